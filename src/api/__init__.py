@@ -2,14 +2,32 @@
 
 FastAPI-based REST API for semantic search across scriptures,
 Come Follow Me lessons, and General Conference talks.
+
+`app` and `create_app` are imported from src.api.main on first access, so
+importing a submodule (services, config) does not build the application.
 """
 
-from src.api.main import app, create_app
+import importlib
+from typing import Any
+
 from src.api.config import APISettings, get_settings
 
+# Lazily imported names -> submodule defining them
+_EXPORTS = {
+    "app": "src.api.main",
+    "create_app": "src.api.main",
+}
+
 __all__ = [
     "app",
     "create_app",
     "APISettings",
     "get_settings",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
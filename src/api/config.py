@@ -5,7 +5,7 @@ Loads configuration from environment variables with sensible defaults.
 """
 
 from functools import lru_cache
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -39,16 +39,106 @@ class APISettings(BaseSettings):
     # Database (reused from existing config)
     database_url_sync: str = ""
 
+    # API connection pool (src/api/database.py), separate from the ingestion
+    # engine in src/db/config.py. Without pre-ping, connections are recycled
+    # after db_pool_recycle_seconds instead of pinged on every checkout.
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 10.0
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = False
+
+    # Read replicas (src/api/replicas.py): comma-separated URLs of read-only
+    # servers that serve the API's searches in health-aware round-robin, each
+    # with its own DB_POOL_* sized pool. A replica that fails (or does not
+    # connect within db_replica_connect_timeout_seconds) is skipped for
+    # db_replica_retry_seconds; with none healthy, searches fall back to
+    # DATABASE_URL_SYNC unless db_replica_fallback_to_primary is off.
+    database_replica_urls: str = ""
+    db_replica_connect_timeout_seconds: int = 3
+    db_replica_retry_seconds: float = 30.0
+    db_replica_fallback_to_primary: bool = True
+
+    # Server-side prepared statements for the vector search shapes
+    # (src/api/services/prepared.py), kept per pooled connection
+    db_prepared_statements: bool = True
+    db_prepared_statements_per_connection: int = 128
+
     # Azure OpenAI settings
     azure_openai_endpoint: str = ""
     azure_openai_api_key: str = ""
     azure_openai_embedding_deployment: str = "text-embedding-3-small"
 
+    # Embedding provider used for query embeddings and searched column
+    # ("azure", "local" CPU model, "hashing" for load tests); see
+    # src/embeddings/providers.py. embedding_dimensions, when set, must match
+    # the provider's column.
+    embedding_provider: Literal["azure", "local", "hashing"] = "azure"
+    embedding_dimensions: Optional[int] = None
+    local_embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    local_embedding_backend: Literal["torch", "onnx"] = "torch"
+    local_embedding_threads: int = 0
+
+    # Rank CFM lessons by their best-matching section (cfm_sections) instead
+    # of the single, truncated lesson vector. Enable once the cfm_sections
+    # corpus is embedded.
+    cfm_search_sections: bool = False
+
+    # Per-request timing spans (src/api/timing.py): Server-Timing response
+    # header (read by the load tester), Prometheus histograms at /metrics,
+    # and OpenTelemetry span attributes (needs opentelemetry-api)
+    server_timing: bool = False
+    metrics_enabled: bool = True
+    otel_tracing: bool = False
+
+    # Slow vector search capture (src/api/services/slow_queries.py): ANN
+    # statements slower than slow_query_ms (0 disables) or randomly sampled
+    # are re-run under EXPLAIN (ANALYZE, BUFFERS), at most
+    # slow_query_explains_per_minute times, and kept in a ring buffer
+    slow_query_ms: float = 250.0
+    slow_query_sample_rate: float = 0.0
+    slow_query_log_size: int = 100
+    slow_query_explain: bool = True
+    slow_query_explains_per_minute: int = 6
+
+    # Token for the /admin endpoints (X-Admin-Token header); empty disables them
+    admin_token: str = ""
+
+    # Startup warm-up (src/api/warmup.py), run in the background when a
+    # worker starts; /health/ready fails until it has finished.
+    # warmup_queries_file lists queries (one per line) whose embeddings are
+    # precomputed into the embedding cache.
+    warmup_enabled: bool = True
+    warmup_connections: int = 4
+    warmup_prewarm_indexes: bool = True
+    warmup_langs: str = "en,es"
+    warmup_queries_file: str = ""
+
+    # Search result hydration (rows cached per table, 0 disables caching)
+    hydration_cache_size: int = 20000
+
+    # Cache backend shared by the response, query embedding, and row caches
+    # ("local" in-process LRU, "redis" shared across workers, "none" disables).
+    # Redis calls that take longer than redis_socket_timeout (or connections
+    # not made within redis_connect_timeout), in seconds, are served as misses.
+    cache_backend: Literal["local", "redis", "none"] = "local"
+    local_cache_size: int = 10000
+    redis_url: str = "redis://localhost:7379/0"
+    redis_prefix: str = "scripture-search:"
+    redis_socket_timeout: float = 0.05
+    redis_connect_timeout: float = 0.05
+    cache_ttl_seconds: int = 86400
+
     @property
     def cors_origins_list(self) -> list[str]:
         """Parse CORS origins from comma-separated string."""
         return [origin.strip() for origin in self.cors_origins.split(",") if origin.strip()]
 
+    @property
+    def database_replica_urls_list(self) -> list[str]:
+        """Parse read replica URLs from comma-separated string."""
+        return [url.strip() for url in self.database_replica_urls.split(",") if url.strip()]
+
     @property
     def is_development(self) -> bool:
         """Check if running in development mode."""
@@ -0,0 +1,125 @@
+"""Database engine and sessions for the API.
+
+The engine in src/db/config.py is sized for ingestion scripts (5 + 10
+connections, pinged on every checkout). The API gets its own engine,
+configured from APISettings:
+
+- DB_POOL_SIZE / DB_MAX_OVERFLOW: size it for the threadpool's concurrent
+  requests, not for a single script
+- DB_POOL_TIMEOUT: how long a request waits for a connection before it
+  fails with 503
+- DB_POOL_PRE_PING: off by default; the pre-ping adds a round-trip to every
+  checkout. Connections are recycled after DB_POOL_RECYCLE_SECONDS instead,
+  and a connection found dead mid-request invalidates the pool.
+
+The pool hands out the most recently returned connection first (LIFO), so
+a few warm connections, with their prepared statements
+(src/api/services/prepared.py), serve most requests and idle ones age out.
+
+Pool usage is exported to Prometheus (src/api/metrics.py) and
+reported by /health/stats.
+
+This is the primary's engine. Request sessions are opened by
+src/api/replicas.py, on a read replica when DATABASE_REPLICA_URLS lists
+any, and on this engine otherwise.
+
+The engine is created on first use, so importing the search services
+(benchmarks, tests) or creating the app opens no pool and needs no
+database URL.
+
+Usage:
+    from src.api.database import open_session
+
+    session = open_session()
+"""
+
+from functools import lru_cache
+from typing import Any, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.api.config import APISettings, get_settings
+from src.api.metrics import install_pool_metrics
+from src.api.timing import install_engine_timing
+
+
+def create_api_engine(
+    settings: Optional[APISettings] = None,
+    url: Optional[str] = None,
+    connect_args: Optional[dict[str, Any]] = None,
+) -> Engine:
+    """Create the API's SQLAlchemy engine from settings.
+
+    Args:
+        settings: API settings (defaults to the cached settings)
+        url: Database URL (defaults to DATABASE_URL_SYNC, the primary)
+        connect_args: Extra psycopg2 connection arguments
+
+    Returns:
+        Engine: Engine with a QueuePool sized by the DB_POOL_* settings.
+
+    Raises:
+        ValueError: If no URL is given and DATABASE_URL_SYNC is not set.
+    """
+    settings = settings or get_settings()
+    url = url or settings.database_url_sync
+    if not url:
+        raise ValueError(
+            "DATABASE_URL_SYNC environment variable is not set. "
+            "Please configure it in your .env file."
+        )
+    return create_engine(
+        url,
+        connect_args=connect_args or {},
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_use_lifo=True,
+        echo=settings.debug,
+    )
+
+
+@lru_cache
+def get_engine() -> Engine:
+    """Get the API's primary engine, creating it (with pool metrics and timing) on first use."""
+    engine = create_api_engine()
+    install_pool_metrics(engine)
+    install_engine_timing(engine)
+    return engine
+
+
+@lru_cache
+def get_sessionmaker() -> sessionmaker:
+    """Get the session factory bound to the API engine."""
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=get_engine(),
+    )
+
+
+def open_session() -> Session:
+    """Create a session on the API engine (the caller closes it)."""
+    return get_sessionmaker()()
+
+
+def pool_stats() -> dict[str, Any]:
+    """Current pool usage for this worker process.
+
+    Returns:
+        dict: Configured size and overflow, and connections checked in,
+        checked out, and open beyond pool_size.
+    """
+    pool = get_engine().pool
+    settings = get_settings()
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+    }
@@ -1,16 +1,24 @@
 """API dependency injection module.
 
 Provides FastAPI dependencies for database sessions and embedding clients.
-Reuses existing components from src/db and src/embeddings.
+Sessions come from the API's read replicas or its primary engine
+(src/api/replicas.py, src/api/database.py); the embedding client is
+reused from src/embeddings.
 """
 
-from typing import Generator
+import time
+from typing import TYPE_CHECKING, Generator
 
-from openai import AzureOpenAI
+from fastapi import HTTPException
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import Session
 
-from src.db.config import SessionLocal
-from src.embeddings.client import get_embedding_client as _get_embedding_client
+from src.api.metrics import record_pool_timeout, record_pool_wait
+from src.api.replicas import open_read_session
+from src.api.timing import mark_since_start, timed
+
+if TYPE_CHECKING:
+    from openai import AzureOpenAI
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -19,22 +27,48 @@ def get_db() -> Generator[Session, None, None]:
     This is a FastAPI dependency that yields a SQLAlchemy session.
     The session is automatically closed when the request completes.
 
+    The session is opened on the next healthy read replica, or on the
+    primary when none is configured (see src/api/replicas.py). Its
+    connection is checked out up front so the wait for a pooled connection
+    is timed separately from query time (see src/api/timing.py).
+
     Yields:
         Session: SQLAlchemy session object.
 
+    Raises:
+        HTTPException: 503 if no pooled connection frees up within
+            DB_POOL_TIMEOUT seconds, or if no read replica is healthy and
+            the fallback to the primary is disabled.
+
     Example:
         @app.get("/items")
         def get_items(db: Session = Depends(get_db)):
             return db.query(Item).all()
     """
-    session = SessionLocal()
+    mark_since_start("queue")
+    session = None
     try:
+        start = time.perf_counter()
+        try:
+            with timed("pool_wait"):
+                session = open_read_session()
+        except PoolTimeoutError:
+            record_pool_timeout()
+            waited = time.perf_counter() - start
+            raise HTTPException(
+                status_code=503,
+                detail=f"No database connection available after {waited:.1f}s",
+            )
+        if session is None:
+            raise HTTPException(status_code=503, detail="No healthy read replica available")
+        record_pool_wait(time.perf_counter() - start)
         yield session
     finally:
-        session.close()
+        if session is not None:
+            session.close()
 
 
-def get_embedding_client() -> AzureOpenAI:
+def get_embedding_client() -> "AzureOpenAI":
     """Provide an Azure OpenAI client for embedding generation.
 
     This is a FastAPI dependency that returns the embedding client.
@@ -48,4 +82,6 @@ def get_embedding_client() -> AzureOpenAI:
         def search(client: AzureOpenAI = Depends(get_embedding_client)):
             embeddings = client.embeddings.create(...)
     """
+    from src.embeddings.client import get_embedding_client as _get_embedding_client
+
     return _get_embedding_client()
@@ -1,13 +1,31 @@
 """FastAPI application entry point.
 
-Provides the main FastAPI application factory and app instance.
+Provides the main FastAPI application factory and app instance. The
+instance is created on first access of `app` (uvicorn src.api.main:app,
+the test client), not when the module is imported.
 """
 
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.api.config import get_settings
-from src.api.routers import cfm, conference, health, scriptures
+from src.api.metrics import observe_request
+from src.api.routers import admin, cfm, conference, health, metrics, scriptures
+from src.api.timing import TimingMiddleware
+from src.api.tracing import annotate_request
+from src.api.warmup import start_warmup
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the background warm-up when the worker starts (see src/api/warmup.py)."""
+    start_warmup()
+    yield
 
 
 def create_app() -> FastAPI:
@@ -24,6 +42,8 @@ def create_app() -> FastAPI:
         description="Semantic search API for scriptures, Come Follow Me lessons, and General Conference talks.",
         docs_url="/docs" if settings.is_development else None,
         redoc_url="/redoc" if settings.is_development else None,
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
     # Configure CORS
@@ -35,11 +55,24 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Request timing spans (added last so it wraps everything)
+    observers = [annotate_request]
+    if settings.metrics_enabled:
+        observers.append(observe_request)
+    app.add_middleware(
+        TimingMiddleware,
+        server_timing=settings.server_timing,
+        observers=observers,
+    )
+
     # Register routers
     app.include_router(health.router)
     app.include_router(scriptures.router, prefix="/api/v1")
     app.include_router(cfm.router, prefix="/api/v1")
     app.include_router(conference.router, prefix="/api/v1")
+    if settings.metrics_enabled:
+        app.include_router(metrics.router)
+    app.include_router(admin.router)
 
     @app.get("/")
     async def root():
@@ -53,5 +86,18 @@ def create_app() -> FastAPI:
     return app
 
 
-# Create the app instance for uvicorn
-app = create_app()
+@lru_cache
+def get_app() -> FastAPI:
+    """Get the application instance, created on first use.
+
+    Returns:
+        FastAPI: The process's application instance.
+    """
+    return create_app()
+
+
+def __getattr__(name: str) -> Any:
+    # The app instance for uvicorn, created on first access
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
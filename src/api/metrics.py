@@ -0,0 +1,200 @@
+"""Prometheus metrics for search requests.
+
+Search routes describe each request with label_request (corpus, endpoint,
+and filter shape); when the request finishes, observe_request records its
+total latency and every timing span (src/api/timing.py) in histograms:
+
+    search_request_duration_seconds{corpus, endpoint, filters, cached}
+    search_span_duration_seconds{corpus, endpoint, filters, span}
+    search_requests_total{corpus, endpoint, status}
+    search_slow_queries_total{table, reason, index_used}
+
+The filter shape is the sorted names of the filters a request set (e.g.
+"book+volume", or "none"), never their values, so label cardinality stays
+bounded. Non-search requests are not recorded.
+
+The API's connection pools (src/api/database.py; "primary" and one per
+read replica, see src/api/replicas.py) are reported as:
+
+    db_pool_checked_out{pool}       connections in use
+    db_pool_overflow{pool}          connections open beyond pool_size
+    db_pool_wait_seconds            time get_db waited for a connection
+    db_pool_timeouts_total          checkouts that gave up after pool_timeout
+
+Cache backend failures (src/api/services/cache_backends.py), which are
+served as misses, are counted in cache_backend_errors_total{operation}.
+
+GET /metrics serves the registry in the Prometheus text format. With
+several worker processes, set PROMETHEUS_MULTIPROC_DIR to a shared,
+empty directory so every scrape aggregates all workers.
+"""
+
+import os
+from typing import Any, Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.api.timing import PHASES, RequestTimings, set_labels
+
+# Request fields that are not filters (shared by SearchRequest and BatchSearchRequest)
+NON_FILTER_FIELDS = {"query", "queries", "lang", "limit"}
+
+# Seconds; search latency ranges from cached (~1 ms) to cold Azure calls (~seconds)
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.075, 0.1,
+    0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0,
+)
+
+REQUEST_DURATION = Histogram(
+    "search_request_duration_seconds",
+    "Search request latency",
+    ["corpus", "endpoint", "filters", "cached"],
+    buckets=LATENCY_BUCKETS,
+)
+SPAN_DURATION = Histogram(
+    "search_span_duration_seconds",
+    "Time spent per search request stage",
+    ["corpus", "endpoint", "filters", "span"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS = Counter(
+    "search_requests",
+    "Search requests by status code",
+    ["corpus", "endpoint", "status"],
+)
+SLOW_QUERIES = Counter(
+    "search_slow_queries",
+    "Captured slow or sampled vector search statements (src/api/services/slow_queries.py)",
+    ["table", "reason", "index_used"],
+)
+CACHE_ERRORS = Counter(
+    "cache_backend_errors",
+    "Cache backend calls that failed and were treated as a miss or skipped",
+    ["operation"],
+)
+POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "API database connections checked out of the pool",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "API database connections open beyond pool_size",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time waiting for a pooled API database connection",
+    buckets=LATENCY_BUCKETS,
+)
+POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts",
+    "API database connection checkouts that exceeded pool_timeout",
+)
+
+
+def filter_shape(request: BaseModel) -> str:
+    """Names of the filters a search request set, e.g. 'book+volume' or 'none'."""
+    fields = request.model_dump(exclude_defaults=True, exclude=NON_FILTER_FIELDS)
+    return "+".join(sorted(fields)) or "none"
+
+
+def label_request(corpus: str, endpoint: str, request: BaseModel) -> None:
+    """Describe the current search request for metrics and tracing.
+
+    Args:
+        corpus: Corpus searched ('scriptures', 'cfm', 'conference')
+        endpoint: 'search' or 'batch'
+        request: Parsed request body
+    """
+    set_labels(corpus=corpus, endpoint=endpoint, filters=filter_shape(request))
+
+
+def observe_request(timings: RequestTimings) -> None:
+    """Request observer: record a finished search request's histograms."""
+    labels = timings.labels
+    if "corpus" not in labels:
+        return
+    corpus, endpoint, filters = labels["corpus"], labels["endpoint"], labels["filters"]
+
+    REQUESTS.labels(corpus, endpoint, str(timings.status)).inc()
+    if timings.status != 200:
+        return
+    REQUEST_DURATION.labels(corpus, endpoint, filters, labels.get("cached", "false")).observe(
+        timings.elapsed_ms() / 1000
+    )
+    for phase in PHASES:
+        if phase in timings.durations:
+            SPAN_DURATION.labels(corpus, endpoint, filters, phase).observe(
+                timings.durations[phase] / 1000
+            )
+
+
+def record_slow_query(table: str, reason: str, index_used: Optional[bool]) -> None:
+    """Count a captured statement ('unknown' index use if no plan was taken)."""
+    used = "unknown" if index_used is None else str(index_used).lower()
+    SLOW_QUERIES.labels(table, reason, used).inc()
+
+
+def record_cache_error(operation: str) -> None:
+    """Count a failed cache backend call ('get', 'set', 'lock', ...)."""
+    CACHE_ERRORS.labels(operation).inc()
+
+
+def install_pool_metrics(engine: Engine, name: str = "primary") -> None:
+    """Keep the pool gauges current on every checkout and checkin.
+
+    Call once per engine; the engine must use a QueuePool.
+
+    Args:
+        engine: Engine whose pool is reported
+        name: Value of the gauges' pool label
+    """
+    pool = engine.pool
+    checked_out = POOL_CHECKED_OUT.labels(pool=name)
+    overflow = POOL_OVERFLOW.labels(pool=name)
+
+    def update_pool_gauges(*args: Any) -> None:
+        checked_out.set(pool.checkedout())
+        overflow.set(max(pool.overflow(), 0))
+
+    event.listen(engine, "checkout", update_pool_gauges)
+    event.listen(engine, "checkin", update_pool_gauges)
+
+
+def record_pool_wait(seconds: float) -> None:
+    """Observe how long a request waited for a pooled connection."""
+    POOL_WAIT.observe(seconds)
+
+
+def record_pool_timeout() -> None:
+    """Count a checkout that exceeded pool_timeout."""
+    POOL_TIMEOUTS.inc()
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Render all metrics in the Prometheus text format.
+
+    Returns:
+        Tuple of (body, content type).
+    """
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,245 @@
+"""Read-replica routing for the API's searches.
+
+Ingestion and embedding scripts write to the primary (DATABASE_URL_SYNC,
+src/db/config.py) in long bulk transactions. The API only reads, so its
+request sessions can be served by read replicas instead: search latency is
+isolated from bulk loads, and read capacity grows with each replica.
+
+- DATABASE_REPLICA_URLS lists the replicas (streaming standbys, or a
+  read-only role on another instance); each gets its own engine and
+  DB_POOL_* sized pool, and its sessions are read-only, so no write can
+  land on a replica
+- get_db (src/api/dependencies.py) opens each request's session on the
+  next healthy replica in round-robin order
+- a replica whose connection fails (refused, timed out, or dropped
+  mid-query) is marked down and skipped for DB_REPLICA_RETRY_SECONDS, then
+  tried again by the next request
+- with no healthy replica, sessions fall back to the primary engine
+  (src/api/database.py), or fail with 503 when
+  DB_REPLICA_FALLBACK_TO_PRIMARY=false
+
+Writes and maintenance (ingestion, embedding, migrations) stay on the
+primary. Replicas may lag it; a request reads the corpus generation
+(src/db/generations.py) through its own session, so cached responses are
+keyed by the data the replica actually served.
+
+Each replica's pool is reported at /health/stats ("replicas") and in the
+db_pool_* metrics with pool="replica-<n>".
+
+Usage:
+    export DATABASE_REPLICA_URLS=postgresql://reader@replica-1/db,postgresql://reader@replica-2/db
+    uvicorn src.api.main:app
+"""
+
+import itertools
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.api.config import APISettings, get_settings
+from src.api.database import create_api_engine, get_engine, open_session
+from src.api.metrics import install_pool_metrics
+from src.api.timing import install_engine_timing
+
+# Server option making every transaction on a replica connection read-only
+READ_ONLY_OPTIONS = "-c default_transaction_read_only=on"
+
+
+class Replica:
+    """One read replica and its health.
+
+    Attributes:
+        name: Pool label in metrics and stats ("replica-0", ...)
+        url: Database URL with the password masked
+        engine: Engine with this replica's pool
+        down_until: Monotonic time until which the replica is skipped
+        failures: Times the replica was marked down
+        last_error: Most recent connection error
+    """
+
+    def __init__(self, name: str, url: str, engine: Engine) -> None:
+        self.name = name
+        self.url = url
+        self.engine = engine
+        self.down_until = 0.0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self._sessionmaker = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def open_session(self) -> Session:
+        """Create a session on this replica (the caller closes it)."""
+        return self._sessionmaker()
+
+
+class ReplicaRouter:
+    """Health-aware round-robin over the read replicas.
+
+    Args:
+        replicas: Replicas in configuration order
+        retry_seconds: How long a failed replica is skipped
+        clock: Monotonic clock, in seconds
+    """
+
+    def __init__(
+        self,
+        replicas: Sequence[Replica],
+        retry_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.replicas = list(replicas)
+        self.retry_seconds = retry_seconds
+        self._clock = clock
+        self._turn = itertools.count()
+        self._lock = threading.Lock()
+
+    def healthy(self, replica: Replica) -> bool:
+        """Whether a replica is in rotation (never failed, or its retry is due)."""
+        return replica.down_until <= self._clock()
+
+    def candidates(self) -> list[Replica]:
+        """Healthy replicas, starting with the one whose turn it is.
+
+        Returns:
+            list: Replicas to try in order (empty if none is healthy).
+        """
+        if not self.replicas:
+            return []
+        with self._lock:
+            start = next(self._turn) % len(self.replicas)
+        ordered = self.replicas[start:] + self.replicas[:start]
+        return [replica for replica in ordered if self.healthy(replica)]
+
+    def mark_down(self, replica: Replica, error: BaseException) -> None:
+        """Take a replica out of rotation for retry_seconds.
+
+        A replica that is already down only has its error updated, so one
+        outage reported by several requests counts as one failure.
+
+        Args:
+            replica: Replica whose connection failed
+            error: The connection error
+        """
+        message = str(error).strip().splitlines()
+        with self._lock:
+            replica.last_error = f"{type(error).__name__}: {message[0] if message else ''}"
+            if self.healthy(replica):
+                replica.failures += 1
+            replica.down_until = self._clock() + self.retry_seconds
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Health and pool usage per replica, for /health/stats."""
+        now = self._clock()
+        stats = []
+        for replica in self.replicas:
+            pool = replica.engine.pool
+            stats.append({
+                "name": replica.name,
+                "url": replica.url,
+                "healthy": replica.down_until <= now,
+                "retry_in_seconds": round(max(replica.down_until - now, 0.0), 1),
+                "failures": replica.failures,
+                "last_error": replica.last_error,
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+            })
+        return stats
+
+
+def create_replica(settings: APISettings, index: int, url: str) -> Replica:
+    """Create a replica's read-only engine, with pool metrics and timing.
+
+    Args:
+        settings: API settings (pool size, connect timeout)
+        index: Position in DATABASE_REPLICA_URLS
+        url: Replica database URL
+
+    Returns:
+        Replica: The replica, in rotation.
+    """
+    engine = create_api_engine(
+        settings,
+        url=url,
+        connect_args={
+            "options": READ_ONLY_OPTIONS,
+            "connect_timeout": settings.db_replica_connect_timeout_seconds,
+        },
+    )
+    name = f"replica-{index}"
+    install_pool_metrics(engine, name)
+    install_engine_timing(engine)
+    return Replica(name, make_url(url).render_as_string(hide_password=True), engine)
+
+
+def watch_disconnects(router: ReplicaRouter, replica: Replica) -> None:
+    """Mark a replica down when one of its connections fails mid-request."""
+
+    def mark_down_on_disconnect(context: Any) -> None:
+        if context.is_disconnect:
+            router.mark_down(replica, context.original_exception)
+
+    event.listen(replica.engine, "handle_error", mark_down_on_disconnect)
+
+
+@lru_cache
+def get_replica_router() -> ReplicaRouter:
+    """Get the router over DATABASE_REPLICA_URLS, creating the engines on first use."""
+    settings = get_settings()
+    replicas = [
+        create_replica(settings, index, url)
+        for index, url in enumerate(settings.database_replica_urls_list)
+    ]
+    router = ReplicaRouter(replicas, settings.db_replica_retry_seconds)
+    for replica in replicas:
+        watch_disconnects(router, replica)
+    return router
+
+
+def read_pools() -> dict[str, Engine]:
+    """Engines serving request sessions by pool name: the replicas, or else the primary."""
+    replicas = get_replica_router().replicas
+    if not replicas:
+        return {"primary": get_engine()}
+    return {replica.name: replica.engine for replica in replicas}
+
+
+def open_read_session() -> Optional[Session]:
+    """Open a request's session, with its connection checked out.
+
+    Tries the healthy replicas in round-robin order, marking down each one
+    that fails to connect, then falls back to the primary.
+
+    Returns:
+        Session: Connected session, or None if no replica is healthy and
+        DB_REPLICA_FALLBACK_TO_PRIMARY is off.
+
+    Raises:
+        sqlalchemy.exc.TimeoutError: If the chosen pool has no free
+            connection within DB_POOL_TIMEOUT.
+    """
+    router = get_replica_router()
+    for replica in router.candidates():
+        session = replica.open_session()
+        try:
+            session.connection()
+        except OperationalError as e:
+            session.close()
+            router.mark_down(replica, e)
+            continue
+        return session
+
+    if router.replicas and not get_settings().db_replica_fallback_to_primary:
+        return None
+    session = open_session()
+    try:
+        session.connection()
+    except Exception:
+        session.close()
+        raise
+    return session
@@ -0,0 +1,197 @@
+"""Fast response rendering for search endpoints.
+
+Search services already return plain dictionaries with JSON-native values,
+so the search routers skip rebuilding a pydantic model per row and hand the
+dictionaries straight to orjson. The declared response_model is kept for
+the OpenAPI schema; returning a Response bypasses FastAPI's re-validation
+and jsonable_encoder pass.
+
+Two request options are supported on every search endpoint:
+- ``fields=id,reference,text`` projects each result to the listed fields
+  (e.g., to drop the large context_text column)
+- ``Accept: application/x-ndjson`` streams newline-delimited JSON: a
+  ``{"meta": ...}`` line followed by one line per result (unless the
+  header gives JSON a higher q-value)
+
+With ``timings=true`` the request's timing spans (src/api/timing.py) are
+added to ``meta.timings``. JSON results are serialized before the meta, so
+serialize_ms covers them; streamed responses serialize while sending and
+report serialize_ms as 0.
+"""
+
+from typing import Any, Iterable, Iterator, Optional
+
+import orjson
+from fastapi import HTTPException
+from fastapi.responses import Response, StreamingResponse
+
+from src.api.timing import current_timings, set_labels, timed
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Accept entries that cover JSON, most specific first
+JSON_MEDIA_RANGES = ("application/json", "application/*", "*/*")
+
+# OpenAPI entry advertising the NDJSON alternative on search endpoints
+NDJSON_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {"content": {NDJSON_MEDIA_TYPE: {}}},
+}
+
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str]) -> Optional[list[str]]:
+    """Parse a comma-separated field projection.
+
+    Args:
+        fields: Raw ``fields`` query parameter (e.g., "id,reference,text")
+        allowed: Field names of the result model
+
+    Returns:
+        Requested field names in request order, or None to return all fields.
+
+    Raises:
+        HTTPException: 422 if an unknown field is requested
+    """
+    if not fields:
+        return None
+    requested = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in requested if f not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown field(s): {', '.join(unknown)}",
+        )
+    return requested or None
+
+
+def project(rows: list[dict[str, Any]], fields: Optional[list[str]]) -> list[dict[str, Any]]:
+    """Project result rows to the requested fields (no-op when fields is None)."""
+    if fields is None:
+        return rows
+    return [{field: row[field] for field in fields} for row in rows]
+
+
+def accept_qualities(accept: str) -> dict[str, float]:
+    """Parse an Accept header into media ranges and their q-values.
+
+    Example:
+        accept_qualities("application/x-ndjson;q=0.5, */*") ->
+            {"application/x-ndjson": 0.5, "*/*": 1.0}
+    """
+    qualities: dict[str, float] = {}
+    for entry in accept.split(","):
+        media_type, *params = (part.strip() for part in entry.split(";"))
+        if not media_type:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        media_type = media_type.lower()
+        qualities[media_type] = max(quality, qualities.get(media_type, 0.0))
+    return qualities
+
+
+def wants_ndjson(accept: Optional[str]) -> bool:
+    """Check whether the Accept header prefers NDJSON to JSON.
+
+    Media types are compared exactly. NDJSON is chosen when it is listed
+    with a non-zero q-value at least as high as JSON's, taken from the most
+    specific of application/json, application/* and */* that is listed.
+    """
+    if not accept:
+        return False
+    qualities = accept_qualities(accept)
+    ndjson = qualities.get(NDJSON_MEDIA_TYPE, 0.0)
+    if ndjson <= 0:
+        return False
+    for media_range in JSON_MEDIA_RANGES:
+        if media_range in qualities:
+            return ndjson >= qualities[media_range]
+    return True
+
+
+def _ndjson_lines(meta: dict[str, Any], rows: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    yield orjson.dumps({"meta": meta}) + b"\n"
+    for row in rows:
+        yield orjson.dumps(row) + b"\n"
+
+
+def _with_timings(meta: dict[str, Any], timings: bool) -> dict[str, Any]:
+    current = current_timings() if timings else None
+    return {**meta, "timings": current.spans()} if current is not None else meta
+
+
+def _json_response(
+    results: list[dict[str, Any]], meta: dict[str, Any], timings: bool
+) -> Response:
+    # Serialize the results first so meta.timings can include serialize_ms
+    with timed("serialize"):
+        body = orjson.dumps(results)
+    meta = _with_timings(meta, timings)
+    return Response(
+        b'{"results":' + body + b',"meta":' + orjson.dumps(meta) + b"}",
+        media_type="application/json",
+    )
+
+
+def search_response(
+    results: list[dict[str, Any]],
+    meta: dict[str, Any],
+    fields: Optional[list[str]] = None,
+    accept: Optional[str] = None,
+    timings: bool = False,
+) -> Response:
+    """Render a single-query search response.
+
+    Args:
+        results: Result dictionaries from a search service
+        meta: Search metadata (SearchResultMeta fields)
+        fields: Optional field projection from parse_fields
+        accept: Request Accept header
+        timings: Add the request's timing spans to meta
+
+    Returns:
+        JSON Response with ``results`` and ``meta``, or a StreamingResponse
+        of NDJSON lines when requested.
+    """
+    set_labels(cached="true" if meta.get("cached") else "false")
+    rows = project(results, fields)
+    if wants_ndjson(accept):
+        meta = _with_timings(meta, timings)
+        return StreamingResponse(_ndjson_lines(meta, rows), media_type=NDJSON_MEDIA_TYPE)
+    return _json_response(rows, meta, timings)
+
+
+def batch_search_response(
+    items: list[dict[str, Any]],
+    meta: dict[str, Any],
+    fields: Optional[list[str]] = None,
+    accept: Optional[str] = None,
+    timings: bool = False,
+) -> Response:
+    """Render a batch search response.
+
+    Args:
+        items: Per-query dictionaries with ``query``, ``results``, ``cached``
+        meta: Batch metadata (BatchSearchMeta fields)
+        fields: Optional field projection applied to every query's results
+        accept: Request Accept header
+        timings: Add the request's timing spans to meta
+
+    Returns:
+        JSON Response with ``results`` and ``meta``, or a StreamingResponse
+        with one NDJSON line per query when requested.
+    """
+    cached = meta.get("cached_queries", 0)
+    set_labels(
+        cached="true" if cached == len(items) else "partial" if cached else "false"
+    )
+    items = [{**item, "results": project(item["results"], fields)} for item in items]
+    if wants_ndjson(accept):
+        meta = _with_timings(meta, timings)
+        return StreamingResponse(_ndjson_lines(meta, items), media_type=NDJSON_MEDIA_TYPE)
+    return _json_response(items, meta, timings)
@@ -5,4 +5,6 @@ Contains FastAPI routers for:
 - scriptures: Scripture search endpoints
 - cfm: Come Follow Me search endpoints
 - conference: General Conference search endpoints
+- metrics: Prometheus metrics endpoint
+- admin: Token-protected operational endpoints (slow query captures)
 """
@@ -0,0 +1,84 @@
+"""Admin router.
+
+Operational endpoints for maintainers, enabled only when ADMIN_TOKEN is
+set and authenticated with the X-Admin-Token header:
+
+- GET /admin/slow-queries: captured slow and sampled vector searches with
+  their EXPLAIN ANALYZE plans (see src/api/services/slow_queries.py)
+- DELETE /admin/slow-queries: clear the capture buffer
+
+Captures are per worker process; each request sees the buffer of the
+worker that serves it.
+"""
+
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+
+from src.api.config import get_settings
+from src.api.services.slow_queries import capture_dict, get_slow_query_log
+
+
+def require_admin(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    """Reject requests without the configured admin token.
+
+    Raises:
+        HTTPException: 404 if admin endpoints are disabled, 403 if the token
+            is missing or wrong
+    """
+    token = get_settings().admin_token
+    if not token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin)],
+)
+
+
+@router.get("/slow-queries")
+def slow_queries(
+    table: Optional[str] = Query(default=None, description="Only captures for this table"),
+    limit: int = Query(default=20, ge=1, le=500, description="Maximum captures to return"),
+    plans: bool = Query(default=True, description="Include full EXPLAIN plans"),
+):
+    """List captured vector search statements, newest first.
+
+    Args:
+        table: Optional table filter (e.g., 'conference_paragraphs')
+        limit: Maximum number of captures
+        plans: Include the EXPLAIN JSON plans (large)
+
+    Returns:
+        dict: Capture totals, per-table index usage, and the captures.
+    """
+    log = get_slow_query_log()
+    entries = log.entries(table)
+
+    index_usage: dict[str, dict[str, int]] = {}
+    for entry in entries:
+        counts = index_usage.setdefault(entry.table, {"index": 0, "no_index": 0, "unknown": 0})
+        key = "unknown" if entry.index_used is None else "index" if entry.index_used else "no_index"
+        counts[key] += 1
+
+    return {
+        "captured_total": log.captured,
+        "buffered": len(entries),
+        "index_usage": index_usage,
+        "captures": [capture_dict(entry, include_plan=plans) for entry in entries[:limit]],
+    }
+
+
+@router.delete("/slow-queries")
+def clear_slow_queries():
+    """Clear the capture buffer of this worker.
+
+    Returns:
+        dict: Number of captures dropped.
+    """
+    return {"cleared": get_slow_query_log().clear()}
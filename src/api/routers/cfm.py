@@ -1,23 +1,45 @@
 """Come Follow Me (CFM) lesson search router.
 
 This module provides the FastAPI router for CFM lesson semantic search,
-exposing the POST /api/v1/cfm/search endpoint.
+exposing the POST /api/v1/cfm/search and POST /api/v1/cfm/search/batch
+endpoints.
 """
 
 import time
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from src.api.dependencies import get_db
+from src.api.metrics import label_request
+from src.api.responses import (
+    NDJSON_RESPONSES,
+    batch_search_response,
+    parse_fields,
+    search_response,
+)
 from src.api.schemas.cfm import (
+    CFMBatchSearchRequest,
+    CFMBatchSearchResponse,
     CFMResult,
+    CFMResultMode,
     CFMSearchRequest,
     CFMSearchResponse,
+    CFMSectionResult,
+)
+from src.api.schemas.common import BatchSearchMeta, SearchResultMeta
+from src.api.services.cfm import (
+    search_cfm_lessons,
+    search_cfm_lessons_batch,
+    search_cfm_sections,
+    search_cfm_sections_batch,
+    search_mode,
 )
-from src.api.schemas.common import SearchResultMeta
-from src.api.services.cfm import search_cfm_lessons
-from src.embeddings.client import get_single_embedding
+from src.api.services.query_embeddings import get_query_embedding, get_query_embeddings
+from src.api.services.response_cache import get_response_cache
+from src.api.services.single_flight import get_flight
+from src.db.generations import get_generation
 
 router = APIRouter(
     prefix="/cfm",
@@ -28,37 +50,112 @@ router = APIRouter(
 @router.post(
     "/search",
     response_model=CFMSearchResponse,
+    responses=NDJSON_RESPONSES,
     summary="Search Come Follow Me lessons semantically",
     description="""
     Perform semantic search across Come Follow Me (CFM) lessons using natural language queries.
 
     Returns lessons ranked by semantic similarity to the query, with optional
-    filtering by year (2019-2030) and testament (ot, nt, bom, dc).
+    filtering by year (2019-2030) and testament (ot, nt, bom, dc). Set
+    `result_mode` to `section` to get the matching lesson sections instead
+    of whole lessons.
 
     The search uses vector embeddings and cosine similarity for ranking.
+
+    Pass `fields` to return only some result fields, or send
+    `Accept: application/x-ndjson` to stream newline-delimited JSON.
+    Pass `timings=true` for a per-stage timing breakdown in `meta.timings`.
     """,
 )
 def cfm_search(
     request: CFMSearchRequest,
+    fields: Optional[str] = Query(
+        default=None,
+        description="Comma-separated result fields to return (e.g., 'id,text')",
+    ),
+    timings: bool = Query(
+        default=False,
+        description="Include a per-stage timing breakdown in meta",
+    ),
+    accept: Optional[str] = Header(default=None),
     db: Session = Depends(get_db),
-) -> CFMSearchResponse:
+) -> Response:
     """Search CFM lessons by semantic similarity.
 
     Args:
         request: Search request with query, filters, and options
+        fields: Optional comma-separated result field projection
+        timings: Include per-stage timings in meta
+        accept: Accept header; application/x-ndjson selects streaming
         db: Database session (injected)
 
     Returns:
-        CFMSearchResponse with results and metadata
+        JSON (or NDJSON) response with results and metadata
 
     Raises:
         HTTPException: If embedding generation fails
     """
     start_time = time.perf_counter()
+    label_request("cfm", "search", request)
+    selected = parse_fields(fields, _result_model(request.result_mode).model_fields)
+
+    # Serve repeated requests from the response cache
+    cache = get_response_cache()
+    try:
+        cache_key = cache.make_key(
+            "cfm",
+            get_generation(db, "cfm"),
+            {**request.model_dump(mode="json"), "mode": search_mode()},
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Search failed: {str(e)}",
+        )
+    results = cache.get(cache_key)
+    cached = results is not None
+
+    if results is None:
+        # Identical concurrent requests share one embedding call and one search
+        def search_and_cache() -> list[dict]:
+            found = _run_search(request, db)
+            cache.set(cache_key, found)
+            return found
+
+        results, _ = get_flight("search:cfm").do(cache_key, search_and_cache)
+
+    # Calculate elapsed time
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
 
+    # Build response
+    return search_response(
+        results,
+        meta=SearchResultMeta(
+            query=request.query,
+            total_results=len(results),
+            search_time_ms=round(elapsed_ms, 2),
+            cached=cached,
+        ).model_dump(exclude_none=True),
+        fields=selected,
+        accept=accept,
+        timings=timings,
+    )
+
+
+def _result_model(mode: CFMResultMode) -> type:
+    """Result schema for a result mode (used to validate field projections)."""
+    return CFMSectionResult if mode is CFMResultMode.section else CFMResult
+
+
+def _run_search(request: CFMSearchRequest, db: Session) -> list[dict]:
+    """Embed the query and run the search (the work shared by coalesced requests).
+
+    Raises:
+        HTTPException: 503 if embedding generation fails, 500 if the search fails
+    """
     # Get embedding for the query
     try:
-        query_embedding = get_single_embedding(request.query)
+        query_embedding = get_query_embedding(request.query)
     except Exception as e:
         raise HTTPException(
             status_code=503,
@@ -66,8 +163,12 @@ def cfm_search(
         )
 
     # Perform search
+    if request.result_mode is CFMResultMode.section:
+        search = search_cfm_sections
+    else:
+        search = search_cfm_lessons
     try:
-        results = search_cfm_lessons(
+        return search(
             session=db,
             query_embedding=query_embedding,
             lang=request.lang.value,
@@ -81,15 +182,127 @@ def cfm_search(
             detail=f"Search failed: {str(e)}",
         )
 
-    # Calculate elapsed time
+
+@router.post(
+    "/search/batch",
+    response_model=CFMBatchSearchResponse,
+    responses=NDJSON_RESPONSES,
+    summary="Search Come Follow Me lessons for many queries at once",
+    description="""
+    Run up to 50 semantic searches that share language, limit, and filters.
+
+    All uncached queries are embedded in a single embedding API call and
+    searched in a single database round-trip. Results are returned per query,
+    in request order, and share the response cache with the single-query
+    endpoint.
+
+    Pass `fields` to return only some result fields, or send
+    `Accept: application/x-ndjson` to stream newline-delimited JSON.
+    Pass `timings=true` for a per-stage timing breakdown in `meta.timings`.
+    """,
+)
+def cfm_batch_search(
+    request: CFMBatchSearchRequest,
+    fields: Optional[str] = Query(
+        default=None,
+        description="Comma-separated result fields to return (e.g., 'id,text')",
+    ),
+    timings: bool = Query(
+        default=False,
+        description="Include a per-stage timing breakdown in meta",
+    ),
+    accept: Optional[str] = Header(default=None),
+    db: Session = Depends(get_db),
+) -> Response:
+    """Search CFM lessons for a batch of queries.
+
+    Args:
+        request: Batch search request with queries, filters, and options
+        fields: Optional comma-separated result field projection
+        timings: Include per-stage timings in meta
+        accept: Accept header; application/x-ndjson selects streaming
+        db: Database session (injected)
+
+    Returns:
+        JSON (or NDJSON) response with per-query results and metadata
+
+    Raises:
+        HTTPException: If embedding generation or the search fails
+    """
+    start_time = time.perf_counter()
+    label_request("cfm", "batch", request)
+    selected = parse_fields(fields, _result_model(request.result_mode).model_fields)
+
+    # Each query is cached under the same key as the equivalent single search
+    cache = get_response_cache()
+    params = {**request.model_dump(mode="json", exclude={"queries"}), "mode": search_mode()}
+    try:
+        generation = get_generation(db, "cfm")
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Search failed: {str(e)}",
+        )
+    keys = [
+        cache.make_key("cfm", generation, {**params, "query": query})
+        for query in request.queries
+    ]
+    results = cache.get_many(keys)
+    cached = [item is not None for item in results]
+
+    # Embed and search each distinct uncached query once
+    pending: dict[str, list[int]] = {}
+    for i, key in enumerate(keys):
+        if results[i] is None:
+            pending.setdefault(key, []).append(i)
+
+    if pending:
+        queries = [request.queries[indices[0]] for indices in pending.values()]
+        try:
+            query_embeddings = get_query_embeddings(queries)
+        except Exception as e:
+            raise HTTPException(
+                status_code=503,
+                detail=f"Embedding service unavailable: {str(e)}",
+            )
+
+        if request.result_mode is CFMResultMode.section:
+            search_batch = search_cfm_sections_batch
+        else:
+            search_batch = search_cfm_lessons_batch
+        try:
+            batch_results = search_batch(
+                session=db,
+                query_embeddings=query_embeddings,
+                lang=request.lang.value,
+                limit=request.limit,
+                year=request.year,
+                testament=request.testament.value if request.testament else None,
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Search failed: {str(e)}",
+            )
+
+        for (key, indices), query_results in zip(pending.items(), batch_results):
+            cache.set(key, query_results)
+            for i in indices:
+                results[i] = query_results
+
     elapsed_ms = (time.perf_counter() - start_time) * 1000
 
-    # Build response
-    return CFMSearchResponse(
-        results=[CFMResult(**r) for r in results],
-        meta=SearchResultMeta(
-            query=request.query,
-            total_results=len(results),
+    return batch_search_response(
+        [
+            {"query": query, "results": query_results, "cached": is_cached}
+            for query, query_results, is_cached in zip(request.queries, results, cached)
+        ],
+        meta=BatchSearchMeta(
+            total_queries=len(request.queries),
+            cached_queries=sum(cached),
             search_time_ms=round(elapsed_ms, 2),
-        ),
+        ).model_dump(exclude_none=True),
+        fields=selected,
+        accept=accept,
+        timings=timings,
     )
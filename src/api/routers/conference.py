@@ -1,23 +1,40 @@
 """General Conference talk search router.
 
 This module provides the FastAPI router for conference talk semantic search,
-exposing the POST /api/v1/conference/search endpoint.
+exposing the POST /api/v1/conference/search and POST
+/api/v1/conference/search/batch endpoints.
 """
 
 import time
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from src.api.dependencies import get_db
+from src.api.metrics import label_request
+from src.api.responses import (
+    NDJSON_RESPONSES,
+    batch_search_response,
+    parse_fields,
+    search_response,
+)
 from src.api.schemas.conference import (
+    ConferenceBatchSearchRequest,
+    ConferenceBatchSearchResponse,
     ConferenceResult,
     ConferenceSearchRequest,
     ConferenceSearchResponse,
 )
-from src.api.schemas.common import SearchResultMeta
-from src.api.services.conference import search_conference_talks
-from src.embeddings.client import get_single_embedding
+from src.api.schemas.common import BatchSearchMeta, SearchResultMeta
+from src.api.services.conference import (
+    search_conference_talks,
+    search_conference_talks_batch,
+)
+from src.api.services.query_embeddings import get_query_embedding, get_query_embeddings
+from src.api.services.response_cache import get_response_cache
+from src.api.services.single_flight import get_flight
+from src.db.generations import get_generation
 
 router = APIRouter(
     prefix="/conference",
@@ -28,6 +45,7 @@ router = APIRouter(
 @router.post(
     "/search",
     response_model=ConferenceSearchResponse,
+    responses=NDJSON_RESPONSES,
     summary="Search General Conference talks semantically",
     description="""
     Perform semantic search across General Conference talks using natural language queries.
@@ -38,29 +56,96 @@ router = APIRouter(
     The speaker filter performs a partial match (case-insensitive) on the speaker name.
 
     The search uses vector embeddings and cosine similarity for ranking.
+
+    Pass `fields` to return only some result fields, or send
+    `Accept: application/x-ndjson` to stream newline-delimited JSON.
+    Pass `timings=true` for a per-stage timing breakdown in `meta.timings`.
     """,
 )
 def conference_search(
     request: ConferenceSearchRequest,
+    fields: Optional[str] = Query(
+        default=None,
+        description="Comma-separated result fields to return (e.g., 'id,text')",
+    ),
+    timings: bool = Query(
+        default=False,
+        description="Include a per-stage timing breakdown in meta",
+    ),
+    accept: Optional[str] = Header(default=None),
     db: Session = Depends(get_db),
-) -> ConferenceSearchResponse:
+) -> Response:
     """Search conference talks by semantic similarity.
 
     Args:
         request: Search request with query, filters, and options
+        fields: Optional comma-separated result field projection
+        timings: Include per-stage timings in meta
+        accept: Accept header; application/x-ndjson selects streaming
         db: Database session (injected)
 
     Returns:
-        ConferenceSearchResponse with results and metadata
+        JSON (or NDJSON) response with results and metadata
 
     Raises:
         HTTPException: If embedding generation fails
     """
     start_time = time.perf_counter()
+    label_request("conference", "search", request)
+    selected = parse_fields(fields, ConferenceResult.model_fields)
+
+    # Serve repeated requests from the response cache
+    cache = get_response_cache()
+    try:
+        cache_key = cache.make_key(
+            "conference",
+            get_generation(db, "conference"),
+            request.model_dump(mode="json"),
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Search failed: {str(e)}",
+        )
+    results = cache.get(cache_key)
+    cached = results is not None
+
+    if results is None:
+        # Identical concurrent requests share one embedding call and one search
+        def search_and_cache() -> list[dict]:
+            found = _run_search(request, db)
+            cache.set(cache_key, found)
+            return found
+
+        results, _ = get_flight("search:conference").do(cache_key, search_and_cache)
+
+    # Calculate elapsed time
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
 
+    # Build response
+    return search_response(
+        results,
+        meta=SearchResultMeta(
+            query=request.query,
+            total_results=len(results),
+            search_time_ms=round(elapsed_ms, 2),
+            cached=cached,
+        ).model_dump(exclude_none=True),
+        fields=selected,
+        accept=accept,
+        timings=timings,
+    )
+
+
+def _run_search(request: ConferenceSearchRequest, db: Session) -> list[dict]:
+    """Embed the query and run the search (the work shared by coalesced requests).
+
+    Raises:
+        HTTPException: 503 if embedding generation fails, 500 if the search fails
+    """
     # Get embedding for the query
     try:
-        query_embedding = get_single_embedding(request.query)
+        query_embedding = get_query_embedding(request.query)
     except Exception as e:
         raise HTTPException(
             status_code=503,
@@ -69,7 +154,7 @@ def conference_search(
 
     # Perform search
     try:
-        results = search_conference_talks(
+        return search_conference_talks(
             session=db,
             query_embedding=query_embedding,
             lang=request.lang.value,
@@ -84,15 +169,124 @@ def conference_search(
             detail=f"Search failed: {str(e)}",
         )
 
-    # Calculate elapsed time
+
+@router.post(
+    "/search/batch",
+    response_model=ConferenceBatchSearchResponse,
+    responses=NDJSON_RESPONSES,
+    summary="Search General Conference talks for many queries at once",
+    description="""
+    Run up to 50 semantic searches that share language, limit, and filters.
+
+    All uncached queries are embedded in a single embedding API call and
+    searched in a single database round-trip. Results are returned per query,
+    in request order, and share the response cache with the single-query
+    endpoint.
+
+    Pass `fields` to return only some result fields, or send
+    `Accept: application/x-ndjson` to stream newline-delimited JSON.
+    Pass `timings=true` for a per-stage timing breakdown in `meta.timings`.
+    """,
+)
+def conference_batch_search(
+    request: ConferenceBatchSearchRequest,
+    fields: Optional[str] = Query(
+        default=None,
+        description="Comma-separated result fields to return (e.g., 'id,text')",
+    ),
+    timings: bool = Query(
+        default=False,
+        description="Include a per-stage timing breakdown in meta",
+    ),
+    accept: Optional[str] = Header(default=None),
+    db: Session = Depends(get_db),
+) -> Response:
+    """Search conference paragraphs for a batch of queries.
+
+    Args:
+        request: Batch search request with queries, filters, and options
+        fields: Optional comma-separated result field projection
+        timings: Include per-stage timings in meta
+        accept: Accept header; application/x-ndjson selects streaming
+        db: Database session (injected)
+
+    Returns:
+        JSON (or NDJSON) response with per-query results and metadata
+
+    Raises:
+        HTTPException: If embedding generation or the search fails
+    """
+    start_time = time.perf_counter()
+    label_request("conference", "batch", request)
+    selected = parse_fields(fields, ConferenceResult.model_fields)
+
+    # Each query is cached under the same key as the equivalent single search
+    cache = get_response_cache()
+    params = request.model_dump(mode="json", exclude={"queries"})
+    try:
+        generation = get_generation(db, "conference")
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Search failed: {str(e)}",
+        )
+    keys = [
+        cache.make_key("conference", generation, {**params, "query": query})
+        for query in request.queries
+    ]
+    results = cache.get_many(keys)
+    cached = [item is not None for item in results]
+
+    # Embed and search each distinct uncached query once
+    pending: dict[str, list[int]] = {}
+    for i, key in enumerate(keys):
+        if results[i] is None:
+            pending.setdefault(key, []).append(i)
+
+    if pending:
+        queries = [request.queries[indices[0]] for indices in pending.values()]
+        try:
+            query_embeddings = get_query_embeddings(queries)
+        except Exception as e:
+            raise HTTPException(
+                status_code=503,
+                detail=f"Embedding service unavailable: {str(e)}",
+            )
+
+        try:
+            batch_results = search_conference_talks_batch(
+                session=db,
+                query_embeddings=query_embeddings,
+                lang=request.lang.value,
+                limit=request.limit,
+                year=request.year,
+                month=request.month,
+                speaker=request.speaker,
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Search failed: {str(e)}",
+            )
+
+        for (key, indices), query_results in zip(pending.items(), batch_results):
+            cache.set(key, query_results)
+            for i in indices:
+                results[i] = query_results
+
     elapsed_ms = (time.perf_counter() - start_time) * 1000
 
-    # Build response
-    return ConferenceSearchResponse(
-        results=[ConferenceResult(**r) for r in results],
-        meta=SearchResultMeta(
-            query=request.query,
-            total_results=len(results),
+    return batch_search_response(
+        [
+            {"query": query, "results": query_results, "cached": is_cached}
+            for query, query_results, is_cached in zip(request.queries, results, cached)
+        ],
+        meta=BatchSearchMeta(
+            total_queries=len(request.queries),
+            cached_queries=sum(cached),
             search_time_ms=round(elapsed_ms, 2),
-        ),
+        ).model_dump(exclude_none=True),
+        fields=selected,
+        accept=accept,
+        timings=timings,
     )
@@ -1,6 +1,8 @@
 """Health check router.
 
-Provides endpoints for basic health checks and readiness probes.
+Provides endpoints for basic health checks, readiness probes, and
+per-process cache, request-coalescing, connection pool, read replica,
+and warm-up stats.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -8,7 +10,13 @@ from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from src.api.config import get_settings
+from src.api.database import pool_stats
 from src.api.dependencies import get_db
+from src.api.replicas import get_replica_router, read_pools
+from src.api.services.hydration import HYDRATION_COLUMNS, get_row_cache
+from src.api.services.response_cache import get_response_cache
+from src.api.services.single_flight import flight_stats
+from src.api.warmup import get_warmup
 
 router = APIRouter(tags=["health"])
 
@@ -32,10 +40,11 @@ async def health_check():
 
 @router.get("/health/ready")
 def readiness_check(db: Session = Depends(get_db)):
-    """Readiness probe checking database connectivity.
+    """Readiness probe checking warm-up and database connectivity.
 
-    Verifies that the database is accessible and responding.
-    Use this endpoint for Kubernetes readiness probes.
+    Fails until this worker's startup warm-up has finished (see
+    src/api/warmup.py), then verifies that the database is accessible and
+    responding. Use this endpoint for Kubernetes readiness probes.
 
     Args:
         db: Database session dependency.
@@ -44,14 +53,26 @@ def readiness_check(db: Session = Depends(get_db)):
         dict: Status and details about database connectivity.
 
     Raises:
-        HTTPException: 503 if database is not reachable.
+        HTTPException: 503 if warm-up is still running or the database is
+            not reachable.
     """
+    warmup = get_warmup()
+    if not warmup.finished:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "status": "warming up",
+                "warmup": warmup.as_dict(),
+            },
+        )
+
     try:
         # Execute a simple query to verify database connectivity
         db.execute(text("SELECT 1"))
         return {
             "status": "ready",
             "database": "connected",
+            "warmup": warmup.status,
         }
     except Exception as e:
         raise HTTPException(
@@ -62,3 +83,39 @@ def readiness_check(db: Session = Depends(get_db)):
                 "error": str(e),
             },
         )
+
+
+@router.get("/health/stats")
+def stats():
+    """Cache, request-coalescing, and pool counters for this worker process.
+
+    Reports response cache and row cache hit/miss counts, for each
+    single-flight group the number of executed calls (leaders), coalesced
+    calls (followers), and the fan-in ratio (callers served per execution),
+    the primary database pool's current usage (null when read replicas
+    serve the requests), each read replica's health and pool usage, and
+    the startup warm-up's steps.
+
+    Returns:
+        dict: Counters keyed by component.
+    """
+    response_cache = get_response_cache()
+    return {
+        "response_cache": {
+            "hits": response_cache.hits,
+            "misses": response_cache.misses,
+        },
+        "row_cache": {
+            table: {
+                "hits": cache.hits,
+                "misses": cache.misses,
+                "size": len(cache),
+            }
+            for table in HYDRATION_COLUMNS
+            for cache in [get_row_cache(table)]
+        },
+        "single_flight": flight_stats(),
+        "db_pool": pool_stats() if "primary" in read_pools() else None,
+        "replicas": get_replica_router().stats(),
+        "warmup": get_warmup().as_dict(),
+    }
@@ -0,0 +1,22 @@
+"""Prometheus metrics router.
+
+Exposes GET /metrics in the Prometheus text format (see src/api/metrics.py
+for the recorded series). Registered only when METRICS_ENABLED is true.
+"""
+
+from fastapi import APIRouter, Response
+
+from src.api.metrics import render_metrics
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """Serve search metrics for Prometheus scraping.
+
+    Returns:
+        Response: Metrics in the Prometheus text exposition format.
+    """
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -1,23 +1,55 @@
 """Scripture search router.
 
 This module provides the FastAPI router for scripture semantic search,
-exposing the POST /api/v1/scriptures/search endpoint.
+exposing the POST /api/v1/scriptures/search and POST
+/api/v1/scriptures/search/batch endpoints, and direct verse lookup by
+reference via GET /api/v1/scriptures/lookup.
 """
 
+import hashlib
 import time
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from src.api.dependencies import get_db
-from src.api.schemas.common import SearchResultMeta
+from src.api.metrics import label_request
+from src.api.responses import (
+    NDJSON_RESPONSES,
+    batch_search_response,
+    parse_fields,
+    search_response,
+)
+from src.api.schemas.common import BatchSearchMeta, Language, SearchResultMeta
 from src.api.schemas.scriptures import (
+    ScriptureBatchSearchRequest,
+    ScriptureBatchSearchResponse,
+    ScriptureLookupMeta,
+    ScriptureLookupResponse,
+    ScripturePassage,
     ScriptureResult,
     ScriptureSearchRequest,
     ScriptureSearchResponse,
 )
-from src.api.services.scriptures import search_scriptures
-from src.embeddings.client import get_single_embedding
+from src.api.services.query_embeddings import get_query_embedding, get_query_embeddings
+from src.api.services.response_cache import get_response_cache
+from src.api.services.scriptures import (
+    lookup_scriptures,
+    search_scriptures,
+    search_scriptures_batch,
+)
+from src.api.services.single_flight import get_flight
+from src.db.generations import get_generation
+from src.references import normalize_reference, parse_references
+
+# Request limits for reference lookup
+MAX_LOOKUP_REFS = 20
+MAX_LOOKUP_PASSAGES = 100
+
+# Scripture text is static between ingestion runs (the ETag changes with
+# the corpus generation, so revalidation picks up re-ingested text)
+LOOKUP_CACHE_CONTROL = "public, max-age=86400"
 
 router = APIRouter(
     prefix="/scriptures",
@@ -28,6 +60,7 @@ router = APIRouter(
 @router.post(
     "/search",
     response_model=ScriptureSearchResponse,
+    responses=NDJSON_RESPONSES,
     summary="Search scriptures semantically",
     description="""
     Perform semantic search across scripture verses using natural language queries.
@@ -36,29 +69,96 @@ router = APIRouter(
     filtering by volume (e.g., Book of Mormon) and book (e.g., Alma).
 
     The search uses vector embeddings and cosine similarity for ranking.
+
+    Pass `fields` to return only some result fields, or send
+    `Accept: application/x-ndjson` to stream newline-delimited JSON.
+    Pass `timings=true` for a per-stage timing breakdown in `meta.timings`.
     """,
 )
 def scripture_search(
     request: ScriptureSearchRequest,
+    fields: Optional[str] = Query(
+        default=None,
+        description="Comma-separated result fields to return (e.g., 'id,text')",
+    ),
+    timings: bool = Query(
+        default=False,
+        description="Include a per-stage timing breakdown in meta",
+    ),
+    accept: Optional[str] = Header(default=None),
     db: Session = Depends(get_db),
-) -> ScriptureSearchResponse:
+) -> Response:
     """Search scriptures by semantic similarity.
 
     Args:
         request: Search request with query, filters, and options
+        fields: Optional comma-separated result field projection
+        timings: Include per-stage timings in meta
+        accept: Accept header; application/x-ndjson selects streaming
         db: Database session (injected)
 
     Returns:
-        ScriptureSearchResponse with results and metadata
+        JSON (or NDJSON) response with results and metadata
 
     Raises:
         HTTPException: If embedding generation fails
     """
     start_time = time.perf_counter()
+    label_request("scriptures", "search", request)
+    selected = parse_fields(fields, ScriptureResult.model_fields)
+
+    # Serve repeated requests from the response cache
+    cache = get_response_cache()
+    try:
+        cache_key = cache.make_key(
+            "scriptures",
+            get_generation(db, "scriptures"),
+            request.model_dump(mode="json"),
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Search failed: {str(e)}",
+        )
+    results = cache.get(cache_key)
+    cached = results is not None
+
+    if results is None:
+        # Identical concurrent requests share one embedding call and one search
+        def search_and_cache() -> list[dict]:
+            found = _run_search(request, db)
+            cache.set(cache_key, found)
+            return found
+
+        results, _ = get_flight("search:scriptures").do(cache_key, search_and_cache)
+
+    # Calculate elapsed time
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+    # Build response
+    return search_response(
+        results,
+        meta=SearchResultMeta(
+            query=request.query,
+            total_results=len(results),
+            search_time_ms=round(elapsed_ms, 2),
+            cached=cached,
+        ).model_dump(exclude_none=True),
+        fields=selected,
+        accept=accept,
+        timings=timings,
+    )
 
+
+def _run_search(request: ScriptureSearchRequest, db: Session) -> list[dict]:
+    """Embed the query and run the search (the work shared by coalesced requests).
+
+    Raises:
+        HTTPException: 503 if embedding generation fails, 500 if the search fails
+    """
     # Get embedding for the query
     try:
-        query_embedding = get_single_embedding(request.query)
+        query_embedding = get_query_embedding(request.query)
     except Exception as e:
         raise HTTPException(
             status_code=503,
@@ -67,7 +167,7 @@ def scripture_search(
 
     # Perform search
     try:
-        results = search_scriptures(
+        return search_scriptures(
             session=db,
             query_embedding=query_embedding,
             lang=request.lang.value,
@@ -81,15 +181,228 @@ def scripture_search(
             detail=f"Search failed: {str(e)}",
         )
 
-    # Calculate elapsed time
+
+@router.post(
+    "/search/batch",
+    response_model=ScriptureBatchSearchResponse,
+    responses=NDJSON_RESPONSES,
+    summary="Search scriptures for many queries at once",
+    description="""
+    Run up to 50 semantic searches that share language, limit, and filters.
+
+    All uncached queries are embedded in a single embedding API call and
+    searched in a single database round-trip. Results are returned per query,
+    in request order, and share the response cache with the single-query
+    endpoint.
+
+    Pass `fields` to return only some result fields, or send
+    `Accept: application/x-ndjson` to stream newline-delimited JSON.
+    Pass `timings=true` for a per-stage timing breakdown in `meta.timings`.
+    """,
+)
+def scripture_batch_search(
+    request: ScriptureBatchSearchRequest,
+    fields: Optional[str] = Query(
+        default=None,
+        description="Comma-separated result fields to return (e.g., 'id,text')",
+    ),
+    timings: bool = Query(
+        default=False,
+        description="Include a per-stage timing breakdown in meta",
+    ),
+    accept: Optional[str] = Header(default=None),
+    db: Session = Depends(get_db),
+) -> Response:
+    """Search scripture verses for a batch of queries.
+
+    Args:
+        request: Batch search request with queries, filters, and options
+        fields: Optional comma-separated result field projection
+        timings: Include per-stage timings in meta
+        accept: Accept header; application/x-ndjson selects streaming
+        db: Database session (injected)
+
+    Returns:
+        JSON (or NDJSON) response with per-query results and metadata
+
+    Raises:
+        HTTPException: If embedding generation or the search fails
+    """
+    start_time = time.perf_counter()
+    label_request("scriptures", "batch", request)
+    selected = parse_fields(fields, ScriptureResult.model_fields)
+
+    # Each query is cached under the same key as the equivalent single search
+    cache = get_response_cache()
+    params = request.model_dump(mode="json", exclude={"queries"})
+    try:
+        generation = get_generation(db, "scriptures")
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Search failed: {str(e)}",
+        )
+    keys = [
+        cache.make_key("scriptures", generation, {**params, "query": query})
+        for query in request.queries
+    ]
+    results = cache.get_many(keys)
+    cached = [item is not None for item in results]
+
+    # Embed and search each distinct uncached query once
+    pending: dict[str, list[int]] = {}
+    for i, key in enumerate(keys):
+        if results[i] is None:
+            pending.setdefault(key, []).append(i)
+
+    if pending:
+        queries = [request.queries[indices[0]] for indices in pending.values()]
+        try:
+            query_embeddings = get_query_embeddings(queries)
+        except Exception as e:
+            raise HTTPException(
+                status_code=503,
+                detail=f"Embedding service unavailable: {str(e)}",
+            )
+
+        try:
+            batch_results = search_scriptures_batch(
+                session=db,
+                query_embeddings=query_embeddings,
+                lang=request.lang.value,
+                limit=request.limit,
+                volume=request.volume.value if request.volume else None,
+                book=request.book,
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Search failed: {str(e)}",
+            )
+
+        for (key, indices), query_results in zip(pending.items(), batch_results):
+            cache.set(key, query_results)
+            for i in indices:
+                results[i] = query_results
+
     elapsed_ms = (time.perf_counter() - start_time) * 1000
 
-    # Build response
-    return ScriptureSearchResponse(
-        results=[ScriptureResult(**r) for r in results],
-        meta=SearchResultMeta(
-            query=request.query,
-            total_results=len(results),
+    return batch_search_response(
+        [
+            {"query": query, "results": query_results, "cached": is_cached}
+            for query, query_results, is_cached in zip(request.queries, results, cached)
+        ],
+        meta=BatchSearchMeta(
+            total_queries=len(request.queries),
+            cached_queries=sum(cached),
             search_time_ms=round(elapsed_ms, 2),
+        ).model_dump(exclude_none=True),
+        fields=selected,
+        accept=accept,
+        timings=timings,
+    )
+
+
+@router.get(
+    "/lookup",
+    response_model=ScriptureLookupResponse,
+    summary="Look up scriptures by reference",
+    description="""
+    Fetch verses directly by reference, without semantic search.
+
+    Accepts one or more `ref` parameters in English or Spanish
+    (e.g., `Alma 32:21`, `D&C 121`, `1 Nefi 3:7, 15-16`, `Genesis 1-2`)
+    and one or more `lang` parameters. Each reference is returned in every
+    requested language.
+
+    Responses carry `Cache-Control` and `ETag` headers; clients sending a
+    matching `If-None-Match` receive `304 Not Modified`.
+    """,
+)
+def scripture_lookup(
+    response: Response,
+    ref: list[str] = Query(
+        ...,
+        description="Scripture reference (repeatable), e.g. 'Alma 32:21'",
+    ),
+    lang: list[Language] = Query(
+        default=[Language.en],
+        description="Language(s) to return (repeatable)",
+    ),
+    if_none_match: Optional[str] = Header(default=None),
+    db: Session = Depends(get_db),
+) -> ScriptureLookupResponse:
+    """Look up scripture verses by reference.
+
+    Args:
+        response: Response object used to set caching headers
+        ref: Reference strings to look up
+        lang: Languages to return each reference in
+        if_none_match: ETag from a previous response (conditional GET)
+        db: Database session (injected)
+
+    Returns:
+        ScriptureLookupResponse with passages and metadata
+
+    Raises:
+        HTTPException: 422 if a reference cannot be parsed or the request
+            expands to too many passages, 500 if the lookup fails
+    """
+    if len(ref) > MAX_LOOKUP_REFS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Too many references: {len(ref)} (maximum {MAX_LOOKUP_REFS})",
+        )
+
+    # Deduplicate languages while preserving order
+    langs = list(dict.fromkeys(item.value for item in lang))
+
+    parsed = parse_references(ref)
+    unparsed = [raw for raw, refs in zip(ref, parsed) if not refs]
+    if unparsed:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unrecognized scripture reference(s): {', '.join(unparsed)}",
+        )
+
+    pairs = [(raw, item) for raw, refs in zip(ref, parsed) for item in refs]
+    if len(pairs) * len(langs) > MAX_LOOKUP_PASSAGES:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Request expands to more than {MAX_LOOKUP_PASSAGES} passages",
+        )
+
+    # The response depends on the normalized request and on the scripture
+    # text, which changes only with the corpus generation
+    generation = get_generation(db, "scriptures")
+    etag_source = (
+        "|".join(normalize_reference(raw) for raw in ref)
+        + "#" + ",".join(langs)
+        + f"#{generation}"
+    )
+    etag = f'"{hashlib.sha256(etag_source.encode("utf-8")).hexdigest()[:32]}"'
+    headers = {"Cache-Control": LOOKUP_CACHE_CONTROL, "ETag": etag}
+    if if_none_match and etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
+
+    try:
+        passages = lookup_scriptures(session=db, refs=pairs, langs=langs)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Lookup failed: {str(e)}",
+        )
+
+    response.headers.update(headers)
+
+    return ScriptureLookupResponse(
+        passages=[ScripturePassage(**p) for p in passages],
+        meta=ScriptureLookupMeta(
+            refs=ref,
+            langs=langs,
+            total_verses=sum(len(p["verses"]) for p in passages),
+            not_found=[
+                f"{p['reference']} ({p['lang']})" for p in passages if not p["verses"]
+            ],
         ),
     )
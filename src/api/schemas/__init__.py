@@ -1,15 +1,24 @@
 """Schema definitions for Scripture Search API.
 
 This package contains Pydantic models for request/response validation:
-- common: Shared models (Language, SearchRequest, SearchResultMeta)
+- common: Shared models (Language, SearchRequest, SearchResultMeta,
+  BatchSearchRequest, BatchSearchMeta)
 - scriptures: Scripture search models (future)
 - cfm: Come Follow Me search models (future)
 - conference: Conference talk search models (future)
 """
 
-from .common import Language, SearchRequest, SearchResultMeta
+from .common import (
+    BatchSearchMeta,
+    BatchSearchRequest,
+    Language,
+    SearchRequest,
+    SearchResultMeta,
+)
 
 __all__ = [
+    "BatchSearchMeta",
+    "BatchSearchRequest",
     "Language",
     "SearchRequest",
     "SearchResultMeta",
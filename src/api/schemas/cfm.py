@@ -1,15 +1,22 @@
 """Come Follow Me (CFM) search schema definitions.
 
 This module contains Pydantic models for CFM lesson search requests
-and responses, including year/testament filtering.
+and responses, including year/testament filtering and the choice between
+lesson and section results.
 """
 
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 
 from pydantic import BaseModel, Field
 
-from src.api.schemas.common import Language, SearchRequest, SearchResultMeta
+from src.api.schemas.common import (
+    BatchSearchMeta,
+    BatchSearchRequest,
+    Language,
+    SearchRequest,
+    SearchResultMeta,
+)
 
 
 class CFMTestament(str, Enum):
@@ -24,15 +31,24 @@ class CFMTestament(str, Enum):
     dc = "dc"
 
 
-class CFMSearchRequest(SearchRequest):
-    """Request model for CFM lesson semantic search.
+class CFMResultMode(str, Enum):
+    """Granularity of CFM search results.
 
-    Extends the base SearchRequest with optional year and testament filters
-    to narrow search results to specific CFM lessons.
+    lesson returns whole lessons (CFMResult); section returns the matching
+    sections of lessons (CFMSectionResult).
+    """
+
+    lesson = "lesson"
+    section = "section"
+
+
+class CFMSearchFilters(BaseModel):
+    """Filters and result mode shared by single and batch CFM search.
 
     Attributes:
         year: Optional filter for lesson year (2019-2030)
         testament: Optional filter for scripture focus (ot, nt, bom, dc)
+        result_mode: Return lessons (default) or individual lesson sections
     """
 
     year: Optional[int] = Field(
@@ -45,6 +61,22 @@ class CFMSearchRequest(SearchRequest):
         default=None,
         description="Filter results to a specific testament/scripture focus",
     )
+    result_mode: CFMResultMode = Field(
+        default=CFMResultMode.lesson,
+        description="Return whole lessons or the matching lesson sections",
+    )
+
+
+class CFMSearchRequest(SearchRequest, CFMSearchFilters):
+    """Request model for CFM lesson semantic search.
+
+    Extends the base SearchRequest with optional year and testament filters
+    to narrow search results to specific CFM lessons.
+
+    Attributes:
+        year: Optional filter for lesson year (2019-2030)
+        testament: Optional filter for scripture focus (ot, nt, bom, dc)
+    """
 
     model_config = {
         "json_schema_extra": {
@@ -148,19 +180,111 @@ class CFMResult(BaseModel):
     }
 
 
+class CFMSectionResult(BaseModel):
+    """Individual CFM section search result (result_mode "section").
+
+    A single section of a CFM lesson with its lesson's metadata, so
+    clients get the relevant passage instead of the whole lesson.
+
+    Attributes:
+        id: Database ID of the section
+        cfm_lesson_id: Database ID of the lesson the section belongs to
+        year: Lesson year
+        testament: Scripture focus (ot, nt, bom, dc)
+        lesson_id: Unique lesson identifier
+        title: Lesson title
+        date_range: Date range string for the lesson
+        section_title: Section title (empty for the lesson introduction)
+        text: Section text
+        lang: Language of the lesson
+        similarity: Semantic similarity score (0-1, higher is more similar)
+    """
+
+    id: int = Field(
+        ...,
+        description="Database ID of the section",
+    )
+    cfm_lesson_id: int = Field(
+        ...,
+        description="Database ID of the lesson the section belongs to",
+    )
+    year: int = Field(
+        ...,
+        description="Lesson year (e.g., 2024)",
+    )
+    testament: Optional[str] = Field(
+        default=None,
+        description="Scripture focus (ot, nt, bom, dc)",
+    )
+    lesson_id: str = Field(
+        ...,
+        description="Unique lesson identifier",
+    )
+    title: Optional[str] = Field(
+        default=None,
+        description="Lesson title",
+    )
+    date_range: Optional[str] = Field(
+        default=None,
+        description="Date range for the lesson",
+    )
+    section_title: str = Field(
+        default="",
+        description="Section title (empty for the lesson introduction)",
+    )
+    text: str = Field(
+        ...,
+        description="Section text",
+    )
+    lang: str = Field(
+        ...,
+        description="Language code ('en' or 'es')",
+    )
+    similarity: float = Field(
+        ...,
+        ge=0.0,
+        le=1.0,
+        description="Semantic similarity score (0-1)",
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "id": 311,
+                    "cfm_lesson_id": 42,
+                    "year": 2024,
+                    "testament": "bom",
+                    "lesson_id": "15-faith",
+                    "title": "What Is Faith?",
+                    "date_range": "April 8-14",
+                    "section_title": "Alma 32:17-43",
+                    "text": "Alma compared the word of God to a seed...",
+                    "lang": "en",
+                    "similarity": 0.8817,
+                }
+            ]
+        }
+    }
+
+
+# A result of either granularity, depending on the request's result_mode
+CFMAnyResult = Union[CFMResult, CFMSectionResult]
+
+
 class CFMSearchResponse(BaseModel):
     """Response model for CFM lesson search endpoint.
 
     Contains a list of search results and metadata about the search operation.
 
     Attributes:
-        results: List of matching CFM lessons
+        results: List of matching CFM lessons (or sections)
         meta: Metadata about the search (query, count, timing)
     """
 
-    results: list[CFMResult] = Field(
+    results: list[CFMAnyResult] = Field(
         ...,
-        description="List of matching CFM lessons",
+        description="List of matching CFM lessons (or sections)",
     )
     meta: SearchResultMeta = Field(
         ...,
@@ -194,3 +318,51 @@ class CFMSearchResponse(BaseModel):
             ]
         }
     }
+
+
+class CFMBatchSearchRequest(BatchSearchRequest, CFMSearchFilters):
+    """Request model for batch CFM search.
+
+    Runs every query with the same language, limit, and filters.
+    """
+
+
+class CFMBatchResult(BaseModel):
+    """Results for a single query in a batch search.
+
+    Attributes:
+        query: The search query
+        results: List of matching CFM lessons (or sections)
+        cached: Whether the results were served from the response cache
+    """
+
+    query: str = Field(
+        ...,
+        description="The search query",
+    )
+    results: list[CFMAnyResult] = Field(
+        ...,
+        description="List of matching CFM lessons (or sections)",
+    )
+    cached: bool = Field(
+        default=False,
+        description="Whether the results were served from the response cache",
+    )
+
+
+class CFMBatchSearchResponse(BaseModel):
+    """Response model for the batch CFM search endpoint.
+
+    Attributes:
+        results: Per-query results, in request order
+        meta: Metadata about the batch (query count, cache hits, timing)
+    """
+
+    results: list[CFMBatchResult] = Field(
+        ...,
+        description="Per-query results, in request order",
+    )
+    meta: BatchSearchMeta = Field(
+        ...,
+        description="Batch metadata (query count, cache hits, timing)",
+    )
@@ -4,9 +4,12 @@ This module contains shared schema components used across all search endpoints:
 - Language enum for supported languages
 - SearchRequest base model for all search requests
 - SearchResultMeta for response metadata
+- BatchSearchRequest and BatchSearchMeta for batch search endpoints
+- SearchTimings for the optional per-stage timing breakdown
 """
 
 from enum import Enum
+from typing import Annotated, Optional
 
 from pydantic import BaseModel, Field
 
@@ -66,6 +69,31 @@ class SearchRequest(BaseModel):
     }
 
 
+class SearchTimings(BaseModel):
+    """Per-stage timing breakdown of a search request (?timings=true).
+
+    Stages are exclusive; total_ms also covers routing and validation.
+    See src/api/timing.py.
+
+    Attributes:
+        queue_ms: Threadpool wait before the route started
+        pool_wait_ms: Wait for a pooled database connection
+        embed_ms: Query embedding calls
+        db_ms: SQL execution
+        hydrate_ms: Result row cache lookups
+        serialize_ms: Rendering the results as JSON
+        total_ms: Request time until the meta was rendered
+    """
+
+    queue_ms: float = Field(default=0.0, description="Threadpool wait before the route started")
+    pool_wait_ms: float = Field(default=0.0, description="Wait for a database connection")
+    embed_ms: float = Field(default=0.0, description="Query embedding calls")
+    db_ms: float = Field(default=0.0, description="SQL execution")
+    hydrate_ms: float = Field(default=0.0, description="Result row cache lookups")
+    serialize_ms: float = Field(default=0.0, description="Rendering the results as JSON")
+    total_ms: float = Field(default=0.0, description="Request time until the meta was rendered")
+
+
 class SearchResultMeta(BaseModel):
     """Metadata about search results.
 
@@ -76,6 +104,8 @@ class SearchResultMeta(BaseModel):
         query: The original search query
         total_results: Number of results returned
         search_time_ms: Time taken to perform the search in milliseconds
+        cached: Whether the results were served from the response cache
+        timings: Per-stage timing breakdown (only with ?timings=true)
     """
 
     query: str = Field(
@@ -92,6 +122,14 @@ class SearchResultMeta(BaseModel):
         ge=0,
         description="Search execution time in milliseconds",
     )
+    cached: bool = Field(
+        default=False,
+        description="Whether the results were served from the response cache",
+    )
+    timings: Optional[SearchTimings] = Field(
+        default=None,
+        description="Per-stage timing breakdown (only with ?timings=true)",
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -104,3 +142,80 @@ class SearchResultMeta(BaseModel):
             ]
         }
     }
+
+
+# Maximum number of queries in a single batch search request
+MAX_BATCH_QUERIES = 50
+
+
+class BatchSearchRequest(BaseModel):
+    """Base model for batch search requests.
+
+    Runs many queries with the same language, limit, and filters in one
+    request. All queries are embedded in a single embedding API call.
+
+    Attributes:
+        queries: Natural language search queries
+        lang: Language to search in (English or Spanish)
+        limit: Maximum number of results to return per query
+    """
+
+    queries: list[Annotated[str, Field(min_length=3, max_length=500)]] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_QUERIES,
+        description=f"Search queries (1-{MAX_BATCH_QUERIES}, each 3-500 characters)",
+    )
+    lang: Language = Field(
+        default=Language.en,
+        description="Language to search in",
+    )
+    limit: int = Field(
+        default=10,
+        ge=1,
+        le=50,
+        description="Maximum number of results to return per query (1-50)",
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "queries": ["faith in Jesus Christ", "the power of prayer"],
+                    "lang": "en",
+                    "limit": 5,
+                }
+            ]
+        }
+    }
+
+
+class BatchSearchMeta(BaseModel):
+    """Metadata about a batch search.
+
+    Attributes:
+        total_queries: Number of queries in the batch
+        cached_queries: Number of queries served from the response cache
+        search_time_ms: Time taken for the whole batch in milliseconds
+        timings: Per-stage timing breakdown (only with ?timings=true)
+    """
+
+    total_queries: int = Field(
+        ...,
+        ge=0,
+        description="Number of queries in the batch",
+    )
+    cached_queries: int = Field(
+        ...,
+        ge=0,
+        description="Number of queries served from the response cache",
+    )
+    search_time_ms: float = Field(
+        ...,
+        ge=0,
+        description="Batch execution time in milliseconds",
+    )
+    timings: Optional[SearchTimings] = Field(
+        default=None,
+        description="Per-stage timing breakdown (only with ?timings=true)",
+    )
@@ -8,14 +8,16 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
-from src.api.schemas.common import SearchRequest, SearchResultMeta
+from src.api.schemas.common import (
+    BatchSearchMeta,
+    BatchSearchRequest,
+    SearchRequest,
+    SearchResultMeta,
+)
 
 
-class ConferenceSearchRequest(SearchRequest):
-    """Request model for General Conference talk semantic search.
-
-    Extends the base SearchRequest with optional year, month, and speaker
-    filters to narrow search results to specific conference talks.
+class ConferenceSearchFilters(BaseModel):
+    """Year, month, and speaker filters shared by single and batch conference search.
 
     Attributes:
         year: Optional filter for conference year (2014-2030)
@@ -41,6 +43,19 @@ class ConferenceSearchRequest(SearchRequest):
         description="Partial match filter for speaker name",
     )
 
+
+class ConferenceSearchRequest(SearchRequest, ConferenceSearchFilters):
+    """Request model for General Conference talk semantic search.
+
+    Extends the base SearchRequest with optional year, month, and speaker
+    filters to narrow search results to specific conference talks.
+
+    Attributes:
+        year: Optional filter for conference year (2014-2030)
+        month: Optional filter for conference month ("04" or "10")
+        speaker: Optional partial match filter for speaker name
+    """
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -218,3 +233,51 @@ class ConferenceSearchResponse(BaseModel):
             ]
         }
     }
+
+
+class ConferenceBatchSearchRequest(BatchSearchRequest, ConferenceSearchFilters):
+    """Request model for batch conference search.
+
+    Runs every query with the same language, limit, and filters.
+    """
+
+
+class ConferenceBatchResult(BaseModel):
+    """Results for a single query in a batch search.
+
+    Attributes:
+        query: The search query
+        results: List of matching conference paragraphs
+        cached: Whether the results were served from the response cache
+    """
+
+    query: str = Field(
+        ...,
+        description="The search query",
+    )
+    results: list[ConferenceResult] = Field(
+        ...,
+        description="List of matching conference paragraphs",
+    )
+    cached: bool = Field(
+        default=False,
+        description="Whether the results were served from the response cache",
+    )
+
+
+class ConferenceBatchSearchResponse(BaseModel):
+    """Response model for the batch conference search endpoint.
+
+    Attributes:
+        results: Per-query results, in request order
+        meta: Metadata about the batch (query count, cache hits, timing)
+    """
+
+    results: list[ConferenceBatchResult] = Field(
+        ...,
+        description="Per-query results, in request order",
+    )
+    meta: BatchSearchMeta = Field(
+        ...,
+        description="Batch metadata (query count, cache hits, timing)",
+    )
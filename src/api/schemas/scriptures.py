@@ -9,7 +9,13 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
-from src.api.schemas.common import Language, SearchRequest, SearchResultMeta
+from src.api.schemas.common import (
+    BatchSearchMeta,
+    BatchSearchRequest,
+    Language,
+    SearchRequest,
+    SearchResultMeta,
+)
 
 
 class ScriptureVolume(str, Enum):
@@ -25,11 +31,8 @@ class ScriptureVolume(str, Enum):
     pearlofgreatprice = "pearlofgreatprice"
 
 
-class ScriptureSearchRequest(SearchRequest):
-    """Request model for scripture semantic search.
-
-    Extends the base SearchRequest with optional volume and book filters
-    to narrow search results to specific scriptures.
+class ScriptureSearchFilters(BaseModel):
+    """Volume and book filters shared by single and batch scripture search.
 
     Attributes:
         volume: Optional filter for scripture volume
@@ -47,6 +50,18 @@ class ScriptureSearchRequest(SearchRequest):
         json_schema_extra={"example": "alma"},
     )
 
+
+class ScriptureSearchRequest(SearchRequest, ScriptureSearchFilters):
+    """Request model for scripture semantic search.
+
+    Extends the base SearchRequest with optional volume and book filters
+    to narrow search results to specific scriptures.
+
+    Attributes:
+        volume: Optional filter for scripture volume
+        book: Optional filter for specific book within a volume
+    """
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -196,3 +211,215 @@ class ScriptureSearchResponse(BaseModel):
             ]
         }
     }
+
+
+class ScriptureVerse(BaseModel):
+    """A single verse within a looked-up passage.
+
+    Attributes:
+        id: Database ID of the scripture verse
+        verse: Verse number
+        text: Full text of the verse
+    """
+
+    id: int = Field(
+        ...,
+        description="Database ID of the scripture verse",
+    )
+    verse: int = Field(
+        ...,
+        description="Verse number",
+    )
+    text: str = Field(
+        ...,
+        description="Full text of the verse",
+    )
+
+
+class ScripturePassage(BaseModel):
+    """A passage returned by reference lookup.
+
+    One passage is returned per parsed chapter/verse range and language,
+    so "Alma 32:21, 27" in English and Spanish yields four passages.
+
+    Attributes:
+        ref: The reference string as supplied by the client
+        reference: Formatted reference in the passage language (e.g., "Alma 32:21")
+        lang: Language of the passage
+        volume: Scripture volume containing the passage
+        book: Book ID as stored for the passage language
+        chapter: Chapter number
+        verse_start: First verse requested (None for a whole chapter)
+        verse_end: Last verse requested (None for a whole chapter, or
+                   through the end of the chapter when verse_start is set)
+        verses: Verses found, in verse order
+    """
+
+    ref: str = Field(
+        ...,
+        description="Reference as supplied in the request",
+    )
+    reference: str = Field(
+        ...,
+        description="Formatted reference (e.g., 'Alma 32:21')",
+    )
+    lang: str = Field(
+        ...,
+        description="Language code ('en' or 'es')",
+    )
+    volume: str = Field(
+        ...,
+        description="Scripture volume (e.g., 'bookofmormon')",
+    )
+    book: str = Field(
+        ...,
+        description="Book ID as stored for this language (e.g., 'alma', '1-ne')",
+    )
+    chapter: int = Field(
+        ...,
+        description="Chapter number (section number for D&C)",
+    )
+    verse_start: Optional[int] = Field(
+        default=None,
+        description="First verse requested (null for a whole chapter)",
+    )
+    verse_end: Optional[int] = Field(
+        default=None,
+        description=(
+            "Last verse requested (null for a whole chapter, or through the "
+            "end of the chapter when verse_start is set, e.g. 'Mosiah 2:17ff')"
+        ),
+    )
+    verses: list[ScriptureVerse] = Field(
+        ...,
+        description="Verses in the passage, in verse order",
+    )
+
+
+class ScriptureLookupMeta(BaseModel):
+    """Metadata about a reference lookup.
+
+    Attributes:
+        refs: Reference strings from the request
+        langs: Languages requested
+        total_verses: Number of verses returned across all passages
+        not_found: Formatted references that matched no verses
+    """
+
+    refs: list[str] = Field(
+        ...,
+        description="Reference strings from the request",
+    )
+    langs: list[str] = Field(
+        ...,
+        description="Languages requested",
+    )
+    total_verses: int = Field(
+        ...,
+        ge=0,
+        description="Number of verses returned across all passages",
+    )
+    not_found: list[str] = Field(
+        default_factory=list,
+        description="Formatted references that matched no verses",
+    )
+
+
+class ScriptureLookupResponse(BaseModel):
+    """Response model for scripture reference lookup endpoint.
+
+    Attributes:
+        passages: Passages in request order, grouped by language
+        meta: Metadata about the lookup
+    """
+
+    passages: list[ScripturePassage] = Field(
+        ...,
+        description="Passages in request order",
+    )
+    meta: ScriptureLookupMeta = Field(
+        ...,
+        description="Lookup metadata (refs, languages, counts)",
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "passages": [
+                        {
+                            "ref": "Alma 32:21",
+                            "reference": "Alma 32:21",
+                            "lang": "en",
+                            "volume": "bookofmormon",
+                            "book": "alma",
+                            "chapter": 32,
+                            "verse_start": 21,
+                            "verse_end": 21,
+                            "verses": [
+                                {
+                                    "id": 12345,
+                                    "verse": 21,
+                                    "text": "And now as I said concerning faith...",
+                                }
+                            ],
+                        }
+                    ],
+                    "meta": {
+                        "refs": ["Alma 32:21"],
+                        "langs": ["en"],
+                        "total_verses": 1,
+                        "not_found": [],
+                    },
+                }
+            ]
+        }
+    }
+
+
+class ScriptureBatchSearchRequest(BatchSearchRequest, ScriptureSearchFilters):
+    """Request model for batch scripture search.
+
+    Runs every query with the same language, limit, and filters.
+    """
+
+
+class ScriptureBatchResult(BaseModel):
+    """Results for a single query in a batch search.
+
+    Attributes:
+        query: The search query
+        results: List of matching scripture verses
+        cached: Whether the results were served from the response cache
+    """
+
+    query: str = Field(
+        ...,
+        description="The search query",
+    )
+    results: list[ScriptureResult] = Field(
+        ...,
+        description="List of matching scripture verses",
+    )
+    cached: bool = Field(
+        default=False,
+        description="Whether the results were served from the response cache",
+    )
+
+
+class ScriptureBatchSearchResponse(BaseModel):
+    """Response model for the batch scripture search endpoint.
+
+    Attributes:
+        results: Per-query results, in request order
+        meta: Metadata about the batch (query count, cache hits, timing)
+    """
+
+    results: list[ScriptureBatchResult] = Field(
+        ...,
+        description="Per-query results, in request order",
+    )
+    meta: BatchSearchMeta = Field(
+        ...,
+        description="Batch metadata (query count, cache hits, timing)",
+    )
@@ -0,0 +1,377 @@
+"""Pluggable key/value cache backends shared by the API caches.
+
+The response cache, the query embedding cache, and the hydrated row cache
+all store bytes through the CacheBackend interface, so the storage tier can
+be switched by configuration:
+
+- local: in-process LRU (default; each worker has its own cache)
+- redis: shared Redis instance (all workers share warm state and pay for
+  each Azure embedding call once)
+- none: caching disabled
+
+Backends also provide short-lived locks used by get_or_compute for
+single-flight computation: when many requests miss the same key at once,
+one computes the value while the others wait for it to appear.
+
+Redis is only a cache: when it is down or slow, failed reads are served as
+misses, failed writes are skipped, and lock calls let the caller compute,
+so searches keep working without it. Every Redis call is bounded by
+REDIS_SOCKET_TIMEOUT and REDIS_CONNECT_TIMEOUT, so a hung or unreachable
+server costs a request tens of milliseconds, not a blocked thread. Failures are counted in the
+cache_backend_errors_total metric and logged when Redis goes down and
+comes back.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Optional, Protocol, Sequence
+
+from src.api.config import get_settings
+from src.api.metrics import record_cache_error
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Key/value interface a cache backend must provide."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored value for key, or None on a miss."""
+        ...
+
+    def get_many(self, keys: Sequence[str]) -> list[Optional[bytes]]:
+        """Return stored values for keys (None for misses), in key order."""
+        ...
+
+    def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        """Store value under key, expiring after ttl seconds if given."""
+        ...
+
+    def set_many(self, items: dict[str, bytes], ttl: Optional[int] = None) -> None:
+        """Store several values at once."""
+        ...
+
+    def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        """Try to take the lock for key; return a release token or None if held."""
+        ...
+
+    def release_lock(self, key: str, token: str) -> None:
+        """Release a lock taken with acquire_lock (no-op if it expired)."""
+        ...
+
+
+class LocalCacheBackend:
+    """Thread-safe in-process LRU backend.
+
+    TTLs are ignored; entries leave the cache by LRU eviction only.
+
+    Attributes:
+        maxsize: Maximum number of entries kept
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._locks: dict[str, tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def get_many(self, keys: Sequence[str]) -> list[Optional[bytes]]:
+        return [self.get(key) for key in keys]
+
+    def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        self.set_many({key: value})
+
+    def set_many(self, items: dict[str, bytes], ttl: Optional[int] = None) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            for key, value in items.items():
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        now = time.monotonic()
+        with self._lock:
+            held = self._locks.get(key)
+            if held is not None and held[1] > now:
+                return None
+            token = uuid.uuid4().hex
+            self._locks[key] = (token, now + ttl)
+            return token
+
+    def release_lock(self, key: str, token: str) -> None:
+        with self._lock:
+            held = self._locks.get(key)
+            if held is not None and held[0] == token:
+                del self._locks[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class NullCacheBackend:
+    """Backend that stores nothing (caching disabled).
+
+    Locks always succeed, so get_or_compute degrades to plain computation.
+    """
+
+    def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    def get_many(self, keys: Sequence[str]) -> list[Optional[bytes]]:
+        return [None] * len(keys)
+
+    def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        pass
+
+    def set_many(self, items: dict[str, bytes], ttl: Optional[int] = None) -> None:
+        pass
+
+    def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        return "null"
+
+    def release_lock(self, key: str, token: str) -> None:
+        pass
+
+
+# Delete the lock only if it still holds our token (it may have expired and
+# been taken by another worker in the meantime)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class RedisCacheBackend:
+    """Backend storing values in a shared Redis instance.
+
+    Multi-key reads use a single MGET and multi-key writes a single pipeline,
+    so hydrating a page of results costs one round-trip. Locks are
+    ``SET NX PX`` keys released with a compare-and-delete script.
+
+    Redis errors never reach the caller: reads return misses, writes are
+    skipped, and acquire_lock grants the lock so the caller computes.
+
+    Attributes:
+        client: redis.Redis client (bytes responses)
+        prefix: Namespace prepended to every key
+        errors: Exception types treated as Redis being unavailable
+            (default: redis.RedisError)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        prefix: str = "",
+        errors: Optional[tuple[type[BaseException], ...]] = None,
+    ) -> None:
+        self.client = client
+        self.prefix = prefix
+        if errors is None:
+            import redis
+
+            errors = (redis.RedisError,)
+        self.errors = errors
+        self._failing = False
+
+    def _failed(self, operation: str, error: BaseException) -> None:
+        record_cache_error(operation)
+        if not self._failing:
+            self._failing = True
+            logger.warning("Redis cache unavailable (%s): %s", operation, error)
+
+    def _recovered(self) -> None:
+        if self._failing:
+            self._failing = False
+            logger.warning("Redis cache available again")
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            value = self.client.get(self.prefix + key)
+        except self.errors as e:
+            self._failed("get", e)
+            return None
+        self._recovered()
+        return value
+
+    def get_many(self, keys: Sequence[str]) -> list[Optional[bytes]]:
+        if not keys:
+            return []
+        try:
+            values = self.client.mget([self.prefix + key for key in keys])
+        except self.errors as e:
+            self._failed("get_many", e)
+            return [None] * len(keys)
+        self._recovered()
+        return values
+
+    def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        try:
+            self.client.set(self.prefix + key, value, ex=ttl)
+        except self.errors as e:
+            self._failed("set", e)
+            return
+        self._recovered()
+
+    def set_many(self, items: dict[str, bytes], ttl: Optional[int] = None) -> None:
+        if not items:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.set(self.prefix + key, value, ex=ttl)
+            pipe.execute()
+        except self.errors as e:
+            self._failed("set_many", e)
+            return
+        self._recovered()
+
+    def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        token = uuid.uuid4().hex
+        try:
+            acquired = self.client.set(
+                f"{self.prefix}lock:{key}", token, nx=True, px=int(ttl * 1000)
+            )
+        except self.errors as e:
+            # Without Redis there is nothing to wait on: compute right away
+            self._failed("lock", e)
+            return token
+        self._recovered()
+        return token if acquired else None
+
+    def release_lock(self, key: str, token: str) -> None:
+        try:
+            self.client.eval(_RELEASE_LOCK_SCRIPT, 1, f"{self.prefix}lock:{key}", token)
+        except self.errors as e:
+            self._failed("unlock", e)
+
+
+def get_or_compute(
+    backend: CacheBackend,
+    key: str,
+    compute: Callable[[], bytes],
+    ttl: Optional[int] = None,
+    lock_ttl: float = 10.0,
+    wait_timeout: float = 5.0,
+    poll_interval: float = 0.02,
+) -> bytes:
+    """Return the cached value for key, computing it at most once across workers.
+
+    On a miss the caller tries to take the key's lock. The lock holder
+    computes and stores the value; everyone else polls the backend until it
+    appears. If the holder does not deliver within wait_timeout (slow or
+    failed), waiters compute the value themselves.
+
+    Args:
+        backend: Cache backend
+        key: Cache key
+        compute: Produces the value on a miss
+        ttl: Optional expiry for the stored value, in seconds
+        lock_ttl: Lock expiry in seconds (bounds how long a crashed holder blocks)
+        wait_timeout: Maximum time to wait for another worker's value
+        poll_interval: Delay between polls while waiting
+
+    Returns:
+        The cached or freshly computed value.
+    """
+    value = backend.get(key)
+    if value is not None:
+        return value
+
+    token = backend.acquire_lock(key, lock_ttl)
+    if token is None:
+        deadline = time.monotonic() + wait_timeout
+        while time.monotonic() < deadline:
+            time.sleep(poll_interval)
+            value = backend.get(key)
+            if value is not None:
+                return value
+        value = compute()
+        backend.set(key, value, ttl)
+        return value
+
+    try:
+        value = compute()
+        backend.set(key, value, ttl)
+        return value
+    finally:
+        backend.release_lock(key, token)
+
+
+def create_backend(
+    name: str,
+    maxsize: int = 0,
+    redis_url: str = "",
+    prefix: str = "",
+    socket_timeout: Optional[float] = None,
+    connect_timeout: Optional[float] = None,
+) -> CacheBackend:
+    """Create a cache backend by name.
+
+    Args:
+        name: Backend name ("local", "redis", or "none")
+        maxsize: Maximum entries for the local backend
+        redis_url: Redis connection URL for the redis backend
+        prefix: Key namespace for the redis backend
+        socket_timeout: Redis command timeout in seconds (None waits forever)
+        connect_timeout: Redis connection timeout in seconds
+
+    Returns:
+        CacheBackend instance.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if name == "local":
+        return LocalCacheBackend(maxsize)
+    if name == "redis":
+        # Imported lazily so the redis package is only needed when used
+        import redis
+
+        client = redis.Redis.from_url(
+            redis_url,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=connect_timeout,
+        )
+        return RedisCacheBackend(client, prefix=prefix)
+    if name == "none":
+        return NullCacheBackend()
+    raise ValueError(f"Unknown cache backend: {name}")
+
+
+@lru_cache
+def get_cache_backend() -> CacheBackend:
+    """Get the process-wide cache backend configured from settings.
+
+    Returns:
+        CacheBackend shared by the response, embedding, and row caches.
+    """
+    settings = get_settings()
+    return create_backend(
+        settings.cache_backend,
+        maxsize=settings.local_cache_size,
+        redis_url=settings.redis_url,
+        prefix=settings.redis_prefix,
+        socket_timeout=settings.redis_socket_timeout,
+        connect_timeout=settings.redis_connect_timeout,
+    )
@@ -2,13 +2,34 @@
 
 This module provides CFM-specific search functionality,
 building on the core vector search with year and testament filters.
+
+Lessons are stored both whole (cfm_lessons) and section by section
+(cfm_sections). Section search returns the matching sections themselves.
+With CFM_SEARCH_SECTIONS enabled, lesson search ranks lessons by their
+best-matching section rather than by the lesson vector, whose context is
+truncated for long lessons.
 """
 
 from typing import Optional
 
 from sqlalchemy.orm import Session
 
-from src.api.services.search import execute_vector_search
+from src.api.config import get_settings
+from src.api.services.hydration import hydrate_rows
+from src.api.services.search import (
+    execute_hydrated_batch_search,
+    execute_hydrated_pooled_batch_search,
+    execute_hydrated_search,
+)
+
+
+def search_mode() -> str:
+    """Lesson ranking in effect: 'sections' (max-pooled sections) or 'lesson'.
+
+    Included in response cache keys so switching modes never serves results
+    ranked the other way.
+    """
+    return "sections" if get_settings().cfm_search_sections else "lesson"
 
 
 def search_cfm_lessons(
@@ -26,7 +47,7 @@ def search_cfm_lessons(
 
     Args:
         session: SQLAlchemy database session
-        query_embedding: Query vector (1536 dimensions)
+        query_embedding: Query vector (embedding provider dimensions)
         lang: Language code ('en' or 'es')
         limit: Maximum number of results
         year: Optional year filter (e.g., 2024)
@@ -35,47 +56,202 @@ def search_cfm_lessons(
     Returns:
         List of CFM lesson result dictionaries with content_preview
     """
-    # Build optional filters
-    additional_filters = ""
-    filter_params = {}
+    if search_mode() == "sections":
+        return search_cfm_lessons_batch(
+            session, [query_embedding], lang, limit, year, testament
+        )[0]
 
-    if year:
-        additional_filters += " AND year = :year"
-        filter_params["year"] = year
-
-    if testament:
-        additional_filters += " AND testament = :testament"
-        filter_params["testament"] = testament
+    additional_filters, filter_params = _build_filters(year, testament)
 
     # Execute search
-    results = execute_vector_search(
+    results = execute_hydrated_search(
         session=session,
         table="cfm_lessons",
         query_embedding=query_embedding,
         lang=lang,
         limit=limit,
-        select_columns="id, year, testament, lesson_id, title, date_range, scripture_refs, content, lang",
         additional_filters=additional_filters,
         filter_params=filter_params,
     )
 
-    # Format results with content_preview (first 500 chars)
-    formatted_results = []
-    for row in results:
-        content = row.get("content") or ""
-        content_preview = content[:500] if len(content) > 500 else content
-
-        formatted_results.append({
-            "id": row["id"],
-            "year": row["year"],
-            "testament": row["testament"],
-            "lesson_id": row["lesson_id"],
-            "title": row["title"],
-            "date_range": row["date_range"],
-            "scripture_refs": row["scripture_refs"],
-            "content_preview": content_preview,
-            "lang": row["lang"],
-            "similarity": round(row["similarity"], 4),
-        })
-
-    return formatted_results
+    return [_format_result(row) for row in results]
+
+
+def search_cfm_lessons_batch(
+    session: Session,
+    query_embeddings: list[list[float]],
+    lang: str,
+    limit: int,
+    year: Optional[int] = None,
+    testament: Optional[str] = None,
+) -> list[list[dict]]:
+    """Search CFM lessons for many queries in one database round-trip.
+
+    Args:
+        session: SQLAlchemy database session
+        query_embeddings: Query vectors (embedding provider dimensions each)
+        lang: Language code ('en' or 'es')
+        limit: Maximum number of results per query
+        year: Optional year filter (e.g., 2024)
+        testament: Optional testament filter ('ot', 'nt', 'bom', 'dc')
+
+    Returns:
+        One list of CFM lesson result dictionaries per query, in query order
+    """
+    additional_filters, filter_params = _build_filters(year, testament)
+
+    if search_mode() == "sections":
+        batch_results = execute_hydrated_pooled_batch_search(
+            session=session,
+            table="cfm_sections",
+            parent_table="cfm_lessons",
+            parent_key="lesson_id",
+            query_embeddings=query_embeddings,
+            lang=lang,
+            limit=limit,
+            additional_filters=additional_filters,
+            filter_params=filter_params,
+        )
+    else:
+        batch_results = execute_hydrated_batch_search(
+            session=session,
+            table="cfm_lessons",
+            query_embeddings=query_embeddings,
+            lang=lang,
+            limit=limit,
+            additional_filters=additional_filters,
+            filter_params=filter_params,
+        )
+
+    return [[_format_result(row) for row in results] for results in batch_results]
+
+
+def search_cfm_sections(
+    session: Session,
+    query_embedding: list[float],
+    lang: str,
+    limit: int,
+    year: Optional[int] = None,
+    testament: Optional[str] = None,
+) -> list[dict]:
+    """Search individual CFM lesson sections by semantic similarity.
+
+    Args:
+        session: SQLAlchemy database session
+        query_embedding: Query vector (embedding provider dimensions)
+        lang: Language code ('en' or 'es')
+        limit: Maximum number of sections
+        year: Optional lesson year filter (e.g., 2024)
+        testament: Optional testament filter ('ot', 'nt', 'bom', 'dc')
+
+    Returns:
+        List of CFM section result dictionaries with their lesson's metadata
+    """
+    return search_cfm_sections_batch(
+        session, [query_embedding], lang, limit, year, testament
+    )[0]
+
+
+def search_cfm_sections_batch(
+    session: Session,
+    query_embeddings: list[list[float]],
+    lang: str,
+    limit: int,
+    year: Optional[int] = None,
+    testament: Optional[str] = None,
+) -> list[list[dict]]:
+    """Search CFM lesson sections for many queries in one database round-trip.
+
+    Sections are hydrated from the section row cache and their lessons'
+    metadata from the lesson row cache, so hot lessons are read once.
+
+    Args:
+        session: SQLAlchemy database session
+        query_embeddings: Query vectors (embedding provider dimensions each)
+        lang: Language code ('en' or 'es')
+        limit: Maximum number of sections per query
+        year: Optional lesson year filter (e.g., 2024)
+        testament: Optional testament filter ('ot', 'nt', 'bom', 'dc')
+
+    Returns:
+        One list of CFM section result dictionaries per query, in query order
+    """
+    lesson_filters, filter_params = _build_filters(year, testament)
+    additional_filters = ""
+    if lesson_filters:
+        # Year and testament live on the lesson
+        additional_filters = (
+            f" AND lesson_id IN (SELECT id FROM cfm_lessons WHERE TRUE{lesson_filters})"
+        )
+
+    batch_results = execute_hydrated_batch_search(
+        session=session,
+        table="cfm_sections",
+        query_embeddings=query_embeddings,
+        lang=lang,
+        limit=limit,
+        additional_filters=additional_filters,
+        filter_params=filter_params,
+    )
+
+    lesson_ids = list(dict.fromkeys(
+        row["lesson_id"] for results in batch_results for row in results
+    ))
+    lessons = hydrate_rows(session, "cfm_lessons", lesson_ids)
+    return [
+        [
+            _format_section_result(row, lessons[row["lesson_id"]])
+            for row in results
+            if row["lesson_id"] in lessons
+        ]
+        for results in batch_results
+    ]
+
+
+def _build_filters(year: Optional[int], testament: Optional[str]) -> tuple[str, dict]:
+    """Build the optional year/testament WHERE clause and its parameters."""
+    additional_filters = ""
+    filter_params = {}
+
+    if year:
+        additional_filters += " AND year = :year"
+        filter_params["year"] = year
+
+    if testament:
+        additional_filters += " AND testament = :testament"
+        filter_params["testament"] = testament
+
+    return additional_filters, filter_params
+
+
+def _format_result(row: dict) -> dict:
+    """Format a hydrated lesson row (content_preview is precomputed by the database)."""
+    return {
+        "id": row["id"],
+        "year": row["year"],
+        "testament": row["testament"],
+        "lesson_id": row["lesson_id"],
+        "title": row["title"],
+        "date_range": row["date_range"],
+        "scripture_refs": row["scripture_refs"],
+        "content_preview": row["content_preview"] or "",
+        "lang": row["lang"],
+        "similarity": round(row["similarity"], 4),
+    }
+
+
+def _format_section_result(row: dict, lesson: dict) -> dict:
+    """Format a hydrated section row with its hydrated lesson's metadata."""
+    return {
+        "id": row["id"],
+        "cfm_lesson_id": row["lesson_id"],
+        "year": lesson["year"],
+        "testament": lesson["testament"],
+        "lesson_id": lesson["lesson_id"],
+        "title": lesson["title"],
+        "date_range": lesson["date_range"],
+        "section_title": row["section_title"] or "",
+        "text": row["content"],
+        "lang": row["lang"],
+        "similarity": round(row["similarity"], 4),
+    }
@@ -8,7 +8,10 @@ from typing import Optional
 
 from sqlalchemy.orm import Session
 
-from src.api.services.search import execute_vector_search
+from src.api.services.search import (
+    execute_hydrated_batch_search,
+    execute_hydrated_search,
+)
 
 
 def search_conference_talks(
@@ -27,7 +30,7 @@ def search_conference_talks(
 
     Args:
         session: SQLAlchemy database session
-        query_embedding: Query vector (1536 dimensions)
+        query_embedding: Query vector (embedding provider dimensions)
         lang: Language code ('en' or 'es')
         limit: Maximum number of results
         year: Optional year filter (e.g., 2024)
@@ -37,7 +40,67 @@ def search_conference_talks(
     Returns:
         List of conference paragraph result dictionaries
     """
-    # Build optional filters
+    additional_filters, filter_params = _build_filters(year, month, speaker)
+
+    # Execute search
+    results = execute_hydrated_search(
+        session=session,
+        table="conference_paragraphs",
+        query_embedding=query_embedding,
+        lang=lang,
+        limit=limit,
+        additional_filters=additional_filters,
+        filter_params=filter_params,
+    )
+
+    return [_format_result(row) for row in results]
+
+
+def search_conference_talks_batch(
+    session: Session,
+    query_embeddings: list[list[float]],
+    lang: str,
+    limit: int,
+    year: Optional[int] = None,
+    month: Optional[str] = None,
+    speaker: Optional[str] = None,
+) -> list[list[dict]]:
+    """Search conference talks for many queries in one database round-trip.
+
+    Args:
+        session: SQLAlchemy database session
+        query_embeddings: Query vectors (embedding provider dimensions each)
+        lang: Language code ('en' or 'es')
+        limit: Maximum number of results per query
+        year: Optional year filter (e.g., 2024)
+        month: Optional month filter ('04' or '10')
+        speaker: Optional speaker name partial match filter
+
+    Returns:
+        One list of conference paragraph result dictionaries per query, in
+        query order
+    """
+    additional_filters, filter_params = _build_filters(year, month, speaker)
+
+    batch_results = execute_hydrated_batch_search(
+        session=session,
+        table="conference_paragraphs",
+        query_embeddings=query_embeddings,
+        lang=lang,
+        limit=limit,
+        additional_filters=additional_filters,
+        filter_params=filter_params,
+    )
+
+    return [[_format_result(row) for row in results] for results in batch_results]
+
+
+def _build_filters(
+    year: Optional[int],
+    month: Optional[str],
+    speaker: Optional[str],
+) -> tuple[str, dict]:
+    """Build the optional year/month/speaker WHERE clause and its parameters."""
     additional_filters = ""
     filter_params = {}
 
@@ -53,39 +116,24 @@ def search_conference_talks(
         additional_filters += " AND speaker_name ILIKE :speaker"
         filter_params["speaker"] = f"%{speaker}%"
 
-    # Execute search
-    results = execute_vector_search(
-        session=session,
-        table="conference_paragraphs",
-        query_embedding=query_embedding,
-        lang=lang,
-        limit=limit,
-        select_columns=(
-            "id, year, month, session, talk_uri, talk_title, speaker_name, "
-            "speaker_role, paragraph_num, text, context_text, scripture_refs, lang"
-        ),
-        additional_filters=additional_filters,
-        filter_params=filter_params,
-    )
+    return additional_filters, filter_params
+
 
-    # Format results
-    formatted_results = []
-    for row in results:
-        formatted_results.append({
-            "id": row["id"],
-            "year": row["year"],
-            "month": row["month"],
-            "session": row["session"],
-            "talk_uri": row["talk_uri"],
-            "talk_title": row["talk_title"],
-            "speaker_name": row["speaker_name"],
-            "speaker_role": row["speaker_role"],
-            "paragraph_num": row["paragraph_num"],
-            "text": row["text"],
-            "context_text": row["context_text"],
-            "scripture_refs": row["scripture_refs"],
-            "lang": row["lang"],
-            "similarity": round(row["similarity"], 4),
-        })
-
-    return formatted_results
+def _format_result(row: dict) -> dict:
+    """Format a hydrated conference paragraph row."""
+    return {
+        "id": row["id"],
+        "year": row["year"],
+        "month": row["month"],
+        "session": row["session"],
+        "talk_uri": row["talk_uri"],
+        "talk_title": row["talk_title"],
+        "speaker_name": row["speaker_name"],
+        "speaker_role": row["speaker_role"],
+        "paragraph_num": row["paragraph_num"],
+        "text": row["text"],
+        "context_text": row["context_text"],
+        "scripture_refs": row["scripture_refs"],
+        "lang": row["lang"],
+        "similarity": round(row["similarity"], 4),
+    }
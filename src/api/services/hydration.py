@@ -0,0 +1,213 @@
+"""Search result hydration with an in-process row cache.
+
+Vector search runs in two phases: the ANN query returns only ids and
+similarity scores, then the display columns for those ids are "hydrated"
+here. Hydrated rows are kept in a per-table LRU cache, so hot rows skip the
+database entirely. Cache misses are fetched in a single primary-key lookup.
+
+Rows can change in place (context generation rewrites context_text), so
+cached rows belong to a corpus generation (src/db/generations.py): when a
+request sees a newer generation the table's cache is cleared, and a request
+still on an older generation (a lagging replica) bypasses it.
+
+With the redis cache backend, rows missing from the in-process cache are
+next looked up in Redis with one multi-get, so a row fetched by any worker
+is warm for all of them. Redis keys include the generation.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable
+
+from sqlalchemy import text as sql_text
+from sqlalchemy.orm import Session
+
+from src.api.config import get_settings
+from src.api.services.cache_backends import get_cache_backend
+from src.api.timing import timed
+from src.db.generations import get_generation
+
+# Columns returned to clients for each searchable table
+HYDRATION_COLUMNS = {
+    "scriptures": "id, volume, book, chapter, verse, text, lang, context_text",
+    "cfm_lessons": (
+        "id, year, testament, lesson_id, title, date_range, scripture_refs, "
+        "content_preview, lang"
+    ),
+    "cfm_sections": "id, lesson_id, section_title, content, lang",
+    "conference_paragraphs": (
+        "id, year, month, session, talk_uri, talk_title, speaker_name, "
+        "speaker_role, paragraph_num, text, context_text, scripture_refs, lang"
+    ),
+}
+
+# Corpus whose generation covers each table
+TABLE_CORPORA = {
+    "scriptures": "scriptures",
+    "cfm_lessons": "cfm",
+    "cfm_sections": "cfm",
+    "conference_paragraphs": "conference",
+}
+
+
+class RowCache:
+    """Thread-safe LRU cache of hydrated rows keyed by row id.
+
+    Cached rows are shared between requests and must be treated as
+    read-only by callers. All cached rows belong to one corpus generation;
+    a newer generation clears the cache, an older one is not served.
+
+    Attributes:
+        maxsize: Maximum number of rows kept (0 disables caching)
+        generation: Corpus generation of the cached rows
+        hits: Number of ids served from the cache
+        misses: Number of ids that had to be fetched
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._rows: OrderedDict[int, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _roll(self, generation: int) -> bool:
+        """Move to a newer generation; returns whether the cache serves this one."""
+        if generation > self.generation:
+            self._rows.clear()
+            self.generation = generation
+        return generation == self.generation
+
+    def get_many(self, ids: Iterable[int], generation: int = 0) -> dict[int, dict[str, Any]]:
+        """Return cached rows for the given ids, marking them recently used.
+
+        Args:
+            ids: Row ids to look up
+            generation: Corpus generation the caller reads
+
+        Returns:
+            Mapping of id to cached row (empty for an older generation).
+        """
+        found: dict[int, dict[str, Any]] = {}
+        with self._lock:
+            if not self._roll(generation):
+                self.misses += len(list(ids))
+                return found
+            for row_id in ids:
+                row = self._rows.get(row_id)
+                if row is None:
+                    self.misses += 1
+                    continue
+                self._rows.move_to_end(row_id)
+                found[row_id] = row
+                self.hits += 1
+        return found
+
+    def put_many(self, rows: dict[int, dict[str, Any]], generation: int = 0) -> None:
+        """Add rows read at a generation, evicting the least recently used."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            if not self._roll(generation):
+                return
+            self._rows.update(rows)
+            for row_id in rows:
+                self._rows.move_to_end(row_id)
+            while len(self._rows) > self.maxsize:
+                self._rows.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached rows and forget their generation."""
+        with self._lock:
+            self._rows.clear()
+            self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+_caches: dict[str, RowCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_row_cache(table: str) -> RowCache:
+    """Get the row cache for a table, creating it on first use.
+
+    Args:
+        table: Name of a table in HYDRATION_COLUMNS
+
+    Returns:
+        RowCache shared by all requests in this process.
+    """
+    cache = _caches.get(table)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.setdefault(table, RowCache(get_settings().hydration_cache_size))
+    return cache
+
+
+def hydrate_rows(
+    session: Session,
+    table: str,
+    ids: list[int],
+) -> dict[int, dict[str, Any]]:
+    """Fetch display columns for search hits, using the row cache.
+
+    Args:
+        session: SQLAlchemy database session
+        table: Name of a table in HYDRATION_COLUMNS
+        ids: Row ids returned by the ANN phase
+
+    Returns:
+        Mapping of id to row dictionary. Ids that no longer exist are absent.
+    """
+    # Cache lookups are timed as hydrate; the SQL fetch counts as db
+    with timed("hydrate", exclude=("db",)):
+        return _hydrate_rows(session, table, ids)
+
+
+def _hydrate_rows(
+    session: Session,
+    table: str,
+    ids: list[int],
+) -> dict[int, dict[str, Any]]:
+    generation = get_generation(session, TABLE_CORPORA[table])
+    cache = get_row_cache(table)
+    rows = cache.get_many(ids, generation)
+    missing = [row_id for row_id in ids if row_id not in rows]
+
+    settings = get_settings()
+    shared = get_cache_backend() if settings.cache_backend == "redis" else None
+
+    if missing and shared is not None:
+        found = {}
+        keys = [_row_key(table, generation, row_id) for row_id in missing]
+        for row_id, data in zip(missing, shared.get_many(keys)):
+            if data is not None:
+                found[row_id] = json.loads(data)
+        cache.put_many(found, generation)
+        rows.update(found)
+        missing = [row_id for row_id in missing if row_id not in found]
+
+    if missing:
+        result = session.execute(
+            sql_text(f"SELECT {HYDRATION_COLUMNS[table]} FROM {table} WHERE id = ANY(:ids)"),
+            {"ids": missing},
+        )
+        fetched = {row.id: dict(row._mapping) for row in result}
+        cache.put_many(fetched, generation)
+        rows.update(fetched)
+        if shared is not None:
+            encoded = {
+                _row_key(table, generation, row_id): json.dumps(row).encode("utf-8")
+                for row_id, row in fetched.items()
+            }
+            shared.set_many(encoded, settings.cache_ttl_seconds or None)
+
+    return rows
+
+
+def _row_key(table: str, generation: int, row_id: int) -> str:
+    return f"row:{table}:{generation}:{row_id}"
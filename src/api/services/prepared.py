@@ -0,0 +1,126 @@
+"""Server-side prepared statements for the vector search shapes.
+
+The search functions in search.py build their SQL from a fixed template
+per corpus (table, columns, filter combination, batch size), so the API
+sends a small, bounded set of distinct statements. execute_prepared runs
+each one through PREPARE / EXECUTE, so Postgres parses and plans a shape
+once per connection instead of on every request, and can settle on a
+cached generic plan after five executions.
+
+psycopg2 interpolates parameters client-side, so the statement's named
+binds (:lang) are rewritten to positional parameters ($1) for PREPARE, and
+the values are passed to EXECUTE. Statement names are derived from the SQL
+text, so every worker and connection uses the same name for a shape.
+
+Prepared statements belong to a database connection. The names prepared
+on a connection are tracked in Connection.info, which lives as long as the
+DBAPI connection (across pool checkouts) and is cleared when it is
+replaced, so each pooled connection prepares a shape on first use. At
+most DB_PREPARED_STATEMENTS_PER_CONNECTION are kept per connection; the
+least recently used one is deallocated beyond that.
+
+Set DB_PREPARED_STATEMENTS=false to send plain statements (e.g., behind a
+transaction-pooling PgBouncer, where session state is not kept).
+
+Usage:
+    from src.api.services.prepared import execute_prepared
+
+    rows = execute_prepared(session, sql, params).fetchall()
+"""
+
+import hashlib
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional
+
+from sqlalchemy import text as sql_text
+from sqlalchemy.engine import Result
+from sqlalchemy.orm import Session
+
+from src.api.config import get_settings
+
+# SQLAlchemy's text() bind syntax: ':name', but not '::type' casts
+BIND_PARAM = re.compile(r"(?<![:\w\\]):(\w+)(?!:)")
+
+# Connection.info key holding the names prepared on that connection
+PREPARED_KEY = "prepared_statements"
+
+
+@lru_cache(maxsize=1024)
+def positional_sql(sql: str) -> tuple[str, str, tuple[str, ...]]:
+    """Rewrite a statement with named binds for PREPARE.
+
+    Args:
+        sql: Statement text with :name binds
+
+    Returns:
+        Tuple of (statement name, SQL with $n parameters, bind names in $n
+        order). A name used several times maps to a single parameter.
+    """
+    names: list[str] = []
+
+    def replace(match: re.Match) -> str:
+        name = match.group(1)
+        if name not in names:
+            names.append(name)
+        return f"${names.index(name) + 1}"
+
+    positional = BIND_PARAM.sub(replace, sql)
+    digest = hashlib.sha1(" ".join(sql.split()).encode()).hexdigest()[:16]
+    return f"search_{digest}", positional, tuple(names)
+
+
+def execute_sql(name: str, names: tuple[str, ...]) -> str:
+    """The EXECUTE statement for a prepared statement, with named binds."""
+    arguments = ", ".join(f":{bind}" for bind in names)
+    return f"EXECUTE {name}({arguments})" if names else f"EXECUTE {name}"
+
+
+def prepared_form(session: Session, sql: str) -> Optional[str]:
+    """The EXECUTE statement that runs sql's prepared form on this connection.
+
+    Args:
+        session: SQLAlchemy database session
+        sql: Statement text with :name binds
+
+    Returns:
+        EXECUTE statement with :name binds, or None if prepared statements
+        are disabled or sql is not prepared on the session's connection.
+    """
+    if not get_settings().db_prepared_statements:
+        return None
+    name, _, names = positional_sql(sql)
+    if name not in session.connection().info.get(PREPARED_KEY, ()):
+        return None
+    return execute_sql(name, names)
+
+
+def execute_prepared(session: Session, sql: str, params: dict[str, Any]) -> Result:
+    """Execute a statement as a prepared statement on the session's connection.
+
+    Args:
+        session: SQLAlchemy database session
+        sql: Statement text with :name binds
+        params: Bound parameters (one per bind name)
+
+    Returns:
+        Result: The statement's result, as from session.execute.
+    """
+    settings = get_settings()
+    if not settings.db_prepared_statements:
+        return session.execute(sql_text(sql), params)
+
+    name, positional, names = positional_sql(sql)
+    connection = session.connection()
+    prepared: OrderedDict[str, None] = connection.info.setdefault(PREPARED_KEY, OrderedDict())
+    if name in prepared:
+        prepared.move_to_end(name)
+    else:
+        while len(prepared) >= max(settings.db_prepared_statements_per_connection, 1):
+            oldest, _ = prepared.popitem(last=False)
+            connection.execute(sql_text(f"DEALLOCATE {oldest}"))
+        connection.execute(sql_text(f"PREPARE {name} AS {positional}"))
+        prepared[name] = None
+
+    return session.execute(sql_text(execute_sql(name, names)), params)
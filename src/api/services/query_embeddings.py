@@ -0,0 +1,139 @@
+"""Cached query embeddings from the configured embedding provider.
+
+Every search starts with an embedding call for the query text (an Azure
+OpenAI request with the default provider). Embeddings are deterministic for
+a given model and text, so they are cached in the shared cache backend and
+each distinct query is paid for once across all workers.
+
+Vectors are stored as packed little-endian float32 (6 KB for 1536
+dimensions) rather than JSON lists. pgvector stores float32, so the packing
+loses nothing the database would keep.
+"""
+
+import hashlib
+import struct
+from functools import lru_cache
+from typing import Optional
+
+from src.api.config import get_settings
+from src.api.services.cache_backends import get_cache_backend, get_or_compute
+from src.api.services.single_flight import get_flight
+from src.api.timing import timed
+from src.embeddings.providers import EmbeddingProvider, create_provider
+
+
+@lru_cache
+def get_embedding_provider() -> EmbeddingProvider:
+    """Get the embedding provider configured in settings.
+
+    Returns:
+        EmbeddingProvider shared by all requests in this process. Its column
+        is the vector column searched by the API.
+    """
+    settings = get_settings()
+    options = {}
+    if settings.embedding_provider == "azure":
+        options["deployment"] = settings.azure_openai_embedding_deployment
+    elif settings.embedding_provider == "local":
+        options = {
+            "model_name": settings.local_embedding_model,
+            "backend": settings.local_embedding_backend,
+            "num_threads": settings.local_embedding_threads,
+        }
+    return create_provider(
+        settings.embedding_provider,
+        dimensions=settings.embedding_dimensions,
+        **options,
+    )
+
+
+def pack_embedding(embedding: list[float]) -> bytes:
+    """Pack an embedding as little-endian float32 bytes."""
+    return struct.pack(f"<{len(embedding)}f", *embedding)
+
+
+def unpack_embedding(data: bytes) -> list[float]:
+    """Unpack bytes produced by pack_embedding."""
+    return list(struct.unpack(f"<{len(data) // 4}f", data))
+
+
+def embedding_key(text: str, model_id: Optional[str] = None) -> str:
+    """Build the cache key for a query embedding.
+
+    Args:
+        text: Query text (exact; embeddings are case and whitespace sensitive)
+        model_id: Provider model identifier (defaults to the configured provider)
+
+    Returns:
+        Key of the form "emb:{model_id}:{digest}".
+    """
+    if model_id is None:
+        model_id = get_embedding_provider().model_id
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+    return f"emb:{model_id}:{digest}"
+
+
+def get_query_embedding(text: str) -> list[float]:
+    """Get the embedding for a search query, using the cache.
+
+    Concurrent misses for the same text are coalesced: within a process
+    callers share one in-flight call, and across processes one worker embeds
+    it while the others wait for the cached result.
+
+    Args:
+        text: Query text
+
+    Returns:
+        Embedding vector (dimensions of the configured provider)
+    """
+    provider = get_embedding_provider()
+    key = embedding_key(text, provider.model_id)
+
+    def embed() -> bytes:
+        with timed("embed"):
+            return pack_embedding(provider.embed_one(text))
+
+    data, _ = get_flight("embedding").do(
+        key,
+        lambda: get_or_compute(
+            get_cache_backend(),
+            key,
+            embed,
+            ttl=get_settings().cache_ttl_seconds or None,
+        ),
+    )
+    return unpack_embedding(data)
+
+
+def get_query_embeddings(texts: list[str]) -> list[list[float]]:
+    """Get embeddings for several queries with one cache read and one API call.
+
+    Cached embeddings are read with a single multi-get; the remaining texts
+    are embedded in a single provider call and written back together.
+
+    Args:
+        texts: Query texts
+
+    Returns:
+        Embedding vectors in input order
+    """
+    provider = get_embedding_provider()
+    backend = get_cache_backend()
+    keys = [embedding_key(text, provider.model_id) for text in texts]
+    embeddings: list[Optional[list[float]]] = [
+        unpack_embedding(data) if data is not None else None
+        for data in backend.get_many(keys)
+    ]
+
+    missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+    if missing:
+        with timed("embed"):
+            fetched = provider.embed([texts[i] for i in missing])
+        packed = {}
+        for i, embedding in zip(missing, fetched):
+            packed[keys[i]] = pack_embedding(embedding)
+            # Round-trip so cached and uncached vectors are identical
+            embeddings[i] = unpack_embedding(packed[keys[i]])
+        backend.set_many(packed, get_settings().cache_ttl_seconds or None)
+
+    return embeddings
@@ -0,0 +1,114 @@
+"""Response cache for full search results.
+
+Search requests repeat heavily (popular topics, lesson-of-the-week queries),
+and a repeated request costs an embedding API call plus an ANN query. This
+module caches the final result list keyed on the normalized request
+parameters, so a repeat is served without either.
+
+Keys embed the corpus generation number (see src.db.generations). Ingestion
+and embedding scripts bump the generation whenever searchable data changes,
+so stale entries are never read again and simply age out of the backend.
+
+Entries are stored through the shared cache backend (see cache_backends),
+so with the redis backend every worker shares the same response cache.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any, Optional
+
+from src.api.config import get_settings
+from src.api.services.cache_backends import CacheBackend, get_cache_backend
+
+
+def normalize_search_params(params: dict[str, Any]) -> dict[str, Any]:
+    """Normalize search request parameters for use in a cache key.
+
+    Collapses whitespace in the query so trivially different spellings of
+    the same request share an entry. Case is preserved because it affects
+    the query embedding.
+
+    Args:
+        params: Request parameters (e.g., request.model_dump(mode="json"))
+
+    Returns:
+        Normalized copy of params.
+    """
+    normalized = dict(params)
+    if isinstance(normalized.get("query"), str):
+        normalized["query"] = " ".join(normalized["query"].split())
+    return normalized
+
+
+class ResponseCache:
+    """Cache of search result lists on top of a CacheBackend.
+
+    Attributes:
+        backend: Storage backend
+        ttl: Expiry for stored entries in seconds (None for no expiry)
+        hits: Number of lookups served from the cache
+        misses: Number of lookups that missed
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: Optional[int] = None) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(corpus: str, generation: int, params: dict[str, Any]) -> str:
+        """Build the cache key for a search request.
+
+        Args:
+            corpus: Corpus name ('scriptures', 'cfm', 'conference')
+            generation: Current corpus generation number
+            params: Request parameters (query, lang, limit, filters)
+
+        Returns:
+            Key of the form "search:{corpus}:{generation}:{digest}".
+        """
+        canonical = json.dumps(
+            normalize_search_params(params),
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+        return f"search:{corpus}:{generation}:{digest}"
+
+    def get(self, key: str) -> Optional[list[dict[str, Any]]]:
+        """Return cached results for key, or None on a miss."""
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(value)
+
+    def get_many(self, keys: list[str]) -> list[Optional[list[dict[str, Any]]]]:
+        """Return cached results per key (None for misses) with one backend read."""
+        values = self.backend.get_many(keys)
+        found = sum(value is not None for value in values)
+        self.hits += found
+        self.misses += len(keys) - found
+        return [None if value is None else json.loads(value) for value in values]
+
+    def set(self, key: str, results: list[dict[str, Any]]) -> None:
+        """Store results under key."""
+        self.backend.set(
+            key,
+            json.dumps(results, separators=(",", ":")).encode("utf-8"),
+            self.ttl,
+        )
+
+
+@lru_cache
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache on the configured backend.
+
+    Returns:
+        ResponseCache shared by all requests in this process.
+    """
+    return ResponseCache(get_cache_backend(), ttl=get_settings().cache_ttl_seconds or None)
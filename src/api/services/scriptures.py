@@ -2,15 +2,20 @@
 
 This module provides scripture-specific search functionality,
 building on the core vector search with scripture filters and
-reference formatting.
+reference formatting, plus direct lookup of verses by reference.
 """
 
 from typing import Optional
 
+from sqlalchemy import text as sql_text
 from sqlalchemy.orm import Session
 
-from src.api.services.search import execute_vector_search
+from src.api.services.search import (
+    execute_hydrated_batch_search,
+    execute_hydrated_search,
+)
 from src.embeddings.context import format_book_title
+from src.references import ScriptureRef, book_id_for_lang, format_reference
 
 
 def search_scriptures(
@@ -28,7 +33,7 @@ def search_scriptures(
 
     Args:
         session: SQLAlchemy database session
-        query_embedding: Query vector (1536 dimensions)
+        query_embedding: Query vector (embedding provider dimensions)
         lang: Language code ('en' or 'es')
         limit: Maximum number of results
         volume: Optional volume filter (e.g., 'bookofmormon')
@@ -37,7 +42,60 @@ def search_scriptures(
     Returns:
         List of scripture result dictionaries with formatted references
     """
-    # Build optional filters
+    additional_filters, filter_params = _build_filters(volume, book)
+
+    # Execute search
+    results = execute_hydrated_search(
+        session=session,
+        table="scriptures",
+        query_embedding=query_embedding,
+        lang=lang,
+        limit=limit,
+        additional_filters=additional_filters,
+        filter_params=filter_params,
+    )
+
+    return [_format_result(row) for row in results]
+
+
+def search_scriptures_batch(
+    session: Session,
+    query_embeddings: list[list[float]],
+    lang: str,
+    limit: int,
+    volume: Optional[str] = None,
+    book: Optional[str] = None,
+) -> list[list[dict]]:
+    """Search scriptures for many queries in one database round-trip.
+
+    Args:
+        session: SQLAlchemy database session
+        query_embeddings: Query vectors (embedding provider dimensions each)
+        lang: Language code ('en' or 'es')
+        limit: Maximum number of results per query
+        volume: Optional volume filter (e.g., 'bookofmormon')
+        book: Optional book filter (e.g., 'alma')
+
+    Returns:
+        One list of scripture result dictionaries per query, in query order
+    """
+    additional_filters, filter_params = _build_filters(volume, book)
+
+    batch_results = execute_hydrated_batch_search(
+        session=session,
+        table="scriptures",
+        query_embeddings=query_embeddings,
+        lang=lang,
+        limit=limit,
+        additional_filters=additional_filters,
+        filter_params=filter_params,
+    )
+
+    return [[_format_result(row) for row in results] for results in batch_results]
+
+
+def _build_filters(volume: Optional[str], book: Optional[str]) -> tuple[str, dict]:
+    """Build the optional volume/book WHERE clause and its parameters."""
     additional_filters = ""
     filter_params = {}
 
@@ -49,35 +107,102 @@ def search_scriptures(
         additional_filters += " AND book = :book"
         filter_params["book"] = book
 
-    # Execute search
-    results = execute_vector_search(
-        session=session,
-        table="scriptures",
-        query_embedding=query_embedding,
-        lang=lang,
-        limit=limit,
-        select_columns="id, volume, book, chapter, verse, text, lang, context_text",
-        additional_filters=additional_filters,
-        filter_params=filter_params,
-    )
+    return additional_filters, filter_params
+
+
+def _format_result(row: dict) -> dict:
+    """Format a hydrated scripture row with its reference string."""
+    book_title = format_book_title(row["book"])
+    reference = f"{book_title} {row['chapter']}:{row['verse']}"
+
+    return {
+        "id": row["id"],
+        "volume": row["volume"],
+        "book": row["book"],
+        "chapter": row["chapter"],
+        "verse": row["verse"],
+        "text": row["text"],
+        "lang": row["lang"],
+        "context_text": row["context_text"],
+        "similarity": round(row["similarity"], 4),
+        "reference": reference,
+    }
+
+
+def lookup_scriptures(
+    session: Session,
+    refs: list[tuple[str, ScriptureRef]],
+    langs: list[str],
+) -> list[dict]:
+    """Fetch verses for parsed references without a vector search.
+
+    Every (reference, language) pair becomes one passage. All passages are
+    fetched in a single round-trip: each is a UNION ALL branch filtering on
+    the full (volume, book, chapter, verse, lang) key, so each branch is an
+    index range scan on idx_scriptures_ref.
+
+    Args:
+        session: SQLAlchemy database session
+        refs: (original text, parsed reference) pairs in request order
+        langs: Language codes to fetch each reference in
+
+    Returns:
+        List of passage dictionaries (request order, then language order),
+        each with a "verses" list. Passages with no matching verses have an
+        empty list.
+    """
+    passages = []
+    branches = []
+    params = {}
+
+    for raw, ref in refs:
+        for lang in langs:
+            n = len(passages)
+            conditions = [
+                f"volume = :volume_{n}",
+                f"book = :book_{n}",
+                f"chapter = :chapter_{n}",
+                f"lang = :lang_{n}",
+            ]
+            book = book_id_for_lang(ref.book, lang)
+            params.update({
+                f"volume_{n}": ref.volume,
+                f"book_{n}": book,
+                f"chapter_{n}": ref.chapter,
+                f"lang_{n}": lang,
+            })
+            if ref.verse_start is not None:
+                conditions.append(f"verse >= :verse_start_{n}")
+                params[f"verse_start_{n}"] = ref.verse_start
+                if ref.verse_end is not None:
+                    conditions.append(f"verse <= :verse_end_{n}")
+                    params[f"verse_end_{n}"] = ref.verse_end
+
+            branches.append(
+                f"SELECT {n} AS passage, id, verse, text FROM scriptures "
+                f"WHERE {' AND '.join(conditions)}"
+            )
+            passages.append({
+                "ref": raw,
+                "reference": format_reference(ref, lang),
+                "lang": lang,
+                "volume": ref.volume,
+                "book": book,
+                "chapter": ref.chapter,
+                "verse_start": ref.verse_start,
+                "verse_end": ref.verse_end,
+                "verses": [],
+            })
+
+    if not branches:
+        return passages
 
-    # Format results with reference strings
-    formatted_results = []
-    for row in results:
-        book_title = format_book_title(row["book"])
-        reference = f"{book_title} {row['chapter']}:{row['verse']}"
-
-        formatted_results.append({
-            "id": row["id"],
-            "volume": row["volume"],
-            "book": row["book"],
-            "chapter": row["chapter"],
-            "verse": row["verse"],
-            "text": row["text"],
-            "lang": row["lang"],
-            "context_text": row["context_text"],
-            "similarity": round(row["similarity"], 4),
-            "reference": reference,
+    query = " UNION ALL ".join(branches) + " ORDER BY passage, verse"
+    for row in session.execute(sql_text(query), params):
+        passages[row.passage]["verses"].append({
+            "id": row.id,
+            "verse": row.verse,
+            "text": row.text,
         })
 
-    return formatted_results
+    return passages
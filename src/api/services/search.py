@@ -2,13 +2,62 @@
 
 This module provides the foundational vector similarity search logic
 used by all search services (scriptures, CFM, conference talks).
+
+Documents embedded as several chunks (CFM lessons in cfm_sections)
+are searched with execute_pooled_batch_search, which ranks each parent
+document by its best-matching chunk (max-pooling).
+
+Every ANN statement runs as a server-side prepared statement (one per
+query shape and connection, see prepared.py), is timed, and is handed to
+capture_query, which keeps slow and sampled statements with their EXPLAIN
+ANALYZE plans (see slow_queries.py).
+
+Query vectors are sent as pgvector text literals (psycopg2 has no binary
+parameters) built by vector_literal, at float4 precision, and each vector
+appears once per statement: the single search orders by its distance
+column instead of repeating the cast.
 """
 
-from typing import Any
+import time
+from functools import lru_cache
+from typing import Any, Sequence
 
 from sqlalchemy import text as sql_text
 from sqlalchemy.orm import Session
 
+from src.api.services.hydration import hydrate_rows
+from src.api.services.prepared import execute_prepared
+from src.api.services.query_embeddings import get_embedding_provider
+from src.api.services.slow_queries import capture_query
+
+# Chunk candidates fetched per requested parent result: the top chunks of
+# one document cluster together, so pooling needs several per result
+CHUNK_CANDIDATES_PER_RESULT = 8
+
+# hnsw.ef_search upper bound (pgvector rejects larger values)
+MAX_EF_SEARCH = 1000
+
+
+@lru_cache(maxsize=8)
+def _vector_template(dimensions: int) -> str:
+    # '%.9g' round-trips float4, the precision pgvector stores
+    return "[" + ",".join(["%.9g"] * dimensions) + "]"
+
+
+def vector_literal(vector: Sequence[float]) -> str:
+    """Format a query vector as a pgvector text literal.
+
+    About twice as fast as str(list) and a third shorter, since digits
+    beyond float4 precision (which pgvector discards) are not sent.
+
+    Args:
+        vector: Query vector
+
+    Returns:
+        Literal such as '[0.0123,-0.0456]' for CAST(... AS vector).
+    """
+    return _vector_template(len(vector)) % tuple(vector)
+
 
 def execute_vector_search(
     session: Session,
@@ -19,6 +68,7 @@ def execute_vector_search(
     select_columns: str = "*",
     additional_filters: str = "",
     filter_params: dict[str, Any] | None = None,
+    embedding_column: str = "embedding",
 ) -> list[dict[str, Any]]:
     """Execute a pgvector similarity search.
 
@@ -32,12 +82,13 @@ def execute_vector_search(
     Args:
         session: SQLAlchemy database session
         table: Name of the table to search
-        query_embedding: Query vector (1536 dimensions)
+        query_embedding: Query vector (embedding provider dimensions)
         lang: Language code ('en' or 'es')
         limit: Maximum number of results
         select_columns: Columns to select (default: "*")
         additional_filters: Optional SQL WHERE clause additions
         filter_params: Parameters for additional_filters
+        embedding_column: Vector column to search (one per embedding provider)
 
     Returns:
         List of result dictionaries with similarity scores
@@ -60,21 +111,23 @@ def execute_vector_search(
         session.execute(sql_text("SET ivfflat.probes = 100"))
 
     # Build the base query
-    # Use CAST instead of :: to avoid SQLAlchemy parameter parsing issues
+    # Use CAST instead of :: to avoid SQLAlchemy parameter parsing issues.
+    # Ordering by the distance column keeps the index ordering while the
+    # vector is bound (and parsed) only once.
     base_query = f"""
         SELECT {select_columns},
-               1 - (embedding <=> CAST(:query_embedding AS vector)) as similarity
+               {embedding_column} <=> CAST(:query_embedding AS vector) as distance
         FROM {table}
-        WHERE embedding IS NOT NULL
+        WHERE {embedding_column} IS NOT NULL
           AND lang = :lang
           {additional_filters}
-        ORDER BY embedding <=> CAST(:query_embedding AS vector)
+        ORDER BY distance
         LIMIT :limit
     """
 
     # Build parameters
     params = {
-        "query_embedding": str(query_embedding),
+        "query_embedding": vector_literal(query_embedding),
         "lang": lang,
         "limit": limit,
     }
@@ -82,8 +135,331 @@ def execute_vector_search(
         params.update(filter_params)
 
     # Execute query
-    result = session.execute(sql_text(base_query), params)
+    start = time.perf_counter()
+    result = execute_prepared(session, base_query, params)
 
-    # Convert to list of dictionaries
+    # Convert to list of dictionaries, distance to similarity
     columns = result.keys()
-    return [dict(zip(columns, row)) for row in result.fetchall()]
+    rows = [dict(zip(columns, row)) for row in result.fetchall()]
+    for row in rows:
+        row["similarity"] = 1 - row.pop("distance")
+    capture_query(session, table, base_query, params, (time.perf_counter() - start) * 1000)
+    return rows
+
+
+def execute_hydrated_search(
+    session: Session,
+    table: str,
+    query_embedding: list[float],
+    lang: str,
+    limit: int,
+    additional_filters: str = "",
+    filter_params: dict[str, Any] | None = None,
+    embedding_column: str | None = None,
+) -> list[dict[str, Any]]:
+    """Execute a two-phase vector search: ANN ids, then row hydration.
+
+    The ANN query selects only id and similarity, so large text columns are
+    never read alongside the index ordering. Display columns are then
+    hydrated by id from the in-process row cache, falling back to a single
+    primary-key query for cache misses.
+
+    Args:
+        session: SQLAlchemy database session
+        table: Name of the table to search (must be in HYDRATION_COLUMNS)
+        query_embedding: Query vector (embedding provider dimensions)
+        lang: Language code ('en' or 'es')
+        limit: Maximum number of results
+        additional_filters: Optional SQL WHERE clause additions
+        filter_params: Parameters for additional_filters
+        embedding_column: Vector column to search (defaults to the configured
+                          embedding provider's column)
+
+    Returns:
+        List of hydrated row dictionaries with similarity scores, in
+        similarity order
+    """
+    hits = execute_vector_search(
+        session=session,
+        table=table,
+        query_embedding=query_embedding,
+        lang=lang,
+        limit=limit,
+        select_columns="id",
+        additional_filters=additional_filters,
+        filter_params=filter_params,
+        embedding_column=embedding_column or get_embedding_provider().column,
+    )
+
+    rows = hydrate_rows(session, table, [hit["id"] for hit in hits])
+    return _merge_hits(hits, rows)
+
+
+def execute_batch_vector_search(
+    session: Session,
+    table: str,
+    query_embeddings: list[list[float]],
+    lang: str,
+    limit: int,
+    additional_filters: str = "",
+    filter_params: dict[str, Any] | None = None,
+    embedding_column: str = "embedding",
+) -> list[list[dict[str, Any]]]:
+    """Execute one pgvector similarity search per query in a single statement.
+
+    The query vectors are unnested and each one drives a LATERAL top-k
+    subquery, so the whole batch costs one database round-trip while every
+    subquery can still use the IVFFlat index ordering.
+
+    Args:
+        session: SQLAlchemy database session
+        table: Name of the table to search
+        query_embeddings: Query vectors (embedding provider dimensions each)
+        lang: Language code ('en' or 'es')
+        limit: Maximum number of results per query
+        additional_filters: Optional SQL WHERE clause additions
+        filter_params: Parameters for additional_filters
+        embedding_column: Vector column to search (one per embedding provider)
+
+    Returns:
+        One list of {"id", "similarity"} dictionaries per query, in query
+        order, each sorted by similarity
+    """
+    if not query_embeddings:
+        return []
+
+    # Same probes rationale as execute_vector_search
+    if additional_filters:
+        session.execute(sql_text("SET ivfflat.probes = 100"))
+
+    vectors = ", ".join(
+        f"CAST(:query_embedding_{i} AS vector)" for i in range(len(query_embeddings))
+    )
+    batch_query = f"""
+        SELECT q.ord - 1 AS query_index, hit.id, hit.similarity
+        FROM unnest(ARRAY[{vectors}]) WITH ORDINALITY AS q(query_embedding, ord)
+        CROSS JOIN LATERAL (
+            SELECT id,
+                   1 - ({embedding_column} <=> q.query_embedding) as similarity
+            FROM {table}
+            WHERE {embedding_column} IS NOT NULL
+              AND lang = :lang
+              {additional_filters}
+            ORDER BY {embedding_column} <=> q.query_embedding
+            LIMIT :limit
+        ) AS hit
+        ORDER BY query_index, hit.similarity DESC
+    """
+
+    params: dict[str, Any] = {
+        f"query_embedding_{i}": vector_literal(embedding)
+        for i, embedding in enumerate(query_embeddings)
+    }
+    params.update({"lang": lang, "limit": limit})
+    if filter_params:
+        params.update(filter_params)
+
+    start = time.perf_counter()
+    rows = execute_prepared(session, batch_query, params).fetchall()
+    capture_query(session, table, batch_query, params, (time.perf_counter() - start) * 1000)
+
+    hits: list[list[dict[str, Any]]] = [[] for _ in query_embeddings]
+    for row in rows:
+        hits[row.query_index].append({"id": row.id, "similarity": row.similarity})
+    return hits
+
+
+def execute_hydrated_batch_search(
+    session: Session,
+    table: str,
+    query_embeddings: list[list[float]],
+    lang: str,
+    limit: int,
+    additional_filters: str = "",
+    filter_params: dict[str, Any] | None = None,
+    embedding_column: str | None = None,
+) -> list[list[dict[str, Any]]]:
+    """Batch counterpart of execute_hydrated_search.
+
+    Runs the batched ANN query, then hydrates the union of all hit ids in a
+    single pass (ids shared between queries are fetched once).
+
+    Args:
+        session: SQLAlchemy database session
+        table: Name of the table to search (must be in HYDRATION_COLUMNS)
+        query_embeddings: Query vectors (embedding provider dimensions each)
+        lang: Language code ('en' or 'es')
+        limit: Maximum number of results per query
+        additional_filters: Optional SQL WHERE clause additions
+        filter_params: Parameters for additional_filters
+        embedding_column: Vector column to search (defaults to the configured
+                          embedding provider's column)
+
+    Returns:
+        One list of hydrated row dictionaries per query, in query order
+    """
+    batch_hits = execute_batch_vector_search(
+        session=session,
+        table=table,
+        query_embeddings=query_embeddings,
+        lang=lang,
+        limit=limit,
+        additional_filters=additional_filters,
+        filter_params=filter_params,
+        embedding_column=embedding_column or get_embedding_provider().column,
+    )
+
+    ids = list(dict.fromkeys(hit["id"] for hits in batch_hits for hit in hits))
+    rows = hydrate_rows(session, table, ids)
+    return [_merge_hits(hits, rows) for hits in batch_hits]
+
+
+def execute_pooled_batch_search(
+    session: Session,
+    table: str,
+    parent_table: str,
+    parent_key: str,
+    query_embeddings: list[list[float]],
+    lang: str,
+    limit: int,
+    additional_filters: str = "",
+    filter_params: dict[str, Any] | None = None,
+    embedding_column: str = "embedding",
+) -> list[list[dict[str, Any]]]:
+    """Rank parent documents by their best-matching chunk, for many queries.
+
+    Each query fetches its nearest chunks (CHUNK_CANDIDATES_PER_RESULT per
+    requested result) through the chunk table's ANN index, then groups
+    them by parent and scores every parent with its maximum chunk
+    similarity. The chunk table is joined to the parent table so filters
+    on parent columns apply.
+
+    Args:
+        session: SQLAlchemy database session
+        table: Chunk table to search (aliased c; must have lang)
+        parent_table: Parent table (aliased p) the chunks belong to
+        parent_key: Chunk column holding the parent id
+        query_embeddings: Query vectors (embedding provider dimensions each)
+        lang: Language code ('en' or 'es')
+        limit: Maximum number of parents per query
+        additional_filters: Optional SQL WHERE clause additions on parent
+                            columns
+        filter_params: Parameters for additional_filters
+        embedding_column: Vector column to search (one per embedding provider)
+
+    Returns:
+        One list of {"id", "similarity"} dictionaries per query (parent ids),
+        in query order, each sorted by similarity
+    """
+    if not query_embeddings:
+        return []
+
+    # The HNSW scan returns at most ef_search candidates (SET LOCAL: only
+    # for this transaction, so other searches keep the default)
+    candidates = min(limit * CHUNK_CANDIDATES_PER_RESULT, MAX_EF_SEARCH)
+    session.execute(sql_text(f"SET LOCAL hnsw.ef_search = {max(candidates, 40)}"))
+
+    vectors = ", ".join(
+        f"CAST(:query_embedding_{i} AS vector)" for i in range(len(query_embeddings))
+    )
+    pooled_query = f"""
+        SELECT q.ord - 1 AS query_index, hit.id, hit.similarity
+        FROM unnest(ARRAY[{vectors}]) WITH ORDINALITY AS q(query_embedding, ord)
+        CROSS JOIN LATERAL (
+            SELECT chunk.parent_id AS id, MAX(chunk.similarity) AS similarity
+            FROM (
+                SELECT c.{parent_key} AS parent_id,
+                       1 - (c.{embedding_column} <=> q.query_embedding) as similarity
+                FROM {table} c
+                JOIN {parent_table} p ON p.id = c.{parent_key}
+                WHERE c.{embedding_column} IS NOT NULL
+                  AND c.lang = :lang
+                  {additional_filters}
+                ORDER BY c.{embedding_column} <=> q.query_embedding
+                LIMIT :candidates
+            ) AS chunk
+            GROUP BY chunk.parent_id
+            ORDER BY similarity DESC
+            LIMIT :limit
+        ) AS hit
+        ORDER BY query_index, hit.similarity DESC
+    """
+
+    params: dict[str, Any] = {
+        f"query_embedding_{i}": vector_literal(embedding)
+        for i, embedding in enumerate(query_embeddings)
+    }
+    params.update({"lang": lang, "limit": limit, "candidates": candidates})
+    if filter_params:
+        params.update(filter_params)
+
+    start = time.perf_counter()
+    rows = execute_prepared(session, pooled_query, params).fetchall()
+    capture_query(session, table, pooled_query, params, (time.perf_counter() - start) * 1000)
+
+    hits: list[list[dict[str, Any]]] = [[] for _ in query_embeddings]
+    for row in rows:
+        hits[row.query_index].append({"id": row.id, "similarity": row.similarity})
+    return hits
+
+
+def execute_hydrated_pooled_batch_search(
+    session: Session,
+    table: str,
+    parent_table: str,
+    parent_key: str,
+    query_embeddings: list[list[float]],
+    lang: str,
+    limit: int,
+    additional_filters: str = "",
+    filter_params: dict[str, Any] | None = None,
+    embedding_column: str | None = None,
+) -> list[list[dict[str, Any]]]:
+    """Chunk-pooled counterpart of execute_hydrated_batch_search.
+
+    Args:
+        session: SQLAlchemy database session
+        table: Chunk table to search
+        parent_table: Parent table (must be in HYDRATION_COLUMNS)
+        parent_key: Chunk column holding the parent id
+        query_embeddings: Query vectors (embedding provider dimensions each)
+        lang: Language code ('en' or 'es')
+        limit: Maximum number of parents per query
+        additional_filters: Optional SQL WHERE clause additions on parent
+                            columns
+        filter_params: Parameters for additional_filters
+        embedding_column: Vector column to search (defaults to the configured
+                          embedding provider's column)
+
+    Returns:
+        One list of hydrated parent row dictionaries per query, in query order
+    """
+    batch_hits = execute_pooled_batch_search(
+        session=session,
+        table=table,
+        parent_table=parent_table,
+        parent_key=parent_key,
+        query_embeddings=query_embeddings,
+        lang=lang,
+        limit=limit,
+        additional_filters=additional_filters,
+        filter_params=filter_params,
+        embedding_column=embedding_column or get_embedding_provider().column,
+    )
+
+    ids = list(dict.fromkeys(hit["id"] for hits in batch_hits for hit in hits))
+    rows = hydrate_rows(session, parent_table, ids)
+    return [_merge_hits(hits, rows) for hits in batch_hits]
+
+
+def _merge_hits(
+    hits: list[dict[str, Any]],
+    rows: dict[int, dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Attach similarity scores to hydrated rows, dropping vanished ids."""
+    results = []
+    for hit in hits:
+        row = rows.get(hit["id"])
+        if row is not None:
+            results.append({**row, "similarity": hit["similarity"]})
+    return results
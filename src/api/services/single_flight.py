@@ -0,0 +1,124 @@
+"""In-process coalescing of concurrent identical work.
+
+When many requests for the same thing arrive together (a new CFM lesson goes
+live and everyone searches its title), only the first caller for a key (the
+leader) does the work; callers arriving while it is in flight (followers)
+block until it finishes and share its result or exception.
+
+Sync routes run in FastAPI's threadpool, so coalescing is thread-based.
+Coalescing across worker processes is handled separately by the cache
+backend locks (see cache_backends.get_or_compute).
+"""
+
+import threading
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """An in-flight call shared by its leader and followers."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key.
+
+    Attributes:
+        name: Name used when reporting stats
+        leaders: Number of calls that executed the work
+        followers: Number of calls that joined an in-flight call
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.leaders = 0
+        self.followers = 0
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], T]) -> tuple[T, bool]:
+        """Run fn once for all concurrent callers with the same key.
+
+        Args:
+            key: Identity of the work (callers with equal keys are coalesced)
+            fn: The work to run if no identical call is in flight
+
+        Returns:
+            Tuple of (result, shared) where shared is True if this caller
+            joined another caller's in-flight call.
+
+        Raises:
+            Exception: Whatever fn raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.followers += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+
+        try:
+            call.value = fn()
+            return call.value, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    @property
+    def fan_in(self) -> float:
+        """Average number of callers served per executed call."""
+        if not self.leaders:
+            return 0.0
+        return (self.leaders + self.followers) / self.leaders
+
+    def stats(self) -> dict[str, Any]:
+        """Return counters for monitoring."""
+        return {
+            "leaders": self.leaders,
+            "followers": self.followers,
+            "in_flight": len(self._calls),
+            "fan_in": round(self.fan_in, 3),
+        }
+
+
+_flights: dict[str, SingleFlight] = {}
+_flights_lock = threading.Lock()
+
+
+def get_flight(name: str) -> SingleFlight:
+    """Get the process-wide SingleFlight for a kind of work, creating it on first use.
+
+    Args:
+        name: Work name (e.g., "search:scriptures", "embedding")
+
+    Returns:
+        SingleFlight shared by all requests in this process.
+    """
+    flight = _flights.get(name)
+    if flight is None:
+        with _flights_lock:
+            flight = _flights.setdefault(name, SingleFlight(name))
+    return flight
+
+
+def flight_stats() -> dict[str, dict[str, Any]]:
+    """Return stats for every SingleFlight created so far, keyed by name."""
+    return {name: flight.stats() for name, flight in sorted(_flights.items())}
@@ -0,0 +1,282 @@
+"""Slow vector search capture with EXPLAIN ANALYZE.
+
+The vector search functions in search.py hand every ANN statement to
+capture_query after it runs. A statement is captured when it took longer
+than SLOW_QUERY_MS, or at random for a SLOW_QUERY_SAMPLE_RATE fraction of
+searches (so fast-path plans are visible too). A capture records:
+
+- the final SQL and its bound parameters (query vectors elided)
+- the request's corpus, endpoint, and filter shape, if known
+- the EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) plan of the same statement,
+  re-run in a savepoint of the same transaction so session settings such as
+  ivfflat.probes and hnsw.ef_search still apply. When the statement ran as
+  a prepared statement (prepared.py), its EXECUTE is explained, so the
+  plan is the one the request got, including a cached generic plan
+- whether the plan used an ANN index (an index scan ordered by <=>), and
+  every scan node, so a filter that pushes the planner to a sequential scan
+  or a non-vector index stands out
+
+Captures live in a per-process ring buffer served by GET
+/admin/slow-queries and are counted in search_slow_queries_total.
+Statements run outside an API request (CLI tools, the retrieval
+benchmark's brute-force scans) are never captured.
+
+The EXPLAIN re-runs the statement, so at most
+SLOW_QUERY_EXPLAINS_PER_MINUTE captures per process include a plan; the
+rest record the SQL and timing only. The re-run counts toward the
+request's db time.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Optional
+
+from sqlalchemy import text as sql_text
+from sqlalchemy.orm import Session
+
+from src.api.config import get_settings
+from src.api.metrics import record_slow_query
+from src.api.services.prepared import prepared_form
+from src.api.timing import current_timings
+
+# Parameters holding query vectors (elided from captures)
+VECTOR_PARAM = re.compile(r"^query_embedding(_\d+)?$")
+
+# Plan node types that read a table through an index
+INDEX_SCANS = ("Index Scan", "Index Only Scan")
+
+
+@dataclass
+class CapturedQuery:
+    """One captured vector search statement.
+
+    Attributes:
+        captured_at: UTC ISO timestamp
+        reason: 'slow' (over the threshold) or 'sampled'
+        table: Table searched
+        duration_ms: Statement time as seen by the application
+        sql: Statement text (whitespace collapsed)
+        params: Bound parameters, query vectors elided
+        request: Request labels (corpus, endpoint, filters) if known
+        index_used: Whether the plan scanned an ANN index (None without a plan)
+        scans: Scan nodes of the plan, e.g. 'Index Scan on scriptures using idx_...'
+        execution_ms: Execution time reported by EXPLAIN ANALYZE
+        plan: EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) output
+        explained: Form that was explained: 'prepared' (EXECUTE of the
+            connection's prepared statement) or 'statement' (the plain SQL)
+        error: Why the plan could not be captured, if it failed
+    """
+
+    captured_at: str
+    reason: str
+    table: str
+    duration_ms: float
+    sql: str
+    params: dict[str, Any]
+    request: dict[str, str] = field(default_factory=dict)
+    index_used: Optional[bool] = None
+    scans: list[str] = field(default_factory=list)
+    execution_ms: Optional[float] = None
+    plan: Optional[Any] = None
+    explained: Optional[str] = None
+    error: Optional[str] = None
+
+
+class SlowQueryLog:
+    """Thread-safe ring buffer of captured queries.
+
+    Args:
+        size: Captures kept (oldest dropped first)
+        explains_per_minute: Captures per minute that may run EXPLAIN ANALYZE
+
+    Attributes:
+        captured: Total captures since start (including dropped ones)
+    """
+
+    def __init__(self, size: int = 100, explains_per_minute: int = 6) -> None:
+        self._entries: deque[CapturedQuery] = deque(maxlen=size)
+        self._explains: deque[float] = deque()
+        self.explains_per_minute = explains_per_minute
+        self.captured = 0
+        self._lock = threading.Lock()
+
+    def add(self, entry: CapturedQuery) -> None:
+        """Append a capture."""
+        with self._lock:
+            self._entries.append(entry)
+            self.captured += 1
+
+    def allow_explain(self, now: Optional[float] = None) -> bool:
+        """Take an EXPLAIN slot if fewer than the per-minute budget were used."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            while self._explains and now - self._explains[0] >= 60:
+                self._explains.popleft()
+            if len(self._explains) >= self.explains_per_minute:
+                return False
+            self._explains.append(now)
+            return True
+
+    def entries(self, table: Optional[str] = None) -> list[CapturedQuery]:
+        """Captures, newest first, optionally for one table."""
+        with self._lock:
+            entries = list(self._entries)
+        return [e for e in reversed(entries) if table is None or e.table == table]
+
+    def clear(self) -> int:
+        """Drop all captures; returns how many were dropped."""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+
+
+@lru_cache
+def get_slow_query_log() -> SlowQueryLog:
+    """Get the process-wide slow query log sized from settings."""
+    settings = get_settings()
+    return SlowQueryLog(settings.slow_query_log_size, settings.slow_query_explains_per_minute)
+
+
+def capture_reason(duration_ms: float) -> Optional[str]:
+    """Decide whether a statement is captured.
+
+    Args:
+        duration_ms: Statement time
+
+    Returns:
+        'slow', 'sampled', or None to skip.
+    """
+    settings = get_settings()
+    if settings.slow_query_ms and duration_ms >= settings.slow_query_ms:
+        return "slow"
+    if settings.slow_query_sample_rate and random.random() < settings.slow_query_sample_rate:
+        return "sampled"
+    return None
+
+
+def sanitize_params(params: dict[str, Any]) -> dict[str, Any]:
+    """Replace query vectors with a short description."""
+    sanitized = {}
+    for name, value in params.items():
+        if VECTOR_PARAM.match(name):
+            dims = str(value).count(",") + 1
+            sanitized[name] = f"<vector({dims})>"
+        else:
+            sanitized[name] = value
+    return sanitized
+
+
+def _plan_nodes(node: dict[str, Any]):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def summarize_plan(plan: Any) -> tuple[bool, list[str], Optional[float]]:
+    """Find the scan nodes of an EXPLAIN (FORMAT JSON) plan.
+
+    Args:
+        plan: Parsed EXPLAIN output (a one-element list)
+
+    Returns:
+        Tuple of (whether an ANN index scan was used, scan descriptions,
+        execution time in ms).
+    """
+    root = plan[0] if isinstance(plan, list) else plan
+    index_used = False
+    scans = []
+    for node in _plan_nodes(root["Plan"]):
+        node_type = node.get("Node Type", "")
+        if "Relation Name" not in node:
+            continue
+        description = f"{node_type} on {node['Relation Name']}"
+        if node.get("Index Name"):
+            description += f" using {node['Index Name']}"
+        scans.append(description)
+        if node_type in INDEX_SCANS and "<=>" in node.get("Order By", ""):
+            index_used = True
+    return index_used, scans, root.get("Execution Time")
+
+
+def explain(session: Session, sql: str, params: dict[str, Any]) -> tuple[Any, str]:
+    """Run EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) in a savepoint.
+
+    Explains the EXECUTE of the connection's prepared statement when sql
+    ran prepared, so a cached generic plan is what gets captured. A failure
+    rolls back to the savepoint, leaving the request's transaction usable.
+
+    Returns:
+        Tuple of (parsed plan, 'prepared' or 'statement').
+    """
+    execute = prepared_form(session, sql)
+    with session.begin_nested():
+        plan = session.execute(
+            sql_text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {execute or sql}"), params
+        ).scalar()
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+    return plan, "prepared" if execute else "statement"
+
+
+def capture_query(
+    session: Session,
+    table: str,
+    sql: str,
+    params: dict[str, Any],
+    duration_ms: float,
+) -> Optional[CapturedQuery]:
+    """Capture a vector search statement if it was slow or sampled.
+
+    Args:
+        session: Session that ran the statement (its transaction is reused)
+        table: Table searched
+        sql: Statement text
+        params: Bound parameters
+        duration_ms: Statement time
+
+    Returns:
+        The capture, or None if the statement was not captured.
+    """
+    timings = current_timings()
+    if timings is None:
+        return None
+    reason = capture_reason(duration_ms)
+    if reason is None:
+        return None
+
+    entry = CapturedQuery(
+        captured_at=datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+        reason=reason,
+        table=table,
+        duration_ms=round(duration_ms, 3),
+        sql=" ".join(sql.split()),
+        params=sanitize_params(params),
+        request=dict(timings.labels),
+    )
+
+    log = get_slow_query_log()
+    if get_settings().slow_query_explain and log.allow_explain():
+        try:
+            entry.plan, entry.explained = explain(session, sql, params)
+            entry.index_used, entry.scans, entry.execution_ms = summarize_plan(entry.plan)
+        except Exception as e:
+            entry.error = f"EXPLAIN failed: {e}"
+
+    log.add(entry)
+    record_slow_query(table, reason, entry.index_used)
+    return entry
+
+
+def capture_dict(entry: CapturedQuery, include_plan: bool = True) -> dict[str, Any]:
+    """Serialize a capture for the admin endpoint."""
+    data = asdict(entry)
+    if not include_plan:
+        data.pop("plan")
+    return data
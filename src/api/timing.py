@@ -0,0 +1,213 @@
+"""Per-request timing spans for search requests.
+
+A search request spends its time in a few places, and under load they
+saturate differently. Each is recorded as an exclusive span:
+
+    span        time spent
+    queue       before the route's first dependency ran (threadpool wait)
+    pool_wait   waiting for a pooled database connection
+    embed       query embedding provider calls
+    db          executing SQL (engine cursor events)
+    hydrate     hydration cache lookups (its SQL counts as db)
+    serialize   rendering the JSON response body
+    total       the whole request, as seen by the middleware
+
+TimingMiddleware gives each request a RequestTimings collector in a
+context variable. Sync routes run in the threadpool with a copy of the
+request's context, so the collector is shared by the route, its
+dependencies, and the SQLAlchemy cursor events fired from its thread.
+Outside a request (CLI scripts) nothing is collected.
+
+The spans are reported three ways:
+- in meta.timings when a search is called with ?timings=true
+- in a Server-Timing header with SERVER_TIMING=true (read by the load
+  tester, src/benchmarks/load.py)
+- to the request observers: Prometheus histograms (src/api/metrics.py)
+  and OpenTelemetry span attributes (src/api/tracing.py)
+
+Usage:
+    from src.api.timing import timed
+
+    with timed("embed"):
+        vector = provider.embed_one(text)
+"""
+
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.api.tracing import get_tracer
+
+# Exclusive spans, in reporting order
+PHASES = ("queue", "pool_wait", "embed", "db", "hydrate", "serialize")
+
+
+class RequestTimings:
+    """Accumulated milliseconds and call counts per span for one request.
+
+    Attributes:
+        start: perf_counter() when the request arrived
+        durations: Milliseconds per span
+        counts: Number of recorded intervals per span
+        labels: Request description for metrics (corpus, endpoint, filters, cached)
+        status: Response status code (set by the middleware)
+    """
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.durations: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+        self.labels: dict[str, str] = {}
+        self.status = 0
+
+    def add(self, phase: str, ms: float) -> None:
+        """Add an interval to a span."""
+        self.durations[phase] = self.durations.get(phase, 0.0) + ms
+        self.counts[phase] = self.counts.get(phase, 0) + 1
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the request arrived."""
+        return (time.perf_counter() - self.start) * 1000
+
+    def spans(self) -> dict[str, float]:
+        """Span durations so far as {'<span>_ms': ms}, including total_ms."""
+        spans = {f"{phase}_ms": round(self.durations.get(phase, 0.0), 3) for phase in PHASES}
+        spans["total_ms"] = round(self.elapsed_ms(), 3)
+        return spans
+
+    def header(self) -> str:
+        """Render the Server-Timing header value (spans, then total)."""
+        parts = []
+        for phase in [*PHASES, *sorted(set(self.durations) - set(PHASES))]:
+            if phase in self.durations:
+                parts.append(f"{phase};dur={self.durations[phase]:.2f}")
+        parts.append(f"total;dur={self.elapsed_ms():.2f}")
+        return ", ".join(parts)
+
+
+# Called with the finished request's timings (after the response is sent)
+RequestObserver = Callable[[RequestTimings], None]
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    """The collector of the request being handled (None outside requests)."""
+    return _current.get()
+
+
+def record(phase: str, ms: float) -> None:
+    """Record an interval for the current request, if any."""
+    timings = _current.get()
+    if timings is not None:
+        timings.add(phase, ms)
+
+
+def set_labels(**labels: str) -> None:
+    """Describe the current request for metrics (no-op outside requests)."""
+    timings = _current.get()
+    if timings is not None:
+        timings.labels.update(labels)
+
+
+def mark_since_start(phase: str) -> None:
+    """Record the time from request arrival until now as a span (once)."""
+    timings = _current.get()
+    if timings is not None and phase not in timings.durations:
+        timings.add(phase, timings.elapsed_ms())
+
+
+@contextmanager
+def timed(phase: str, exclude: Sequence[str] = ()) -> Iterator[None]:
+    """Record the duration of the enclosed block as a span.
+
+    Args:
+        phase: Span name
+        exclude: Spans recorded inside the block whose time is subtracted,
+                 so spans stay exclusive (e.g., hydrate excludes db)
+    """
+    timings = _current.get()
+    before = sum(timings.durations.get(name, 0.0) for name in exclude) if timings else 0.0
+    tracer = get_tracer()
+    span = tracer.start_as_current_span(f"search.{phase}") if tracer else nullcontext()
+    start = time.perf_counter()
+    try:
+        with span:
+            yield
+    finally:
+        if timings is not None:
+            nested = sum(timings.durations.get(name, 0.0) for name in exclude) - before
+            timings.add(phase, (time.perf_counter() - start) * 1000 - nested)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("timing_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stack = conn.info.get("timing_start")
+    if stack:
+        record("db", (time.perf_counter() - stack.pop()) * 1000)
+
+
+def install_engine_timing(engine: Engine) -> None:
+    """Record statement execution time on an engine as the 'db' span (idempotent)."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class TimingMiddleware:
+    """ASGI middleware that collects request spans.
+
+    Written as plain ASGI (not BaseHTTPMiddleware) so streaming NDJSON
+    responses pass through untouched. The Server-Timing header is sent with
+    the response start, so it covers everything up to the first body byte;
+    observers run once the response has been sent.
+
+    Args:
+        app: ASGI application
+        server_timing: Add a Server-Timing header to every response
+        observers: Callables receiving each finished request's timings
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        server_timing: bool = False,
+        observers: Sequence[RequestObserver] = (),
+    ) -> None:
+        self.app = app
+        self.server_timing = server_timing
+        self.observers = list(observers)
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+
+        async def send_with_timing(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                timings.status = message["status"]
+                if self.server_timing:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", timings.header().encode("latin-1")))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        except Exception:
+            timings.status = timings.status or 500
+            raise
+        finally:
+            _current.reset(token)
+            for observer in self.observers:
+                observer(timings)
@@ -0,0 +1,55 @@
+"""Optional OpenTelemetry hooks for search requests.
+
+With OTEL_TRACING=true and the opentelemetry-api package installed:
+- every timed span (src/api/timing.py: embed, hydrate, serialize) becomes a
+  child span named search.<span>
+- when a search request finishes, its span durations, corpus, endpoint,
+  and filter shape are set as attributes on the current server span
+
+The server span itself and the SQL spans come from the standard
+instrumentations, configured by the deployment (exporter, sampling):
+
+    pip install opentelemetry-distro opentelemetry-instrumentation-fastapi \\
+        opentelemetry-instrumentation-sqlalchemy
+    OTEL_TRACING=true opentelemetry-instrument uvicorn src.api.main:app
+
+Without the package, or with tracing disabled, the hooks are no-ops.
+"""
+
+from functools import lru_cache
+from typing import Any, Optional
+
+from src.api.config import get_settings
+
+TRACER_NAME = "scripture-search"
+
+
+@lru_cache
+def get_tracer() -> Optional[Any]:
+    """Get the OpenTelemetry tracer, or None if tracing is off or unavailable."""
+    if not get_settings().otel_tracing:
+        return None
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        return None
+    return trace.get_tracer(TRACER_NAME)
+
+
+def annotate_request(timings: Any) -> None:
+    """Request observer: attach span durations and labels to the server span.
+
+    Args:
+        timings: Finished RequestTimings of a search request
+    """
+    if get_tracer() is None or not timings.labels:
+        return
+    from opentelemetry import trace
+
+    span = trace.get_current_span()
+    if not span.is_recording():
+        return
+    for name, value in timings.labels.items():
+        span.set_attribute(f"search.{name}", value)
+    for name, ms in timings.spans().items():
+        span.set_attribute(f"search.{name}", ms)
@@ -0,0 +1,264 @@
+"""Startup warm-up for cold workers.
+
+After a deploy the first searches are slow: the connection pool is empty,
+the vector index pages are not in shared buffers, the embedding client is
+not built, and the search path's modules, prepared statements, and row
+cache are cold. When a worker starts, the app's lifespan runs these steps
+once, in a background thread:
+
+    step         what it warms
+    connections  opens WARMUP_CONNECTIONS pooled connections (at most
+                 DB_POOL_SIZE) at the same time, so the pool starts full
+    prewarm      loads the HNSW/IVFFlat indexes on the configured embedding
+                 column into shared buffers with pg_prewarm (migration 012;
+                 standbys get the extension through replication)
+    embeddings   precomputes the embeddings of the queries listed in
+                 WARMUP_QUERIES_FILE into the embedding cache, building the
+                 embedding client on the way
+    search       runs one synthetic search per corpus and WARMUP_LANGS
+                 language through the search services
+
+The indexes cover all languages (one index per vector column), so the
+prewarm step does not depend on WARMUP_LANGS; the synthetic searches warm
+each language's heap pages and rows.
+
+The connections, prewarm, and search steps run on every pool that serves
+requests: each read replica (src/api/replicas.py), or the primary.
+
+A failing step is recorded and the next one still runs: warm-up is best
+effort and never keeps a worker out of service for good. /health/ready
+returns 503 until warm-up has finished, so the load balancer sends no user
+request to a cold worker. WARMUP_ENABLED=false skips it.
+
+Usage:
+    WARMUP_QUERIES_FILE=popular_queries.txt uvicorn src.api.main:app
+
+    # popular_queries.txt: one query per line, '#' starts a comment
+"""
+
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from sqlalchemy import text as sql_text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from src.api.config import get_settings
+from src.api.replicas import read_pools
+from src.api.services.cfm import search_cfm_lessons
+from src.api.services.conference import search_conference_talks
+from src.api.services.query_embeddings import (
+    get_embedding_provider,
+    get_query_embedding,
+    get_query_embeddings,
+)
+from src.api.services.scriptures import search_scriptures
+
+# Tables whose vector indexes are prewarmed
+VECTOR_TABLES = ("scriptures", "cfm_lessons", "cfm_sections", "conference_paragraphs")
+
+# Synthetic search per corpus
+SEARCHES: dict[str, Callable[..., list[dict]]] = {
+    "scriptures": search_scriptures,
+    "cfm": search_cfm_lessons,
+    "conference": search_conference_talks,
+}
+
+# Query used for the synthetic searches, per language (English otherwise)
+SEARCH_QUERIES = {
+    "en": "faith in Jesus Christ",
+    "es": "fe en Jesucristo",
+}
+
+# Queries embedded per provider call
+EMBEDDING_BATCH_SIZE = 100
+
+
+class Warmup:
+    """Progress of this worker's warm-up.
+
+    Attributes:
+        status: 'pending', 'running', 'done', or 'skipped'
+        steps: Outcome per step: status ('ok' or 'failed'), ms, and detail
+    """
+
+    def __init__(self) -> None:
+        self.status = "pending"
+        self.steps: dict[str, dict[str, Any]] = {}
+        self._started: Optional[float] = None
+        self._elapsed_ms: Optional[float] = None
+        self._finished = threading.Event()
+
+    @property
+    def finished(self) -> bool:
+        """Whether warm-up has finished (or was skipped)."""
+        return self._finished.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until warm-up has finished; returns whether it did."""
+        return self._finished.wait(timeout)
+
+    def skip(self) -> None:
+        """Mark warm-up as not needed."""
+        self.status = "skipped"
+        self._finished.set()
+
+    def run(self, steps: dict[str, Callable[[], Any]]) -> None:
+        """Run the steps in order, recording each one's outcome and time.
+
+        Args:
+            steps: Step name to callable; the return value is kept as detail
+        """
+        self.status = "running"
+        self._started = time.perf_counter()
+        try:
+            for name, step in steps.items():
+                start = time.perf_counter()
+                try:
+                    outcome = {"status": "ok", "detail": step()}
+                except Exception as e:
+                    outcome = {"status": "failed", "detail": f"{type(e).__name__}: {e}"}
+                outcome["ms"] = round((time.perf_counter() - start) * 1000, 1)
+                self.steps[name] = outcome
+        finally:
+            self._elapsed_ms = round((time.perf_counter() - self._started) * 1000, 1)
+            self.status = "done"
+            self._finished.set()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Status, elapsed ms, and step outcomes, for the health endpoints."""
+        elapsed = self._elapsed_ms
+        if elapsed is None and self._started is not None:
+            elapsed = round((time.perf_counter() - self._started) * 1000, 1)
+        return {"status": self.status, "elapsed_ms": elapsed, "steps": self.steps}
+
+
+@lru_cache
+def get_warmup() -> Warmup:
+    """Get this process's warm-up progress."""
+    return Warmup()
+
+
+def open_connections() -> dict[str, int]:
+    """Check out several connections at once from each read pool, then return them."""
+    settings = get_settings()
+    count = max(min(settings.warmup_connections, settings.db_pool_size), 0)
+    opened = {}
+    for name, engine in read_pools().items():
+        connections = []
+        try:
+            for _ in range(count):
+                connection = engine.connect()
+                connections.append(connection)
+                connection.execute(sql_text("SELECT 1"))
+        finally:
+            for connection in connections:
+                connection.close()
+        opened[name] = len(connections)
+    return opened
+
+
+def _prewarm_pool(engine: Engine, column: str) -> dict[str, int]:
+    with Session(bind=engine) as session:
+        indexes = session.execute(
+            sql_text("""
+                SELECT index_class.relname
+                FROM pg_index i
+                JOIN pg_class index_class ON index_class.oid = i.indexrelid
+                JOIN pg_class table_class ON table_class.oid = i.indrelid
+                JOIN pg_am am ON am.oid = index_class.relam
+                JOIN pg_attribute a
+                  ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+                WHERE am.amname IN ('hnsw', 'ivfflat')
+                  AND a.attname = :column
+                  AND table_class.relname = ANY(:tables)
+                ORDER BY index_class.relname
+            """),
+            {"column": column, "tables": list(VECTOR_TABLES)},
+        ).scalars().all()
+        return {
+            index: session.execute(
+                sql_text("SELECT pg_prewarm(CAST(:index AS regclass))"), {"index": index}
+            ).scalar()
+            for index in indexes
+        }
+
+
+def prewarm_indexes() -> dict[str, dict[str, int]]:
+    """Load the vector indexes on the configured column into shared buffers.
+
+    Returns:
+        dict: Blocks loaded per index, per read pool.
+    """
+    column = get_embedding_provider().column
+    return {name: _prewarm_pool(engine, column) for name, engine in read_pools().items()}
+
+
+def read_queries(path: str) -> list[str]:
+    """Read warm-up queries: one per line, skipping blanks and '#' comments."""
+    lines = Path(path).read_text(encoding="utf-8").splitlines()
+    queries = (line.strip() for line in lines)
+    return list(dict.fromkeys(q for q in queries if q and not q.startswith("#")))
+
+
+def precompute_embeddings() -> dict[str, int]:
+    """Embed the WARMUP_QUERIES_FILE queries into the embedding cache."""
+    path = get_settings().warmup_queries_file
+    queries = read_queries(path) if path else []
+    for start in range(0, len(queries), EMBEDDING_BATCH_SIZE):
+        get_query_embeddings(queries[start:start + EMBEDDING_BATCH_SIZE])
+    return {"queries": len(queries)}
+
+
+def synthetic_searches() -> dict[str, dict[str, int]]:
+    """Run one search per corpus and language on each read pool.
+
+    Returns:
+        dict: Results returned per '<corpus>:<lang>', per read pool.
+    """
+    langs = [lang.strip() for lang in get_settings().warmup_langs.split(",") if lang.strip()]
+    embeddings = {
+        lang: get_query_embedding(SEARCH_QUERIES.get(lang, SEARCH_QUERIES["en"]))
+        for lang in langs
+    }
+    results: dict[str, dict[str, int]] = {}
+    for name, engine in read_pools().items():
+        results[name] = {}
+        with Session(bind=engine) as session:
+            for lang, embedding in embeddings.items():
+                for corpus, search in SEARCHES.items():
+                    hits = search(session, embedding, lang, 10)
+                    results[name][f"{corpus}:{lang}"] = len(hits)
+            session.rollback()
+    return results
+
+
+def run_warmup() -> Warmup:
+    """Run the configured warm-up steps in this thread.
+
+    Returns:
+        Warmup: The process's warm-up progress, finished.
+    """
+    settings = get_settings()
+    warmup = get_warmup()
+    if not settings.warmup_enabled:
+        warmup.skip()
+        return warmup
+
+    steps: dict[str, Callable[[], Any]] = {"connections": open_connections}
+    if settings.warmup_prewarm_indexes:
+        steps["prewarm"] = prewarm_indexes
+    steps["embeddings"] = precompute_embeddings
+    steps["search"] = synthetic_searches
+    warmup.run(steps)
+    return warmup
+
+
+def start_warmup() -> threading.Thread:
+    """Run the warm-up in a background thread (called from the app lifespan)."""
+    thread = threading.Thread(target=run_warmup, name="warmup", daemon=True)
+    thread.start()
+    return thread
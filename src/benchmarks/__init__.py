@@ -0,0 +1 @@
+"""Retrieval benchmarks: golden query sets, quality metrics, and latency."""
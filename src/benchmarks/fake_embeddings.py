@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Local stand-in for the Azure OpenAI embeddings endpoint.
+
+Serves POST /openai/deployments/<deployment>/embeddings with the Azure
+response shape, so the API runs unmodified with EMBEDDING_PROVIDER=azure
+while load tests control embedding latency instead of paying for (and
+being rate-limited by) the real service.
+
+Vectors come from the hashing provider's feature hashing at the requested
+dimensions: deterministic per text and well-distributed, but not semantic.
+Both float and base64 (float32) encodings are supported, as the openai SDK
+requests base64 by default.
+
+Usage:
+    # 40 ms +/- 10 ms per call, 1% throttled with 429:
+    python -m src.benchmarks.fake_embeddings --port 8089 \\
+        --latency-ms 40 --jitter-ms 10 --throttle-rate 0.01
+
+    # Point the API at it:
+    AZURE_OPENAI_ENDPOINT=http://localhost:8089 AZURE_OPENAI_API_KEY=fake \\
+        uvicorn src.api.main:app
+"""
+
+import argparse
+import base64
+import json
+import random
+import re
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+from src.embeddings.providers import HashingProvider
+
+PATH_RE = re.compile(r"^/openai/deployments/(?P<deployment>[^/]+)/embeddings$")
+
+
+class FakeEmbedder(HashingProvider):
+    """Hashing embeddings at arbitrary dimensions (1536 like the Azure model)."""
+
+    def __init__(self, dimensions: int = 1536) -> None:
+        super().__init__()
+        self.dimensions = dimensions
+
+
+def embedding_response(
+    embedder: FakeEmbedder, texts: list[str], deployment: str, encoding_format: str = "float"
+) -> dict[str, Any]:
+    """Build an Azure OpenAI embeddings response body.
+
+    Args:
+        embedder: Vector source
+        texts: Input texts
+        deployment: Deployment name (echoed as the model)
+        encoding_format: 'float' (JSON lists) or 'base64' (packed float32)
+
+    Returns:
+        Response body as a dict.
+    """
+    data = []
+    for index, vector in enumerate(embedder.embed(texts)):
+        if encoding_format == "base64":
+            packed = struct.pack(f"<{len(vector)}f", *vector)
+            embedding: Any = base64.b64encode(packed).decode("ascii")
+        else:
+            embedding = vector
+        data.append({"object": "embedding", "index": index, "embedding": embedding})
+
+    tokens = sum(len(text.split()) for text in texts)
+    return {
+        "object": "list",
+        "data": data,
+        "model": deployment,
+        "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+    }
+
+
+class FakeEmbeddingServer(ThreadingHTTPServer):
+    """Threaded HTTP server with configurable latency and throttling.
+
+    Attributes:
+        requests: Embedding calls served
+        throttled: Calls rejected with 429
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        embedder: FakeEmbedder,
+        latency_ms: float = 40.0,
+        jitter_ms: float = 10.0,
+        throttle_rate: float = 0.0,
+    ) -> None:
+        super().__init__(address, FakeEmbeddingHandler)
+        self.embedder = embedder
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.throttle_rate = throttle_rate
+        self.requests = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def delay_seconds(self) -> float:
+        """Simulated service latency for one call."""
+        return max(random.gauss(self.latency_ms, self.jitter_ms), 0.0) / 1000
+
+    def count(self, throttled: bool) -> None:
+        """Count a served call."""
+        with self._lock:
+            self.requests += 1
+            self.throttled += int(throttled)
+
+
+class FakeEmbeddingHandler(BaseHTTPRequestHandler):
+    """Handles embedding requests for FakeEmbeddingServer."""
+
+    server: FakeEmbeddingServer
+
+    def do_POST(self) -> None:
+        match = PATH_RE.match(self.path.split("?", 1)[0])
+        if not match:
+            self._send(404, {"error": {"code": "404", "message": "Resource not found"}})
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        texts = body.get("input", [])
+        if isinstance(texts, str):
+            texts = [texts]
+
+        time.sleep(self.server.delay_seconds())
+        throttled = random.random() < self.server.throttle_rate
+        self.server.count(throttled)
+        if throttled:
+            self._send(
+                429,
+                {"error": {"code": "429", "message": "Rate limit exceeded (fake)"}},
+                {"Retry-After": "1"},
+            )
+            return
+
+        self._send(200, embedding_response(
+            self.server.embedder,
+            texts,
+            match.group("deployment"),
+            body.get("encoding_format", "float"),
+        ))
+
+    def _send(
+        self, status: int, payload: dict, headers: Optional[dict[str, str]] = None
+    ) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # One line per call would dominate the output of a load test
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Azure OpenAI embeddings server")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=8089, help="Port (default: 8089)")
+    parser.add_argument("--dimensions", type=int, default=1536,
+                        help="Vector dimensions (default: 1536)")
+    parser.add_argument("--latency-ms", type=float, default=40.0,
+                        help="Mean latency per call (default: 40)")
+    parser.add_argument("--jitter-ms", type=float, default=10.0,
+                        help="Latency standard deviation (default: 10)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0,
+                        help="Fraction of calls answered with 429 (default: 0)")
+    args = parser.parse_args()
+
+    server = FakeEmbeddingServer(
+        (args.host, args.port),
+        FakeEmbedder(args.dimensions),
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        throttle_rate=args.throttle_rate,
+    )
+    print(f"Fake embeddings on http://{args.host}:{args.port} "
+          f"({args.latency_ms:g}±{args.jitter_ms:g} ms, {args.dimensions} dims)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"\nServed {server.requests:,} calls ({server.throttled:,} throttled)")
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Versioned golden query sets for retrieval benchmarks.
+
+Each corpus and language has a golden set at golden/<version>/<corpus>_<lang>.json:
+
+    {
+      "version": "v1",
+      "corpus": "scriptures",
+      "lang": "en",
+      "queries": [
+        {"id": "faith-unseen", "query": "...", "expected": ["Alma 32:21", "Hebrews 11:1"]}
+      ]
+    }
+
+Expected results are scripture references rather than row IDs, so a set
+stays valid across re-ingestion and works for every corpus:
+- scriptures: a verse is relevant if it falls within an expected reference
+- cfm, conference: a lesson or paragraph is relevant if its scripture_refs
+  cite a chapter of an expected reference
+
+Query IDs are stable across languages. Never edit a published version in
+place; add golden/v2 so benchmark results stay comparable.
+
+Usage:
+    from src.benchmarks.golden import load_golden_set
+
+    golden = load_golden_set("scriptures", "en")
+    for query in golden.queries:
+        print(query.id, query.expected_refs)
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from src.references import ScriptureRef, get_book, parse_reference, parse_references
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+DEFAULT_VERSION = "v1"
+
+# Corpora with golden sets (one per API search endpoint)
+CORPORA = ("scriptures", "cfm", "conference")
+
+# Corpora whose hits are single verses (others are judged by cited chapters)
+VERSE_CORPORA = ("scriptures",)
+
+
+@dataclass
+class GoldenQuery:
+    """A benchmark query and the references that answer it.
+
+    Attributes:
+        id: Stable query ID (shared across languages)
+        query: Query text
+        expected: Expected scripture references as written
+        expected_refs: Parsed expected references
+    """
+
+    id: str
+    query: str
+    expected: list[str]
+    expected_refs: list[ScriptureRef] = field(default_factory=list)
+
+
+@dataclass
+class GoldenSet:
+    """A versioned golden query set for one corpus and language."""
+
+    version: str
+    corpus: str
+    lang: str
+    queries: list[GoldenQuery]
+
+
+def golden_path(corpus: str, lang: str, version: str = DEFAULT_VERSION) -> Path:
+    """Path of the golden set file for a corpus and language."""
+    return GOLDEN_DIR / version / f"{corpus}_{lang}.json"
+
+
+def load_golden_set(corpus: str, lang: str, version: str = DEFAULT_VERSION) -> GoldenSet:
+    """Load and validate a golden query set.
+
+    Args:
+        corpus: Corpus name ('scriptures', 'cfm', 'conference')
+        lang: Language code
+        version: Golden set version directory (e.g., 'v1')
+
+    Returns:
+        The golden set with parsed expected references.
+
+    Raises:
+        FileNotFoundError: If there is no golden set for the corpus/lang/version.
+        ValueError: If an expected reference cannot be parsed.
+    """
+    with open(golden_path(corpus, lang, version), encoding="utf-8") as f:
+        data = json.load(f)
+
+    queries = []
+    for item in data["queries"]:
+        refs = [ref for text in item["expected"] for ref in parse_reference(text)]
+        if len(refs) < len(item["expected"]):
+            raise ValueError(
+                f"Unparseable expected reference in {corpus}_{lang} query {item['id']}: "
+                f"{item['expected']}"
+            )
+        queries.append(GoldenQuery(item["id"], item["query"], item["expected"], refs))
+    return GoldenSet(data["version"], data["corpus"], data["lang"], queries)
+
+
+def _verse_in(ref: ScriptureRef, book: str, chapter: int, verse: Optional[int]) -> bool:
+    if ref.book != book or ref.chapter != chapter:
+        return False
+    if ref.verse_start is None or verse is None:
+        return True
+    end = ref.verse_end if ref.verse_end is not None else float("inf")
+    return ref.verse_start <= verse <= end
+
+
+def is_relevant(corpus: str, hit: dict[str, Any], expected: Sequence[ScriptureRef]) -> bool:
+    """Judge a search hit against a query's expected references.
+
+    Args:
+        corpus: Corpus name
+        hit: Row with book/chapter/verse (scriptures) or scripture_refs
+        expected: Parsed expected references
+
+    Returns:
+        True if the hit answers the query.
+    """
+    if corpus in VERSE_CORPORA:
+        book = get_book(hit["book"])
+        book_id = book.id if book else hit["book"]
+        return any(_verse_in(ref, book_id, hit["chapter"], hit["verse"]) for ref in expected)
+
+    cited = [ref for refs in parse_references(hit.get("scripture_refs") or []) for ref in refs]
+    return any(
+        _verse_in(ref, cite.book, cite.chapter, None) for cite in cited for ref in expected
+    )
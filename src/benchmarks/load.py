@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""Load generator for the search endpoints.
+
+Drives POST /api/v1/{scriptures,cfm,conference}/search with a weighted mix
+of golden-set queries (src/benchmarks/golden) through a ramp of
+concurrency stages. Each stage runs closed-loop workers for a fixed time
+and reports throughput, error rate, tail latency, and, when the API runs
+with SERVER_TIMING=true, where the time went:
+
+    queue       threadpool wait before the route started
+    pool_wait   wait for a pooled database connection
+    embed       query embedding calls
+    db          SQL execution
+    hydrate     result row cache lookups
+    serialize   rendering the JSON response
+    other       the rest (routing, validation, response cache)
+
+Throughput that stops growing while p95 climbs marks saturation; a growing
+pool_wait share points at the SQLAlchemy pool, a growing queue share at the
+threadpool, and a flat embed share with rising latency at the database.
+
+Run the API against the fake embedding server (src/benchmarks/fake_embeddings.py)
+to control embedding latency, and raise --miss-rate to defeat the response
+and embedding caches.
+
+Usage:
+    python -m src.benchmarks.fake_embeddings --latency-ms 40 &
+    SERVER_TIMING=true AZURE_OPENAI_ENDPOINT=http://localhost:8089 \\
+        AZURE_OPENAI_API_KEY=fake uvicorn src.api.main:app --port 8000 &
+
+    python -m src.benchmarks.load --stages 1,4,8,16,32 --duration 20 \\
+        --mix scriptures=6,cfm=2,conference=2 --miss-rate 0.5
+"""
+
+import argparse
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+
+from src.benchmarks.golden import CORPORA, DEFAULT_VERSION, load_golden_set
+from src.benchmarks.metrics import latency_summary, mean
+from src.benchmarks.output import git_commit, timestamp, write_report
+
+# Server-Timing phases reported per stage ("other" is derived)
+PHASES = ("queue", "pool_wait", "embed", "db", "hydrate", "serialize")
+
+# A stage whose throughput grows less than this over the best so far has
+# stopped scaling with concurrency
+PLATEAU_GAIN = 0.05
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    """Parse 'scriptures=6,cfm=2' into normalized corpus weights."""
+    weights = {}
+    for part in value.split(","):
+        corpus, _, weight = part.partition("=")
+        corpus = corpus.strip()
+        if corpus not in CORPORA:
+            raise argparse.ArgumentTypeError(f"Unknown corpus in mix: {corpus}")
+        try:
+            weights[corpus] = float(weight) if weight else 1.0
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid weight in mix: {part}")
+    total = sum(weights.values())
+    if total <= 0:
+        raise argparse.ArgumentTypeError(f"Mix weights must be positive: {value}")
+    return {corpus: weight / total for corpus, weight in weights.items()}
+
+
+def parse_stages(value: str) -> list[int]:
+    """Parse '1,4,16' into concurrency stages."""
+    try:
+        stages = [int(part) for part in value.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid stages: {value}")
+    if not stages or min(stages) < 1:
+        raise argparse.ArgumentTypeError(f"Stages must be positive integers: {value}")
+    return stages
+
+
+def parse_server_timing(header: Optional[str]) -> dict[str, float]:
+    """Parse a Server-Timing header into milliseconds per metric name."""
+    timings: dict[str, float] = {}
+    for entry in (header or "").split(","):
+        name, *params = [part.strip() for part in entry.split(";")]
+        for param in params:
+            key, _, value = param.partition("=")
+            if name and key == "dur":
+                try:
+                    timings[name] = float(value)
+                except ValueError:
+                    pass
+    return timings
+
+
+@dataclass
+class Sample:
+    """One request's outcome."""
+
+    corpus: str
+    status: int
+    latency_ms: float
+    timings: dict[str, float] = field(default_factory=dict)
+    cached: Optional[bool] = None
+
+
+class QueryMix:
+    """Weighted random search requests built from the golden query sets.
+
+    Args:
+        weights: Corpus weights (see parse_mix)
+        langs: Languages to draw from
+        limit: Results per request
+        miss_rate: Fraction of queries made unique so they miss every cache
+        version: Golden query set version
+    """
+
+    def __init__(
+        self,
+        weights: dict[str, float],
+        langs: list[str],
+        limit: int = 10,
+        miss_rate: float = 0.0,
+        version: str = DEFAULT_VERSION,
+    ) -> None:
+        self.corpora = list(weights)
+        self.weights = [weights[corpus] for corpus in self.corpora]
+        self.limit = limit
+        self.miss_rate = miss_rate
+        self.queries = {
+            (corpus, lang): [q.query for q in load_golden_set(corpus, lang, version).queries]
+            for corpus in self.corpora
+            for lang in langs
+        }
+        self.langs = langs
+
+    def next(self, rng: random.Random) -> tuple[str, str, dict[str, Any]]:
+        """Draw a request: (corpus, path, JSON payload)."""
+        corpus = rng.choices(self.corpora, self.weights)[0]
+        lang = rng.choice(self.langs)
+        query = rng.choice(self.queries[(corpus, lang)])
+        if rng.random() < self.miss_rate:
+            query = f"{query} ({uuid.uuid4().hex[:8]})"
+        payload = {"query": query, "lang": lang, "limit": self.limit}
+        return corpus, f"/api/v1/{corpus}/search", payload
+
+
+def run_stage(
+    base_url: str, mix: QueryMix, concurrency: int, duration: float, timeout: float
+) -> tuple[list[Sample], float]:
+    """Run closed-loop workers for `duration` seconds.
+
+    Returns:
+        Tuple of (samples, wall-clock seconds).
+    """
+    deadline = time.perf_counter() + duration
+    lock = threading.Lock()
+    samples: list[Sample] = []
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        local: list[Sample] = []
+        with httpx.Client(base_url=base_url, timeout=timeout) as client:
+            while time.perf_counter() < deadline:
+                corpus, path, payload = mix.next(rng)
+                start = time.perf_counter()
+                try:
+                    response = client.post(path, json=payload)
+                except httpx.HTTPError:
+                    local.append(Sample(corpus, 0, (time.perf_counter() - start) * 1000))
+                    continue
+                latency = (time.perf_counter() - start) * 1000
+                cached = None
+                if response.status_code == 200:
+                    cached = response.json().get("meta", {}).get("cached")
+                local.append(Sample(
+                    corpus,
+                    response.status_code,
+                    latency,
+                    parse_server_timing(response.headers.get("server-timing")),
+                    cached,
+                ))
+        with lock:
+            samples.extend(local)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, [random.randrange(2**32) for _ in range(concurrency)]))
+    return samples, time.perf_counter() - start
+
+
+def summarize_stage(samples: list[Sample], elapsed: float) -> dict[str, Any]:
+    """Throughput, errors, latency percentiles, and phase breakdown for a stage."""
+    ok = [sample for sample in samples if sample.status == 200]
+    statuses: dict[str, int] = {}
+    for sample in samples:
+        statuses[str(sample.status)] = statuses.get(str(sample.status), 0) + 1
+
+    phases: dict[str, Optional[float]] = {}
+    timed = [sample for sample in ok if sample.timings]
+    if timed:
+        for phase in PHASES:
+            phases[phase] = round(mean(s.timings.get(phase, 0.0) for s in timed) or 0.0, 3)
+        total = mean(s.timings.get("total", s.latency_ms) for s in timed) or 0.0
+        phases["other"] = round(max(total - sum(phases.values()), 0.0), 3)
+
+    by_corpus = {}
+    for corpus in sorted({sample.corpus for sample in ok}):
+        latencies = [s.latency_ms for s in ok if s.corpus == corpus]
+        by_corpus[corpus] = {"requests": len(latencies), "latency_ms": latency_summary(latencies)}
+
+    cached = [sample.cached for sample in ok if sample.cached is not None]
+    return {
+        "requests": len(samples),
+        "rps": round(len(ok) / elapsed, 2) if elapsed else 0.0,
+        "error_rate": round(1 - len(ok) / len(samples), 4) if samples else 0.0,
+        "statuses": statuses,
+        "cache_hit_rate": round(sum(cached) / len(cached), 4) if cached else None,
+        "latency_ms": latency_summary([sample.latency_ms for sample in ok]),
+        "phases_ms": phases,
+        "by_corpus": by_corpus,
+    }
+
+
+def find_plateau(stages: list[dict[str, Any]]) -> Optional[dict[str, Any]]:
+    """First stage whose throughput stopped growing with concurrency.
+
+    Args:
+        stages: Stage summaries with 'concurrency' and 'rps', in ramp order
+
+    Returns:
+        The stage at which throughput plateaued, or None if it kept scaling.
+    """
+    best = None
+    for stage in stages:
+        if best is not None and stage["rps"] < best["rps"] * (1 + PLATEAU_GAIN):
+            return best
+        if best is None or stage["rps"] > best["rps"]:
+            best = stage
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the search endpoints")
+    parser.add_argument("--url", default="http://localhost:8000",
+                        help="API base URL (default: http://localhost:8000)")
+    parser.add_argument("--stages", type=parse_stages, default=[1, 2, 4, 8, 16, 32],
+                        help="Comma-separated concurrency ramp (default: 1,2,4,8,16,32)")
+    parser.add_argument("--duration", type=float, default=15.0,
+                        help="Seconds per stage (default: 15)")
+    parser.add_argument("--mix", type=parse_mix,
+                        default=parse_mix("scriptures=6,cfm=2,conference=2"),
+                        help="Corpus weights (default: scriptures=6,cfm=2,conference=2)")
+    parser.add_argument("--lang", choices=["en", "es", "all"], default="all",
+                        help="Query language (default: all)")
+    parser.add_argument("--limit", type=int, default=10,
+                        help="Results per search (default: 10)")
+    parser.add_argument("--miss-rate", type=float, default=0.0,
+                        help="Fraction of queries made unique to miss caches (default: 0)")
+    parser.add_argument("--timeout", type=float, default=30.0,
+                        help="Request timeout in seconds (default: 30)")
+    parser.add_argument("--output", type=Path,
+                        help="Report file (default: .benchmarks/load/<timestamp>.json)")
+    args = parser.parse_args()
+
+    langs = ["en", "es"] if args.lang == "all" else [args.lang]
+    mix = QueryMix(args.mix, langs, args.limit, args.miss_rate)
+    print(f"Load testing {args.url}: stages {args.stages}, {args.duration:g}s each")
+    stages = []
+    for concurrency in args.stages:
+        samples, elapsed = run_stage(args.url, mix, concurrency, args.duration, args.timeout)
+        summary = {"concurrency": concurrency, **summarize_stage(samples, elapsed)}
+        stages.append(summary)
+
+        latency = summary["latency_ms"]
+        phases = " ".join(f"{k}={v}" for k, v in summary["phases_ms"].items())
+        print(
+            f"  c={concurrency:<4} rps={summary['rps']:<8} err={summary['error_rate']:.2%} "
+            f"p50={latency['p50']}ms p95={latency['p95']}ms p99={latency['p99']}ms"
+            + (f"  [{phases}]" if phases else "")
+        )
+
+    plateau = find_plateau(stages)
+    if plateau:
+        print(f"\nThroughput plateaus at concurrency {plateau['concurrency']} "
+              f"({plateau['rps']} rps)")
+    else:
+        print("\nThroughput still scaling at the last stage")
+
+    report = {
+        "timestamp": timestamp(),
+        "commit": git_commit(),
+        "url": args.url,
+        "duration_s": args.duration,
+        "mix": args.mix,
+        "langs": langs,
+        "miss_rate": args.miss_rate,
+        "plateau_concurrency": plateau["concurrency"] if plateau else None,
+        "stages": stages,
+    }
+    output = write_report(report, "load", args.output)
+    print(f"Wrote {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Retrieval quality and latency metrics.
+
+- recall@k: overlap of the ANN top k with the exact (brute-force) top k,
+  which isolates what an index or quantization change costs
+- reciprocal rank / MRR and hit rate: rank of the first hit relevant to
+  the golden set, which measures the embeddings and context builders
+- latency percentiles (p50/p95/p99) and throughput
+
+Usage:
+    from src.benchmarks.metrics import latency_summary, mean, recall_at_k
+
+    recall = mean(recall_at_k(ann, exact, 10) for ann, exact in pairs)
+    print(latency_summary(latencies_ms))
+"""
+
+import math
+from typing import Iterable, Optional, Sequence
+
+
+def recall_at_k(found: Sequence[int], exact: Sequence[int], k: int) -> Optional[float]:
+    """Fraction of the exact top k that the approximate search returned.
+
+    Args:
+        found: IDs returned by the approximate search, in rank order
+        exact: IDs of the exact nearest neighbors, in rank order
+        k: Cutoff
+
+    Returns:
+        Recall in [0, 1], or None if there are no exact neighbors.
+    """
+    truth = set(exact[:k])
+    if not truth:
+        return None
+    return len(truth.intersection(found[:k])) / len(truth)
+
+
+def reciprocal_rank(relevant: Sequence[bool]) -> float:
+    """1 / rank of the first relevant result (0.0 if none is relevant)."""
+    for rank, is_relevant in enumerate(relevant, start=1):
+        if is_relevant:
+            return 1.0 / rank
+    return 0.0
+
+
+def mean(values: Iterable[Optional[float]]) -> Optional[float]:
+    """Mean of the values that are not None (None if there are none)."""
+    present = [value for value in values if value is not None]
+    return sum(present) / len(present) if present else None
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Percentile by linear interpolation between closest ranks.
+
+    Args:
+        values: Samples (need not be sorted)
+        pct: Percentile in [0, 100]
+
+    Returns:
+        The interpolated percentile (0.0 for no samples).
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    fraction = position - lower
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * fraction
+
+
+def latency_summary(latencies_ms: Sequence[float]) -> dict[str, float]:
+    """Summarize latencies as mean, p50, p95, p99, and max (milliseconds)."""
+    if not latencies_ms:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "mean": round(sum(latencies_ms) / len(latencies_ms), 3),
+        "p50": round(percentile(latencies_ms, 50), 3),
+        "p95": round(percentile(latencies_ms, 95), 3),
+        "p99": round(percentile(latencies_ms, 99), 3),
+        "max": round(max(latencies_ms), 3),
+    }
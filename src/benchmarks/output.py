@@ -0,0 +1,46 @@
+"""Result files shared by the benchmark CLIs.
+
+Results go under .benchmarks/ (git-ignored) as timestamped JSON, tagged
+with the git commit they were measured at.
+"""
+
+import json
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+BENCHMARK_DIR = Path(".benchmarks")
+
+
+def timestamp() -> str:
+    """UTC timestamp used in result file names."""
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+
+
+def git_commit() -> Optional[str]:
+    """Current git commit, if running in a checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_report(report: dict[str, Any], kind: str, output: Optional[Path] = None) -> Path:
+    """Write a result file.
+
+    Args:
+        report: JSON-serializable results (should include 'timestamp')
+        kind: Subdirectory of .benchmarks ('results', 'load')
+        output: Explicit path (default: .benchmarks/<kind>/<timestamp>.json)
+
+    Returns:
+        Path written.
+    """
+    output = output or BENCHMARK_DIR / kind / f"{report['timestamp']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return output
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""Retrieval benchmark: recall@k, MRR, and latency against a seeded database.
+
+For every golden query set (src/benchmarks/golden/<version>) this:
+1. Embeds the queries once, caching the vectors on disk per model so later
+   runs (and CI) need no embedding API calls
+2. Computes the exact top k with a sequential scan (index scans disabled)
+   once per corpus generation and caches it as ground truth
+3. Runs the normal indexed search under the requested concurrency and
+   settings, measuring per-query latency
+4. Writes a JSON result file for comparing runs over time
+
+recall@k compares the indexed results with the exact ones, so it measures
+what an index, ef_search, or quantization change costs; MRR and hit rate
+compare them with the golden references, so they measure the embeddings.
+
+Usage:
+    # Everything, with the deterministic hashing provider (no API calls):
+    python -m src.benchmarks.retrieval --provider hashing
+
+    # One corpus under load, with an HNSW setting, compared to a previous run:
+    python -m src.benchmarks.retrieval --corpus scriptures --lang en \\
+        --concurrency 8 --repeat 5 --setting hnsw.ef_search=100 \\
+        --baseline .benchmarks/results/20261019T120000.json
+
+    # Recompute ground truth (e.g., after changing k):
+    python -m src.benchmarks.retrieval --refresh-ground-truth
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+from sqlalchemy import text as sql_text
+
+from src.api.services.search import execute_vector_search
+from src.benchmarks.golden import DEFAULT_VERSION, GoldenSet, is_relevant, load_golden_set
+from src.benchmarks.metrics import latency_summary, mean, recall_at_k, reciprocal_rank
+from src.benchmarks.output import BENCHMARK_DIR, git_commit, timestamp, write_report
+from src.db import get_session
+from src.db.generations import CORPORA, get_generation
+from src.embeddings.providers import PROVIDER_COLUMNS, EmbeddingProvider, create_provider
+
+# Table searched per corpus and the columns needed to judge relevance
+TABLES = {
+    "scriptures": ("scriptures", "id, book, chapter, verse"),
+    "cfm": ("cfm_lessons", "id, scripture_refs"),
+    "conference": ("conference_paragraphs", "id, scripture_refs"),
+}
+
+SETTING_NAME = re.compile(r"^[a-z_][a-z0-9_]*(\.[a-z_][a-z0-9_]*)?$")
+SETTING_VALUE = re.compile(r"^[A-Za-z0-9_.\-]+$")
+
+
+def parse_setting(value: str) -> tuple[str, str]:
+    """Parse a NAME=VALUE Postgres setting from the command line."""
+    name, _, setting = value.partition("=")
+    if not SETTING_NAME.match(name) or not SETTING_VALUE.match(setting):
+        raise argparse.ArgumentTypeError(f"Invalid setting: {value} (expected NAME=VALUE)")
+    return name, setting
+
+
+def apply_settings(session, settings: list[tuple[str, str]]) -> None:
+    """Apply validated Postgres settings to the session's connection."""
+    for name, value in settings:
+        session.execute(sql_text(f"SET {name} = '{value}'"))
+
+
+def embed_queries(
+    provider: EmbeddingProvider, texts: list[str], cache_dir: Path = BENCHMARK_DIR
+) -> dict[str, list[float]]:
+    """Embed query texts, reusing vectors cached on disk for this model.
+
+    Args:
+        provider: Embedding provider
+        texts: Query texts
+        cache_dir: Directory holding embeddings_<model>.json
+
+    Returns:
+        Mapping of query text to vector.
+    """
+    model = re.sub(r"[^A-Za-z0-9_.-]", "_", provider.model_id)
+    path = cache_dir / f"embeddings_{model}.json"
+    cached: dict[str, list[float]] = {}
+    if path.exists():
+        cached = json.loads(path.read_text(encoding="utf-8"))
+
+    missing = [text for text in dict.fromkeys(texts) if text not in cached]
+    if missing:
+        cached.update(zip(missing, provider.embed(missing)))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(cached), encoding="utf-8")
+    return {text: cached[text] for text in texts}
+
+
+def exact_neighbors(
+    session, table: str, embedding: list[float], lang: str, k: int, column: str
+) -> list[int]:
+    """Exact top k IDs by cosine distance, via a sequential scan.
+
+    Index scans are disabled for the transaction only, so the planner
+    cannot answer from the approximate HNSW/IVFFlat index. The search runs
+    as a prepared statement, so custom plans are forced: a cached generic
+    plan would keep using the index.
+    """
+    session.execute(sql_text("SET LOCAL plan_cache_mode = force_custom_plan"))
+    session.execute(sql_text("SET LOCAL enable_indexscan = off"))
+    session.execute(sql_text("SET LOCAL enable_bitmapscan = off"))
+    rows = execute_vector_search(
+        session, table, embedding, lang, k, select_columns="id", embedding_column=column
+    )
+    session.rollback()
+    return [row["id"] for row in rows]
+
+
+def load_ground_truth(
+    session,
+    golden: GoldenSet,
+    embeddings: dict[str, list[float]],
+    provider: EmbeddingProvider,
+    k: int,
+    refresh: bool = False,
+) -> dict[str, list[int]]:
+    """Exact neighbors per query, computed once per model and corpus generation.
+
+    Args:
+        session: Database session
+        golden: Golden query set
+        embeddings: Query text to vector
+        provider: Provider whose column is searched
+        k: Number of neighbors needed
+        refresh: Recompute even if a matching cache exists
+
+    Returns:
+        Mapping of query ID to exact neighbor IDs, in rank order.
+    """
+    table, _ = TABLES[golden.corpus]
+    path = (
+        BENCHMARK_DIR / "ground_truth"
+        / f"{golden.version}_{golden.corpus}_{golden.lang}_{provider.column}.json"
+    )
+    generation = get_generation(session, golden.corpus)
+
+    if path.exists() and not refresh:
+        cached = json.loads(path.read_text(encoding="utf-8"))
+        if (
+            cached["model"] == provider.model_id
+            and cached["generation"] == generation
+            and cached["k"] >= k
+            and set(cached["neighbors"]) >= {query.id for query in golden.queries}
+        ):
+            return cached["neighbors"]
+
+    neighbors = {
+        query.id: exact_neighbors(
+            session, table, embeddings[query.query], golden.lang, k, provider.column
+        )
+        for query in golden.queries
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "model": provider.model_id,
+        "generation": generation,
+        "k": k,
+        "neighbors": neighbors,
+    }), encoding="utf-8")
+    return neighbors
+
+
+def timed_searches(
+    golden: GoldenSet,
+    embeddings: dict[str, list[float]],
+    column: str,
+    k: int,
+    concurrency: int,
+    repeat: int,
+    settings: list[tuple[str, str]],
+) -> tuple[dict[str, list[dict[str, Any]]], list[float], float]:
+    """Run every golden query `repeat` times across `concurrency` workers.
+
+    Each worker has its own session (and so its own pooled connection).
+
+    Returns:
+        Tuple of (results per query ID, latencies in ms, wall-clock seconds).
+    """
+    table, columns = TABLES[golden.corpus]
+    tasks = [query for _ in range(repeat) for query in golden.queries]
+    shares = [tasks[i::concurrency] for i in range(concurrency)]
+
+    def worker(share):
+        timings = []
+        with get_session() as session:
+            apply_settings(session, settings)
+            for query in share:
+                start = time.perf_counter()
+                rows = execute_vector_search(
+                    session, table, embeddings[query.query], golden.lang, k,
+                    select_columns=columns, embedding_column=column,
+                )
+                timings.append((query.id, (time.perf_counter() - start) * 1000, rows))
+        return timings
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        timings = [item for share in pool.map(worker, shares) for item in share]
+    elapsed = time.perf_counter() - start
+
+    results = {query_id: rows for query_id, _, rows in timings}
+    return results, [ms for _, ms, _ in timings], elapsed
+
+
+def benchmark_set(
+    golden: GoldenSet,
+    provider: EmbeddingProvider,
+    args: argparse.Namespace,
+) -> Optional[dict[str, Any]]:
+    """Benchmark one golden set; None if the corpus has no embedded rows."""
+    embeddings = embed_queries(provider, [query.query for query in golden.queries])
+
+    with get_session() as session:
+        truth = load_ground_truth(
+            session, golden, embeddings, provider, args.k, args.refresh_ground_truth
+        )
+    if not any(truth.values()):
+        return None
+
+    for _ in range(args.warmup):
+        timed_searches(golden, embeddings, provider.column, args.k, 1, 1, args.setting)
+    results, latencies, elapsed = timed_searches(
+        golden, embeddings, provider.column, args.k,
+        args.concurrency, args.repeat, args.setting,
+    )
+
+    recalls, ranks, per_query = [], [], {}
+    for query in golden.queries:
+        rows = results[query.id]
+        recall = recall_at_k([row["id"] for row in rows], truth[query.id], args.k)
+        rank = reciprocal_rank(
+            [is_relevant(golden.corpus, row, query.expected_refs) for row in rows]
+        )
+        recalls.append(recall)
+        ranks.append(rank)
+        per_query[query.id] = {"recall": recall, "rr": round(rank, 4)}
+
+    recall = mean(recalls)
+    return {
+        "queries": len(golden.queries),
+        "recall_at_k": round(recall, 4) if recall is not None else None,
+        "mrr": round(mean(ranks) or 0.0, 4),
+        "hit_rate": round(sum(1 for rank in ranks if rank > 0) / len(ranks), 4),
+        "latency_ms": latency_summary(latencies),
+        "qps": round(len(latencies) / elapsed, 2) if elapsed else None,
+        "per_query": per_query,
+    }
+
+
+def print_comparison(results: dict[str, Any], baseline: dict[str, Any]) -> None:
+    """Print metric deltas against a previous result file."""
+    print(f"\nCompared with {baseline.get('timestamp')} ({baseline.get('commit')}):")
+    for key, current in results["results"].items():
+        previous = baseline.get("results", {}).get(key)
+        if not previous:
+            print(f"  {key}: no baseline")
+            continue
+        deltas = []
+        for metric in ("recall_at_k", "mrr"):
+            if current[metric] is not None and previous.get(metric) is not None:
+                deltas.append(f"{metric} {current[metric] - previous[metric]:+.4f}")
+        for pct in ("p50", "p95", "p99"):
+            before = previous["latency_ms"][pct]
+            after = current["latency_ms"][pct]
+            change = f" ({(after - before) / before:+.0%})" if before else ""
+            deltas.append(f"{pct} {after - before:+.2f}ms{change}")
+        print(f"  {key}: " + ", ".join(deltas))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark retrieval quality and latency")
+    parser.add_argument("--corpus", choices=[*CORPORA, "all"], default="all",
+                        help="Corpus to benchmark (default: all)")
+    parser.add_argument("--lang", choices=["en", "es", "all"], default="all",
+                        help="Language to benchmark (default: all)")
+    parser.add_argument("--provider", choices=sorted(PROVIDER_COLUMNS),
+                        default=os.getenv("EMBEDDING_PROVIDER", "hashing"),
+                        help="Embedding provider whose column is searched (default: hashing)")
+    parser.add_argument("--golden-version", default=DEFAULT_VERSION,
+                        help=f"Golden query set version (default: {DEFAULT_VERSION})")
+    parser.add_argument("--k", type=int, default=10,
+                        help="Results per query for recall@k and MRR (default: 10)")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Concurrent search workers (default: 1)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Times each query is run for latency (default: 3)")
+    parser.add_argument("--warmup", type=int, default=1,
+                        help="Untimed passes before measuring (default: 1)")
+    parser.add_argument("--setting", type=parse_setting, action="append", default=[],
+                        metavar="NAME=VALUE",
+                        help="Postgres setting for the timed searches (repeatable)")
+    parser.add_argument("--refresh-ground-truth", action="store_true",
+                        help="Recompute exact neighbors even if cached")
+    parser.add_argument("--output", type=Path,
+                        help="Result file (default: .benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--baseline", type=Path,
+                        help="Previous result file to compare against")
+    args = parser.parse_args()
+
+    provider = create_provider(args.provider)
+    corpora = list(CORPORA) if args.corpus == "all" else [args.corpus]
+    langs = ["en", "es"] if args.lang == "all" else [args.lang]
+    results: dict[str, Any] = {
+        "golden_version": args.golden_version,
+        "timestamp": timestamp(),
+        "commit": git_commit(),
+        "provider": args.provider,
+        "model": provider.model_id,
+        "column": provider.column,
+        "k": args.k,
+        "concurrency": args.concurrency,
+        "repeat": args.repeat,
+        "settings": dict(args.setting),
+        "results": {},
+    }
+
+    print(f"Benchmarking {provider.column} ({provider.model_id}), k={args.k}, "
+          f"concurrency={args.concurrency}")
+    for corpus in corpora:
+        for lang in langs:
+            golden = load_golden_set(corpus, lang, args.golden_version)
+            summary = benchmark_set(golden, provider, args)
+            if summary is None:
+                print(f"  {corpus}/{lang}: no embedded rows, skipped")
+                continue
+            results["results"][f"{corpus}/{lang}"] = summary
+            latency = summary["latency_ms"]
+            print(
+                f"  {corpus}/{lang}: recall@{args.k}={summary['recall_at_k']} "
+                f"mrr={summary['mrr']} hit_rate={summary['hit_rate']} "
+                f"p50={latency['p50']}ms p95={latency['p95']}ms p99={latency['p99']}ms "
+                f"qps={summary['qps']}"
+            )
+
+    output = write_report(results, "results", args.output)
+    print(f"\nWrote {output}")
+
+    if args.baseline:
+        print_comparison(results, json.loads(args.baseline.read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    main()
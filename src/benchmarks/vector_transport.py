@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""Microbenchmark: how a query vector is sent to Postgres.
+
+psycopg2 interpolates parameters into the statement text, so a query
+vector travels as a pgvector text literal that the client formats and the
+server parses. This compares three ways of sending it:
+
+    variant       literal                   statement
+    str_twice     str(list), float64 digits cast twice (similarity, ORDER BY)
+    literal_once  vector_literal, float4    cast once, ORDER BY distance
+    prepared      vector_literal, float4    cast once, PREPARE / EXECUTE
+
+The vectors are float4 values unpacked to Python floats, as the query
+embedding cache returns them (src/api/services/query_embeddings.py).
+
+Client side (always): microseconds to format the literal and its size in
+bytes, per vector dimension.
+
+Server side (with --table): round-trip milliseconds of the same top-k
+search per variant on one connection, which includes sending and parsing
+the literal (and planning, except for reused prepared plans).
+
+Usage:
+    python -m src.benchmarks.vector_transport --dimensions 384,1536
+
+    python -m src.benchmarks.vector_transport --table scriptures \\
+        --column embedding_hashing --repeat 200
+"""
+
+import argparse
+import math
+import random
+import struct
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from sqlalchemy import text as sql_text
+
+from src.api.services.prepared import execute_prepared
+from src.api.services.search import vector_literal
+from src.benchmarks.metrics import latency_summary
+from src.benchmarks.output import git_commit, timestamp, write_report
+
+# Statement shapes compared (the search layer's before and after)
+CAST_TWICE_SQL = """
+    SELECT id,
+           1 - ({column} <=> CAST(:query_embedding AS vector)) as similarity
+    FROM {table}
+    WHERE {column} IS NOT NULL
+      AND lang = :lang
+    ORDER BY {column} <=> CAST(:query_embedding AS vector)
+    LIMIT :limit
+"""
+CAST_ONCE_SQL = """
+    SELECT id,
+           {column} <=> CAST(:query_embedding AS vector) as distance
+    FROM {table}
+    WHERE {column} IS NOT NULL
+      AND lang = :lang
+    ORDER BY distance
+    LIMIT :limit
+"""
+
+
+def random_vector(dimensions: int, rng: random.Random) -> list[float]:
+    """Unit-length vector of float4 values, as unpacked from the embedding cache."""
+    values = [rng.gauss(0.0, 1.0) for _ in range(dimensions)]
+    norm = math.sqrt(sum(value * value for value in values)) or 1.0
+    packed = struct.pack(f"<{dimensions}f", *(value / norm for value in values))
+    return list(struct.unpack(f"<{dimensions}f", packed))
+
+
+def _time_us(fn: Callable[[], Any], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1_000_000
+
+
+def client_costs(dimensions: int, repeat: int, rng: random.Random) -> dict[str, Any]:
+    """Formatting time and literal size of str(list) and vector_literal.
+
+    Args:
+        dimensions: Vector dimensions
+        repeat: Formatting calls timed per method
+        rng: Random source for the vector
+
+    Returns:
+        dict: Microseconds per call and bytes per literal for each method,
+        and the bytes sent per statement (str(list) is sent twice).
+    """
+    vector = random_vector(dimensions, rng)
+    str_literal = str(vector)
+    compact = vector_literal(vector)
+    return {
+        "dimensions": dimensions,
+        "str_us": round(_time_us(lambda: str(vector), repeat), 1),
+        "literal_us": round(_time_us(lambda: vector_literal(vector), repeat), 1),
+        "str_bytes": len(str_literal),
+        "literal_bytes": len(compact),
+        "statement_bytes": {
+            "str_twice": 2 * len(str_literal),
+            "literal_once": len(compact),
+        },
+    }
+
+
+def server_costs(
+    session, table: str, column: str, lang: str, k: int, repeat: int, rng: random.Random
+) -> dict[str, Any]:
+    """Round-trip latency of one search per variant.
+
+    Each variant gets a fresh vector per execution (so nothing is cached by
+    value), the same number of warmup runs, and runs on the same connection.
+
+    Args:
+        session: Database session
+        table: Table searched
+        column: Vector column searched
+        lang: Language filter
+        k: Results per search
+        repeat: Timed executions per variant
+        rng: Random source for the vectors
+
+    Returns:
+        dict: Latency summary in ms per variant.
+    """
+    dimensions = session.execute(
+        sql_text(f"SELECT vector_dims({column}) FROM {table} WHERE {column} IS NOT NULL LIMIT 1")
+    ).scalar()
+    if dimensions is None:
+        raise SystemExit(f"{table}.{column} has no embedded rows")
+
+    cast_twice = CAST_TWICE_SQL.format(table=table, column=column)
+    cast_once = CAST_ONCE_SQL.format(table=table, column=column)
+    variants: dict[str, Callable[[list[float]], Any]] = {
+        "str_twice": lambda v: session.execute(
+            sql_text(cast_twice), {"query_embedding": str(v), "lang": lang, "limit": k}
+        ).fetchall(),
+        "literal_once": lambda v: session.execute(
+            sql_text(cast_once), {"query_embedding": vector_literal(v), "lang": lang, "limit": k}
+        ).fetchall(),
+        "prepared": lambda v: execute_prepared(
+            session, cast_once, {"query_embedding": vector_literal(v), "lang": lang, "limit": k}
+        ).fetchall(),
+    }
+
+    results = {}
+    for name, run in variants.items():
+        for _ in range(min(repeat, 10)):
+            run(random_vector(dimensions, rng))
+        latencies = []
+        for _ in range(repeat):
+            vector = random_vector(dimensions, rng)
+            start = time.perf_counter()
+            run(vector)
+            latencies.append((time.perf_counter() - start) * 1000)
+        results[name] = latency_summary(latencies)
+    return {"dimensions": dimensions, "variants": results}
+
+
+def parse_dimensions(value: str) -> list[int]:
+    """Parse '384,1536' into vector dimensions."""
+    try:
+        dimensions = [int(part) for part in value.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid dimensions: {value}")
+    if not dimensions or min(dimensions) < 1:
+        raise argparse.ArgumentTypeError(f"Dimensions must be positive integers: {value}")
+    return dimensions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark query vector transport")
+    parser.add_argument("--dimensions", type=parse_dimensions, default=[384, 1536],
+                        help="Vector sizes for the client-side timing (default: 384,1536)")
+    parser.add_argument("--table",
+                        help="Table to search for the server-side timing (default: skip)")
+    parser.add_argument("--column", default="embedding",
+                        help="Vector column to search (default: embedding)")
+    parser.add_argument("--lang", choices=["en", "es"], default="en",
+                        help="Language filter (default: en)")
+    parser.add_argument("--k", type=int, default=10,
+                        help="Results per search (default: 10)")
+    parser.add_argument("--repeat", type=int, default=200,
+                        help="Timed runs per variant (default: 200)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Random seed for the vectors (default: 0)")
+    parser.add_argument("--output", type=Path,
+                        help="Report file (default: .benchmarks/vector_transport/<timestamp>.json)")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    report: dict[str, Any] = {
+        "timestamp": timestamp(),
+        "commit": git_commit(),
+        "client": [client_costs(dims, args.repeat, rng) for dims in args.dimensions],
+    }
+
+    print("Client formatting (per vector):")
+    for costs in report["client"]:
+        print(
+            f"  {costs['dimensions']:>5}d  str(list) {costs['str_us']:>7}us "
+            f"{costs['str_bytes']:>6}B x2   vector_literal {costs['literal_us']:>7}us "
+            f"{costs['literal_bytes']:>6}B x1"
+        )
+
+    server: Optional[dict[str, Any]] = None
+    if args.table:
+        from src.db import get_session
+
+        with get_session() as session:
+            server = server_costs(
+                session, args.table, args.column, args.lang, args.k, args.repeat, rng
+            )
+        print(f"\nRound trip, {args.table}.{args.column} ({server['dimensions']}d), k={args.k}:")
+        for name, latency in server["variants"].items():
+            print(f"  {name:<13} mean {latency['mean']}ms  p50 {latency['p50']}ms  "
+                  f"p95 {latency['p95']}ms")
+    report["server"] = server
+
+    output = write_report(report, "vector_transport", args.output)
+    print(f"Wrote {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,18 +3,49 @@
 Contains SQLAlchemy configuration and ORM models for:
 - scriptures: verse-level scripture data with embeddings
 - cfm_lessons: Come Follow Me lesson content
+- cfm_sections: section-level pieces of CFM lessons with embeddings
 - conference_paragraphs: General Conference talk paragraphs with embeddings
+- corpus_generations: per-corpus generation numbers for cache invalidation
+- embedding_provenance: model and context hash behind each stored embedding
+- embedding_store: content-addressed vectors shared by identical contexts
+- embedding_jobs / embedding_quarantine: resumable embedding run ledger
+
+Names are imported from their submodules on first access, so
+`from src.db import get_session` does not load the ORM models.
 """
 
-from src.db.config import get_session, engine, SessionLocal
-from src.db.models import Base, Scripture, CFMLesson, ConferenceParagraph
-
-__all__ = [
-    "get_session",
-    "engine",
-    "SessionLocal",
-    "Base",
-    "Scripture",
-    "CFMLesson",
-    "ConferenceParagraph",
-]
+import importlib
+from typing import Any
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "get_session": "src.db.config",
+    "get_engine": "src.db.config",
+    "engine": "src.db.config",
+    "SessionLocal": "src.db.config",
+    "bump_generation": "src.db.generations",
+    "get_generation": "src.db.generations",
+    "Base": "src.db.models",
+    "Scripture": "src.db.models",
+    "CFMLesson": "src.db.models",
+    "CFMSection": "src.db.models",
+    "ConferenceParagraph": "src.db.models",
+    "CorpusGeneration": "src.db.models",
+    "EmbeddingProvenance": "src.db.models",
+    "EmbeddingStoreEntry": "src.db.models",
+    "EmbeddingJob": "src.db.models",
+    "EmbeddingQuarantine": "src.db.models",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
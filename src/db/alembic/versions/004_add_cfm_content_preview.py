@@ -0,0 +1,33 @@
+"""Add precomputed content_preview to cfm_lessons.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+
+Search results only show the first 500 characters of a lesson. Storing the
+preview as a generated column lets the API fetch it instead of pulling the
+full multi-KB lesson body and truncating it in Python.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Generated columns are maintained by Postgres on insert/update,
+    # so ingestion does not need to change
+    op.execute("""
+        ALTER TABLE cfm_lessons
+        ADD COLUMN content_preview TEXT
+        GENERATED ALWAYS AS (LEFT(content, 500)) STORED
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column("cfm_lessons", "content_preview")
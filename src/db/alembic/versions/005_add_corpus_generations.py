@@ -0,0 +1,44 @@
+"""Add corpus_generations table.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+
+Tracks a generation number per searchable corpus. Ingestion and embedding
+scripts bump the generation whenever they change searchable data, and the
+API tags cached search responses with it, so cache entries are invalidated
+exactly when the underlying data changes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "corpus_generations",
+        sa.Column("corpus", sa.String(50), primary_key=True),
+        sa.Column("generation", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(),
+            server_default=sa.text("NOW()"),
+        ),
+    )
+
+    # Seed one row per corpus so the API never sees a missing generation
+    op.execute("""
+        INSERT INTO corpus_generations (corpus, generation)
+        VALUES ('scriptures', 0), ('cfm', 0), ('conference', 0)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("corpus_generations")
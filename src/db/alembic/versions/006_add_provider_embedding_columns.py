@@ -0,0 +1,60 @@
+"""Add per-provider embedding columns.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+
+Each embedding provider stores vectors in its own column so vectors from
+different models never mix (see src/embeddings/providers.py):
+- embedding: Azure OpenAI text-embedding-3-small (1536, existing)
+- embedding_local: local sentence-transformers model (384)
+- embedding_hashing: deterministic hashing provider for load tests (384)
+
+The new columns get HNSW indexes rather than IVFFlat: they start empty, and
+IVFFlat clusters are computed from the rows present at build time, while
+HNSW builds incrementally as rows are embedded.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("scriptures", "cfm_lessons", "conference_paragraphs")
+COLUMNS = {"embedding_local": 384, "embedding_hashing": 384}
+
+# Same tables as the IVFFlat indexes in 002 (conference is searched without one)
+INDEXES = {
+    "idx_scriptures_embedding_local": ("scriptures", "embedding_local"),
+    "idx_scriptures_embedding_hashing": ("scriptures", "embedding_hashing"),
+    "idx_cfm_embedding_local": ("cfm_lessons", "embedding_local"),
+    "idx_cfm_embedding_hashing": ("cfm_lessons", "embedding_hashing"),
+}
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        for column, dims in COLUMNS.items():
+            op.add_column(table, sa.Column(column, Vector(dims), nullable=True))
+
+    for name, (table, column) in INDEXES.items():
+        op.execute(f"""
+            CREATE INDEX {name}
+            ON {table}
+            USING hnsw ({column} vector_cosine_ops)
+        """)
+
+
+def downgrade() -> None:
+    for name, (table, _) in INDEXES.items():
+        op.drop_index(name, table_name=table)
+
+    for table in TABLES:
+        for column in COLUMNS:
+            op.drop_column(table, column)
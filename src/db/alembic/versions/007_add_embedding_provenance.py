@@ -0,0 +1,50 @@
+"""Add embedding_provenance table.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19
+
+Records, for every embedded row and vector column, which model produced
+the vector, its dimensions, a hash of the context text that was embedded,
+and when. Embedding generators compare the stored context hash with the
+current context builder's output and re-embed only rows whose context (or
+model) changed, instead of requiring every embedding to be nulled.
+
+Rows are keyed by (table_name, column_name, row_id). There is no foreign
+key because one table serves three corpora; row IDs are never reused, so
+rows orphaned by re-ingestion are inert and can be pruned with
+`python -m src.embeddings.stale --prune-orphans`.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "embedding_provenance",
+        sa.Column("table_name", sa.String(50), nullable=False),
+        sa.Column("column_name", sa.String(50), nullable=False),
+        sa.Column("row_id", sa.Integer(), nullable=False),
+        sa.Column("model", sa.String(200), nullable=False),
+        sa.Column("dimensions", sa.Integer(), nullable=False),
+        sa.Column("context_hash", sa.String(64), nullable=False),
+        sa.Column(
+            "generated_at",
+            sa.TIMESTAMP(),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.PrimaryKeyConstraint("table_name", "column_name", "row_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("embedding_provenance")
@@ -0,0 +1,46 @@
+"""Add content-addressed embedding_store table.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19
+
+Stores one vector per (model, context_hash). Many rows embed identical
+context text (boilerplate conference paragraphs, repeated D&C and Isaiah
+passages), and embeddings are deterministic for a model and text, so
+generators look vectors up here before calling the embedding provider and
+fill duplicate rows from the store in bulk.
+
+The embedding column is an undimensioned vector so one table serves every
+provider; it is never searched, only looked up by primary key.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "embedding_store",
+        sa.Column("model", sa.String(200), nullable=False),
+        sa.Column("context_hash", sa.String(64), nullable=False),
+        sa.Column("embedding", Vector(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.PrimaryKeyConstraint("model", "context_hash"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("embedding_store")
@@ -0,0 +1,81 @@
+"""Add embedding_jobs ledger and embedding_quarantine tables.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19
+
+embedding_jobs records each embedding run (corpus, language, vector
+column, model) with its keyset checkpoint: the last row ID whose batch was
+committed. The checkpoint is updated in the same transaction as the
+vectors, so an interrupted run resumes exactly after the last committed
+batch.
+
+embedding_quarantine holds rows whose context text the provider rejects
+on its own (a poison pill). Quarantined rows are skipped by later runs
+until they are retried explicitly, so one bad text cannot stall a corpus.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "embedding_jobs",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("corpus", sa.String(50), nullable=False),
+        sa.Column("lang", sa.String(5), nullable=False),
+        sa.Column("column_name", sa.String(50), nullable=False),
+        sa.Column("model", sa.String(200), nullable=False),
+        sa.Column("stale", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("status", sa.String(20), nullable=False, server_default="running"),
+        sa.Column("last_row_id", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("rows_processed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("rows_embedded", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("rows_quarantined", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("tokens", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("cost", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("error", sa.Text()),
+        sa.Column("started_at", sa.TIMESTAMP(), server_default=sa.text("NOW()")),
+        sa.Column("updated_at", sa.TIMESTAMP(), server_default=sa.text("NOW()")),
+        sa.Column("finished_at", sa.TIMESTAMP()),
+    )
+    op.create_index(
+        "idx_embedding_jobs_lookup",
+        "embedding_jobs",
+        ["corpus", "lang", "column_name", "status"],
+    )
+
+    op.create_table(
+        "embedding_quarantine",
+        sa.Column("table_name", sa.String(50), nullable=False),
+        sa.Column("column_name", sa.String(50), nullable=False),
+        sa.Column("row_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "job_id",
+            sa.Integer(),
+            sa.ForeignKey("embedding_jobs.id", ondelete="SET NULL"),
+        ),
+        sa.Column("error", sa.Text(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column(
+            "quarantined_at",
+            sa.TIMESTAMP(),
+            nullable=False,
+            server_default=sa.text("NOW()"),
+        ),
+        sa.PrimaryKeyConstraint("table_name", "column_name", "row_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("embedding_quarantine")
+    op.drop_index("idx_embedding_jobs_lookup", table_name="embedding_jobs")
+    op.drop_table("embedding_jobs")
@@ -0,0 +1,32 @@
+"""Add worker-pool columns to embedding_jobs.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19
+
+Worker-pool embedding runs start one job per worker process. run_label
+groups the jobs of one run (across processes and nodes) so the supervisor
+can aggregate their progress; worker records which process ran each job.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("embedding_jobs", sa.Column("run_label", sa.String(100)))
+    op.add_column("embedding_jobs", sa.Column("worker", sa.String(100)))
+    op.create_index("ix_embedding_jobs_run_label", "embedding_jobs", ["run_label"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_embedding_jobs_run_label", table_name="embedding_jobs")
+    op.drop_column("embedding_jobs", "worker")
+    op.drop_column("embedding_jobs", "run_label")
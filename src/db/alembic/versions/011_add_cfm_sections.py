@@ -0,0 +1,75 @@
+"""Add cfm_sections table.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19
+
+Long CFM lessons exceed the embedding model's input limit, so
+build_cfm_context truncates their commentary and the rest was never
+embedded. cfm_sections stores each lesson section by section (built from
+the sections in the processed JSON by ingest_cfm; long sections span
+several rows) with one vector column per embedding provider. The API
+returns matching sections as results and ranks lessons by their
+best-matching section.
+
+Sections are deleted with their lesson. Like the provider columns in 006,
+the vector columns get HNSW indexes because the table starts empty.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "idx_cfm_sections_embedding": "embedding",
+    "idx_cfm_sections_embedding_local": "embedding_local",
+    "idx_cfm_sections_embedding_hashing": "embedding_hashing",
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cfm_sections",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "lesson_id",
+            sa.Integer(),
+            sa.ForeignKey("cfm_lessons.id", ondelete="CASCADE"),
+            nullable=False,
+            index=True,
+        ),
+        sa.Column("chunk_index", sa.Integer(), nullable=False),
+        sa.Column("section_title", sa.Text()),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("lang", sa.String(5), nullable=False, index=True),
+        sa.Column("context_text", sa.Text()),
+        sa.Column("embedding", Vector(1536)),
+        sa.Column("embedding_local", Vector(384)),
+        sa.Column("embedding_hashing", Vector(384)),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(),
+            server_default=sa.text("NOW()"),
+        ),
+        sa.UniqueConstraint("lesson_id", "chunk_index", name="uq_cfm_sections_lesson_chunk"),
+    )
+
+    for name, column in INDEXES.items():
+        op.execute(f"""
+            CREATE INDEX {name}
+            ON cfm_sections
+            USING hnsw ({column} vector_cosine_ops)
+        """)
+
+
+def downgrade() -> None:
+    for name in INDEXES:
+        op.drop_index(name, table_name="cfm_sections")
+    op.drop_table("cfm_sections")
@@ -0,0 +1,28 @@
+"""Add the pg_prewarm extension.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-19
+
+The API's startup warm-up (src/api/warmup.py) loads the vector indexes
+into shared buffers with pg_prewarm, so the first searches after a deploy
+or a database restart do not read index pages from disk. pg_prewarm ships
+with PostgreSQL's contrib modules (included in the pgvector image).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_prewarm")
+
+
+def downgrade() -> None:
+    op.execute("DROP EXTENSION IF EXISTS pg_prewarm")
@@ -2,43 +2,74 @@
 
 Provides SQLAlchemy engine and session management for the Scripture Search project.
 Uses synchronous psycopg2 driver for data ingestion tasks.
+
+The engine is created on first use, not at import: importing models or
+helpers (and collecting tests) needs neither DATABASE_URL_SYNC nor the
+psycopg2 driver. `engine` and `SessionLocal` remain available as module
+attributes and are resolved lazily.
 """
 
 import os
 from contextlib import contextmanager
-from typing import Generator
+from functools import lru_cache
+from typing import Any, Generator
 
-from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
-# Load environment variables from .env file
-load_dotenv()
 
-# Get database URL from environment
-DATABASE_URL = os.getenv("DATABASE_URL_SYNC")
-if not DATABASE_URL:
-    raise ValueError(
-        "DATABASE_URL_SYNC environment variable is not set. "
-        "Please configure it in your .env file."
+@lru_cache
+def get_engine() -> Engine:
+    """Create the SQLAlchemy engine (once per process).
+
+    Loads DATABASE_URL_SYNC from the environment or the .env file.
+
+    Returns:
+        Engine: Engine for the ingestion and CLI tools.
+
+    Raises:
+        ValueError: If DATABASE_URL_SYNC is not set.
+    """
+    from dotenv import load_dotenv
+
+    # Load environment variables from .env file
+    load_dotenv()
+
+    database_url = os.getenv("DATABASE_URL_SYNC")
+    if not database_url:
+        raise ValueError(
+            "DATABASE_URL_SYNC environment variable is not set. "
+            "Please configure it in your .env file."
+        )
+
+    # Using pool_pre_ping to handle dropped connections gracefully
+    return create_engine(
+        database_url,
+        pool_pre_ping=True,
+        pool_size=5,
+        max_overflow=10,
+        echo=os.getenv("DEBUG", "false").lower() == "true",
+    )
+
+
+@lru_cache
+def get_sessionmaker() -> sessionmaker:
+    """Create the session factory bound to the engine (once per process)."""
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=get_engine(),
     )
 
-# Create SQLAlchemy engine
-# Using pool_pre_ping to handle dropped connections gracefully
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-    echo=os.getenv("DEBUG", "false").lower() == "true",
-)
 
-# Create session factory
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-)
+def __getattr__(name: str) -> Any:
+    # Lazy module attributes: engine and SessionLocal
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @contextmanager
@@ -57,7 +88,7 @@ def get_session() -> Generator[Session, None, None]:
         The session is automatically closed when exiting the context.
         Commits must be done explicitly within the context.
     """
-    session = SessionLocal()
+    session = get_sessionmaker()()
     try:
         yield session
     finally:
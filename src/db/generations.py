@@ -0,0 +1,67 @@
+"""Corpus generation numbers for cache invalidation.
+
+Every searchable corpus has a generation number in the corpus_generations
+table. Anything that changes searchable data bumps the generation inside
+the same transaction as a data change, and the API includes the current
+generation in its cache keys. Ingestion bumps with each load; embedding
+runs bump when they finish and at most every few minutes while they run
+(src/embeddings/runner.py), so long runs do not flush the caches per batch.
+
+Usage:
+    from src.db.generations import bump_generation
+
+    with get_session() as session:
+        ...  # insert or update rows
+        bump_generation(session, "scriptures")
+        session.commit()
+"""
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# Corpus names, matching the API search endpoints
+CORPORA = ("scriptures", "cfm", "conference")
+
+
+def bump_generation(session: Session, corpus: str) -> None:
+    """Increment the generation number for a corpus.
+
+    Does not commit; call this before the commit that publishes the data
+    change so the new generation becomes visible atomically with it.
+
+    Args:
+        session: SQLAlchemy session
+        corpus: Corpus name ('scriptures', 'cfm', 'conference')
+
+    Raises:
+        ValueError: If corpus is not a known corpus name.
+    """
+    if corpus not in CORPORA:
+        raise ValueError(f"Unknown corpus: {corpus}")
+    session.execute(
+        text("""
+            INSERT INTO corpus_generations (corpus, generation)
+            VALUES (:corpus, 1)
+            ON CONFLICT (corpus) DO UPDATE
+            SET generation = corpus_generations.generation + 1,
+                updated_at = NOW()
+        """),
+        {"corpus": corpus},
+    )
+
+
+def get_generation(session: Session, corpus: str) -> int:
+    """Return the current generation number for a corpus.
+
+    Args:
+        session: SQLAlchemy session
+        corpus: Corpus name ('scriptures', 'cfm', 'conference')
+
+    Returns:
+        Current generation number (0 if the corpus has never been bumped).
+    """
+    result = session.execute(
+        text("SELECT generation FROM corpus_generations WHERE corpus = :corpus"),
+        {"corpus": corpus},
+    )
+    return result.scalar() or 0
@@ -3,12 +3,24 @@
 Models:
 - Scripture: verse-level scripture data with vector embeddings
 - CFMLesson: Come Follow Me lesson content with embeddings
+- CFMSection: section-level pieces of CFM lessons with embeddings
+- ConferenceParagraph: General Conference talk paragraphs with embeddings
+- CorpusGeneration: per-corpus data generation numbers for cache invalidation
+- EmbeddingProvenance: model and context hash behind each stored embedding
+- EmbeddingStoreEntry: content-addressed vectors shared by identical contexts
+- EmbeddingJob: ledger of embedding runs with resumable checkpoints
+- EmbeddingQuarantine: rows the embedding provider rejects (poison pills)
 """
 
 from sqlalchemy import (
     ARRAY,
     TIMESTAMP,
+    BigInteger,
+    Boolean,
     Column,
+    Computed,
+    Float,
+    ForeignKey,
     Integer,
     String,
     Text,
@@ -39,6 +51,8 @@ class Scripture(Base):
         footnotes: JSON object containing footnote references and content
         context_text: Concatenated text from +/-2 verses for embedding context
         embedding: Vector embedding (1536 dimensions for text-embedding-3-small)
+        embedding_local: Local CPU model embedding (384 dimensions)
+        embedding_hashing: Hashing provider embedding (384 dimensions, load tests)
         created_at: Timestamp of record creation
     """
     __tablename__ = "scriptures"
@@ -53,6 +67,8 @@ class Scripture(Base):
     footnotes = Column(JSONB)
     context_text = Column(Text)  # NULL until Phase 3 embedding generation
     embedding = Column(Vector(1536))  # NULL until Phase 3 embedding generation
+    embedding_local = Column(Vector(384))
+    embedding_hashing = Column(Vector(384))
     created_at = Column(TIMESTAMP, server_default=sql_text("NOW()"))
 
     def __repr__(self) -> str:
@@ -76,8 +92,11 @@ class CFMLesson(Base):
         date_range: Date range string for the lesson
         scripture_refs: Array of scripture reference strings
         content: Plain text content of the lesson
+        content_preview: First 500 characters of content (generated column)
         lang: Language code ('en', 'es')
         embedding: Vector embedding (1536 dimensions)
+        embedding_local: Local CPU model embedding (384 dimensions)
+        embedding_hashing: Hashing provider embedding (384 dimensions, load tests)
         created_at: Timestamp of record creation
     """
     __tablename__ = "cfm_lessons"
@@ -90,8 +109,11 @@ class CFMLesson(Base):
     date_range = Column(String(100))
     scripture_refs = Column(ARRAY(Text))
     content = Column(Text)
+    content_preview = Column(Text, Computed("LEFT(content, 500)", persisted=True))
     lang = Column(String(5), nullable=False, index=True)
     embedding = Column(Vector(1536))  # NULL until Phase 3 embedding generation
+    embedding_local = Column(Vector(384))
+    embedding_hashing = Column(Vector(384))
     created_at = Column(TIMESTAMP, server_default=sql_text("NOW()"))
 
     def __repr__(self) -> str:
@@ -101,6 +123,50 @@ class CFMLesson(Base):
         )
 
 
+class CFMSection(Base):
+    """Come Follow Me lesson section model.
+
+    One row per section of a lesson (the intro is an untitled first
+    section; sections longer than the chunk token budget span several
+    rows), so lessons are embedded in full and search can return the one
+    relevant section.
+
+    Attributes:
+        id: Primary key
+        lesson_id: Parent cfm_lessons.id (sections are deleted with the lesson)
+        chunk_index: 0-indexed position in the lesson
+        section_title: Section title ('' for the intro)
+        content: Section paragraphs, newline-separated
+        lang: Language code ('en', 'es')
+        context_text: Lesson header plus section, as embedded
+        embedding: Vector embedding (1536 dimensions)
+        embedding_local: Local CPU model embedding (384 dimensions)
+        embedding_hashing: Hashing provider embedding (384 dimensions, load tests)
+        created_at: Timestamp of record creation
+    """
+    __tablename__ = "cfm_sections"
+
+    id = Column(Integer, primary_key=True)
+    lesson_id = Column(
+        Integer, ForeignKey("cfm_lessons.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    chunk_index = Column(Integer, nullable=False)
+    section_title = Column(Text)
+    content = Column(Text, nullable=False)
+    lang = Column(String(5), nullable=False, index=True)
+    context_text = Column(Text)  # NULL until embedding generation
+    embedding = Column(Vector(1536))
+    embedding_local = Column(Vector(384))
+    embedding_hashing = Column(Vector(384))
+    created_at = Column(TIMESTAMP, server_default=sql_text("NOW()"))
+
+    def __repr__(self) -> str:
+        return (
+            f"<CFMSection(id={self.id}, lesson_id={self.lesson_id}, "
+            f"chunk_index={self.chunk_index}, lang={self.lang})>"
+        )
+
+
 class ConferenceParagraph(Base):
     """Conference talk paragraph model.
 
@@ -124,6 +190,8 @@ class ConferenceParagraph(Base):
         talk_refs: Array of cross-references to other talks
         context_text: ±2 paragraph context for embedding
         embedding: Vector embedding (1536 dimensions)
+        embedding_local: Local CPU model embedding (384 dimensions)
+        embedding_hashing: Hashing provider embedding (384 dimensions, load tests)
         created_at: Timestamp of record creation
     """
     __tablename__ = "conference_paragraphs"
@@ -144,6 +212,8 @@ class ConferenceParagraph(Base):
     talk_refs = Column(ARRAY(Text))
     context_text = Column(Text)  # NULL until embedding generation
     embedding = Column(Vector(1536))  # NULL until embedding generation
+    embedding_local = Column(Vector(384))
+    embedding_hashing = Column(Vector(384))
     created_at = Column(TIMESTAMP, server_default=sql_text("NOW()"))
 
     def __repr__(self) -> str:
@@ -151,3 +221,171 @@ class ConferenceParagraph(Base):
             f"<ConferenceParagraph(id={self.id}, {self.year}/{self.month} "
             f"para {self.paragraph_num}, lang={self.lang})>"
         )
+
+
+class CorpusGeneration(Base):
+    """Corpus generation counter model.
+
+    Stores a monotonically increasing generation number per searchable
+    corpus. Ingestion and embedding scripts bump it when searchable data
+    changes; the API uses it to tag and invalidate cached search responses.
+
+    Attributes:
+        corpus: Corpus name ('scriptures', 'cfm', 'conference')
+        generation: Current generation number
+        updated_at: Timestamp of the last bump
+    """
+    __tablename__ = "corpus_generations"
+
+    corpus = Column(String(50), primary_key=True)
+    generation = Column(BigInteger, nullable=False, server_default=sql_text("0"))
+    updated_at = Column(TIMESTAMP, server_default=sql_text("NOW()"))
+
+    def __repr__(self) -> str:
+        return f"<CorpusGeneration(corpus={self.corpus}, generation={self.generation})>"
+
+
+class EmbeddingProvenance(Base):
+    """Embedding provenance model.
+
+    One row per embedded row and vector column, recording what produced
+    the stored vector. Embedding generators use it to re-embed only rows
+    whose context text or model changed.
+
+    Attributes:
+        table_name: Embedded table ('scriptures', 'cfm_lessons', 'conference_paragraphs')
+        column_name: Vector column (e.g., 'embedding', 'embedding_local')
+        row_id: ID of the embedded row
+        model: Provider model ID (e.g., 'azure:text-embedding-3-small')
+        dimensions: Vector dimensions
+        context_hash: SHA-256 hex digest of the embedded context text
+        generated_at: When the vector was generated
+    """
+    __tablename__ = "embedding_provenance"
+
+    table_name = Column(String(50), primary_key=True)
+    column_name = Column(String(50), primary_key=True)
+    row_id = Column(Integer, primary_key=True)
+    model = Column(String(200), nullable=False)
+    dimensions = Column(Integer, nullable=False)
+    context_hash = Column(String(64), nullable=False)
+    generated_at = Column(TIMESTAMP, nullable=False, server_default=sql_text("NOW()"))
+
+    def __repr__(self) -> str:
+        return (
+            f"<EmbeddingProvenance({self.table_name}.{self.column_name} "
+            f"id={self.row_id}, model={self.model})>"
+        )
+
+
+class EmbeddingStoreEntry(Base):
+    """Content-addressed embedding model.
+
+    One vector per (model, context hash), shared by every row whose context
+    text is identical. Embedding generators consult it before calling the
+    embedding provider.
+
+    Attributes:
+        model: Provider model ID (e.g., 'azure:text-embedding-3-small')
+        context_hash: SHA-256 hex digest of the context text
+        embedding: Vector (dimensions depend on the model)
+        created_at: When the vector was first generated
+    """
+    __tablename__ = "embedding_store"
+
+    model = Column(String(200), primary_key=True)
+    context_hash = Column(String(64), primary_key=True)
+    embedding = Column(Vector(), nullable=False)
+    created_at = Column(TIMESTAMP, nullable=False, server_default=sql_text("NOW()"))
+
+    def __repr__(self) -> str:
+        return f"<EmbeddingStoreEntry(model={self.model}, hash={self.context_hash[:12]})>"
+
+
+class EmbeddingJob(Base):
+    """Embedding run ledger model.
+
+    One row per embedding run. last_row_id is the keyset checkpoint,
+    committed together with each batch of vectors, so a run can resume
+    after the last committed batch.
+
+    Attributes:
+        id: Job ID
+        corpus: Corpus name ('scriptures', 'cfm', 'conference')
+        lang: Language code
+        column_name: Vector column being filled
+        model: Provider model ID
+        stale: Whether the run re-embeds stale rows (not just missing ones)
+        status: 'running', 'paused', 'interrupted', 'failed', or 'completed'
+        last_row_id: ID of the last row in the last committed batch
+        rows_processed: Rows examined so far
+        rows_embedded: Rows whose vector was written
+        rows_quarantined: Rows moved to quarantine
+        tokens: Estimated tokens sent to the provider
+        cost: Estimated provider cost in USD
+        error: Error that stopped the run, if any
+        run_label: Label shared by the workers of one multi-worker run
+        worker: Worker identifier ("host:pid") for worker-pool jobs
+        started_at: When the job was created
+        updated_at: Last checkpoint
+        finished_at: When the job completed
+    """
+    __tablename__ = "embedding_jobs"
+
+    id = Column(Integer, primary_key=True)
+    corpus = Column(String(50), nullable=False)
+    lang = Column(String(5), nullable=False)
+    column_name = Column(String(50), nullable=False)
+    model = Column(String(200), nullable=False)
+    stale = Column(Boolean, nullable=False, server_default=sql_text("false"))
+    status = Column(String(20), nullable=False, server_default="running")
+    last_row_id = Column(Integer, nullable=False, server_default=sql_text("0"))
+    rows_processed = Column(Integer, nullable=False, server_default=sql_text("0"))
+    rows_embedded = Column(Integer, nullable=False, server_default=sql_text("0"))
+    rows_quarantined = Column(Integer, nullable=False, server_default=sql_text("0"))
+    tokens = Column(BigInteger, nullable=False, server_default=sql_text("0"))
+    cost = Column(Float, nullable=False, server_default=sql_text("0"))
+    error = Column(Text)
+    run_label = Column(String(100), index=True)
+    worker = Column(String(100))
+    started_at = Column(TIMESTAMP, server_default=sql_text("NOW()"))
+    updated_at = Column(TIMESTAMP, server_default=sql_text("NOW()"))
+    finished_at = Column(TIMESTAMP)
+
+    def __repr__(self) -> str:
+        return (
+            f"<EmbeddingJob(id={self.id}, {self.corpus}/{self.lang} "
+            f"{self.column_name}, status={self.status}, last_row_id={self.last_row_id})>"
+        )
+
+
+class EmbeddingQuarantine(Base):
+    """Quarantined embedding row model.
+
+    Rows whose context text the provider rejected on its own. Embedding
+    runs skip them until they are retried.
+
+    Attributes:
+        table_name: Embedded table name
+        column_name: Vector column
+        row_id: ID of the rejected row
+        job_id: Job that quarantined the row
+        error: Provider error message
+        attempts: Number of failed attempts
+        quarantined_at: When the row was (last) quarantined
+    """
+    __tablename__ = "embedding_quarantine"
+
+    table_name = Column(String(50), primary_key=True)
+    column_name = Column(String(50), primary_key=True)
+    row_id = Column(Integer, primary_key=True)
+    job_id = Column(Integer, ForeignKey("embedding_jobs.id", ondelete="SET NULL"))
+    error = Column(Text, nullable=False)
+    attempts = Column(Integer, nullable=False, server_default=sql_text("1"))
+    quarantined_at = Column(TIMESTAMP, nullable=False, server_default=sql_text("NOW()"))
+
+    def __repr__(self) -> str:
+        return (
+            f"<EmbeddingQuarantine({self.table_name}.{self.column_name} "
+            f"id={self.row_id}, attempts={self.attempts})>"
+        )
@@ -1,8 +1,24 @@
-"""Embeddings module for scripture search."""
-
-from src.embeddings.verify import (
-    verify_embedding_counts,
-    verify_embedding_dimensions,
-    verify_cfm_embeddings,
-    test_semantic_search,
-)
+"""Embeddings module for scripture search.
+
+The verification helpers are imported from src.embeddings.verify on first
+access, so importing a submodule (providers, tokens) does not load the
+database layer.
+"""
+
+import importlib
+from typing import Any
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "verify_embedding_counts": "src.embeddings.verify",
+    "verify_embedding_dimensions": "src.embeddings.verify",
+    "verify_cfm_embeddings": "src.embeddings.verify",
+    "test_semantic_search": "src.embeddings.verify",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
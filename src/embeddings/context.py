@@ -1,51 +1,22 @@
-"""Context window builder for scripture embeddings."""
+"""Context builders for embeddings.
+
+One builder per corpus turns a row into the text that is embedded:
+- build_context_for_verse: verse with ±2 surrounding verses
+- build_cfm_context: lesson title, references, referenced verses, commentary
+  (cut to MAX_CONTEXT_TOKENS tokens)
+- build_cfm_section_context: lesson title and one lesson section
+- build_conference_context: paragraph with ±2 paragraphs from the same talk
+"""
 from typing import Optional
 from sqlalchemy import text as sql_text
 from sqlalchemy.orm import Session
 
-from src.db.models import Scripture
-
-# Book ID to display name mapping
-BOOK_TITLES = {
-    # Book of Mormon
-    "1nephi": "1 Nephi", "2nephi": "2 Nephi", "jacob": "Jacob",
-    "enos": "Enos", "jarom": "Jarom", "omni": "Omni",
-    "wordsofmormon": "Words of Mormon", "mosiah": "Mosiah",
-    "alma": "Alma", "helaman": "Helaman", "3nephi": "3 Nephi",
-    "4nephi": "4 Nephi", "mormon": "Mormon", "ether": "Ether",
-    "moroni": "Moroni",
-    # Old Testament (abbreviated list - add more as needed)
-    "genesis": "Genesis", "exodus": "Exodus", "leviticus": "Leviticus",
-    "numbers": "Numbers", "deuteronomy": "Deuteronomy",
-    "joshua": "Joshua", "judges": "Judges", "ruth": "Ruth",
-    "1samuel": "1 Samuel", "2samuel": "2 Samuel",
-    "1kings": "1 Kings", "2kings": "2 Kings",
-    "1chronicles": "1 Chronicles", "2chronicles": "2 Chronicles",
-    "ezra": "Ezra", "nehemiah": "Nehemiah", "esther": "Esther",
-    "job": "Job", "psalms": "Psalms", "proverbs": "Proverbs",
-    "ecclesiastes": "Ecclesiastes", "songofsolomon": "Song of Solomon",
-    "isaiah": "Isaiah", "jeremiah": "Jeremiah", "lamentations": "Lamentations",
-    "ezekiel": "Ezekiel", "daniel": "Daniel", "hosea": "Hosea",
-    "joel": "Joel", "amos": "Amos", "obadiah": "Obadiah",
-    "jonah": "Jonah", "micah": "Micah", "nahum": "Nahum",
-    "habakkuk": "Habakkuk", "zephaniah": "Zephaniah",
-    "haggai": "Haggai", "zechariah": "Zechariah", "malachi": "Malachi",
-    # New Testament
-    "matthew": "Matthew", "mark": "Mark", "luke": "Luke", "john": "John",
-    "acts": "Acts", "romans": "Romans", "1corinthians": "1 Corinthians",
-    "2corinthians": "2 Corinthians", "galatians": "Galatians",
-    "ephesians": "Ephesians", "philippians": "Philippians",
-    "colossians": "Colossians", "1thessalonians": "1 Thessalonians",
-    "2thessalonians": "2 Thessalonians", "1timothy": "1 Timothy",
-    "2timothy": "2 Timothy", "titus": "Titus", "philemon": "Philemon",
-    "hebrews": "Hebrews", "james": "James", "1peter": "1 Peter",
-    "2peter": "2 Peter", "1john": "1 John", "2john": "2 John",
-    "3john": "3 John", "jude": "Jude", "revelation": "Revelation",
-    # D&C and Pearl of Great Price
-    "doctrineandcovenants": "D&C", "moses": "Moses",
-    "abraham": "Abraham", "josephsmith-matthew": "JS-Matthew",
-    "josephsmith-history": "JS-History", "articlesoffaith": "Articles of Faith",
-}
+from src.db.models import CFMLesson, CFMSection, ConferenceParagraph, Scripture
+from src.embeddings.tokens import MAX_CONTEXT_TOKENS, count_tokens, truncate_tokens
+from src.references import BOOKS, ScriptureRef, book_id_for_lang, parse_references
+
+# Book ID to display name mapping (English IDs, from the shared book catalog)
+BOOK_TITLES = {book.id: book.title for book in BOOKS}
 
 def format_book_title(book_id: str) -> str:
     """Convert book ID to display title."""
@@ -122,3 +93,165 @@ def build_context_for_verse(session: Session, verse: Scripture) -> str:
     """Build context text for a single verse, fetching surrounding verses."""
     prev_verses, next_verses = get_context_verses(session, verse)
     return build_context_text(verse, prev_verses, next_verses)
+
+
+def lookup_verse_text(session, ref: ScriptureRef, lang: str) -> Optional[str]:
+    """Look up the first verse of a parsed reference from the database.
+
+    Filters on the full (volume, book, chapter, verse, lang) key so the
+    lookup is served by the idx_scriptures_ref composite index.
+    """
+    result = session.query(Scripture.text).filter(
+        Scripture.volume == ref.volume,
+        Scripture.book == book_id_for_lang(ref.book, lang),
+        Scripture.chapter == ref.chapter,
+        Scripture.verse == ref.verse_start,
+        Scripture.lang == lang
+    ).first()
+
+    return result.text if result else None
+
+
+def build_cfm_context(session, lesson: CFMLesson) -> str:
+    """Build embedding context for a CFM lesson.
+
+    Format:
+    [Title] - Week [lesson_id], [date_range]
+    Scripture References: [refs]
+
+    [Referenced verse texts]
+
+    [CFM commentary]
+
+    The whole context fits MAX_CONTEXT_TOKENS tokens: the header and
+    references are counted first (and cut if they alone exceed the limit),
+    and the commentary gets the tokens left; cfm_sections embeds the full
+    text section by section.
+    """
+    parts = [cfm_lesson_header(lesson)]
+
+    # Scripture references
+    if lesson.scripture_refs:
+        refs_str = ", ".join(lesson.scripture_refs)
+        parts.append(f"Scripture References: {refs_str}")
+
+        # Look up actual verse texts
+        verse_texts = []
+        refs = lesson.scripture_refs[:10]  # Limit to first 10 refs
+        for ref, parsed in zip(refs, parse_references(refs)):
+            # Whole-chapter references have no single verse to quote
+            if parsed and parsed[0].verse_start is not None:
+                text = lookup_verse_text(session, parsed[0], lesson.lang)
+                if text:
+                    verse_texts.append(f"{ref}: {text}")
+
+        if verse_texts:
+            parts.append("\nReferenced Scriptures:")
+            parts.extend(verse_texts)
+
+    # The header and refs come first; a long reference list is cut to the budget
+    header, header_cut = truncate_tokens("\n".join(parts), MAX_CONTEXT_TOKENS)
+    parts = [header]
+
+    # Commentary content, cut to the tokens left after the header and refs
+    if lesson.content and not header_cut:
+        label = "\nLesson Content:\n"
+        # +1 for the newline before the label, +1 for the ellipsis
+        budget = MAX_CONTEXT_TOKENS - count_tokens(header + label) - 2
+        if budget > 0:
+            content, truncated = truncate_tokens(lesson.content, budget)
+            if truncated:
+                content += "..."
+            parts.append(f"{label}{content}")
+
+    # Tokens can merge across the joins; keep the total within the limit
+    context, _ = truncate_tokens("\n".join(parts), MAX_CONTEXT_TOKENS)
+    return context
+
+
+def cfm_lesson_header(lesson: CFMLesson) -> str:
+    """Lesson title with its date range, e.g. "Title (January 1-7)"."""
+    header = f"{lesson.title}"
+    if lesson.date_range:
+        header += f" ({lesson.date_range})"
+    return header
+
+
+def build_cfm_section_context(session, section: CFMSection) -> str:
+    """Build embedding context for one section of a CFM lesson.
+
+    Format:
+    [Title] ([date_range])
+    [Section title]
+
+    [Section paragraphs]
+    """
+    lesson = session.get(CFMLesson, section.lesson_id)
+    parts = [cfm_lesson_header(lesson)]
+    if section.section_title:
+        parts.append(section.section_title)
+    parts.append("")
+    parts.append(section.content)
+    context, _ = truncate_tokens("\n".join(parts), MAX_CONTEXT_TOKENS)
+    return context
+
+
+def build_conference_context(
+    session, paragraph: ConferenceParagraph, context_window: int = 2
+) -> str:
+    """Build embedding context for a conference paragraph.
+
+    Includes ±context_window paragraphs from the same talk.
+
+    Format:
+    [Talk Title] by [Speaker Name]
+
+    [Previous paragraphs...]
+    [Current paragraph]
+    [Following paragraphs...]
+
+    Args:
+        session: Database session
+        paragraph: The paragraph to build context for
+        context_window: Number of paragraphs before/after to include
+
+    Returns:
+        Context string for embedding
+    """
+    parts = []
+
+    # Header with talk metadata
+    header = paragraph.talk_title or "Conference Talk"
+    if paragraph.speaker_name:
+        header += f" by {paragraph.speaker_name}"
+    parts.append(header)
+    parts.append("")
+
+    # Get surrounding paragraphs from same talk
+    min_num = max(1, paragraph.paragraph_num - context_window)
+    max_num = paragraph.paragraph_num + context_window
+
+    result = session.execute(
+        sql_text("""
+            SELECT paragraph_num, text
+            FROM conference_paragraphs
+            WHERE talk_uri = :uri AND lang = :lang
+              AND paragraph_num >= :min_num AND paragraph_num <= :max_num
+            ORDER BY paragraph_num
+        """),
+        {
+            "uri": paragraph.talk_uri,
+            "lang": paragraph.lang,
+            "min_num": min_num,
+            "max_num": max_num,
+        },
+    )
+
+    for row in result.fetchall():
+        if row.paragraph_num == paragraph.paragraph_num:
+            # Mark current paragraph
+            parts.append(f">>> {row.text}")
+        else:
+            parts.append(row.text)
+
+    return "\n".join(parts)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Unified embedding pipeline for every corpus.
+
+Each corpus is an EmbeddingSource: the rows to embed (table and model),
+the context builder that turns a row into text, and the sink that writes
+vectors and provenance. Batching, keyset checkpoints, retries and
+quarantine, the embedding store, cost limits, throughput and ETA reporting
+live in EmbeddingRunner (runner.py) and the SKIP LOCKED worker pool
+(workers.py), so every improvement there applies to all corpora.
+
+Corpora:
+    scriptures  verse with ±2 surrounding verses (batch 100, delay 1.0s)
+    cfm         lesson with referenced verses and commentary (batch 10, delay 0.5s)
+    cfm_sections  lesson section under the lesson title (batch 50, delay 0.5s)
+    conference  paragraph with ±2 paragraphs from the talk (batch 10, delay 0.5s)
+
+Usage:
+    # Generate for English:
+    python -m src.embeddings.pipeline --corpus conference --lang en
+
+    # With custom batch size:
+    python -m src.embeddings.pipeline --corpus conference --lang en --batch-size 20
+
+    # Limit for testing:
+    python -m src.embeddings.pipeline --corpus cfm --lang en --limit 100
+
+    # Embed CFM lesson sections (section results, section-pooled lesson ranking):
+    python -m src.embeddings.pipeline --corpus cfm_sections --lang en
+
+    # Offline CPU embeddings (stored in embedding_local):
+    python -m src.embeddings.pipeline --corpus scriptures --lang en --provider local
+
+    # Re-embed only rows whose context changed (e.g., new header format):
+    python -m src.embeddings.pipeline --corpus conference --lang en --stale
+
+    # Continue an interrupted run from its checkpoint, capping spend at $2:
+    python -m src.embeddings.pipeline --corpus conference --lang en --resume --max-cost 2
+
+The per-corpus scripts (generate, generate_cfm, generate_conference) are
+shortcuts for --corpus.
+"""
+
+import argparse
+from typing import Optional
+
+from src.db.models import CFMLesson, CFMSection, ConferenceParagraph, Scripture
+from src.embeddings.context import (
+    build_cfm_section_context,
+    build_cfm_context,
+    build_conference_context,
+    build_context_for_verse,
+)
+from src.embeddings.runner import EmbeddingSource, add_runner_arguments, run_from_args
+
+SOURCES: dict[str, EmbeddingSource] = {
+    "scriptures": EmbeddingSource(
+        corpus="scriptures",
+        table="scriptures",
+        model=Scripture,
+        build_context=build_context_for_verse,
+        stores_context=True,
+        batch_size=100,
+        delay=1.0,
+    ),
+    "cfm": EmbeddingSource(
+        corpus="cfm",
+        table="cfm_lessons",
+        model=CFMLesson,
+        build_context=build_cfm_context,
+    ),
+    "cfm_sections": EmbeddingSource(
+        corpus="cfm_sections",
+        table="cfm_sections",
+        model=CFMSection,
+        build_context=build_cfm_section_context,
+        stores_context=True,
+        batch_size=50,
+        generation="cfm",
+    ),
+    "conference": EmbeddingSource(
+        corpus="conference",
+        table="conference_paragraphs",
+        model=ConferenceParagraph,
+        build_context=build_conference_context,
+        stores_context=True,
+    ),
+}
+
+
+def get_source(corpus: str) -> EmbeddingSource:
+    """Get the pipeline source for a corpus.
+
+    Raises:
+        ValueError: If the corpus is unknown.
+    """
+    if corpus not in SOURCES:
+        raise ValueError(f"Unknown corpus: {corpus}")
+    return SOURCES[corpus]
+
+
+def build_parser(corpus: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the pipeline's argument parser.
+
+    Args:
+        corpus: Fixed corpus (for the per-corpus scripts); when None the
+                parser takes a required --corpus option
+    """
+    description = f"Generate {corpus} embeddings" if corpus else "Generate embeddings"
+    parser = argparse.ArgumentParser(description=description)
+    if corpus is None:
+        parser.add_argument("--corpus", choices=list(SOURCES), required=True,
+                            help="Corpus to embed")
+    parser.add_argument("--lang", choices=["en", "es"], default="en",
+                        help="Language to process (default: en)")
+    parser.add_argument("--batch-size", type=int, default=None,
+                        help="Rows per batch (default: per corpus)")
+    parser.add_argument("--delay", type=float, default=None,
+                        help="Delay between batches in seconds (default: per corpus)")
+    add_runner_arguments(parser)
+    return parser
+
+
+def main(argv: Optional[list[str]] = None, corpus: Optional[str] = None) -> None:
+    args = build_parser(corpus).parse_args(argv)
+    run_from_args(get_source(corpus or args.corpus), args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""Embedding provenance tracking for incremental re-embedding.
+
+Every stored vector gets an embedding_provenance row recording the model
+that produced it, its dimensions, and a SHA-256 hash of the context text
+that was embedded. Comparing that hash with the current context builder's
+output tells the generators exactly which rows a context-format change
+affected, so only those rows are re-embedded.
+
+Row status, per vector column:
+    missing          vector column is NULL
+    untracked        vector present, no provenance (embedded before tracking)
+    adoptable        untracked, but the context saved on the row still matches,
+                     so provenance can be recorded without re-embedding
+    model_changed    vector produced by a different model
+    context_changed  context text differs from what was embedded
+    current          nothing to do
+
+Usage:
+    from src.embeddings.provenance import embed_rows
+
+    embedded = embed_rows(session, "scriptures", provider, verses, contexts,
+                          only_stale=True)
+"""
+
+from typing import Any, NamedTuple, Optional, Sequence
+
+from sqlalchemy import bindparam, text as sql_text
+from sqlalchemy.orm import Session
+
+from src.embeddings.providers import EmbeddingProvider
+from src.embeddings.store import DedupStats, context_hash, embed_with_store
+
+# Tables whose rows are embedded, mapped to their corpus generation name
+EMBEDDED_TABLES = {
+    "scriptures": "scriptures",
+    "cfm_lessons": "cfm",
+    "cfm_sections": "cfm",
+    "conference_paragraphs": "conference",
+}
+
+STATUSES = (
+    "missing",
+    "untracked",
+    "adoptable",
+    "model_changed",
+    "context_changed",
+    "current",
+)
+
+# Statuses whose vector must be (re)generated
+STALE_STATUSES = ("missing", "untracked", "model_changed", "context_changed")
+
+
+class Provenance(NamedTuple):
+    """Stored provenance of one row's vector."""
+
+    model: str
+    dimensions: int
+    context_hash: str
+
+
+def classify(
+    has_embedding: bool,
+    record: Optional[Provenance],
+    model_id: str,
+    current_hash: str,
+    stored_context: Optional[str] = None,
+) -> str:
+    """Classify a row's vector against the current model and context.
+
+    Args:
+        has_embedding: Whether the row's vector column is populated
+        record: Stored provenance, if any
+        model_id: Current provider model ID
+        current_hash: Hash of the current context text
+        stored_context: Context text saved on the row (scriptures and
+                        conference store it); lets untracked rows whose
+                        context is unchanged be adopted without re-embedding
+
+    Returns:
+        One of STATUSES.
+    """
+    if not has_embedding:
+        return "missing"
+    if record is None:
+        if stored_context is not None and context_hash(stored_context) == current_hash:
+            return "adoptable"
+        return "untracked"
+    if record.model != model_id:
+        return "model_changed"
+    if record.context_hash != current_hash:
+        return "context_changed"
+    return "current"
+
+
+def load_provenance(
+    session: Session, table: str, column: str, row_ids: Sequence[int]
+) -> dict[int, Provenance]:
+    """Load provenance records for a set of rows.
+
+    Args:
+        session: Database session
+        table: Embedded table name
+        column: Vector column name
+        row_ids: Row IDs to look up
+
+    Returns:
+        Mapping of row ID to Provenance for rows that have a record.
+    """
+    if not row_ids:
+        return {}
+    result = session.execute(
+        sql_text("""
+            SELECT row_id, model, dimensions, context_hash
+            FROM embedding_provenance
+            WHERE table_name = :table
+              AND column_name = :column
+              AND row_id IN :row_ids
+        """).bindparams(bindparam("row_ids", expanding=True)),
+        {"table": table, "column": column, "row_ids": list(row_ids)},
+    )
+    return {
+        row.row_id: Provenance(row.model, row.dimensions, row.context_hash)
+        for row in result
+    }
+
+
+def record_provenance(
+    session: Session,
+    table: str,
+    provider: EmbeddingProvider,
+    entries: Sequence[tuple[int, str]],
+) -> None:
+    """Upsert provenance for freshly embedded rows.
+
+    Does not commit; call this in the same transaction as the vector update.
+
+    Args:
+        session: Database session
+        table: Embedded table name
+        provider: Provider that produced the vectors
+        entries: (row_id, context_hash) pairs
+    """
+    if not entries:
+        return
+    session.execute(
+        sql_text("""
+            INSERT INTO embedding_provenance
+                (table_name, column_name, row_id, model, dimensions, context_hash)
+            VALUES (:table, :column, :row_id, :model, :dimensions, :context_hash)
+            ON CONFLICT (table_name, column_name, row_id) DO UPDATE
+            SET model = EXCLUDED.model,
+                dimensions = EXCLUDED.dimensions,
+                context_hash = EXCLUDED.context_hash,
+                generated_at = NOW()
+        """),
+        [
+            {
+                "table": table,
+                "column": provider.column,
+                "row_id": row_id,
+                "model": provider.model_id,
+                "dimensions": provider.dimensions,
+                "context_hash": digest,
+            }
+            for row_id, digest in entries
+        ],
+    )
+
+
+def classify_rows(
+    session: Session,
+    table: str,
+    provider: EmbeddingProvider,
+    rows: Sequence[Any],
+    contexts: Sequence[str],
+    stored_contexts: Optional[Sequence[Optional[str]]] = None,
+) -> list[str]:
+    """Classify a batch of ORM rows against their current context texts.
+
+    Args:
+        session: Database session
+        table: Embedded table name
+        provider: Current embedding provider
+        rows: ORM rows (must have an id and the provider's vector column)
+        contexts: Current context text for each row
+        stored_contexts: Context text previously saved on each row, if the
+                         table stores it
+
+    Returns:
+        One status from STATUSES per row, in input order.
+    """
+    records = load_provenance(session, table, provider.column, [row.id for row in rows])
+    stored = stored_contexts or [None] * len(rows)
+    return [
+        classify(
+            getattr(row, provider.column) is not None,
+            records.get(row.id),
+            provider.model_id,
+            context_hash(context),
+            stored_context,
+        )
+        for row, context, stored_context in zip(rows, contexts, stored)
+    ]
+
+
+def embed_rows(
+    session: Session,
+    table: str,
+    provider: EmbeddingProvider,
+    rows: Sequence[Any],
+    contexts: Sequence[str],
+    stored_contexts: Optional[Sequence[Optional[str]]] = None,
+    only_stale: bool = False,
+    stats: Optional[DedupStats] = None,
+) -> int:
+    """Embed rows into the provider's column and record their provenance.
+
+    Vectors come from the content-addressed embedding store when the same
+    context was embedded before; only new contexts reach the provider.
+    With only_stale, rows whose vector is current are skipped, and
+    adoptable rows get provenance without calling the provider. Does not
+    commit.
+
+    Args:
+        session: Database session
+        table: Embedded table name
+        provider: Embedding provider
+        rows: ORM rows to embed
+        contexts: Context text for each row
+        stored_contexts: Context text previously saved on each row, if any
+        only_stale: Skip rows whose vector is already current
+        stats: Optional dedup counters to accumulate into
+
+    Returns:
+        Number of rows whose vector was (re)generated.
+    """
+    hashes = [context_hash(context) for context in contexts]
+    if only_stale:
+        statuses = classify_rows(session, table, provider, rows, contexts, stored_contexts)
+    else:
+        statuses = ["missing"] * len(rows)
+
+    pending = [i for i, status in enumerate(statuses) if status in STALE_STATUSES]
+    if pending:
+        vectors = embed_with_store(
+            session, provider, [contexts[i] for i in pending], stats
+        )
+        for i, vector in zip(pending, vectors):
+            setattr(rows[i], provider.column, vector)
+
+    record_provenance(
+        session,
+        table,
+        provider,
+        [
+            (rows[i].id, hashes[i])
+            for i, status in enumerate(statuses)
+            if status != "current"
+        ],
+    )
+    return len(pending)
@@ -0,0 +1,235 @@
+"""Embedding providers.
+
+Embeddings can come from one of three providers. Each provider writes to and
+searches its own vector column, so vectors from different models never mix:
+
+    provider  column             dims  model
+    azure     embedding          1536  Azure OpenAI text-embedding-3-small
+    local     embedding_local     384  sentence-transformers on CPU (torch or ONNX)
+    hashing   embedding_hashing   384  deterministic feature hashing (load tests)
+
+The local provider needs no network access, so search can be benchmarked on
+a laptop or an air-gapped node. The hashing provider needs no model at all;
+its vectors are meaningless semantically but stable, cheap, and
+well-distributed, which is what load tests and API tests need.
+
+Usage:
+    from src.embeddings.providers import create_provider
+
+    provider = create_provider("local")
+    vectors = provider.embed(["faith in Jesus Christ"])
+    # store in / search provider.column
+"""
+
+import hashlib
+import math
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+# Vector column and dimensions for each provider (fixed by migration 006)
+PROVIDER_COLUMNS: dict[str, tuple[str, int]] = {
+    "azure": ("embedding", 1536),
+    "local": ("embedding_local", 384),
+    "hashing": ("embedding_hashing", 384),
+}
+
+DEFAULT_LOCAL_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+class EmbeddingProvider(ABC):
+    """Base class for embedding providers.
+
+    Attributes:
+        name: Provider name (key of PROVIDER_COLUMNS)
+        column: Vector column this provider's embeddings are stored in
+        dimensions: Vector dimensions
+        price_per_1k_tokens: Provider cost in USD per 1,000 input tokens
+    """
+
+    name: str
+    price_per_1k_tokens: float = 0.0
+
+    def __init__(self) -> None:
+        self.column, self.dimensions = PROVIDER_COLUMNS[self.name]
+
+    @property
+    @abstractmethod
+    def model_id(self) -> str:
+        """Identifier of the model producing the vectors (used in cache keys)."""
+
+    @abstractmethod
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed a batch of texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One vector of self.dimensions floats per text, in input order
+        """
+
+    def embed_one(self, text: str) -> list[float]:
+        """Embed a single text."""
+        return self.embed([text])[0]
+
+
+class AzureOpenAIProvider(EmbeddingProvider):
+    """Azure OpenAI embeddings (the original, production provider)."""
+
+    name = "azure"
+    # text-embedding-3-small list price
+    price_per_1k_tokens = 0.00002
+
+    def __init__(self, deployment: Optional[str] = None) -> None:
+        super().__init__()
+        self.deployment = deployment or os.getenv(
+            "AZURE_OPENAI_EMBEDDING_DEPLOYMENT", "text-embedding-3-small"
+        )
+
+    @property
+    def model_id(self) -> str:
+        return f"azure:{self.deployment}"
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        from src.embeddings.client import get_embeddings
+
+        return get_embeddings(texts, deployment_name=self.deployment)
+
+
+class LocalProvider(EmbeddingProvider):
+    """CPU embeddings from a sentence-transformers model.
+
+    The model is loaded on first use. Set backend="onnx" to run the ONNX
+    export of the model (faster on CPU; requires sentence-transformers>=3.2
+    with the onnx extra), and num_threads to cap intra-op threads so the
+    model does not compete with the API's request threads.
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_LOCAL_MODEL,
+        backend: str = "torch",
+        batch_size: int = 64,
+        num_threads: int = 0,
+    ) -> None:
+        super().__init__()
+        self.model_name = model_name
+        self.backend = backend
+        self.batch_size = batch_size
+        self.num_threads = num_threads
+        self._model: Any = None
+        self._lock = threading.Lock()
+
+    @property
+    def model_id(self) -> str:
+        return f"local:{self.model_name}:{self.backend}"
+
+    def _load(self) -> Any:
+        with self._lock:
+            if self._model is None:
+                from sentence_transformers import SentenceTransformer
+
+                if self.num_threads:
+                    import torch
+
+                    torch.set_num_threads(self.num_threads)
+                kwargs = {"backend": self.backend} if self.backend != "torch" else {}
+                model = SentenceTransformer(self.model_name, device="cpu", **kwargs)
+                dims = model.get_sentence_embedding_dimension()
+                if dims != self.dimensions:
+                    raise ValueError(
+                        f"Model {self.model_name} produces {dims}-dimensional vectors; "
+                        f"column {self.column} holds {self.dimensions}"
+                    )
+                self._model = model
+        return self._model
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        model = self._model or self._load()
+        vectors = model.encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return vectors.tolist()
+
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class HashingProvider(EmbeddingProvider):
+    """Deterministic feature-hashing embeddings.
+
+    Unigrams and bigrams of the lowercased text are hashed into signed
+    buckets and the vector is L2-normalized. Identical texts always get
+    identical vectors, texts sharing words get positive similarity, and no
+    model or network is involved.
+    """
+
+    name = "hashing"
+
+    @property
+    def model_id(self) -> str:
+        return f"hashing:{self.dimensions}"
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        return [self._embed_text(text) for text in texts]
+
+    def _embed_text(self, text: str) -> list[float]:
+        tokens = _TOKEN_RE.findall(text.lower())
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+        vector = [0.0] * self.dimensions
+        for feature in features:
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dimensions
+            vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+
+        norm = math.sqrt(sum(v * v for v in vector))
+        if norm == 0:
+            # Cosine distance is undefined for the zero vector
+            vector[0] = 1.0
+            return vector
+        return [v / norm for v in vector]
+
+
+def create_provider(
+    name: str,
+    dimensions: Optional[int] = None,
+    **options: Any,
+) -> EmbeddingProvider:
+    """Create an embedding provider by name.
+
+    Args:
+        name: Provider name ("azure", "local", or "hashing")
+        dimensions: Expected dimensions; checked against the provider's column
+        **options: Provider-specific options (e.g., model_name, backend,
+                   num_threads for "local"; deployment for "azure")
+
+    Returns:
+        EmbeddingProvider instance.
+
+    Raises:
+        ValueError: If the provider is unknown or dimensions do not match its column.
+    """
+    providers = {
+        "azure": AzureOpenAIProvider,
+        "local": LocalProvider,
+        "hashing": HashingProvider,
+    }
+    if name not in providers:
+        raise ValueError(f"Unknown embedding provider: {name}")
+    provider = providers[name](**options)
+    if dimensions is not None and dimensions != provider.dimensions:
+        raise ValueError(
+            f"Provider {name} stores {provider.dimensions}-dimensional vectors in "
+            f"{provider.column}; got dimensions={dimensions}"
+        )
+    return provider
@@ -0,0 +1,589 @@
+"""Resumable, checkpointed embedding runs.
+
+The embedding pipeline (src/embeddings/pipeline.py) runs every corpus
+through EmbeddingRunner, which:
+
+- pages through rows by keyset (id > checkpoint) instead of loading every
+  row up front,
+- records each run in embedding_jobs and commits the checkpoint in the
+  same transaction as each batch of vectors, so an interrupted run resumes
+  after the last committed batch with --resume,
+- isolates rows the provider rejects: when a batch fails, its rows are
+  retried one at a time and the ones that still fail are quarantined in
+  embedding_quarantine instead of aborting the run (a transport error
+  such as a connection failure, timeout, 429 or 5xx, or every row of a
+  batch failing, means an outage: the run stops and nothing is
+  quarantined),
+- stops cleanly at --max-cost (estimated from characters sent to the
+  provider) and --limit, leaving the job paused for --resume,
+- bumps the corpus generation (src/db/generations.py) when the run ends,
+  and at most every GENERATION_BUMP_SECONDS while it runs, rather than
+  with every batch, so a full re-embed does not flush the API caches
+  thousands of times or make every worker lock the same generation row,
+- prints throughput and an ETA after every batch.
+
+Usage:
+    parser = argparse.ArgumentParser(...)
+    add_runner_arguments(parser)
+    run_from_args(source, parser.parse_args())
+"""
+
+import argparse
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence
+
+from sqlalchemy import exists, func, text as sql_text
+from sqlalchemy.orm import Session
+
+from src.db import bump_generation, get_session
+from src.db.models import EmbeddingJob, EmbeddingQuarantine
+from src.embeddings.provenance import embed_rows
+from src.embeddings.providers import PROVIDER_COLUMNS, EmbeddingProvider, create_provider
+from src.embeddings.store import DedupStats
+
+# Rough characters per token for English and Spanish prose
+CHARS_PER_TOKEN = 4
+
+# Minimum interval between corpus generation bumps during a run
+GENERATION_BUMP_SECONDS = 300.0
+
+# Provider SDK errors meaning the service is unavailable rather than the
+# input bad, matched by name so the SDKs are only imported when used
+TRANSIENT_ERROR_NAMES = {
+    "APIConnectionError",
+    "APITimeoutError",
+    "RateLimitError",
+    "InternalServerError",
+    "ConnectError",
+    "ConnectTimeout",
+    "ReadTimeout",
+}
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Whether a provider error means an outage rather than a bad row.
+
+    Connection failures, timeouts, HTTP 408, 429 and 5xx responses are
+    transient; tenacity's RetryError is judged by its last attempt.
+
+    Args:
+        exc: Exception raised by the provider
+
+    Returns:
+        True if the error says nothing about the rows sent.
+    """
+    last_attempt = getattr(exc, "last_attempt", None)
+    if last_attempt is not None and last_attempt.exception() is not None:
+        exc = last_attempt.exception()
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    if any(cls.__name__ in TRANSIENT_ERROR_NAMES for cls in type(exc).__mro__):
+        return True
+    status = getattr(exc, "status_code", None)
+    return isinstance(status, int) and (status in (408, 429) or status >= 500)
+
+
+@dataclass
+class EmbeddingSource:
+    """A corpus the pipeline embeds: row source, context builder, and sink.
+
+    Attributes:
+        corpus: Corpus name recorded on jobs ('scriptures', 'cfm', ...)
+        table: Table name
+        model: ORM model class (must have id, lang, and vector columns)
+        build_context: Function (session, row) returning the text to embed
+        stores_context: Whether rows keep their context in context_text.
+                        Stored context is reused unless the run is stale,
+                        and rebuilt context is written back.
+        batch_size: Default rows per batch
+        delay: Default seconds between batches that call the provider
+        sink: Function writing vectors for a batch, with embed_rows'
+              signature (default: provider column plus provenance)
+        generation: Corpus generation bumped when vectors change
+                    (default: corpus)
+    """
+
+    corpus: str
+    table: str
+    model: type
+    build_context: Callable[[Session, Any], str]
+    stores_context: bool = False
+    batch_size: int = 10
+    delay: float = 0.5
+    sink: Callable[..., int] = embed_rows
+    generation: Optional[str] = None
+
+    def build_contexts(
+        self, session: Session, rows: Sequence[Any], stale: bool = False
+    ) -> tuple[list[str], Optional[list[Optional[str]]]]:
+        """Build the context text for a batch of rows.
+
+        Args:
+            session: Database session
+            rows: ORM rows
+            stale: Rebuild stored context so context-format changes are seen
+
+        Returns:
+            Tuple of (context texts, context_text previously stored on each
+            row, or None if the corpus does not store context).
+        """
+        if not self.stores_context:
+            return [self.build_context(session, row) for row in rows], None
+
+        stored = [row.context_text for row in rows]
+        contexts = []
+        for row in rows:
+            if row.context_text and not stale:
+                contexts.append(row.context_text)
+            else:
+                row.context_text = self.build_context(session, row)
+                contexts.append(row.context_text)
+        return contexts, stored
+
+
+def estimate_tokens(chars: int) -> int:
+    """Estimate tokens from characters sent to the provider."""
+    return math.ceil(chars / CHARS_PER_TOKEN)
+
+
+def format_duration(seconds: float) -> str:
+    """Format a duration as '1h02m', '3m12s', or '45s'."""
+    seconds = int(round(seconds))
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+class ProgressTracker:
+    """Throughput and ETA from observed progress.
+
+    Args:
+        total: Rows expected in this run
+        clock: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(self, total: int, clock: Callable[[], float] = time.monotonic):
+        self.total = total
+        self.done = 0
+        self._clock = clock
+        self._started = clock()
+
+    def update(self, rows: int) -> None:
+        """Record rows processed since the last update."""
+        self.done += rows
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since tracking started."""
+        return self._clock() - self._started
+
+    @property
+    def rate(self) -> float:
+        """Rows per second so far."""
+        elapsed = self.elapsed
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Seconds until the remaining rows are processed, if known."""
+        rate = self.rate
+        if rate <= 0:
+            return None
+        return max(self.total - self.done, 0) / rate
+
+    def summary(self) -> str:
+        """One-line progress report."""
+        eta = self.eta_seconds
+        eta_text = format_duration(eta) if eta is not None else "unknown"
+        return f"{self.done:,}/{self.total:,} rows, {self.rate:.1f} rows/s, ETA {eta_text}"
+
+
+class EmbeddingRunner:
+    """Embed one corpus and language with checkpoints, quarantine, and limits.
+
+    Args:
+        session: Database session (committed once per batch)
+        source: What to embed
+        provider: Embedding provider
+        lang: Language code
+        batch_size: Rows per batch
+        delay: Seconds to sleep after batches that called the provider
+        stale: Also re-embed rows whose context or model changed
+        limit: Maximum rows to process in this invocation
+        max_cost: Stop once this invocation's estimated cost (USD) reaches it
+        retry_quarantined: Include quarantined rows again
+        run_label: Label grouping the jobs of one multi-worker run
+        worker: Worker identifier recorded on the job (e.g., "host:pid")
+        generation_interval: Minimum seconds between generation bumps while
+                             the run continues (it always bumps at the end)
+        clock: Monotonic clock, in seconds
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        source: EmbeddingSource,
+        provider: EmbeddingProvider,
+        lang: str,
+        batch_size: int = 100,
+        delay: float = 0.0,
+        stale: bool = False,
+        limit: Optional[int] = None,
+        max_cost: Optional[float] = None,
+        retry_quarantined: bool = False,
+        run_label: Optional[str] = None,
+        worker: Optional[str] = None,
+        generation_interval: float = GENERATION_BUMP_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.session = session
+        self.source = source
+        self.provider = provider
+        self.lang = lang
+        self.batch_size = batch_size
+        self.delay = delay
+        self.stale = stale
+        self.limit = limit
+        self.max_cost = max_cost
+        self.retry_quarantined = retry_quarantined
+        self.run_label = run_label
+        self.worker = worker
+        self.generation_interval = generation_interval
+        self.stats = DedupStats()
+        self.cost = 0.0
+        self._clock = clock
+        self._embedded = 0
+        self._unpublished = 0
+        self._last_bump = clock()
+
+    def publish_generation(self, embedded: int = 0, final: bool = False) -> bool:
+        """Bump the corpus generation for rows embedded since the last bump.
+
+        Does not commit. While the run continues, bumps at most once per
+        generation_interval; the final bump is made whenever this run
+        embedded anything, since an earlier bump may have been rolled back.
+
+        Args:
+            embedded: Rows embedded by the batch about to be committed
+            final: The run is ending (ignore the interval)
+
+        Returns:
+            Whether the generation was bumped.
+        """
+        self._embedded += embedded
+        self._unpublished += embedded
+        if final:
+            due = self._embedded > 0
+        else:
+            due = (
+                self._unpublished > 0
+                and self._clock() - self._last_bump >= self.generation_interval
+            )
+        if not due:
+            return False
+        bump_generation(self.session, self.source.generation or self.source.corpus)
+        self._unpublished = 0
+        self._last_bump = self._clock()
+        return True
+
+    def _quarantine_filter(self):
+        model = self.source.model
+        return ~exists().where(
+            EmbeddingQuarantine.table_name == self.source.table,
+            EmbeddingQuarantine.column_name == self.provider.column,
+            EmbeddingQuarantine.row_id == model.id,
+        )
+
+    def _pending_query(self, after_id: int):
+        model = self.source.model
+        query = self.session.query(model).filter(
+            model.lang == self.lang,
+            model.id > after_id,
+        )
+        if not self.stale:
+            query = query.filter(getattr(model, self.provider.column).is_(None))
+        if not self.retry_quarantined:
+            query = query.filter(self._quarantine_filter())
+        return query
+
+    def next_batch(self, after_id: int, size: int) -> list[Any]:
+        """Fetch the next batch of rows after the checkpoint (keyset page)."""
+        model = self.source.model
+        return self._pending_query(after_id).order_by(model.id).limit(size).all()
+
+    def count_remaining(self, after_id: int) -> int:
+        """Count rows left after the checkpoint."""
+        remaining = self._pending_query(after_id).count()
+        return min(remaining, self.limit) if self.limit else remaining
+
+    def start_job(self, resume: bool = False) -> EmbeddingJob:
+        """Create a job, or reopen the latest unfinished one with resume.
+
+        Args:
+            resume: Continue the most recent unfinished job for the same
+                    corpus, language, column, model, and mode
+
+        Returns:
+            The running EmbeddingJob (committed).
+        """
+        job = None
+        if resume:
+            job = self.session.query(EmbeddingJob).filter(
+                EmbeddingJob.corpus == self.source.corpus,
+                EmbeddingJob.lang == self.lang,
+                EmbeddingJob.column_name == self.provider.column,
+                EmbeddingJob.model == self.provider.model_id,
+                EmbeddingJob.stale == self.stale,
+                EmbeddingJob.status != "completed",
+            ).order_by(EmbeddingJob.id.desc()).first()
+            if job is None:
+                print("No unfinished job to resume; starting a new one")
+            else:
+                print(f"Resuming job {job.id} after row {job.last_row_id} ({job.status})")
+
+        if job is None:
+            job = EmbeddingJob(
+                corpus=self.source.corpus,
+                lang=self.lang,
+                column_name=self.provider.column,
+                model=self.provider.model_id,
+                stale=self.stale,
+                run_label=self.run_label,
+                worker=self.worker,
+            )
+            self.session.add(job)
+        job.status = "running"
+        job.error = None
+        self.session.commit()
+        return job
+
+    def quarantine(self, job: EmbeddingJob, row_id: int, error: Exception) -> None:
+        """Record a row the provider rejected (does not commit)."""
+        self.session.execute(
+            sql_text("""
+                INSERT INTO embedding_quarantine
+                    (table_name, column_name, row_id, job_id, error)
+                VALUES (:table, :column, :row_id, :job_id, :error)
+                ON CONFLICT (table_name, column_name, row_id) DO UPDATE
+                SET job_id = EXCLUDED.job_id,
+                    error = EXCLUDED.error,
+                    attempts = embedding_quarantine.attempts + 1,
+                    quarantined_at = NOW()
+            """),
+            {
+                "table": self.source.table,
+                "column": self.provider.column,
+                "row_id": row_id,
+                "job_id": job.id,
+                "error": f"{type(error).__name__}: {error}"[:2000],
+            },
+        )
+
+    def _embed(
+        self,
+        rows: Sequence[Any],
+        contexts: Sequence[str],
+        stored: Optional[Sequence[Optional[str]]],
+    ) -> int:
+        with self.session.begin_nested():
+            return self.source.sink(
+                self.session,
+                self.source.table,
+                self.provider,
+                rows,
+                contexts,
+                stored_contexts=stored,
+                only_stale=self.stale,
+                stats=self.stats,
+            )
+
+    def embed_batch(
+        self,
+        job: EmbeddingJob,
+        rows: list[Any],
+        contexts: list[str],
+        stored: Optional[list[Optional[str]]],
+    ) -> tuple[int, int]:
+        """Embed a batch, isolating rows the provider rejects.
+
+        Returns:
+            Tuple of (rows embedded, rows quarantined).
+
+        Raises:
+            Exception: The provider error, if it is transient (see
+                       is_transient_error) or every row of a multi-row
+                       batch fails on its own (an outage, not bad input).
+        """
+        try:
+            return self._embed(rows, contexts, stored), 0
+        except Exception as exc:
+            if is_transient_error(exc):
+                raise
+            print(f"  Batch failed ({type(exc).__name__}: {exc}); retrying rows one at a time")
+
+        embedded = 0
+        failures: list[tuple[Any, Exception]] = []
+        for i, row in enumerate(rows):
+            try:
+                embedded += self._embed([row], [contexts[i]], stored and [stored[i]])
+            except Exception as exc:
+                if is_transient_error(exc):
+                    raise
+                failures.append((row, exc))
+
+        if len(rows) > 1 and len(failures) == len(rows):
+            raise failures[-1][1]
+        for row, exc in failures:
+            print(f"  Quarantined {self.source.table} row {row.id}: {exc}")
+            self.quarantine(job, row.id, exc)
+        return embedded, len(failures)
+
+    def run(self, resume: bool = False) -> EmbeddingJob:
+        """Run (or resume) the job until done, limited, or over budget.
+
+        Args:
+            resume: Continue the latest unfinished matching job
+
+        Returns:
+            The job, with status 'completed', 'paused' (limit or max cost
+            reached), 'interrupted' (Ctrl-C), or 'failed'.
+        """
+        job = self.start_job(resume)
+        progress = ProgressTracker(self.count_remaining(job.last_row_id))
+        print(f"Job {job.id}: {progress.total:,} rows to process")
+        processed = 0
+
+        try:
+            while True:
+                if self.max_cost is not None and self.cost >= self.max_cost:
+                    print(f"Reached --max-cost ${self.max_cost:.4f}; pausing")
+                    job.status = "paused"
+                    break
+                size = self.batch_size
+                if self.limit:
+                    if processed >= self.limit:
+                        job.status = "paused"
+                        break
+                    size = min(size, self.limit - processed)
+
+                rows = self.next_batch(job.last_row_id, size)
+                if not rows:
+                    job.status = "completed"
+                    job.finished_at = func.now()
+                    break
+
+                contexts, stored = self.source.build_contexts(self.session, rows, self.stale)
+                embedded_before = self.stats.embedded
+                chars_before = self.stats.embedded_chars
+                embedded, quarantined = self.embed_batch(job, rows, contexts, stored)
+
+                tokens = estimate_tokens(self.stats.embedded_chars - chars_before)
+                batch_cost = tokens / 1000 * self.provider.price_per_1k_tokens
+                self.cost += batch_cost
+
+                # Checkpoint and vectors commit together
+                job.last_row_id = rows[-1].id
+                job.rows_processed += len(rows)
+                job.rows_embedded += embedded
+                job.rows_quarantined += quarantined
+                job.tokens += tokens
+                job.cost += batch_cost
+                job.updated_at = func.now()
+                self.publish_generation(embedded)
+                self.session.commit()
+
+                processed += len(rows)
+                progress.update(len(rows))
+                print(
+                    f"Batch after row {job.last_row_id}: embedded {embedded}/{len(rows)}"
+                    f"{f', quarantined {quarantined}' if quarantined else ''} | "
+                    f"{progress.summary()} | ${self.cost:.4f}"
+                )
+                # Keep memory flat: drop this batch's rows (and any context rows
+                # loaded alongside them) from the identity map
+                for obj in list(self.session.identity_map.values()):
+                    if obj is not job:
+                        self.session.expunge(obj)
+
+                if self.delay and self.stats.embedded > embedded_before:
+                    time.sleep(self.delay)
+        except KeyboardInterrupt:
+            self.session.rollback()
+            job.status = "interrupted"
+            self.publish_generation(final=True)
+            self.session.commit()
+            print(
+                f"\nInterrupted; resume with --resume "
+                f"(job {job.id}, after row {job.last_row_id})"
+            )
+            return job
+        except Exception as exc:
+            self.session.rollback()
+            job.status = "failed"
+            job.error = f"{type(exc).__name__}: {exc}"
+            self.publish_generation(final=True)
+            self.session.commit()
+            print(f"\nJob {job.id} failed after row {job.last_row_id}: {job.error}")
+            raise
+
+        self.publish_generation(final=True)
+        self.session.commit()
+        return job
+
+
+def add_runner_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the runner's options (--provider, --stale, --resume, ...) to a parser."""
+    parser.add_argument("--limit", type=int, default=None,
+                        help="Maximum rows to process in this run")
+    parser.add_argument("--provider", choices=sorted(PROVIDER_COLUMNS),
+                        default=os.getenv("EMBEDDING_PROVIDER", "azure"),
+                        help="Embedding provider (default: azure)")
+    parser.add_argument("--stale", action="store_true",
+                        help="Also re-embed rows whose context or model changed")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue the latest unfinished job from its checkpoint")
+    parser.add_argument("--max-cost", type=float, default=None,
+                        help="Pause once the estimated provider cost (USD) reaches this")
+    parser.add_argument("--retry-quarantined", action="store_true",
+                        help="Include rows previously quarantined as unembeddable")
+
+
+def run_from_args(source: EmbeddingSource, args: argparse.Namespace) -> EmbeddingJob:
+    """Run an embedding job for a source from parsed command-line arguments.
+
+    Args:
+        source: What to embed
+        args: Namespace with lang, batch_size, delay (None for the source's
+              defaults), and the options added by add_runner_arguments
+
+    Returns:
+        The finished (or paused/interrupted) job.
+    """
+    provider = create_provider(args.provider)
+    print(f"Starting {source.corpus} {provider.name} embedding generation for {args.lang}...")
+
+    with get_session() as session:
+        runner = EmbeddingRunner(
+            session,
+            source,
+            provider,
+            args.lang,
+            batch_size=args.batch_size or source.batch_size,
+            delay=source.delay if args.delay is None else args.delay,
+            stale=args.stale,
+            limit=args.limit,
+            max_cost=args.max_cost,
+            retry_quarantined=args.retry_quarantined,
+        )
+        job = runner.run(resume=args.resume)
+        print(
+            f"\nJob {job.id} {job.status}: embedded {job.rows_embedded:,} rows, "
+            f"quarantined {job.rows_quarantined:,}, est. cost ${job.cost:.4f}"
+        )
+        print(f"Embedding store: {runner.stats.summary()}")
+    return job
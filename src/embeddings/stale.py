@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Report rows whose embeddings are stale.
+
+Rebuilds each row's context with the current context builders, compares it
+with the hash recorded in embedding_provenance, and prints how many rows
+per corpus and language are missing, untracked, adoptable, produced by a
+different model, or embedded from an outdated context. Run the matching
+generator with --stale to re-embed exactly those rows.
+
+Usage:
+    # All corpora and languages, Azure column:
+    python -m src.embeddings.stale
+
+    # One corpus, show the first 20 stale row IDs:
+    python -m src.embeddings.stale --corpus conference --lang en --show 20
+
+    # Drop provenance rows whose embedded row no longer exists:
+    python -m src.embeddings.stale --prune-orphans
+
+    # Report duplicate contexts and copy tracked vectors into embedding_store:
+    python -m src.embeddings.stale --seed-store
+"""
+
+import argparse
+import os
+from collections import Counter
+
+from sqlalchemy import text as sql_text
+
+from src.db import get_session
+from src.embeddings.pipeline import SOURCES
+from src.embeddings.provenance import EMBEDDED_TABLES, STALE_STATUSES, STATUSES, classify_rows
+from src.embeddings.providers import PROVIDER_COLUMNS, EmbeddingProvider, create_provider
+from src.embeddings.store import duplicate_contexts, seed_store
+
+
+def count_stale(
+    session,
+    corpus: str,
+    lang: str,
+    provider: EmbeddingProvider,
+    batch_size: int = 500,
+) -> tuple[Counter, list[int]]:
+    """Classify every row of a corpus in one language.
+
+    Args:
+        session: Database session
+        corpus: Corpus name ('scriptures', 'cfm', 'conference')
+        lang: Language code
+        provider: Provider whose column and model are checked
+        batch_size: Rows per keyset page
+
+    Returns:
+        Tuple of (status counts, IDs of rows needing re-embedding).
+    """
+    source = SOURCES[corpus]
+    model = source.model
+    counts: Counter = Counter()
+    stale_ids: list[int] = []
+    last_id = 0
+
+    while True:
+        rows = session.query(model).filter(
+            model.lang == lang,
+            model.id > last_id,
+        ).order_by(model.id).limit(batch_size).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        # Built directly (not via source.build_contexts) so nothing is written back
+        contexts = [source.build_context(session, row) for row in rows]
+        stored = [row.context_text for row in rows] if source.stores_context else None
+        statuses = classify_rows(session, source.table, provider, rows, contexts, stored)
+        counts.update(statuses)
+        stale_ids.extend(
+            row.id for row, status in zip(rows, statuses) if status in STALE_STATUSES
+        )
+        # Read-only report: drop the loaded rows from the identity map
+        session.expunge_all()
+
+    return counts, stale_ids
+
+
+def count_orphans(session, prune: bool = False) -> dict[str, int]:
+    """Count (and optionally delete) provenance rows for deleted rows.
+
+    Re-ingestion deletes and re-inserts rows with new IDs, leaving their
+    old provenance rows behind.
+
+    Args:
+        session: Database session
+        prune: Delete the orphaned rows (commits)
+
+    Returns:
+        Orphaned provenance row count per table.
+    """
+    orphans = {}
+    for table in EMBEDDED_TABLES:
+        condition = f"""
+            p.table_name = '{table}'
+            AND NOT EXISTS (SELECT 1 FROM {table} t WHERE t.id = p.row_id)
+        """
+        if prune:
+            result = session.execute(sql_text(
+                f"DELETE FROM embedding_provenance p WHERE {condition}"
+            ))
+            orphans[table] = result.rowcount
+        else:
+            orphans[table] = session.execute(sql_text(
+                f"SELECT COUNT(*) FROM embedding_provenance p WHERE {condition}"
+            )).scalar()
+    if prune:
+        session.commit()
+    return orphans
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report stale embeddings")
+    parser.add_argument("--corpus", choices=[*SOURCES, "all"], default="all",
+                        help="Corpus to check (default: all)")
+    parser.add_argument("--lang", choices=["en", "es", "all"], default="all",
+                        help="Language to check (default: all)")
+    parser.add_argument("--provider", choices=sorted(PROVIDER_COLUMNS),
+                        default=os.getenv("EMBEDDING_PROVIDER", "azure"),
+                        help="Embedding provider whose column is checked")
+    parser.add_argument("--batch-size", type=int, default=500,
+                        help="Rows per page (default: 500)")
+    parser.add_argument("--show", type=int, default=0,
+                        help="Print up to N stale row IDs per corpus")
+    parser.add_argument("--prune-orphans", action="store_true",
+                        help="Delete provenance rows whose embedded row no longer exists")
+    parser.add_argument("--seed-store", action="store_true",
+                        help="Copy tracked vectors into the content-addressed embedding store")
+    args = parser.parse_args()
+
+    provider = create_provider(args.provider)
+    corpora = list(SOURCES) if args.corpus == "all" else [args.corpus]
+    langs = ["en", "es"] if args.lang == "all" else [args.lang]
+
+    print(f"Checking {provider.column} ({provider.model_id})")
+    total_stale = 0
+
+    with get_session() as session:
+        for corpus in corpora:
+            for lang in langs:
+                counts, stale_ids = count_stale(
+                    session, corpus, lang, provider, args.batch_size
+                )
+                if not counts:
+                    continue
+                total_stale += len(stale_ids)
+                summary = ", ".join(
+                    f"{status}={counts[status]:,}" for status in STATUSES if counts[status]
+                )
+                print(f"  {corpus}/{lang}: {sum(counts.values()):,} rows - {summary}")
+                if args.show and stale_ids:
+                    print(f"    stale ids: {stale_ids[:args.show]}")
+
+        for corpus in corpora:
+            table = SOURCES[corpus].table
+            total, distinct = duplicate_contexts(session, table, provider.column)
+            if total:
+                print(
+                    f"  {table}: {distinct:,} distinct contexts for {total:,} rows "
+                    f"(dedup ratio {1 - distinct / total:.1%})"
+                )
+            if args.seed_store:
+                added = seed_store(session, table, provider.column)
+                print(f"  Seeded embedding store from {table}: {added:,} vectors")
+        if args.seed_store:
+            session.commit()
+
+        orphans = count_orphans(session, prune=args.prune_orphans)
+        action = "Pruned" if args.prune_orphans else "Orphaned"
+        for table, count in orphans.items():
+            if count:
+                print(f"  {action} provenance rows for {table}: {count:,}")
+
+    print(f"\nRows to re-embed: {total_stale:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""Content-addressed embedding store.
+
+Embeddings are deterministic for a model and text, and many rows share
+their context text exactly (boilerplate conference paragraphs, repeated
+passages). The embedding_store table keeps one vector per
+(model, context_hash); generators embed through embed_with_store, which:
+
+1. collapses identical contexts within the batch,
+2. fills contexts already in the store with one bulk lookup,
+3. sends only never-seen contexts to the provider, and saves them.
+
+DedupStats accumulates the counts so generators can report how many
+provider calls were avoided.
+
+Usage:
+    from src.embeddings.store import DedupStats, embed_with_store
+
+    stats = DedupStats()
+    vectors = embed_with_store(session, provider, texts, stats)
+    print(stats.summary())
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from sqlalchemy import bindparam, text as sql_text
+from sqlalchemy.orm import Session
+
+from src.embeddings.providers import EmbeddingProvider
+
+
+def context_hash(text: str) -> str:
+    """Hash context text (SHA-256 hex digest of UTF-8)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class DedupStats:
+    """Counts from embedding through the store.
+
+    Attributes:
+        rows: Texts requested
+        unique: Distinct texts among them
+        store_hits: Distinct texts filled from the store
+        embedded: Distinct texts sent to the provider
+        embedded_chars: Characters sent to the provider (for cost estimates)
+    """
+
+    rows: int = 0
+    unique: int = 0
+    store_hits: int = 0
+    embedded: int = 0
+    embedded_chars: int = 0
+
+    @property
+    def saved(self) -> int:
+        """Texts that did not need a provider call."""
+        return self.rows - self.embedded
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Fraction of texts served without a provider call."""
+        return self.saved / self.rows if self.rows else 0.0
+
+    def summary(self) -> str:
+        """One-line human-readable report."""
+        return (
+            f"{self.rows:,} rows, {self.unique:,} unique contexts, "
+            f"{self.store_hits:,} from store, {self.embedded:,} embedded "
+            f"(dedup ratio {self.dedup_ratio:.1%})"
+        )
+
+
+def lookup_vectors(
+    session: Session, model_id: str, hashes: Sequence[str]
+) -> dict[str, list[float]]:
+    """Fetch stored vectors for a set of context hashes.
+
+    Args:
+        session: Database session
+        model_id: Provider model ID
+        hashes: Context hashes to look up
+
+    Returns:
+        Mapping of context hash to vector for hashes found in the store.
+    """
+    if not hashes:
+        return {}
+    result = session.execute(
+        sql_text("""
+            SELECT context_hash, CAST(embedding AS text) AS embedding
+            FROM embedding_store
+            WHERE model = :model
+              AND context_hash IN :hashes
+        """).bindparams(bindparam("hashes", expanding=True)),
+        {"model": model_id, "hashes": list(hashes)},
+    )
+    # pgvector's text form "[0.1,0.2,...]" is a JSON array
+    return {row.context_hash: json.loads(row.embedding) for row in result}
+
+
+def save_vectors(
+    session: Session, model_id: str, vectors: dict[str, list[float]]
+) -> None:
+    """Insert vectors into the store (existing entries are kept).
+
+    Does not commit.
+
+    Args:
+        session: Database session
+        model_id: Provider model ID
+        vectors: Mapping of context hash to vector
+    """
+    if not vectors:
+        return
+    session.execute(
+        sql_text("""
+            INSERT INTO embedding_store (model, context_hash, embedding)
+            VALUES (:model, :context_hash, CAST(:embedding AS vector))
+            ON CONFLICT (model, context_hash) DO NOTHING
+        """),
+        [
+            {"model": model_id, "context_hash": digest, "embedding": str(vector)}
+            for digest, vector in vectors.items()
+        ],
+    )
+
+
+def embed_with_store(
+    session: Session,
+    provider: EmbeddingProvider,
+    texts: Sequence[str],
+    stats: Optional[DedupStats] = None,
+) -> list[list[float]]:
+    """Embed texts, reusing vectors for contexts embedded before.
+
+    Args:
+        session: Database session
+        provider: Embedding provider
+        texts: Texts to embed
+        stats: Optional counters to accumulate into
+
+    Returns:
+        One vector per text, in input order.
+    """
+    hashes = [context_hash(text) for text in texts]
+    # Distinct texts by hash, in first-seen order
+    unique = dict(zip(hashes, texts))
+
+    vectors = lookup_vectors(session, provider.model_id, list(unique))
+    store_hits = len(vectors)
+
+    missing = [digest for digest in unique if digest not in vectors]
+    if missing:
+        fresh = dict(zip(missing, provider.embed([unique[d] for d in missing])))
+        save_vectors(session, provider.model_id, fresh)
+        vectors.update(fresh)
+
+    if stats is not None:
+        stats.rows += len(texts)
+        stats.unique += len(unique)
+        stats.store_hits += store_hits
+        stats.embedded += len(missing)
+        stats.embedded_chars += sum(len(unique[d]) for d in missing)
+
+    return [vectors[digest] for digest in hashes]
+
+
+def seed_store(session: Session, table: str, column: str) -> int:
+    """Copy already-embedded vectors with known provenance into the store.
+
+    Rows embedded before the store existed (but after provenance tracking)
+    can then be reused by later runs. Does not commit.
+
+    Args:
+        session: Database session
+        table: Embedded table name
+        column: Vector column name
+
+    Returns:
+        Number of store entries added.
+    """
+    result = session.execute(
+        sql_text(f"""
+            INSERT INTO embedding_store (model, context_hash, embedding)
+            SELECT DISTINCT ON (p.model, p.context_hash)
+                   p.model, p.context_hash, t.{column}
+            FROM embedding_provenance p
+            JOIN {table} t ON t.id = p.row_id
+            WHERE p.table_name = :table
+              AND p.column_name = :column
+              AND t.{column} IS NOT NULL
+            ORDER BY p.model, p.context_hash, p.generated_at DESC
+            ON CONFLICT (model, context_hash) DO NOTHING
+        """),
+        {"table": table, "column": column},
+    )
+    return result.rowcount
+
+
+def duplicate_contexts(session: Session, table: str, column: str) -> tuple[int, int]:
+    """Count embedded rows and their distinct contexts for a table.
+
+    Args:
+        session: Database session
+        table: Embedded table name
+        column: Vector column name
+
+    Returns:
+        Tuple of (rows with provenance, distinct context hashes).
+    """
+    row = session.execute(
+        sql_text("""
+            SELECT COUNT(*) AS total, COUNT(DISTINCT context_hash) AS distinct_contexts
+            FROM embedding_provenance
+            WHERE table_name = :table AND column_name = :column
+        """),
+        {"table": table, "column": column},
+    ).one()
+    return row.total, row.distinct_contexts
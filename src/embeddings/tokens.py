@@ -0,0 +1,170 @@
+"""Token counting, truncation, and chunking for embedding contexts.
+
+Context budgets are measured with tiktoken's cl100k_base encoding, the
+tokenizer of the Azure OpenAI embedding models, so a context cut to
+MAX_CONTEXT_TOKENS is guaranteed to fit the model's input limit instead
+of relying on a characters-per-token guess.
+
+CFM lessons are also stored section by section (cfm_sections), each
+section packed from whole paragraphs into chunks of at most
+CHUNK_MAX_TOKENS, so text past the truncation point is still embedded.
+
+Usage:
+    from src.embeddings.tokens import chunk_sections, truncate_tokens
+
+    content, truncated = truncate_tokens(lesson.content, 6000)
+    chunks = chunk_sections(lesson_json["sections"], lesson_json["intro"])
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional, Sequence
+
+ENCODING_NAME = "cl100k_base"
+
+# text-embedding-3-small accepts 8,191 input tokens; keep a small margin
+MAX_CONTEXT_TOKENS = 8000
+
+# Section chunks stay well below the model limit: smaller chunks are more
+# precise matches, and the lesson header is prepended to each one
+CHUNK_MAX_TOKENS = 1500
+
+
+@lru_cache(maxsize=None)
+def get_encoding(name: str = ENCODING_NAME) -> Any:
+    """Load a tiktoken encoding (cached per process)."""
+    import tiktoken
+
+    return tiktoken.get_encoding(name)
+
+
+def count_tokens(text: str, encoding: Optional[Any] = None) -> int:
+    """Count the tokens in text.
+
+    Args:
+        text: Text to measure
+        encoding: tiktoken encoding (default: cl100k_base)
+
+    Returns:
+        Number of tokens.
+    """
+    encoding = encoding or get_encoding()
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(
+    text: str, max_tokens: int, encoding: Optional[Any] = None
+) -> tuple[str, bool]:
+    """Cut text to at most max_tokens tokens.
+
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+        encoding: tiktoken encoding (default: cl100k_base)
+
+    Returns:
+        Tuple of (text within the budget, whether anything was cut).
+    """
+    encoding = encoding or get_encoding()
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text, False
+    return encoding.decode(tokens[:max(max_tokens, 0)]), True
+
+
+@dataclass
+class Chunk:
+    """A section-level piece of a lesson.
+
+    Attributes:
+        section_title: Title of the section the text came from ('' for intro)
+        text: Paragraphs of the chunk, newline-separated
+    """
+
+    section_title: str
+    text: str
+
+
+def pack_paragraphs(
+    paragraphs: Sequence[str], max_tokens: int, encoding: Optional[Any] = None
+) -> list[str]:
+    """Group consecutive paragraphs into texts of at most max_tokens tokens.
+
+    Paragraphs are never split unless a single paragraph exceeds the budget
+    on its own, in which case it is cut into max_tokens-sized pieces.
+
+    Args:
+        paragraphs: Paragraph texts, in order
+        max_tokens: Token budget per group
+        encoding: tiktoken encoding (default: cl100k_base)
+
+    Returns:
+        Newline-joined paragraph groups, in order.
+    """
+    encoding = encoding or get_encoding()
+    groups: list[str] = []
+    current: list[str] = []
+    current_tokens = 0
+
+    for paragraph in paragraphs:
+        tokens = encoding.encode(paragraph, disallowed_special=())
+        if len(tokens) > max_tokens:
+            if current:
+                groups.append("\n".join(current))
+                current, current_tokens = [], 0
+            groups.extend(
+                encoding.decode(tokens[start:start + max_tokens])
+                for start in range(0, len(tokens), max_tokens)
+            )
+            continue
+        # +1 for the newline joining it to the previous paragraph
+        if current and current_tokens + 1 + len(tokens) > max_tokens:
+            groups.append("\n".join(current))
+            current, current_tokens = [], 0
+        current_tokens += len(tokens) + (1 if current else 0)
+        current.append(paragraph)
+
+    if current:
+        groups.append("\n".join(current))
+    return groups
+
+
+def chunk_sections(
+    sections: Sequence[dict[str, Any]],
+    intro: Sequence[str] = (),
+    max_tokens: int = CHUNK_MAX_TOKENS,
+    encoding: Optional[Any] = None,
+) -> list[Chunk]:
+    """Split a fetched lesson into section-level chunks.
+
+    Args:
+        sections: fetch_cfm "sections" ({"title", "paragraphs"} dicts)
+        intro: fetch_cfm "intro" paragraphs (become an untitled first chunk)
+        max_tokens: Token budget per chunk; longer sections are split at
+                    paragraph boundaries
+        encoding: tiktoken encoding (default: cl100k_base)
+
+    Returns:
+        Chunks in document order.
+    """
+    parts = [("", list(intro))] + [
+        (section.get("title", ""), section.get("paragraphs", [])) for section in sections
+    ]
+    return [
+        Chunk(title, text)
+        for title, paragraphs in parts
+        for text in pack_paragraphs(
+            [p for p in paragraphs if p.strip()], max_tokens, encoding
+        )
+    ]
+
+
+def chunk_plain_text(
+    text: str, max_tokens: int = CHUNK_MAX_TOKENS, encoding: Optional[Any] = None
+) -> list[Chunk]:
+    """Split unstructured lesson text (one paragraph per line) into chunks.
+
+    Fallback for lessons whose processed JSON has no sections.
+    """
+    paragraphs = [line for line in text.splitlines() if line.strip()]
+    return [Chunk("", group) for group in pack_paragraphs(paragraphs, max_tokens, encoding)]
@@ -4,8 +4,6 @@ import os
 from sqlalchemy import text as sql_text
 
 from src.db import get_session
-from src.db.models import Scripture
-from src.embeddings.client import get_single_embedding
 
 
 def verify_embedding_counts(session):
@@ -50,6 +48,8 @@ def verify_embedding_dimensions(session):
 
 def test_semantic_search(session, query: str, limit: int = 5):
     """Test semantic search with a query."""
+    from src.embeddings.client import get_single_embedding
+
     print(f"\n=== Semantic Search: '{query}' ===")
 
     # Get embedding for query
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""Multi-process embedding generation coordinated through Postgres.
+
+Workers claim batches of rows with SELECT ... FOR UPDATE SKIP LOCKED, so
+any number of processes, on one box or across nodes, can embed the same
+corpus without coordinating with each other: a locked row is simply
+skipped by the other workers, and each worker builds contexts, embeds,
+and writes back its own batch. Locks are released by the commit that
+stores the batch's vectors, provenance, and job counters.
+
+A row is claimable while its vector column is NULL or it has no
+provenance for the current model, so workers fill missing vectors and
+perform full re-embeds after a model change. Re-embedding rows whose
+context text changed needs the context hash comparison of the
+single-process --stale mode.
+
+The supervisor starts N workers, labels their jobs with a shared run
+label, and prints aggregate progress from embedding_jobs. Supervisors on
+several nodes given the same --run-label report the combined progress.
+
+Usage:
+    # Full bilingual run, 4 workers on this box:
+    python -m src.embeddings.workers run --workers 4
+
+    # One corpus, joining an existing run from a second node:
+    python -m src.embeddings.workers run --corpus conference --lang en \
+        --workers 4 --run-label reembed-2026-10
+"""
+
+import argparse
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from typing import Any, Optional
+
+from sqlalchemy import exists, or_, text as sql_text
+
+from src.db import get_session
+from src.db.models import EmbeddingProvenance
+from src.embeddings.pipeline import SOURCES
+from src.embeddings.providers import PROVIDER_COLUMNS, create_provider
+from src.embeddings.runner import EmbeddingRunner, ProgressTracker, format_duration
+
+
+class ClaimingRunner(EmbeddingRunner):
+    """EmbeddingRunner whose batches are claimed with FOR UPDATE SKIP LOCKED.
+
+    The keyset checkpoint is not used for selection: the claim predicate
+    itself excludes every row a committed batch has handled.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        # only_stale lets embed_rows adopt untracked rows without API calls
+        super().__init__(*args, stale=True, **kwargs)
+
+    def _pending_query(self, after_id: int):
+        model = self.source.model
+        column = getattr(model, self.provider.column)
+        tracked = exists().where(
+            EmbeddingProvenance.table_name == self.source.table,
+            EmbeddingProvenance.column_name == self.provider.column,
+            EmbeddingProvenance.row_id == model.id,
+            EmbeddingProvenance.model == self.provider.model_id,
+        )
+        query = self.session.query(model).filter(
+            model.lang == self.lang,
+            or_(column.is_(None), ~tracked),
+        )
+        if not self.retry_quarantined:
+            query = query.filter(self._quarantine_filter())
+        return query
+
+    def next_batch(self, after_id: int, size: int) -> list[Any]:
+        """Claim the next unlocked batch; rows stay locked until commit."""
+        model = self.source.model
+        return (
+            self._pending_query(after_id)
+            .order_by(model.id)
+            .limit(size)
+            .with_for_update(skip_locked=True, of=model)
+            .all()
+        )
+
+
+def resolve_targets(corpus: str, lang: str) -> list[tuple[str, str]]:
+    """Expand 'all' corpus/lang arguments into (corpus, lang) pairs."""
+    corpora = list(SOURCES) if corpus == "all" else [corpus]
+    langs = ["en", "es"] if lang == "all" else [lang]
+    return [(c, lang_code) for c in corpora for lang_code in langs]
+
+
+def run_worker(args: argparse.Namespace) -> int:
+    """Claim and embed batches for each target until none are left.
+
+    Returns:
+        Process exit code (0 when every target completed or paused).
+    """
+    provider = create_provider(args.provider)
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    budget = args.max_cost
+
+    with get_session() as session:
+        for corpus, lang in resolve_targets(args.corpus, args.lang):
+            runner = ClaimingRunner(
+                session,
+                SOURCES[corpus],
+                provider,
+                lang,
+                batch_size=args.batch_size or SOURCES[corpus].batch_size,
+                delay=args.delay,
+                max_cost=budget,
+                retry_quarantined=args.retry_quarantined,
+                run_label=args.run_label,
+                worker=worker,
+            )
+            job = runner.run()
+            if job.status == "interrupted":
+                return 130
+            if budget is not None:
+                budget -= runner.cost
+                if job.status == "paused":
+                    print(f"[{worker}] Budget exhausted; stopping")
+                    return 0
+    return 0
+
+
+def aggregate_progress(session, run_label: str) -> dict[str, Any]:
+    """Sum the job counters of every worker in a run.
+
+    Args:
+        session: Database session
+        run_label: Run label shared by the workers
+
+    Returns:
+        Dict with jobs, running, failed, processed, embedded, quarantined, cost.
+    """
+    row = session.execute(
+        sql_text("""
+            SELECT COUNT(*) AS jobs,
+                   COUNT(*) FILTER (WHERE status = 'running') AS running,
+                   COUNT(*) FILTER (WHERE status = 'failed') AS failed,
+                   COALESCE(SUM(rows_processed), 0) AS processed,
+                   COALESCE(SUM(rows_embedded), 0) AS embedded,
+                   COALESCE(SUM(rows_quarantined), 0) AS quarantined,
+                   COALESCE(SUM(cost), 0) AS cost
+            FROM embedding_jobs
+            WHERE run_label = :run_label
+        """),
+        {"run_label": run_label},
+    ).one()
+    return dict(row._mapping)
+
+
+def count_claimable(session, targets: list[tuple[str, str]], provider) -> int:
+    """Count rows the workers still have to claim across all targets."""
+    return sum(
+        ClaimingRunner(session, SOURCES[corpus], provider, lang).count_remaining(0)
+        for corpus, lang in targets
+    )
+
+
+def worker_command(args: argparse.Namespace, run_label: str) -> list[str]:
+    """Build the command line for one worker process."""
+    command = [
+        sys.executable, "-m", "src.embeddings.workers", "worker",
+        "--corpus", args.corpus,
+        "--lang", args.lang,
+        "--provider", args.provider,
+        "--delay", str(args.delay),
+        "--run-label", run_label,
+    ]
+    if args.batch_size:
+        command += ["--batch-size", str(args.batch_size)]
+    if args.max_cost is not None:
+        command += ["--max-cost", str(args.max_cost / args.workers)]
+    if args.retry_quarantined:
+        command.append("--retry-quarantined")
+    return command
+
+
+def supervise(args: argparse.Namespace) -> int:
+    """Start N workers and report aggregate progress until they exit.
+
+    Returns:
+        Process exit code (non-zero if any worker failed).
+    """
+    run_label = args.run_label or f"run-{uuid.uuid4().hex[:8]}"
+    targets = resolve_targets(args.corpus, args.lang)
+    provider = create_provider(args.provider)
+
+    with get_session() as session:
+        total = count_claimable(session, targets, provider)
+    print(f"Run {run_label}: {total:,} rows to embed with {args.workers} workers")
+    if total == 0:
+        return 0
+
+    command = worker_command(args, run_label)
+    output = None if args.verbose else subprocess.DEVNULL
+    # Own session per worker: Ctrl-C reaches only the supervisor, which
+    # forwards a single SIGINT so each worker checkpoints its job once
+    workers = [
+        subprocess.Popen(command, stdout=output, start_new_session=True)
+        for _ in range(args.workers)
+    ]
+    progress = ProgressTracker(total)
+
+    try:
+        while any(proc.poll() is None for proc in workers):
+            time.sleep(args.interval)
+            with get_session() as session:
+                stats = aggregate_progress(session, run_label)
+            progress.done = stats["processed"]
+            alive = sum(proc.poll() is None for proc in workers)
+            print(
+                f"[{run_label}] workers {alive}/{args.workers} | {progress.summary()} | "
+                f"embedded {stats['embedded']:,}, quarantined {stats['quarantined']:,} | "
+                f"${stats['cost']:.4f}"
+            )
+    except KeyboardInterrupt:
+        print("\nStopping workers...")
+        for proc in workers:
+            if proc.poll() is None:
+                proc.send_signal(signal.SIGINT)
+        for proc in workers:
+            proc.wait()
+
+    with get_session() as session:
+        stats = aggregate_progress(session, run_label)
+    failed = [proc.returncode for proc in workers if proc.returncode not in (0, 130)]
+    elapsed = format_duration(progress.elapsed)
+    print(
+        f"\nRun {run_label} finished in {elapsed}: processed {stats['processed']:,}, "
+        f"embedded {stats['embedded']:,}, quarantined {stats['quarantined']:,}, "
+        f"est. cost ${stats['cost']:.4f}"
+    )
+    if failed or stats["failed"]:
+        print(f"{len(failed)} worker(s) failed; see embedding_jobs.error for run {run_label}")
+        return 1
+    return 0
+
+
+def add_common_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--corpus", choices=[*SOURCES, "all"], default="all",
+                        help="Corpus to embed (default: all)")
+    parser.add_argument("--lang", choices=["en", "es", "all"], default="all",
+                        help="Language to embed (default: all)")
+    parser.add_argument("--provider", choices=sorted(PROVIDER_COLUMNS),
+                        default=os.getenv("EMBEDDING_PROVIDER", "azure"),
+                        help="Embedding provider (default: azure)")
+    parser.add_argument("--batch-size", type=int, default=None,
+                        help="Rows claimed per batch (default: per-corpus)")
+    parser.add_argument("--delay", type=float, default=0.0,
+                        help="Delay between batches per worker in seconds")
+    parser.add_argument("--run-label", default=None,
+                        help="Label grouping the workers of one run")
+    parser.add_argument("--retry-quarantined", action="store_true",
+                        help="Include rows previously quarantined as unembeddable")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Embedding worker pool")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Start N workers and report progress")
+    add_common_arguments(run)
+    run.add_argument("--workers", type=int, default=os.cpu_count() or 4,
+                     help="Number of worker processes (default: CPU count)")
+    run.add_argument("--max-cost", type=float, default=None,
+                     help="Total estimated cost cap (USD), split evenly across workers")
+    run.add_argument("--interval", type=float, default=5.0,
+                     help="Seconds between progress reports (default: 5)")
+    run.add_argument("--verbose", action="store_true",
+                     help="Show per-batch output from every worker")
+
+    worker = commands.add_parser("worker", help="Run a single worker")
+    add_common_arguments(worker)
+    worker.add_argument("--max-cost", type=float, default=None,
+                        help="Estimated cost cap (USD) for this worker")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        return supervise(args)
+    return run_worker(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,6 +22,7 @@ Exports:
 - verify_cfm_counts: Print CFM lesson counts by year and language
 - random_verse_check: Select random verses for spot-checking
 - footnotes_check: Check footnotes integrity
+- scripture_refs_check: Check stored scripture_refs parse into canonical references
 """
 
 from src.ingestion.base import (
@@ -43,6 +44,7 @@ from src.ingestion.base import (
 from src.ingestion.verify import (
     footnotes_check,
     random_verse_check,
+    scripture_refs_check,
     verify_cfm_counts,
     verify_scripture_counts,
 )
@@ -67,4 +69,5 @@ __all__ = [
     "verify_cfm_counts",
     "random_verse_check",
     "footnotes_check",
+    "scripture_refs_check",
 ]
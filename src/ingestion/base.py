@@ -20,6 +20,8 @@ from typing import Literal
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from src.db.generations import bump_generation
+
 # Valid volume names for scriptures
 VALID_VOLUMES = (
     "oldtestament",
@@ -105,6 +107,7 @@ def truncate_scriptures(session: Session, volume: str, lang: str) -> int:
         text("DELETE FROM scriptures WHERE volume = :v AND lang = :l"),
         {"v": volume, "l": lang},
     )
+    bump_generation(session, "scriptures")
     session.commit()
     return result.rowcount or 0
 
@@ -229,6 +232,7 @@ def truncate_cfm(session: Session, year: int, lang: str) -> int:
         text("DELETE FROM cfm_lessons WHERE year = :y AND lang = :l"),
         {"y": year, "l": lang},
     )
+    bump_generation(session, "cfm")
     session.commit()
     return result.rowcount or 0
 
@@ -21,7 +21,7 @@ from typing import Optional
 
 from sqlalchemy import text
 
-from src.db import get_session, ConferenceParagraph
+from src.db import bump_generation, get_session, ConferenceParagraph
 from src.ingestion.conference.client import ChurchAPIClient, get_all_conferences
 from src.ingestion.conference.parser import parse_talk, get_content_paragraphs
 
@@ -84,6 +84,7 @@ def truncate_conference(session, year: int, month: str, lang: str) -> int:
         """),
         {"y": year, "m": month, "l": lang},
     )
+    bump_generation(session, "conference")
     session.commit()
     return result.rowcount or 0
 
@@ -159,6 +160,7 @@ def ingest_conference(
             print(f"  ERROR on talk {talk_meta.uri}: {e}")
             continue
 
+    bump_generation(session, "conference")
     session.commit()
     return total_paragraphs
 
@@ -8,9 +8,16 @@ Each year focuses on a specific testament:
 - 2025: Doctrine & Covenants
 - 2026: Old Testament
 
+Lessons are inserted in bulk, and each lesson's intro and sections are
+stored in cfm_sections, so lessons are embedded in full and search can
+return the one relevant section.
+
 Usage:
     python -m src.ingestion.ingest_cfm --year 2024 --lang en
     python -m src.ingestion.ingest_cfm --year 2024 --lang en --force
+
+    # Rebuild sections for lessons that are already loaded:
+    python -m src.ingestion.ingest_cfm --year 2024 --lang en --sections-only
 """
 
 import argparse
@@ -18,7 +25,10 @@ import json
 import sys
 from pathlib import Path
 
-from src.db import CFMLesson, get_session
+from sqlalchemy import insert, text as sql_text
+
+from src.db import CFMLesson, CFMSection, bump_generation, get_session
+from src.embeddings.tokens import chunk_plain_text, chunk_sections
 from src.ingestion.base import check_or_skip_cfm
 
 # Year to testament mapping with corresponding JSON filenames
@@ -57,9 +67,100 @@ def create_cfm_year_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Truncate existing data before loading",
     )
+    parser.add_argument(
+        "--sections-only",
+        action="store_true",
+        help="Rebuild sections for already-loaded lessons",
+    )
     return parser
 
 
+def section_rows(lesson_pk: int, lang: str, data: dict) -> list[dict]:
+    """Split a lesson into cfm_sections rows.
+
+    The intro becomes an untitled first section; sections longer than the
+    chunk token budget span several rows. Lessons without sections fall
+    back to their plain text.
+
+    Args:
+        lesson_pk: cfm_lessons.id of the lesson
+        lang: Language code
+        data: The lesson's entry in the processed JSON
+
+    Returns:
+        Row dictionaries for a bulk insert, in document order.
+    """
+    if data.get("sections"):
+        chunks = chunk_sections(data["sections"], data.get("intro", []))
+    else:
+        chunks = chunk_plain_text(data.get("plain_text", ""))
+    return [
+        {
+            "lesson_id": lesson_pk,
+            "chunk_index": i,
+            "section_title": chunk.section_title,
+            "content": chunk.text,
+            "lang": lang,
+        }
+        for i, chunk in enumerate(chunks)
+    ]
+
+
+def insert_sections(
+    session, lesson_pks: dict[str, int], lessons: dict, lang: str
+) -> int:
+    """Bulk insert the sections of loaded lessons (does not commit).
+
+    Args:
+        session: SQLAlchemy session
+        lesson_pks: cfm_lessons.id keyed by lesson_id
+        lessons: Processed JSON lessons keyed by lesson_id
+        lang: Language code
+
+    Returns:
+        Number of section rows inserted.
+    """
+    rows = [
+        row
+        for lesson_id, lesson_pk in lesson_pks.items()
+        if lesson_id in lessons
+        for row in section_rows(lesson_pk, lang, lessons[lesson_id])
+    ]
+    if rows:
+        session.execute(insert(CFMSection), rows)
+    return len(rows)
+
+
+def rebuild_sections(session, year: int, lang: str, lessons: dict) -> int:
+    """Replace the sections of already-loaded lessons (does not commit).
+
+    Args:
+        session: SQLAlchemy session
+        year: Lesson year
+        lang: Language code
+        lessons: Processed JSON lessons keyed by lesson_id
+
+    Returns:
+        Number of section rows inserted.
+    """
+    params = {"y": year, "l": lang}
+    lesson_pks = {
+        row.lesson_id: row.id
+        for row in session.execute(
+            sql_text("SELECT id, lesson_id FROM cfm_lessons WHERE year = :y AND lang = :l"),
+            params,
+        )
+    }
+    session.execute(
+        sql_text("""
+            DELETE FROM cfm_sections
+            WHERE lesson_id IN (SELECT id FROM cfm_lessons WHERE year = :y AND lang = :l)
+        """),
+        params,
+    )
+    return insert_sections(session, lesson_pks, lessons, lang)
+
+
 def main() -> None:
     """Main entry point for CFM ingestion."""
     parser = create_cfm_year_parser()
@@ -72,30 +173,44 @@ def main() -> None:
         print(f"Error: JSON file not found: {json_path}")
         sys.exit(1)
 
+    with open(json_path, encoding="utf-8") as f:
+        data = json.load(f)
+
     with get_session() as session:
-        if not check_or_skip_cfm(session, args.year, args.lang, args.force):
+        if args.sections_only:
+            section_count = rebuild_sections(session, args.year, args.lang, data["lessons"])
+            bump_generation(session, "cfm")
+            session.commit()
+            print(f"Rebuilt {section_count} sections for CFM {args.year}/{args.lang}")
             return
 
-        with open(json_path, encoding="utf-8") as f:
-            data = json.load(f)
-
-        count = 0
-        for lesson_id, lesson in data["lessons"].items():
-            cfm = CFMLesson(
-                year=args.year,
-                testament=testament,
-                lesson_id=lesson_id,
-                title=lesson.get("title", ""),
-                date_range=lesson.get("date_range", ""),
-                scripture_refs=lesson.get("scripture_refs", []),
-                content=lesson.get("plain_text", ""),
-                lang=args.lang,
-            )
-            session.add(cfm)
-            count += 1
+        if not check_or_skip_cfm(session, args.year, args.lang, args.force):
+            return
 
+        # One multi-row INSERT ... RETURNING for the lessons, one for the sections
+        result = session.execute(
+            insert(CFMLesson).returning(CFMLesson.id, CFMLesson.lesson_id),
+            [
+                {
+                    "year": args.year,
+                    "testament": testament,
+                    "lesson_id": lesson_id,
+                    "title": lesson.get("title", ""),
+                    "date_range": lesson.get("date_range", ""),
+                    "scripture_refs": lesson.get("scripture_refs", []),
+                    "content": lesson.get("plain_text", ""),
+                    "lang": args.lang,
+                }
+                for lesson_id, lesson in data["lessons"].items()
+            ],
+        )
+        lesson_pks = {row.lesson_id: row.id for row in result}
+        count = len(lesson_pks)
+        section_count = insert_sections(session, lesson_pks, data["lessons"], args.lang)
+
+        bump_generation(session, "cfm")
         session.commit()
-        print(f"Loaded {count} lessons for CFM {args.year}/{args.lang}")
+        print(f"Loaded {count} lessons ({section_count} sections) for CFM {args.year}/{args.lang}")
 
 
 if __name__ == "__main__":
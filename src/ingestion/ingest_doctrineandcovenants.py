@@ -3,7 +3,7 @@
 import json
 from pathlib import Path
 
-from src.db import get_session, Scripture
+from src.db import bump_generation, get_session, Scripture
 from src.ingestion.base import create_scripture_parser, check_or_skip
 
 VOLUME = "doctrineandcovenants"
@@ -38,6 +38,7 @@ def main():
                     session.add(scripture)
                     count += 1
 
+        bump_generation(session, "scriptures")
         session.commit()
         print(f"Loaded {count} verses for {VOLUME}/{args.lang}")
 
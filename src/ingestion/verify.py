@@ -6,6 +6,7 @@ This script validates the integrity of ingested scripture and CFM data by:
 2. Counting CFM lessons by year and language
 3. Performing random verse spot-checks
 4. Validating footnotes data
+5. Checking that stored scripture_refs parse into canonical references
 
 Expected counts:
 | Volume              | EN     | ES     |
@@ -22,6 +23,7 @@ Expected counts:
 from sqlalchemy import text
 
 from src.db import get_session
+from src.references import parse_references
 
 
 def verify_scripture_counts(session) -> None:
@@ -139,6 +141,41 @@ def footnotes_check(session) -> None:
         print(f"    {row.book} {row.chapter}:{row.verse}: {footnotes_str}...")
 
 
+def scripture_refs_check(session) -> None:
+    """Check how many stored scripture_refs parse into canonical references.
+
+    CFM lessons and conference paragraphs store references as free text
+    extracted from the source HTML. Unparseable entries are usually topic
+    links ("Topical Guide", "Faith") rather than references.
+
+    Args:
+        session: SQLAlchemy session object
+    """
+    print("\n=== Scripture Reference Parsing ===")
+    for table in ("cfm_lessons", "conference_paragraphs"):
+        result = session.execute(
+            text(f"""
+            SELECT lang, scripture_refs
+            FROM {table}
+            WHERE scripture_refs IS NOT NULL
+            ORDER BY id
+        """)
+        )
+        totals: dict[str, list[int]] = {}
+        for row in result:
+            parsed = parse_references(row.scripture_refs)
+            counts = totals.setdefault(row.lang, [0, 0])
+            counts[0] += len(parsed)
+            counts[1] += sum(1 for refs in parsed if refs)
+
+        if not totals:
+            print(f"  {table}: no scripture_refs found.")
+            continue
+        for lang, (total, ok) in sorted(totals.items()):
+            pct = (ok / total * 100) if total > 0 else 0
+            print(f"  {table:25} {lang}: {ok:,}/{total:,} parsed ({pct:.1f}%)")
+
+
 def main() -> None:
     """Run all verification checks."""
     print("Starting data verification...")
@@ -147,6 +184,7 @@ def main() -> None:
         verify_cfm_counts(session)
         random_verse_check(session)
         footnotes_check(session)
+        scripture_refs_check(session)
     print("\n=== Verification Complete ===")
 
 
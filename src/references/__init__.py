@@ -0,0 +1,45 @@
+"""Scripture reference module for Scripture Search project.
+
+Shared reference parsing and formatting used by ingestion, embedding
+context building, and the API.
+
+Submodules:
+- books: Book catalog (canonical IDs, per-language database IDs, titles, aliases)
+- parser: Precompiled English/Spanish reference grammar
+
+Exports:
+- ScriptureRef: Canonical (volume, book, chapter, verse_start, verse_end) tuple
+- parse_reference: Parse a single reference string
+- parse_references: Batch-parse references, resolving book-less fragments
+- format_reference: Format a ScriptureRef for display in English or Spanish
+- normalize_reference: Normalize reference text for matching
+- Book: Book catalog entry
+- BOOKS: All books in canonical order
+- get_book: Look up a book by English or Spanish database ID
+- book_id_for_lang: Translate a book ID to the ID stored for a language
+- book_title: Display title for a book ID
+"""
+
+from src.references.books import BOOKS, Book, book_id_for_lang, book_title, get_book
+from src.references.parser import (
+    ScriptureRef,
+    format_reference,
+    normalize_reference,
+    parse_reference,
+    parse_references,
+)
+
+__all__ = [
+    # Catalog
+    "BOOKS",
+    "Book",
+    "get_book",
+    "book_id_for_lang",
+    "book_title",
+    # Parser
+    "ScriptureRef",
+    "parse_reference",
+    "parse_references",
+    "format_reference",
+    "normalize_reference",
+]
@@ -0,0 +1,194 @@
+"""Scripture book catalog for reference parsing and formatting.
+
+Each book is listed once with its canonical ID (the English database ID,
+e.g. "1nephi"), the Spanish database ID (e.g. "1-ne"), display titles in
+both languages, and the names and abbreviations used in CFM manuals,
+conference talks, and footnotes.
+
+The English IDs come from the Open Scripture API and the Spanish IDs come
+from the Church content API (see src/tools/fetch_scriptures.py), which is
+why the two languages store different book IDs in the scriptures table.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class Book:
+    """A scripture book.
+
+    Attributes:
+        volume: Scripture volume ID (e.g., "bookofmormon")
+        id: Canonical book ID, as stored for English verses (e.g., "1nephi")
+        es_id: Book ID as stored for Spanish verses (e.g., "1-ne")
+        title: English display title (e.g., "1 Nephi")
+        es_title: Spanish display title (e.g., "1 Nefi")
+        aliases: Additional names and abbreviations in either language
+    """
+
+    volume: str
+    id: str
+    es_id: str
+    title: str
+    es_title: str
+    aliases: tuple[str, ...] = field(default_factory=tuple)
+
+
+BOOKS: tuple[Book, ...] = (
+    # Old Testament
+    Book("oldtestament", "genesis", "gen", "Genesis", "Génesis", ("Gen.", "Gén.")),
+    Book("oldtestament", "exodus", "ex", "Exodus", "Éxodo", ("Ex.", "Éx.", "Éxodos")),
+    Book("oldtestament", "leviticus", "lev", "Leviticus", "Levítico", ("Lev.",)),
+    Book("oldtestament", "numbers", "num", "Numbers", "Números", ("Num.", "Núm.")),
+    Book("oldtestament", "deuteronomy", "deut", "Deuteronomy", "Deuteronomio", ("Deut.",)),
+    Book("oldtestament", "joshua", "josh", "Joshua", "Josué", ("Josh.",)),
+    Book("oldtestament", "judges", "judg", "Judges", "Jueces", ("Judg.", "Jue.")),
+    Book("oldtestament", "ruth", "ruth", "Ruth", "Rut", ()),
+    Book("oldtestament", "1samuel", "1-sam", "1 Samuel", "1 Samuel", ("1 Sam.",)),
+    Book("oldtestament", "2samuel", "2-sam", "2 Samuel", "2 Samuel", ("2 Sam.",)),
+    Book("oldtestament", "1kings", "1-kgs", "1 Kings", "1 Reyes", ("1 Kgs.", "1 Rey.")),
+    Book("oldtestament", "2kings", "2-kgs", "2 Kings", "2 Reyes", ("2 Kgs.", "2 Rey.")),
+    Book("oldtestament", "1chronicles", "1-chr", "1 Chronicles", "1 Crónicas", ("1 Chr.", "1 Crón.")),
+    Book("oldtestament", "2chronicles", "2-chr", "2 Chronicles", "2 Crónicas", ("2 Chr.", "2 Crón.")),
+    Book("oldtestament", "ezra", "ezra", "Ezra", "Esdras", ("Esd.",)),
+    Book("oldtestament", "nehemiah", "neh", "Nehemiah", "Nehemías", ("Neh.",)),
+    Book("oldtestament", "esther", "esth", "Esther", "Ester", ("Esth.", "Est.")),
+    Book("oldtestament", "job", "job", "Job", "Job", ()),
+    Book("oldtestament", "psalms", "ps", "Psalms", "Salmos", ("Psalm", "Ps.", "Salmo", "Sal.")),
+    Book("oldtestament", "proverbs", "prov", "Proverbs", "Proverbios", ("Prov.",)),
+    Book("oldtestament", "ecclesiastes", "eccl", "Ecclesiastes", "Eclesiastés", ("Eccl.", "Ecl.")),
+    Book("oldtestament", "songofsolomon", "song", "Song of Solomon", "Cantares", ("Song", "Cant.")),
+    Book("oldtestament", "isaiah", "isa", "Isaiah", "Isaías", ("Isa.",)),
+    Book("oldtestament", "jeremiah", "jer", "Jeremiah", "Jeremías", ("Jer.",)),
+    Book("oldtestament", "lamentations", "lam", "Lamentations", "Lamentaciones", ("Lam.",)),
+    Book("oldtestament", "ezekiel", "ezek", "Ezekiel", "Ezequiel", ("Ezek.", "Ezeq.")),
+    Book("oldtestament", "daniel", "dan", "Daniel", "Daniel", ("Dan.",)),
+    Book("oldtestament", "hosea", "hosea", "Hosea", "Oseas", ("Os.",)),
+    Book("oldtestament", "joel", "joel", "Joel", "Joel", ()),
+    Book("oldtestament", "amos", "amos", "Amos", "Amós", ()),
+    Book("oldtestament", "obadiah", "obad", "Obadiah", "Abdías", ("Obad.", "Abd.")),
+    Book("oldtestament", "jonah", "jonah", "Jonah", "Jonás", ("Jon.",)),
+    Book("oldtestament", "micah", "micah", "Micah", "Miqueas", ("Miq.",)),
+    Book("oldtestament", "nahum", "nahum", "Nahum", "Nahúm", ("Nah.",)),
+    Book("oldtestament", "habakkuk", "hab", "Habakkuk", "Habacuc", ("Hab.",)),
+    Book("oldtestament", "zephaniah", "zeph", "Zephaniah", "Sofonías", ("Zeph.", "Sof.")),
+    Book("oldtestament", "haggai", "hag", "Haggai", "Hageo", ("Hag.",)),
+    Book("oldtestament", "zechariah", "zech", "Zechariah", "Zacarías", ("Zech.", "Zac.")),
+    Book("oldtestament", "malachi", "mal", "Malachi", "Malaquías", ("Mal.",)),
+    # New Testament
+    Book("newtestament", "matthew", "matt", "Matthew", "Mateo", ("Matt.", "Mat.")),
+    Book("newtestament", "mark", "mark", "Mark", "Marcos", ("Mar.",)),
+    Book("newtestament", "luke", "luke", "Luke", "Lucas", ("Luc.",)),
+    Book("newtestament", "john", "john", "John", "Juan", ()),
+    Book("newtestament", "acts", "acts", "Acts", "Hechos", ("Hech.",)),
+    Book("newtestament", "romans", "rom", "Romans", "Romanos", ("Rom.",)),
+    Book("newtestament", "1corinthians", "1-cor", "1 Corinthians", "1 Corintios", ("1 Cor.",)),
+    Book("newtestament", "2corinthians", "2-cor", "2 Corinthians", "2 Corintios", ("2 Cor.",)),
+    Book("newtestament", "galatians", "gal", "Galatians", "Gálatas", ("Gal.", "Gál.")),
+    Book("newtestament", "ephesians", "eph", "Ephesians", "Efesios", ("Eph.", "Efe.")),
+    Book("newtestament", "philippians", "philip", "Philippians", "Filipenses", ("Philip.", "Filip.")),
+    Book("newtestament", "colossians", "col", "Colossians", "Colosenses", ("Col.",)),
+    Book("newtestament", "1thessalonians", "1-thes", "1 Thessalonians", "1 Tesalonicenses", ("1 Thes.", "1 Tes.")),
+    Book("newtestament", "2thessalonians", "2-thes", "2 Thessalonians", "2 Tesalonicenses", ("2 Thes.", "2 Tes.")),
+    Book("newtestament", "1timothy", "1-tim", "1 Timothy", "1 Timoteo", ("1 Tim.",)),
+    Book("newtestament", "2timothy", "2-tim", "2 Timothy", "2 Timoteo", ("2 Tim.",)),
+    Book("newtestament", "titus", "titus", "Titus", "Tito", ()),
+    Book("newtestament", "philemon", "philem", "Philemon", "Filemón", ("Philem.", "Filem.")),
+    Book("newtestament", "hebrews", "heb", "Hebrews", "Hebreos", ("Heb.",)),
+    Book("newtestament", "james", "james", "James", "Santiago", ("Sant.",)),
+    Book("newtestament", "1peter", "1-pet", "1 Peter", "1 Pedro", ("1 Pet.", "1 Pe.")),
+    Book("newtestament", "2peter", "2-pet", "2 Peter", "2 Pedro", ("2 Pet.", "2 Pe.")),
+    Book("newtestament", "1john", "1-jn", "1 John", "1 Juan", ("1 Jn.",)),
+    Book("newtestament", "2john", "2-jn", "2 John", "2 Juan", ("2 Jn.",)),
+    Book("newtestament", "3john", "3-jn", "3 John", "3 Juan", ("3 Jn.",)),
+    Book("newtestament", "jude", "jude", "Jude", "Judas", ()),
+    Book("newtestament", "revelation", "rev", "Revelation", "Apocalipsis", ("Rev.", "Apoc.")),
+    # Book of Mormon
+    Book("bookofmormon", "1nephi", "1-ne", "1 Nephi", "1 Nefi", ("1 Ne.",)),
+    Book("bookofmormon", "2nephi", "2-ne", "2 Nephi", "2 Nefi", ("2 Ne.",)),
+    Book("bookofmormon", "jacob", "jacob", "Jacob", "Jacob", ()),
+    Book("bookofmormon", "enos", "enos", "Enos", "Enós", ()),
+    Book("bookofmormon", "jarom", "jarom", "Jarom", "Jarom", ()),
+    Book("bookofmormon", "omni", "omni", "Omni", "Omni", ()),
+    Book("bookofmormon", "wordsofmormon", "w-of-m", "Words of Mormon", "Palabras de Mormón", ("W of M", "P de Morm.")),
+    Book("bookofmormon", "mosiah", "mosiah", "Mosiah", "Mosíah", ("Mosías", "Mos.")),
+    Book("bookofmormon", "alma", "alma", "Alma", "Alma", ()),
+    Book("bookofmormon", "helaman", "hel", "Helaman", "Helamán", ("Hel.",)),
+    Book("bookofmormon", "3nephi", "3-ne", "3 Nephi", "3 Nefi", ("3 Ne.",)),
+    Book("bookofmormon", "4nephi", "4-ne", "4 Nephi", "4 Nefi", ("4 Ne.",)),
+    Book("bookofmormon", "mormon", "morm", "Mormon", "Mormón", ("Morm.",)),
+    Book("bookofmormon", "ether", "ether", "Ether", "Éter", ()),
+    Book("bookofmormon", "moroni", "moro", "Moroni", "Moroni", ("Moro.",)),
+    # Doctrine and Covenants (sections are stored as chapters)
+    Book(
+        "doctrineandcovenants", "doctrineandcovenants", "dc", "D&C", "Doctrina y Convenios",
+        ("Doctrine and Covenants", "Doctrine and Covenant", "Doctrinas y Convenios", "D. y C.", "D y C", "DyC"),
+    ),
+    # Pearl of Great Price
+    Book("pearlofgreatprice", "moses", "moses", "Moses", "Moisés", ()),
+    Book("pearlofgreatprice", "abraham", "abr", "Abraham", "Abraham", ("Abr.",)),
+    Book(
+        "pearlofgreatprice", "josephsmithmatthew", "js-m", "JS-Matthew", "José Smith—Mateo",
+        ("Joseph Smith—Matthew", "JS—M"),
+    ),
+    Book(
+        "pearlofgreatprice", "josephsmithhistory", "js-h", "JS-History", "José Smith—Historia",
+        ("Joseph Smith—History", "JS—H"),
+    ),
+    Book(
+        "pearlofgreatprice", "articlesoffaith", "a-of-f", "Articles of Faith", "Artículos de Fe",
+        ("A of F", "AdeF"),
+    ),
+)
+
+# Lookup by either the English (canonical) or the Spanish database ID
+_BOOKS_BY_ID: dict[str, Book] = {}
+for _book in BOOKS:
+    _BOOKS_BY_ID[_book.id] = _book
+    _BOOKS_BY_ID.setdefault(_book.es_id, _book)
+
+
+def get_book(book_id: str) -> Optional[Book]:
+    """Look up a book by its English or Spanish database ID.
+
+    Args:
+        book_id: Book ID as stored in the scriptures table (e.g., "1nephi", "1-ne")
+
+    Returns:
+        Matching Book, or None if the ID is unknown.
+    """
+    return _BOOKS_BY_ID.get(book_id)
+
+
+def book_id_for_lang(book_id: str, lang: str) -> str:
+    """Translate a book ID to the ID stored for verses in a given language.
+
+    Args:
+        book_id: English or Spanish book ID
+        lang: Language code ('en' or 'es')
+
+    Returns:
+        Book ID used by the scriptures table for that language. Unknown IDs
+        are returned unchanged.
+    """
+    book = _BOOKS_BY_ID.get(book_id)
+    if book is None:
+        return book_id
+    return book.es_id if lang == "es" else book.id
+
+
+def book_title(book_id: str, lang: str = "en") -> str:
+    """Get the display title for a book.
+
+    Args:
+        book_id: English or Spanish book ID
+        lang: Language code for the title ('en' or 'es')
+
+    Returns:
+        Display title, or the title-cased ID if the book is unknown.
+    """
+    book = _BOOKS_BY_ID.get(book_id)
+    if book is None:
+        return book_id.title()
+    return book.es_title if lang == "es" else book.title
@@ -0,0 +1,333 @@
+"""Scripture reference parser.
+
+Parses free-text references as they appear in CFM manuals, conference
+talks, and API requests ("Alma 32:21", "1 Nefi 3:7, 15–16", "D&C 121",
+"Genesis 1–6", "Mosiah 2:17ff", "Alma 32:21 and Moroni 10:4") into
+canonical ScriptureRef tuples.
+
+The grammar is compiled once at import: every English and Spanish book name
+and abbreviation from the book catalog is folded into a single regular
+expression, so parsing a reference is one regex match plus a short scan of
+the chapter/verse specification. Normalized references are memoized, which
+makes batch parsing of extracted refs (which repeat heavily) cheap.
+
+Usage:
+    from src.references import parse_reference, parse_references
+
+    parse_reference("Alma 32:21")
+    # [ScriptureRef(volume='bookofmormon', book='alma', chapter=32,
+    #               verse_start=21, verse_end=21)]
+
+    # Batch: fragments like "17:23–43" or "verses 12–26" resolve against
+    # the previous reference in the list.
+    parse_references(["Moses 1:12", "verses 24–26", "Isaiah 53"])
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Iterable, NamedTuple, Optional
+
+from src.references.books import BOOKS, Book, book_title, get_book
+
+
+class ScriptureRef(NamedTuple):
+    """A canonical scripture reference within a single chapter.
+
+    Attributes:
+        volume: Scripture volume ID (e.g., "bookofmormon")
+        book: Canonical (English) book ID (e.g., "alma")
+        chapter: Chapter number (section number for D&C)
+        verse_start: First verse, or None for the whole chapter
+        verse_end: Last verse (inclusive), or None for the whole chapter or
+                   "through the end of the chapter" when verse_start is set
+    """
+
+    volume: str
+    book: str
+    chapter: int
+    verse_start: Optional[int] = None
+    verse_end: Optional[int] = None
+
+
+# Characters folded before matching (dashes, non-breaking spaces)
+_TRANSLATE = str.maketrans({
+    "‐": "-", "‑": "-", "‒": "-", "–": "-",
+    "—": "-", "―": "-", "\xa0": " ",
+})
+_WHITESPACE_RE = re.compile(r"\s+")
+_DASH_SPACING_RE = re.compile(r"\s*-\s*")
+
+
+@lru_cache(maxsize=65536)
+def normalize_reference(text: str) -> str:
+    """Normalize a reference for matching.
+
+    Folds dashes and non-breaking spaces, strips accents and periods,
+    lowercases, and collapses whitespace.
+
+    Example:
+        normalize_reference("José Smith—Historia 1:17") -> "jose smith-historia 1:17"
+    """
+    text = unicodedata.normalize("NFKD", text.translate(_TRANSLATE))
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    text = text.lower().replace(".", "")
+    text = _DASH_SPACING_RE.sub("-", _WHITESPACE_RE.sub(" ", text))
+    return text.strip(" ,;:")
+
+
+def _name_variants(book: Book) -> set[str]:
+    """All normalized names a book may be cited by."""
+    names = {book.id, book.es_id, book.title, book.es_title, *book.aliases}
+    variants = {normalize_reference(name) for name in names}
+    # "First Corinthians", "Second Nephi", ...
+    ordinals = {"1 ": "first ", "2 ": "second ", "3 ": "third ", "4 ": "fourth "}
+    for name in list(variants):
+        prefix = name[:2]
+        if prefix in ordinals:
+            variants.add(ordinals[prefix] + name[2:])
+    return variants
+
+
+def _build_name_index() -> dict[str, Book]:
+    index: dict[str, Book] = {}
+    for book in BOOKS:
+        for name in _name_variants(book):
+            existing = index.get(name)
+            if existing is not None and existing is not book:
+                raise ValueError(f"Ambiguous book name {name!r}: {existing.id} / {book.id}")
+            index[name] = book
+    return index
+
+
+_NAME_INDEX = _build_name_index()
+# Same index keyed without spaces; the grammar treats spaces inside names as optional
+_COMPACT_INDEX = {name.replace(" ", ""): book for name, book in _NAME_INDEX.items()}
+
+DOCTRINE_AND_COVENANTS = get_book("doctrineandcovenants")
+
+
+def _name_pattern(name: str) -> str:
+    # Spaces inside names are optional so "1nephi" and "doctrineand covenants" match
+    return r"\s?".join(re.escape(part) for part in name.split(" "))
+
+
+# Longest names first so "1 juan" wins over "juan" and "doctrine and covenants" over "doctrine"
+_BOOK_ALTERNATION = "|".join(
+    _name_pattern(name) for name in sorted(_NAME_INDEX, key=len, reverse=True)
+)
+
+_REFERENCE_RE = re.compile(
+    r"^(?:(?:see|see also|vease|vease tambien)\s+)?"
+    rf"(?P<book>{_BOOK_ALTERNATION})(?![a-z])"
+    r"\s*,?\s*(?:(?:chapters?|capitulos?|sections?|seccion(?:es)?)\s+)?"
+    r"(?P<spec>\d.*)?$"
+)
+# Fragments that continue the previous reference: "17:23–43", "verses 12–26"
+_CONTINUATION_RE = re.compile(
+    r"^(?:(?:the|el|los)\s+)?(?P<kind>verses?|versiculos?|sections?|seccion(?:es)?)?\s*(?P<spec>\d.*)$"
+)
+_SEGMENT_SPLIT_RE = re.compile(r"\s*(?:,|\by\b|\band\b)\s*")
+# Separators between self-contained references: ';', or 'and' / 'y' before
+# another book ("Alma 32:21 and Moroni 10:4"), but not inside a name
+# ("Doctrina y Convenios")
+_PART_SPLIT_RE = re.compile(
+    rf";|(?<=\d),?\s+(?:and|y)\s+(?=(?:{_BOOK_ALTERNATION})(?![a-z]))"
+)
+_CHAPTER_VERSE_RE = re.compile(r"^(\d+)\s*:\s*(\d+)(?:-(\d+)(?:\s*:\s*(\d+))?)?$")
+# "and following" verses: "2:17 ff", "17ss" (through the end of the chapter)
+_OPEN_ENDED_RE = re.compile(r"^(?:(\d+)\s*:\s*)?(\d+)\s*(?:ff|ss)$")
+_RANGE_RE = re.compile(r"^(\d+)-(\d+)$")
+_NUMBER_RE = re.compile(r"^(\d+)$")
+# Leading chapter:verse or verse numbers of a segment followed by prose
+_LEADING_SPEC_RE = re.compile(r"^\d+(?:\s*[:-]\s*\d+)*")
+
+# Guard against typos like "Alma 1-6300" expanding into thousands of chapters
+_MAX_CHAPTER_SPAN = 200
+
+
+def _range_end(first: int, last: int) -> int:
+    """Expand abbreviated range ends ("121-23" -> 123)."""
+    if last < first:
+        digits = len(str(last))
+        expanded = first - first % 10**digits + last
+        if expanded >= first:
+            return expanded
+    return last
+
+
+def _parse_spec(book: Book, spec: str, chapter: Optional[int] = None) -> list[ScriptureRef]:
+    """Parse a chapter/verse specification for a book.
+
+    Args:
+        book: Book the specification belongs to
+        spec: Normalized specification (e.g., "13:21-29, 38-42", "1-6")
+        chapter: Chapter in effect when the spec lists bare verse numbers
+
+    Returns:
+        Parsed references (empty if the spec is not understood).
+    """
+    refs: list[ScriptureRef] = []
+    for segment in _SEGMENT_SPLIT_RE.split(spec.strip(" ,;")):
+        if not segment:
+            continue
+        match = _CHAPTER_VERSE_RE.match(segment)
+        if match:
+            chapter = int(match.group(1))
+            start = int(match.group(2))
+            if match.group(4):
+                # Cross-chapter range "36:1-37:5"
+                end_chapter = int(match.group(3))
+                end_verse = int(match.group(4))
+                if end_chapter < chapter or end_chapter - chapter > _MAX_CHAPTER_SPAN:
+                    return []
+                refs.append(ScriptureRef(book.volume, book.id, chapter, start, None))
+                for middle in range(chapter + 1, end_chapter):
+                    refs.append(ScriptureRef(book.volume, book.id, middle))
+                refs.append(ScriptureRef(book.volume, book.id, end_chapter, 1, end_verse))
+                chapter = end_chapter
+            else:
+                end = _range_end(start, int(match.group(3))) if match.group(3) else start
+                refs.append(ScriptureRef(book.volume, book.id, chapter, start, max(start, end)))
+            continue
+
+        match = _RANGE_RE.match(segment)
+        if match:
+            first = int(match.group(1))
+            last = _range_end(first, int(match.group(2)))
+            if chapter is not None:
+                refs.append(ScriptureRef(book.volume, book.id, chapter, first, max(first, last)))
+            elif first <= last and last - first <= _MAX_CHAPTER_SPAN:
+                refs.extend(
+                    ScriptureRef(book.volume, book.id, c) for c in range(first, last + 1)
+                )
+            else:
+                return []
+            continue
+
+        match = _NUMBER_RE.match(segment)
+        if match:
+            number = int(match.group(1))
+            if chapter is not None:
+                refs.append(ScriptureRef(book.volume, book.id, chapter, number, number))
+            else:
+                refs.append(ScriptureRef(book.volume, book.id, number))
+            continue
+
+        match = _OPEN_ENDED_RE.match(segment)
+        if match:
+            if match.group(1):
+                chapter = int(match.group(1))
+            if chapter is None:
+                # "Alma 32ff" names no verse to start from
+                return []
+            refs.append(ScriptureRef(book.volume, book.id, chapter, int(match.group(2)), None))
+            continue
+
+        # Trailing prose ("Alma 32:21 (emphasis added)") ends the spec, after
+        # the segment's leading chapter:verse
+        match = _LEADING_SPEC_RE.match(segment)
+        if match and match.group(0) != segment:
+            refs.extend(_parse_spec(book, match.group(0), chapter))
+        break
+    return refs
+
+
+@lru_cache(maxsize=16384)
+def _parse_normalized(text: str) -> tuple[ScriptureRef, ...]:
+    """Parse a normalized, self-contained reference (memoized)."""
+    refs: list[ScriptureRef] = []
+    book: Optional[Book] = None
+    for part in _PART_SPLIT_RE.split(text):
+        part = part.strip()
+        if not part:
+            continue
+        match = _REFERENCE_RE.match(part)
+        if match:
+            book = _COMPACT_INDEX[match.group("book").replace(" ", "")]
+            if match.group("spec"):
+                refs.extend(_parse_spec(book, match.group("spec")))
+        elif book is not None and part[0].isdigit():
+            # "Alma 32:21; 33:2" - later parts reuse the book
+            refs.extend(_parse_spec(book, part))
+    return tuple(refs)
+
+
+def parse_reference(ref: str, previous: Optional[ScriptureRef] = None) -> list[ScriptureRef]:
+    """Parse a single free-text scripture reference.
+
+    Args:
+        ref: Reference text (e.g., "Alma 32:21", "1 Nefi 3:7, 15–16")
+        previous: Preceding reference, used to resolve fragments such as
+                  "17:23–43" or "verses 12–26" that omit the book
+
+    Returns:
+        List of ScriptureRef, one per chapter/verse range. Empty if the text
+        is not a recognizable reference (e.g., "Topical Guide").
+    """
+    text = normalize_reference(ref)
+    if not text:
+        return []
+
+    refs = _parse_normalized(text)
+    if refs:
+        return list(refs)
+
+    match = _CONTINUATION_RE.match(text)
+    if not match:
+        return []
+    kind = match.group("kind") or ""
+    spec = match.group("spec")
+
+    # "section 76" always refers to the Doctrine and Covenants
+    if kind.startswith(("section", "seccion")):
+        return _parse_spec(DOCTRINE_AND_COVENANTS, spec)
+    if previous is None:
+        return []
+    book = get_book(previous.book)
+    if kind:
+        return _parse_spec(book, spec, chapter=previous.chapter)
+    if ":" in spec:
+        return _parse_spec(book, spec)
+    return []
+
+
+def parse_references(refs: Iterable[str]) -> list[list[ScriptureRef]]:
+    """Parse a sequence of references in one call.
+
+    References are parsed in order so fragments that omit the book
+    ("17:23–43", "versículos 24–28") resolve against the previous
+    successfully parsed reference, matching how scripture_refs are
+    extracted from lesson and talk HTML.
+
+    Args:
+        refs: Reference strings
+
+    Returns:
+        One list of ScriptureRef per input string, in input order.
+    """
+    results: list[list[ScriptureRef]] = []
+    previous: Optional[ScriptureRef] = None
+    for ref in refs:
+        parsed = parse_reference(ref, previous)
+        if parsed:
+            previous = parsed[-1]
+        results.append(parsed)
+    return results
+
+
+def format_reference(ref: ScriptureRef, lang: str = "en") -> str:
+    """Format a ScriptureRef for display.
+
+    Example:
+        format_reference(ScriptureRef("bookofmormon", "alma", 32, 21, 23)) -> "Alma 32:21-23"
+        format_reference(ScriptureRef("bookofmormon", "1nephi", 3, 7, 7), "es") -> "1 Nefi 3:7"
+    """
+    title = book_title(ref.book, lang)
+    if ref.verse_start is None:
+        return f"{title} {ref.chapter}"
+    if ref.verse_end is None:
+        return f"{title} {ref.chapter}:{ref.verse_start}ff"
+    if ref.verse_end == ref.verse_start:
+        return f"{title} {ref.chapter}:{ref.verse_start}"
+    return f"{title} {ref.chapter}:{ref.verse_start}-{ref.verse_end}"
@@ -12,7 +12,7 @@ Usage:
 
 import json
 import toons
-import tiktoken
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -21,13 +21,21 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 INPUT_DIR = PROJECT_ROOT / "content" / "processed"
 OUTPUT_DIR = PROJECT_ROOT / "content" / "transformed"
 
-# Token encoder for metrics
-ENCODER = tiktoken.get_encoding("cl100k_base")  # GPT-4/Claude tokenizer
+# Token encoding for metrics
+ENCODING_NAME = "cl100k_base"  # GPT-4/Claude tokenizer
+
+
+@lru_cache(maxsize=None)
+def get_encoder() -> Any:
+    """Load the tiktoken encoder on first use (it reads a large BPE file)."""
+    import tiktoken
+
+    return tiktoken.get_encoding(ENCODING_NAME)
 
 
 def count_tokens(text: str) -> int:
     """Count tokens using tiktoken."""
-    return len(ENCODER.encode(text))
+    return len(get_encoder().encode(text))
 
 
 def flatten_scriptures_for_toon(data: dict) -> list[dict]:
@@ -149,7 +149,7 @@ def fetch_lesson(uri: str, lang: str) -> Optional[dict]:
         "date_range": date_range,
         "intro": intro_paragraphs,
         "sections": sections,
-        "scripture_refs": scripture_refs[:20],  # Limit to first 20
+        "scripture_refs": list(dict.fromkeys(scripture_refs)),  # Deduplicated, in order
         "plain_text": plain_text,
     }
 
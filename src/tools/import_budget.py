@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Import-time budget for the API and CLI entry points.
+
+Each entry point is imported in a fresh interpreter under
+`python -X importtime`, and checked against its budget:
+
+- its cumulative import time must stay under max_ms
+- it must not load the modules it has no use for at import time (the
+  database driver, the OpenAI SDK, tiktoken, FastAPI); those are
+  imported on first use instead
+
+The module checks are deterministic and covered by the test suite; the
+millisecond targets depend on the machine, so compare them on the same
+host before and after a change, and use --scale on slower hosts.
+
+Usage:
+    python -m src.tools.import_budget
+    python -m src.tools.import_budget --module src.db --top 15
+    python -m src.tools.import_budget --scale 2
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+
+# One line of -X importtime output: self and cumulative microseconds, name
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+@dataclass(frozen=True)
+class ImportBudget:
+    """Import-time target for one entry point.
+
+    Attributes:
+        module: Module imported by the entry point
+        max_ms: Cumulative import time target (milliseconds)
+        forbidden: Modules that must not be loaded by the import
+    """
+
+    module: str
+    max_ms: float
+    forbidden: tuple[str, ...] = ()
+
+
+BUDGETS = (
+    # Pure-Python reference parsing
+    ImportBudget("src.references", 50, ("sqlalchemy",)),
+    # Package imports resolve names lazily
+    ImportBudget("src.db", 25, ("sqlalchemy",)),
+    ImportBudget("src.embeddings", 25, ("sqlalchemy", "openai")),
+    # Helpers used by the embedding pipeline and its tests
+    ImportBudget("src.embeddings.tokens", 50, ("tiktoken", "sqlalchemy")),
+    ImportBudget(
+        "src.embeddings.providers", 100,
+        ("openai", "sqlalchemy", "torch", "sentence_transformers"),
+    ),
+    # CLI tools: the engine and the driver come with the first session
+    ImportBudget("src.tools.convert_to_toon", 150, ("tiktoken",)),
+    ImportBudget("src.embeddings.verify", 400, ("openai", "psycopg2", "dotenv")),
+    ImportBudget(
+        "src.ingestion.conference.export_json", 400, ("openai", "psycopg2", "pgvector"),
+    ),
+    # Search services (benchmarks) without the web framework
+    ImportBudget("src.api.services.search", 900, ("fastapi", "openai", "psycopg2")),
+    # The API module; the app and its engine are created on first access
+    ImportBudget("src.api.main", 1500, ("openai", "psycopg2", "tiktoken")),
+)
+
+
+def parse_importtime(output: str) -> dict[str, tuple[int, int]]:
+    """Parse -X importtime output.
+
+    Args:
+        output: The interpreter's stderr
+
+    Returns:
+        Mapping of module name to (self, cumulative) microseconds.
+    """
+    timings = {}
+    for line in output.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            timings[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return timings
+
+
+def measure(module: str) -> dict[str, tuple[int, int]]:
+    """Import a module in a fresh interpreter under -X importtime.
+
+    Args:
+        module: Module to import
+
+    Returns:
+        Mapping of every module loaded to (self, cumulative) microseconds.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+    return parse_importtime(result.stderr)
+
+
+def loaded_forbidden(timings: dict[str, tuple[int, int]], forbidden: tuple[str, ...]) -> list[str]:
+    """Forbidden top-level packages that were loaded."""
+    loaded = {name.split(".")[0] for name in timings}
+    return [name for name in forbidden if name in loaded]
+
+
+def check(budget: ImportBudget, scale: float = 1.0, top: int = 0) -> list[str]:
+    """Measure one entry point and print its report.
+
+    Args:
+        budget: Entry point and targets
+        scale: Multiplier for the time target (slow hosts)
+        top: Slowest imports (by self time) to list
+
+    Returns:
+        Violations (empty if within budget).
+    """
+    timings = measure(budget.module)
+    total_ms = timings.get(budget.module, (0, 0))[1] / 1000
+    limit_ms = budget.max_ms * scale
+
+    violations = []
+    if total_ms > limit_ms:
+        violations.append(f"{budget.module}: {total_ms:.0f}ms > {limit_ms:.0f}ms")
+    for name in loaded_forbidden(timings, budget.forbidden):
+        violations.append(f"{budget.module}: imports {name}")
+
+    mark = "FAIL" if violations else "ok"
+    print(f"{mark:<5} {budget.module:<42} {total_ms:>7.0f}ms / {limit_ms:.0f}ms")
+    if top:
+        slowest = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)[:top]
+        for name, (self_us, _) in slowest:
+            print(f"        {self_us / 1000:>7.1f}ms  {name}")
+    return violations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check import-time budgets")
+    parser.add_argument("--module", action="append",
+                        help="Only check these entry points (repeatable)")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Multiply the time targets (default: 1)")
+    parser.add_argument("--top", type=int, default=0,
+                        help="List the N slowest imports per entry point (default: 0)")
+    args = parser.parse_args()
+
+    budgets = [b for b in BUDGETS if not args.module or b.module in args.module]
+    violations: list[str] = []
+    for budget in budgets:
+        violations.extend(check(budget, args.scale, args.top))
+
+    if violations:
+        print("\nOver budget:")
+        for violation in violations:
+            print(f"  {violation}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
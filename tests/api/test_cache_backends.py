@@ -0,0 +1,281 @@
+"""Unit tests for the shared cache backends.
+
+Runs the Redis backend against a real server when TEST_REDIS_URL is set
+(e.g., redis://localhost:7379/15 with docker compose), otherwise against
+an in-memory fake implementing the subset of redis-py the backend uses.
+
+Tests:
+- Single and pipelined multi-key get/set round-trips
+- Locks are exclusive and released only by their holder
+- get_or_compute computes once and waiters reuse the value
+- An unavailable Redis reads as misses, skips writes, and lets callers compute
+- A hung Redis times out into counted misses instead of blocking
+- Embeddings round-trip through the packed float32 format
+"""
+
+import os
+import socket
+import threading
+import time
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.api.services.cache_backends import (
+    LocalCacheBackend,
+    RedisCacheBackend,
+    create_backend,
+    get_or_compute,
+)
+from src.api.services.query_embeddings import pack_embedding, unpack_embedding
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.Redis (bytes responses)."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+        self.expires: dict[str, float] = {}
+        self.mget_calls = 0
+        self._lock = threading.Lock()
+
+    def _live(self, key):
+        expiry = self.expires.get(key)
+        if expiry is not None and expiry <= time.monotonic():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return self.data.get(key)
+
+    def get(self, key):
+        with self._lock:
+            return self._live(key)
+
+    def mget(self, keys):
+        with self._lock:
+            self.mget_calls += 1
+            return [self._live(key) for key in keys]
+
+    def set(self, key, value, ex=None, px=None, nx=False):
+        with self._lock:
+            if nx and self._live(key) is not None:
+                return None
+            self.data[key] = value.encode() if isinstance(value, str) else value
+            self.expires.pop(key, None)
+            if ex is not None:
+                self.expires[key] = time.monotonic() + ex
+            if px is not None:
+                self.expires[key] = time.monotonic() + px / 1000
+            return True
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def eval(self, script, numkeys, key, token):
+        with self._lock:
+            if self._live(key) == token.encode():
+                del self.data[key]
+                return 1
+            return 0
+
+    def flushdb(self):
+        with self._lock:
+            self.data.clear()
+            self.expires.clear()
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def set(self, *args, **kwargs):
+        self.commands.append((args, kwargs))
+
+    def execute(self):
+        return [self.client.set(*args, **kwargs) for args, kwargs in self.commands]
+
+
+@pytest.fixture
+def redis_backend():
+    """RedisCacheBackend on a real server (TEST_REDIS_URL) or the fake."""
+    url = os.getenv("TEST_REDIS_URL")
+    if url:
+        redis = pytest.importorskip("redis")
+        client = redis.Redis.from_url(url)
+        client.flushdb()
+        yield RedisCacheBackend(client, prefix="test:")
+        client.flushdb()
+    else:
+        yield RedisCacheBackend(FakeRedis(), prefix="test:")
+
+
+@pytest.fixture(params=["local", "redis"])
+def backend(request, redis_backend):
+    """Each backend implementation."""
+    if request.param == "local":
+        return LocalCacheBackend(maxsize=100)
+    return redis_backend
+
+
+class TestBackendRoundTrip:
+    """Tests for get/set on every backend."""
+
+    def test_get_set(self, backend):
+        """Test a value round-trips and misses return None."""
+        assert backend.get("a") is None
+        backend.set("a", b"1", ttl=60)
+        assert backend.get("a") == b"1"
+
+    def test_get_many_set_many(self, backend):
+        """Test multi-key operations preserve key order."""
+        backend.set_many({"a": b"1", "c": b"3"}, ttl=60)
+        assert backend.get_many(["a", "b", "c"]) == [b"1", None, b"3"]
+        assert backend.get_many([]) == []
+
+    def test_redis_get_many_is_one_round_trip(self):
+        """Test multi-get uses a single MGET."""
+        client = FakeRedis()
+        backend = RedisCacheBackend(client)
+        backend.set_many({"a": b"1", "b": b"2"})
+        backend.get_many(["a", "b", "c"])
+        assert client.mget_calls == 1
+
+
+class DownRedis:
+    """Stand-in for a Redis server that refuses every command."""
+
+    def __getattr__(self, name):
+        def refuse(*args, **kwargs):
+            raise ConnectionError("Connection refused")
+
+        return refuse
+
+
+class TestRedisUnavailable:
+    """Tests for serving through a Redis outage."""
+
+    @pytest.fixture
+    def down(self):
+        """Redis backend whose server is down."""
+        return RedisCacheBackend(DownRedis(), errors=(ConnectionError,))
+
+    def test_reads_are_misses(self, down):
+        """Test failed reads return misses instead of raising."""
+        assert down.get("a") is None
+        assert down.get_many(["a", "b"]) == [None, None]
+
+    def test_writes_are_skipped(self, down):
+        """Test failed writes do not raise."""
+        down.set("a", b"1", ttl=60)
+        down.set_many({"a": b"1"}, ttl=60)
+
+    def test_get_or_compute_computes(self, down):
+        """Test callers compute right away instead of waiting on a lock."""
+        start = time.monotonic()
+        assert get_or_compute(down, "k", lambda: b"value", wait_timeout=5) == b"value"
+        assert time.monotonic() - start < 1
+
+    def test_recovers(self):
+        """Test the backend works again once Redis is back."""
+        backend = RedisCacheBackend(DownRedis(), errors=(ConnectionError,))
+        assert backend.get("a") is None
+        backend.client = FakeRedis()
+        backend.set("a", b"1")
+        assert backend.get("a") == b"1"
+
+
+class TestRedisHung:
+    """Tests for a Redis server that accepts connections but never answers."""
+
+    @pytest.fixture
+    def hung_url(self):
+        """URL of a listening socket that never replies."""
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(16)
+        yield f"redis://127.0.0.1:{server.getsockname()[1]}/0"
+        server.close()
+
+    def test_timeout_is_counted_miss(self, hung_url):
+        """Test a timed-out read returns a miss quickly and is counted."""
+        pytest.importorskip("redis")
+        backend = create_backend(
+            "redis", redis_url=hung_url, socket_timeout=0.05, connect_timeout=0.05
+        )
+        labels = {"operation": "get"}
+        before = REGISTRY.get_sample_value("cache_backend_errors_total", labels) or 0.0
+
+        start = time.monotonic()
+        assert backend.get("a") is None
+        assert time.monotonic() - start < 1
+
+        after = REGISTRY.get_sample_value("cache_backend_errors_total", labels)
+        assert after == before + 1
+
+
+class TestLocks:
+    """Tests for single-flight locks."""
+
+    def test_lock_is_exclusive(self, backend):
+        """Test a held lock cannot be taken until released."""
+        token = backend.acquire_lock("k", ttl=5)
+        assert token is not None
+        assert backend.acquire_lock("k", ttl=5) is None
+        backend.release_lock("k", token)
+        assert backend.acquire_lock("k", ttl=5) is not None
+
+    def test_release_requires_token(self, backend):
+        """Test a stale token does not release someone else's lock."""
+        token = backend.acquire_lock("k", ttl=5)
+        backend.release_lock("k", "not-the-token")
+        assert backend.acquire_lock("k", ttl=5) is None
+        backend.release_lock("k", token)
+
+    def test_lock_expires(self, backend):
+        """Test an abandoned lock expires."""
+        assert backend.acquire_lock("k", ttl=0.05) is not None
+        time.sleep(0.1)
+        assert backend.acquire_lock("k", ttl=5) is not None
+
+
+class TestGetOrCompute:
+    """Tests for stampede protection."""
+
+    def test_concurrent_misses_compute_once(self, backend):
+        """Test concurrent callers share one computation."""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return b"value"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_or_compute(backend, "k", compute)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [b"value"] * 8
+        assert len(calls) == 1
+
+    def test_waiters_compute_after_timeout(self, backend):
+        """Test waiters fall back to computing if the holder never delivers."""
+        backend.acquire_lock("k", ttl=5)
+        value = get_or_compute(backend, "k", lambda: b"fallback", wait_timeout=0.05)
+        assert value == b"fallback"
+
+
+class TestEmbeddingPacking:
+    """Tests for the packed float32 embedding format."""
+
+    def test_round_trip(self):
+        """Test packing preserves values at float32 precision."""
+        embedding = [0.1, -0.25, 0.5, 1e-3]
+        data = pack_embedding(embedding)
+        assert len(data) == 4 * len(embedding)
+        assert unpack_embedding(data) == pytest.approx(embedding, rel=1e-6)
@@ -6,6 +6,8 @@ Tests:
 - Testament filter works
 - Response structure matches schema
 - Response times under 500ms
+- Batch search returns per-query results
+- Section result mode returns filtered sections with lesson metadata
 """
 
 import pytest
@@ -219,6 +221,55 @@ class TestCFMSearchPerformance:
         )
 
 
+class TestCFMBatchSearch:
+    """Tests for the CFM batch search endpoint."""
+
+    def test_batch_returns_results_per_query(self, client):
+        """Test each query gets its own filtered result list, in request order."""
+        queries = ["How can I strengthen my faith?", "ministering to others"]
+        response = client.post(
+            "/api/v1/cfm/search/batch",
+            json={"queries": queries, "lang": "en", "limit": 3, "year": 2024},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["query"] for item in data["results"]] == queries
+        for item in data["results"]:
+            assert all(r["year"] == 2024 for r in item["results"])
+
+
+class TestCFMSectionSearch:
+    """Tests for the section result mode."""
+
+    def test_section_results(self, client, cfm_search_payload):
+        """Test section mode returns section text with its lesson's metadata."""
+        payload = {**cfm_search_payload, "result_mode": "section", "year": 2024}
+        response = client.post("/api/v1/cfm/search", json=payload)
+        assert response.status_code == 200
+        for result in response.json()["results"]:
+            assert result["year"] == 2024
+            assert {"cfm_lesson_id", "section_title", "text"} <= result.keys()
+            assert "content_preview" not in result
+
+    def test_section_fields_projection(self, client, cfm_search_payload):
+        """Test field projection is validated against the section schema."""
+        payload = {**cfm_search_payload, "result_mode": "section"}
+        response = client.post("/api/v1/cfm/search?fields=id,text", json=payload)
+        assert response.status_code == 200
+        response = client.post("/api/v1/cfm/search?fields=content_preview", json=payload)
+        assert response.status_code == 422
+
+    def test_batch_section_results(self, client):
+        """Test batch search supports the section result mode."""
+        response = client.post(
+            "/api/v1/cfm/search/batch",
+            json={"queries": ["faith", "ministering"], "limit": 2, "result_mode": "section"},
+        )
+        assert response.status_code == 200
+        for item in response.json()["results"]:
+            assert all("section_title" in r for r in item["results"])
+
+
 class TestCFMSearchValidation:
     """Tests for input validation on CFM search endpoint."""
 
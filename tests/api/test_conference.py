@@ -6,8 +6,12 @@ Tests:
 - Speaker filter works (partial match)
 - Response structure matches schema
 - Response times under 500ms
+- Batch search returns per-query results
+- Field projection and NDJSON streaming
 """
 
+import json
+
 import pytest
 
 
@@ -266,6 +270,58 @@ class TestConferenceSearchPerformance:
         )
 
 
+class TestConferenceBatchSearch:
+    """Tests for the conference batch search endpoint."""
+
+    def test_batch_returns_results_per_query(self, client):
+        """Test each query gets its own filtered result list, in request order."""
+        queries = ["How can I strengthen my faith?", "ministering to others"]
+        response = client.post(
+            "/api/v1/conference/search/batch",
+            json={"queries": queries, "lang": "en", "limit": 3, "year": 2024},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["query"] for item in data["results"]] == queries
+        for item in data["results"]:
+            assert all(r["year"] == 2024 for r in item["results"])
+
+
+class TestConferenceSearchRendering:
+    """Tests for field projection and NDJSON streaming."""
+
+    def test_fields_projection(self, client, conference_search_payload):
+        """Test fields= returns only the requested fields."""
+        response = client.post(
+            "/api/v1/conference/search?fields=id,talk_title,similarity",
+            json=conference_search_payload,
+        )
+        assert response.status_code == 200
+        for result in response.json()["results"]:
+            assert set(result) == {"id", "talk_title", "similarity"}
+
+    def test_unknown_field_returns_422(self, client, conference_search_payload):
+        """Test unknown projection fields are rejected."""
+        response = client.post(
+            "/api/v1/conference/search?fields=id,embedding",
+            json=conference_search_payload,
+        )
+        assert response.status_code == 422
+
+    def test_ndjson_stream(self, client, conference_search_payload):
+        """Test Accept: application/x-ndjson streams meta then rows."""
+        response = client.post(
+            "/api/v1/conference/search",
+            json=conference_search_payload,
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert "meta" in lines[0]
+        assert len(lines) - 1 == lines[0]["meta"]["total_results"]
+
+
 class TestConferenceSearchValidation:
     """Tests for input validation on conference search endpoint."""
 
@@ -2,11 +2,14 @@
 
 Tests:
 - GET /health returns 200 with status "healthy"
-- GET /health/ready returns 200 with database connected
+- GET /health/ready returns 200 with database connected once warmed up
+- GET /health/stats reports cache, coalescing, pool, and replica counters
 """
 
 import pytest
 
+from src.api.warmup import get_warmup
+
 
 class TestHealthEndpoint:
     """Tests for the basic health check endpoint."""
@@ -33,6 +36,11 @@ class TestHealthEndpoint:
 class TestReadinessEndpoint:
     """Tests for the readiness probe endpoint."""
 
+    @pytest.fixture(autouse=True)
+    def warmed_up(self, client):
+        """Wait for the startup warm-up, which gates readiness."""
+        assert get_warmup().wait(timeout=120)
+
     def test_ready_returns_200_when_db_connected(self, client):
         """Test GET /health/ready returns 200 when database is connected."""
         response = client.get("/health/ready")
@@ -51,6 +59,36 @@ class TestReadinessEndpoint:
         assert data["database"] == "connected"
 
 
+class TestStatsEndpoint:
+    """Tests for the cache and coalescing stats endpoint."""
+
+    def test_stats_reports_counters(self, client, scripture_search_payload):
+        """Test GET /health/stats reports cache and single-flight counters."""
+        client.post("/api/v1/scriptures/search", json=scripture_search_payload)
+        response = client.get("/health/stats")
+        assert response.status_code == 200
+        data = response.json()
+        assert {"response_cache", "row_cache", "single_flight"} <= set(data)
+        assert "scriptures" in data["row_cache"]
+        flight = data["single_flight"]["search:scriptures"]
+        assert flight["leaders"] >= 1
+        assert flight["fan_in"] >= 1
+
+    def test_stats_reports_pool(self, client):
+        """Test GET /health/stats reports database pool usage."""
+        pool = client.get("/health/stats").json()["db_pool"]
+        assert pool["pool_size"] >= 1
+        assert pool["checked_out"] >= 0
+        assert pool["overflow"] <= pool["max_overflow"]
+
+    def test_stats_reports_replicas(self, client):
+        """Test GET /health/stats lists the read replicas (none by default)."""
+        replicas = client.get("/health/stats").json()["replicas"]
+        assert isinstance(replicas, list)
+        for replica in replicas:
+            assert {"name", "healthy", "failures", "checked_out"} <= set(replica)
+
+
 class TestRootEndpoint:
     """Tests for the root endpoint."""
 
@@ -0,0 +1,66 @@
+"""Tests for search result hydration and the row cache.
+
+Tests:
+- The row cache serves one corpus generation: a newer one clears it, an
+  older one bypasses it
+- Regenerated rows are hydrated fresh after a generation bump
+"""
+
+from sqlalchemy import text as sql_text
+
+from src.api.database import open_session
+from src.api.services.hydration import RowCache, get_row_cache, hydrate_rows
+from src.db.generations import bump_generation
+
+
+class TestRowCache:
+    """Tests for the generation-aware row cache."""
+
+    def test_serves_current_generation(self):
+        """Test rows put at a generation are served at that generation."""
+        cache = RowCache(10)
+        cache.put_many({1: {"id": 1}}, generation=3)
+        assert cache.get_many([1, 2], generation=3) == {1: {"id": 1}}
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_newer_generation_clears(self):
+        """Test a newer generation drops rows cached for the previous one."""
+        cache = RowCache(10)
+        cache.put_many({1: {"id": 1, "context_text": "old"}}, generation=3)
+        assert cache.get_many([1], generation=4) == {}
+        assert len(cache) == 0
+        assert cache.generation == 4
+
+    def test_older_generation_bypasses(self):
+        """Test a request on an older generation neither reads nor fills the cache."""
+        cache = RowCache(10)
+        cache.put_many({1: {"id": 1}}, generation=4)
+        cache.put_many({2: {"id": 2}}, generation=3)
+        assert cache.get_many([1, 2], generation=3) == {}
+        assert cache.get_many([1, 2], generation=4) == {1: {"id": 1}}
+
+
+class TestHydrateRows:
+    """Tests for hydration against the database."""
+
+    def test_generation_bump_hydrates_fresh_rows(self):
+        """Test a context_text rewrite is seen once the generation is bumped."""
+        session = open_session()
+        try:
+            row_id = session.execute(sql_text("SELECT id FROM scriptures LIMIT 1")).scalar()
+            hydrate_rows(session, "scriptures", [row_id])
+
+            session.execute(
+                sql_text("UPDATE scriptures SET context_text = 'regenerated' WHERE id = :id"),
+                {"id": row_id},
+            )
+            stale = hydrate_rows(session, "scriptures", [row_id])[row_id]
+            assert stale["context_text"] != "regenerated"
+
+            bump_generation(session, "scriptures")
+            fresh = hydrate_rows(session, "scriptures", [row_id])[row_id]
+            assert fresh["context_text"] == "regenerated"
+        finally:
+            session.rollback()
+            session.close()
+            get_row_cache("scriptures").clear()
@@ -0,0 +1,108 @@
+"""Tests for search metrics, the /metrics endpoint, and meta.timings.
+
+Tests:
+- Filter shapes name the filters a request set, never their values
+- Finished search requests are recorded in the Prometheus histograms
+- GET /metrics serves the search series
+- ?timings=true adds the per-stage breakdown to search meta
+"""
+
+from prometheus_client import REGISTRY
+
+from src.api.metrics import filter_shape, observe_request
+from src.api.schemas.cfm import CFMSearchRequest
+from src.api.schemas.scriptures import ScriptureBatchSearchRequest, ScriptureSearchRequest
+from src.api.timing import RequestTimings
+
+
+def _sample(name, labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestFilterShape:
+    """Tests for the filters label."""
+
+    def test_no_filters(self):
+        """Test a plain query has shape 'none'."""
+        assert filter_shape(ScriptureSearchRequest(query="faith in Christ")) == "none"
+
+    def test_sorted_filter_names(self):
+        """Test set filters are named in sorted order, without values."""
+        request = ScriptureSearchRequest(
+            query="faith in Christ", volume="bookofmormon", book="alma"
+        )
+        assert filter_shape(request) == "book+volume"
+
+    def test_batch_queries_are_not_filters(self):
+        """Test batch queries, language, and limit are not part of the shape."""
+        request = ScriptureBatchSearchRequest(
+            queries=["faith", "hope"], lang="es", limit=3
+        )
+        assert filter_shape(request) == "none"
+
+    def test_non_default_mode_counts(self):
+        """Test a non-default CFM result mode is part of the shape."""
+        request = CFMSearchRequest(query="prayer", result_mode="section", year=2024)
+        assert filter_shape(request) == "result_mode+year"
+
+
+class TestObserveRequest:
+    """Tests for recording finished requests."""
+
+    def test_records_request_and_spans(self):
+        """Test a successful search updates the counters and histograms."""
+        labels = {"corpus": "conference", "endpoint": "search", "filters": "speaker"}
+        before_requests = _sample(
+            "search_requests_total",
+            {"corpus": "conference", "endpoint": "search", "status": "200"},
+        )
+        before_embed = _sample(
+            "search_span_duration_seconds_count", {**labels, "span": "embed"}
+        )
+
+        timings = RequestTimings()
+        timings.labels = {**labels, "cached": "false"}
+        timings.status = 200
+        timings.add("embed", 40.0)
+        observe_request(timings)
+
+        assert _sample(
+            "search_requests_total",
+            {"corpus": "conference", "endpoint": "search", "status": "200"},
+        ) == before_requests + 1
+        assert _sample(
+            "search_span_duration_seconds_count", {**labels, "span": "embed"}
+        ) == before_embed + 1
+
+    def test_ignores_unlabeled_requests(self):
+        """Test requests that are not searches are not recorded."""
+        timings = RequestTimings()
+        timings.status = 200
+        observe_request(timings)
+
+
+class TestMetricsEndpoint:
+    """Integration tests for /metrics and meta.timings."""
+
+    def test_metrics_endpoint(self, client, scripture_search_payload):
+        """Test /metrics serves the search series after a search."""
+        client.post("/api/v1/scriptures/search", json=scripture_search_payload)
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert "search_request_duration_seconds" in response.text
+        assert 'corpus="scriptures"' in response.text
+
+    def test_timings_in_meta(self, client, scripture_search_payload):
+        """Test ?timings=true adds the per-stage breakdown."""
+        response = client.post(
+            "/api/v1/scriptures/search?timings=true", json=scripture_search_payload
+        )
+        assert response.status_code == 200
+        timings = response.json()["meta"]["timings"]
+        assert timings["total_ms"] >= timings["db_ms"] >= 0
+        assert "serialize_ms" in timings
+
+    def test_no_timings_by_default(self, client, scripture_search_payload):
+        """Test meta has no timings unless requested."""
+        response = client.post("/api/v1/scriptures/search", json=scripture_search_payload)
+        assert "timings" not in response.json()["meta"]
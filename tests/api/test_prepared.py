@@ -0,0 +1,69 @@
+"""Tests for server-side prepared search statements.
+
+Tests:
+- Named binds are rewritten to positional parameters, casts are kept
+- Statement names are stable per shape
+- Prepared execution returns the same rows as a plain statement and is
+  prepared once per connection
+"""
+
+from sqlalchemy import text as sql_text
+
+from src.api.database import open_session
+from src.api.services.prepared import PREPARED_KEY, execute_prepared, positional_sql
+
+
+class TestPositionalSql:
+    """Tests for rewriting named binds."""
+
+    def test_binds_numbered_in_order(self):
+        """Test binds become $n in order of first use, repeats share a number."""
+        name, sql, binds = positional_sql(
+            "SELECT id FROM t WHERE lang = :lang "
+            "ORDER BY e <=> CAST(:v AS vector), e <=> CAST(:v AS vector) LIMIT :limit"
+        )
+        assert sql == (
+            "SELECT id FROM t WHERE lang = $1 "
+            "ORDER BY e <=> CAST($2 AS vector), e <=> CAST($2 AS vector) LIMIT $3"
+        )
+        assert binds == ("lang", "v", "limit")
+        assert name.startswith("search_")
+
+    def test_casts_untouched(self):
+        """Test '::type' casts are not mistaken for binds."""
+        _, sql, binds = positional_sql("SELECT id::text FROM t WHERE lang = :lang")
+        assert sql == "SELECT id::text FROM t WHERE lang = $1"
+        assert binds == ("lang",)
+
+    def test_name_per_shape(self):
+        """Test names are stable per statement and ignore whitespace."""
+        first, _, _ = positional_sql("SELECT 1 WHERE lang = :lang")
+        again, _, _ = positional_sql("SELECT 1\n   WHERE lang = :lang")
+        other, _, _ = positional_sql("SELECT 2 WHERE lang = :lang")
+        assert first == again
+        assert first != other
+
+
+class TestExecutePrepared:
+    """Integration tests against the database."""
+
+    def test_matches_plain_execution(self):
+        """Test a prepared statement returns the plain statement's rows."""
+        sql = "SELECT id FROM scriptures WHERE lang = :lang ORDER BY id LIMIT :limit"
+        params = {"lang": "en", "limit": 5}
+        session = open_session()
+        try:
+            plain = session.execute(sql_text(sql), params).fetchall()
+            first = execute_prepared(session, sql, params).fetchall()
+            second = execute_prepared(session, sql, params).fetchall()
+            assert first == second == plain
+
+            name, _, _ = positional_sql(sql)
+            assert name in session.connection().info[PREPARED_KEY]
+            count = session.execute(
+                sql_text("SELECT count(*) FROM pg_prepared_statements WHERE name = :name"),
+                {"name": name},
+            ).scalar()
+            assert count == 1
+        finally:
+            session.close()
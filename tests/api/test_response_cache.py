@@ -0,0 +1,91 @@
+"""Unit tests for the search response cache.
+
+Tests:
+- Keys are stable under whitespace and parameter-order differences
+- Keys change with the corpus generation and request parameters
+- LocalCacheBackend evicts least recently used entries
+- ResponseCache round-trips results and counts hits and misses
+"""
+
+from src.api.services.cache_backends import LocalCacheBackend, NullCacheBackend
+from src.api.services.response_cache import ResponseCache
+
+
+PARAMS = {"query": "faith in Jesus Christ", "lang": "en", "limit": 5, "volume": None}
+
+
+class TestResponseCacheKeys:
+    """Tests for cache key construction."""
+
+    def test_key_ignores_whitespace_and_order(self):
+        """Test equivalent requests share a key."""
+        reordered = {"limit": 5, "volume": None, "lang": "en", "query": "  faith in\tJesus  Christ "}
+        assert ResponseCache.make_key("scriptures", 3, PARAMS) == ResponseCache.make_key(
+            "scriptures", 3, reordered
+        )
+
+    def test_key_changes_with_generation(self):
+        """Test bumping the generation produces a new key."""
+        assert ResponseCache.make_key("scriptures", 3, PARAMS) != ResponseCache.make_key(
+            "scriptures", 4, PARAMS
+        )
+
+    def test_key_changes_with_params_and_corpus(self):
+        """Test filters and corpus are part of the key."""
+        key = ResponseCache.make_key("scriptures", 1, PARAMS)
+        assert key != ResponseCache.make_key("scriptures", 1, {**PARAMS, "volume": "bookofmormon"})
+        assert key != ResponseCache.make_key("scriptures", 1, {**PARAMS, "query": "Faith in Jesus Christ"})
+        assert key != ResponseCache.make_key("cfm", 1, PARAMS)
+
+
+class TestLocalCacheBackend:
+    """Tests for the in-process LRU backend."""
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is evicted first."""
+        backend = LocalCacheBackend(maxsize=2)
+        backend.set("a", b"1")
+        backend.set("b", b"2")
+        assert backend.get("a") == b"1"
+        backend.set("c", b"3")
+        assert backend.get("b") is None
+        assert backend.get("a") == b"1"
+        assert len(backend) == 2
+
+    def test_zero_size_disables_storage(self):
+        """Test maxsize 0 stores nothing."""
+        backend = LocalCacheBackend(maxsize=0)
+        backend.set("a", b"1")
+        assert backend.get("a") is None
+
+
+class TestResponseCache:
+    """Tests for ResponseCache on top of a backend."""
+
+    def test_round_trip_and_counters(self):
+        """Test results round-trip and hits/misses are counted."""
+        cache = ResponseCache(LocalCacheBackend(maxsize=10))
+        results = [{"id": 1, "text": "Faith is...", "similarity": 0.91, "refs": ["Alma 32:21"]}]
+        key = cache.make_key("scriptures", 1, PARAMS)
+
+        assert cache.get(key) is None
+        cache.set(key, results)
+        assert cache.get(key) == results
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_null_backend_never_hits(self):
+        """Test the disabled backend always misses."""
+        cache = ResponseCache(NullCacheBackend())
+        key = cache.make_key("cfm", 1, PARAMS)
+        cache.set(key, [{"id": 1}])
+        assert cache.get(key) is None
+
+    def test_get_many(self):
+        """Test a multi-key read returns results in key order and counts each key."""
+        backend = LocalCacheBackend(maxsize=10)
+        cache = ResponseCache(backend)
+        keys = [cache.make_key("scriptures", 1, {**PARAMS, "query": q}) for q in "abc"]
+        cache.set(keys[1], [{"id": 2}])
+
+        assert cache.get_many(keys) == [None, [{"id": 2}], None]
+        assert (cache.hits, cache.misses) == (1, 2)
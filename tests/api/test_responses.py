@@ -0,0 +1,142 @@
+"""Unit tests for search response rendering.
+
+Tests:
+- Field projection parsing and validation
+- JSON rendering with and without projection
+- NDJSON streaming emits a meta line followed by one line per row
+- NDJSON is chosen by exact media type and q-value, not substring
+- Timing spans are added to meta only when requested
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.responses import (
+    NDJSON_MEDIA_TYPE,
+    batch_search_response,
+    parse_fields,
+    search_response,
+    wants_ndjson,
+)
+from src.api.timing import RequestTimings, _current
+
+ROWS = [
+    {"id": 1, "text": "And now as I said concerning faith", "context_text": "...", "similarity": 0.9},
+    {"id": 2, "text": "Faith is not to have a perfect knowledge", "context_text": "...", "similarity": 0.8},
+]
+META = {"query": "faith", "total_results": 2, "search_time_ms": 1.5, "cached": False}
+
+
+def _body(response) -> bytes:
+    """Collect the body of a (possibly streaming) response."""
+    if hasattr(response, "body_iterator"):
+        async def collect():
+            return b"".join([chunk async for chunk in response.body_iterator])
+        return asyncio.run(collect())
+    return response.body
+
+
+class TestParseFields:
+    """Tests for the fields query parameter."""
+
+    def test_none_returns_all_fields(self):
+        """Test a missing projection selects every field."""
+        assert parse_fields(None, ROWS[0]) is None
+        assert parse_fields(" , ", ROWS[0]) is None
+
+    def test_parses_and_deduplicates(self):
+        """Test fields are trimmed and deduplicated in order."""
+        assert parse_fields("text, id,text", ROWS[0]) == ["text", "id"]
+
+    def test_unknown_field_returns_422(self):
+        """Test unknown fields are rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            parse_fields("id,embedding", ROWS[0])
+        assert exc_info.value.status_code == 422
+
+
+class TestWantsNdjson:
+    """Tests for Accept header negotiation."""
+
+    @pytest.mark.parametrize(
+        "accept",
+        [
+            "application/x-ndjson",
+            "Application/X-NDJSON",
+            "application/json;q=0.5, application/x-ndjson",
+            "application/x-ndjson, */*;q=0.1",
+            "application/x-ndjson;q=0.8, text/html",
+        ],
+    )
+    def test_selects_ndjson(self, accept):
+        """Test NDJSON listed at least as high as JSON selects streaming."""
+        assert wants_ndjson(accept)
+
+    @pytest.mark.parametrize(
+        "accept",
+        [
+            None,
+            "application/json",
+            "application/x-ndjson;q=0",
+            "application/x-ndjson-seq",
+            "application/x-ndjson;q=0.5, application/json",
+            "application/x-ndjson;q=0.5, */*",
+            "application/x-ndjson;q=oops",
+        ],
+    )
+    def test_selects_json(self, accept):
+        """Test refused, lower-ranked, or merely similar types keep JSON."""
+        assert not wants_ndjson(accept)
+
+
+class TestSearchResponse:
+    """Tests for JSON and NDJSON search responses."""
+
+    def test_json_response(self):
+        """Test the default response is JSON with results and meta."""
+        response = search_response(ROWS, META)
+        data = json.loads(_body(response))
+        assert data == {"results": ROWS, "meta": META}
+
+    def test_projection_drops_fields(self):
+        """Test projection keeps only the requested fields."""
+        response = search_response(ROWS, META, fields=["id", "similarity"])
+        data = json.loads(_body(response))
+        assert data["results"] == [{"id": 1, "similarity": 0.9}, {"id": 2, "similarity": 0.8}]
+
+    def test_ndjson_response(self):
+        """Test NDJSON emits meta first, then one line per row."""
+        response = search_response(ROWS, META, fields=["id"], accept=NDJSON_MEDIA_TYPE)
+        assert response.media_type == NDJSON_MEDIA_TYPE
+        lines = [json.loads(line) for line in _body(response).splitlines()]
+        assert lines == [{"meta": META}, {"id": 1}, {"id": 2}]
+
+    def test_timings_in_meta(self):
+        """Test timings=true adds the spans, including result serialization."""
+        token = _current.set(RequestTimings())
+        try:
+            response = search_response(ROWS, META, timings=True)
+        finally:
+            _current.reset(token)
+        meta = json.loads(_body(response))["meta"]
+        assert meta["timings"]["serialize_ms"] >= 0
+        assert meta["timings"]["total_ms"] >= meta["timings"]["serialize_ms"]
+
+    def test_timings_not_requested(self):
+        """Test meta is unchanged without timings=true."""
+        token = _current.set(RequestTimings())
+        try:
+            response = search_response(ROWS, META)
+        finally:
+            _current.reset(token)
+        assert json.loads(_body(response))["meta"] == META
+
+    def test_batch_ndjson_emits_line_per_query(self):
+        """Test batch NDJSON emits one line per query."""
+        items = [{"query": "faith", "results": ROWS, "cached": True}]
+        response = batch_search_response(items, {"total_queries": 1}, ["id"], NDJSON_MEDIA_TYPE)
+        lines = [json.loads(line) for line in _body(response).splitlines()]
+        assert lines[1] == {"query": "faith", "results": [{"id": 1}, {"id": 2}], "cached": True}
@@ -7,10 +7,17 @@ Tests:
 - Limit constraint works
 - Response structure matches schema
 - Response times under 500ms
+- Repeated searches are served from the response cache
+- Batch search returns per-query results in request order
+- Reference lookup returns verses with caching headers, and its ETag
+  changes with the corpus generation
 """
 
 import pytest
 
+from src.db import get_session
+from src.db.generations import bump_generation
+
 
 class TestScriptureSearchBasic:
     """Basic tests for the scripture search endpoint."""
@@ -191,6 +198,75 @@ class TestScriptureSearchPerformance:
         )
 
 
+class TestScriptureSearchCache:
+    """Tests for the search response cache."""
+
+    def test_repeated_search_is_cached(self, client):
+        """Test an identical repeated search is served from the cache."""
+        payload = {"query": "the  love of God ", "lang": "en", "limit": 3}
+        first = client.post("/api/v1/scriptures/search", json=payload)
+        second = client.post(
+            "/api/v1/scriptures/search",
+            json={**payload, "query": "the love of God"},
+        )
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert second.json()["meta"]["cached"] is True
+        assert second.json()["results"] == first.json()["results"]
+
+
+class TestScriptureBatchSearch:
+    """Tests for the scripture batch search endpoint."""
+
+    def test_batch_returns_results_per_query(self, client):
+        """Test each query gets its own result list, in request order."""
+        queries = ["faith in Jesus Christ", "the power of prayer", "charity never faileth"]
+        response = client.post(
+            "/api/v1/scriptures/search/batch",
+            json={"queries": queries, "lang": "en", "limit": 3},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["query"] for item in data["results"]] == queries
+        assert all(0 < len(item["results"]) <= 3 for item in data["results"])
+        assert data["meta"]["total_queries"] == 3
+
+    def test_batch_matches_single_search(self, client):
+        """Test batch results match the single-query endpoint."""
+        payload = {"lang": "en", "limit": 5, "volume": "bookofmormon"}
+        single = client.post(
+            "/api/v1/scriptures/search",
+            json={**payload, "query": "faith in Jesus Christ"},
+        )
+        batch = client.post(
+            "/api/v1/scriptures/search/batch",
+            json={**payload, "queries": ["faith in Jesus Christ"]},
+        )
+        assert batch.json()["results"][0]["results"] == single.json()["results"]
+
+    def test_batch_filters_apply_to_every_query(self, client):
+        """Test shared filters apply to all queries."""
+        response = client.post(
+            "/api/v1/scriptures/search/batch",
+            json={
+                "queries": ["repentance", "baptism by water"],
+                "lang": "en",
+                "limit": 5,
+                "volume": "newtestament",
+            },
+        )
+        for item in response.json()["results"]:
+            assert all(r["volume"] == "newtestament" for r in item["results"])
+
+    def test_empty_batch_returns_422(self, client):
+        """Test a batch with no queries is rejected."""
+        response = client.post(
+            "/api/v1/scriptures/search/batch",
+            json={"queries": [], "lang": "en"},
+        )
+        assert response.status_code == 422
+
+
 class TestScriptureSearchValidation:
     """Tests for input validation on scripture search endpoint."""
 
@@ -234,3 +310,72 @@ class TestScriptureSearchValidation:
         }
         response = client.post("/api/v1/scriptures/search", json=payload)
         assert response.status_code == 422
+
+
+class TestScriptureLookup:
+    """Tests for the scripture reference lookup endpoint."""
+
+    def test_lookup_single_verse(self, client):
+        """Test GET /api/v1/scriptures/lookup returns the requested verse."""
+        response = client.get("/api/v1/scriptures/lookup", params={"ref": "Alma 32:21"})
+        assert response.status_code == 200
+        data = response.json()
+        passage = data["passages"][0]
+        assert passage["book"] == "alma"
+        assert passage["chapter"] == 32
+        assert [v["verse"] for v in passage["verses"]] == [21]
+        assert data["meta"]["total_verses"] == 1
+
+    def test_lookup_range_and_whole_chapter(self, client):
+        """Test verse ranges and whole chapters in one request."""
+        response = client.get(
+            "/api/v1/scriptures/lookup",
+            params=[("ref", "Alma 32:21-23"), ("ref", "D&C 121")],
+        )
+        data = response.json()
+        assert [v["verse"] for v in data["passages"][0]["verses"]] == [21, 22, 23]
+        assert len(data["passages"][1]["verses"]) > 40
+
+    def test_lookup_both_languages(self, client):
+        """Test each reference is returned in every requested language."""
+        response = client.get(
+            "/api/v1/scriptures/lookup",
+            params=[("ref", "1 Nephi 3:7"), ("lang", "en"), ("lang", "es")],
+        )
+        data = response.json()
+        assert [p["lang"] for p in data["passages"]] == ["en", "es"]
+        assert data["passages"][1]["reference"] == "1 Nefi 3:7"
+        assert all(len(p["verses"]) == 1 for p in data["passages"])
+
+    def test_lookup_sets_caching_headers(self, client):
+        """Test responses carry Cache-Control and ETag, and honor If-None-Match."""
+        response = client.get("/api/v1/scriptures/lookup", params={"ref": "Moroni 10:4"})
+        assert "max-age" in response.headers["cache-control"]
+        etag = response.headers["etag"]
+
+        cached = client.get(
+            "/api/v1/scriptures/lookup",
+            params={"ref": "Moroni 10:4"},
+            headers={"If-None-Match": etag},
+        )
+        assert cached.status_code == 304
+
+    def test_lookup_etag_changes_with_generation(self, client):
+        """Test re-ingesting the corpus (a generation bump) changes the ETag."""
+        params = {"ref": "Moroni 10:4"}
+        etag = client.get("/api/v1/scriptures/lookup", params=params).headers["etag"]
+
+        with get_session() as session:
+            bump_generation(session, "scriptures")
+            session.commit()
+
+        response = client.get(
+            "/api/v1/scriptures/lookup", params=params, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_lookup_unrecognized_reference_returns_422(self, client):
+        """Test an unparseable reference returns 422."""
+        response = client.get("/api/v1/scriptures/lookup", params={"ref": "Topical Guide"})
+        assert response.status_code == 422
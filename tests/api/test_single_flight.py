@@ -0,0 +1,92 @@
+"""Unit tests for in-process request coalescing.
+
+Tests:
+- Concurrent identical calls execute once and share the result
+- Exceptions are shared with every waiting caller
+- Different keys and sequential calls are not coalesced
+- Fan-in stats reflect leaders and followers
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.api.services.single_flight import SingleFlight
+
+
+def _run_concurrently(flight, key, fn, count):
+    """Call flight.do from count threads started together; return outcomes."""
+    outcomes = []
+    barrier = threading.Barrier(count)
+
+    def worker():
+        barrier.wait()
+        try:
+            outcomes.append(flight.do(key, fn))
+        except Exception as e:
+            outcomes.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test N concurrent identical calls run fn once."""
+        flight = SingleFlight("test")
+        calls = []
+
+        def fn():
+            calls.append(1)
+            time.sleep(0.1)
+            return ["result"]
+
+        outcomes = _run_concurrently(flight, "k", fn, 10)
+
+        assert len(calls) == 1
+        assert [value for value, _ in outcomes] == [["result"]] * 10
+        assert sum(shared for _, shared in outcomes) == 9
+        assert flight.stats() == {"leaders": 1, "followers": 9, "in_flight": 0, "fan_in": 10.0}
+
+    def test_exception_is_shared(self):
+        """Test followers receive the leader's exception."""
+        flight = SingleFlight("test")
+
+        def fn():
+            time.sleep(0.1)
+            raise RuntimeError("embedding service down")
+
+        outcomes = _run_concurrently(flight, "k", fn, 4)
+        assert all(isinstance(o, RuntimeError) for o in outcomes)
+
+    def test_sequential_calls_are_not_coalesced(self):
+        """Test a finished call is not reused by later callers."""
+        flight = SingleFlight("test")
+        assert flight.do("k", lambda: 1) == (1, False)
+        assert flight.do("k", lambda: 2) == (2, False)
+        assert flight.fan_in == 1.0
+
+    def test_different_keys_run_independently(self):
+        """Test calls with different keys do not wait on each other."""
+        flight = SingleFlight("test")
+        assert flight.do("a", lambda: "a") == ("a", False)
+        assert flight.do("b", lambda: "b") == ("b", False)
+        assert flight.leaders == 2
+
+    def test_failed_call_releases_key(self):
+        """Test a failed call does not block the next one."""
+        flight = SingleFlight("test")
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            flight.do("k", fail)
+        assert flight.do("k", lambda: "ok") == ("ok", False)
@@ -0,0 +1,210 @@
+"""Tests for slow vector search capture and the admin endpoint.
+
+Tests:
+- EXPLAIN plans are summarized into scan nodes and ANN index use
+- Query vectors are elided from captured parameters
+- The ring buffer keeps the newest captures and budgets EXPLAIN runs
+- A statement that ran prepared is explained through its EXECUTE
+- Statements outside a request are never captured
+- /admin endpoints are disabled without a token and reject a wrong one
+"""
+
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+from src.api.services.prepared import PREPARED_KEY, positional_sql
+from src.api.services.slow_queries import (
+    CapturedQuery,
+    SlowQueryLog,
+    capture_dict,
+    capture_query,
+    explain,
+    sanitize_params,
+    summarize_plan,
+)
+
+INDEX_PLAN = [{
+    "Plan": {
+        "Node Type": "Limit",
+        "Plans": [{
+            "Node Type": "Index Scan",
+            "Relation Name": "scriptures",
+            "Index Name": "idx_scriptures_embedding_en",
+            "Order By": "(embedding_en <=> '[0.1,0.2]'::vector)",
+        }],
+    },
+    "Execution Time": 4.2,
+}]
+
+SEQ_PLAN = [{
+    "Plan": {
+        "Node Type": "Limit",
+        "Plans": [{
+            "Node Type": "Sort",
+            "Plans": [{
+                "Node Type": "Bitmap Heap Scan",
+                "Relation Name": "scriptures",
+                "Plans": [{
+                    "Node Type": "Bitmap Index Scan",
+                    "Index Name": "idx_scriptures_book",
+                }],
+            }],
+        }],
+    },
+    "Execution Time": 180.5,
+}]
+
+
+def _entry(table="scriptures", sql="SELECT 1"):
+    return CapturedQuery(
+        captured_at="2026-01-01T00:00:00.000+00:00",
+        reason="slow",
+        table=table,
+        duration_ms=300.0,
+        sql=sql,
+        params={},
+    )
+
+
+class TestSummarizePlan:
+    """Tests for reading EXPLAIN (FORMAT JSON) output."""
+
+    def test_ann_index_scan(self):
+        """Test an index scan ordered by <=> counts as ANN index use."""
+        index_used, scans, execution_ms = summarize_plan(INDEX_PLAN)
+        assert index_used is True
+        assert scans == ["Index Scan on scriptures using idx_scriptures_embedding_en"]
+        assert execution_ms == 4.2
+
+    def test_filter_index_is_not_ann(self):
+        """Test a filtered heap scan sorted in memory is not ANN index use."""
+        index_used, scans, execution_ms = summarize_plan(SEQ_PLAN)
+        assert index_used is False
+        assert scans == ["Bitmap Heap Scan on scriptures"]
+        assert execution_ms == 180.5
+
+
+class TestSanitizeParams:
+    """Tests for eliding query vectors."""
+
+    def test_vectors_elided(self):
+        """Test single and batch query vectors are replaced by their size."""
+        params = {
+            "query_embedding": "[0.1,0.2,0.3]",
+            "query_embedding_1": "[0.1,0.2]",
+            "book": "alma",
+            "limit": 10,
+        }
+        assert sanitize_params(params) == {
+            "query_embedding": "<vector(3)>",
+            "query_embedding_1": "<vector(2)>",
+            "book": "alma",
+            "limit": 10,
+        }
+
+
+class TestSlowQueryLog:
+    """Tests for the capture ring buffer."""
+
+    def test_keeps_newest(self):
+        """Test the oldest captures are dropped and entries are newest first."""
+        log = SlowQueryLog(size=2)
+        for sql in ("SELECT 1", "SELECT 2", "SELECT 3"):
+            log.add(_entry(sql=sql))
+        assert [e.sql for e in log.entries()] == ["SELECT 3", "SELECT 2"]
+        assert log.captured == 3
+
+    def test_table_filter(self):
+        """Test entries can be limited to one table."""
+        log = SlowQueryLog()
+        log.add(_entry(table="scriptures"))
+        log.add(_entry(table="conference_paragraphs"))
+        assert [e.table for e in log.entries("scriptures")] == ["scriptures"]
+
+    def test_explain_budget(self):
+        """Test EXPLAIN runs are limited per minute."""
+        log = SlowQueryLog(explains_per_minute=2)
+        assert log.allow_explain(now=0.0)
+        assert log.allow_explain(now=1.0)
+        assert not log.allow_explain(now=2.0)
+        assert log.allow_explain(now=60.5)
+
+    def test_clear(self):
+        """Test clearing reports the number of dropped captures."""
+        log = SlowQueryLog()
+        log.add(_entry())
+        assert log.clear() == 1
+        assert log.entries() == []
+
+    def test_capture_dict_without_plan(self):
+        """Test plans can be left out of serialized captures."""
+        entry = _entry()
+        entry.plan = INDEX_PLAN
+        assert "plan" not in capture_dict(entry, include_plan=False)
+        assert capture_dict(entry)["plan"] == INDEX_PLAN
+
+
+class ExplainSession:
+    """Session stand-in recording executed SQL and returning INDEX_PLAN."""
+
+    def __init__(self, prepared=()):
+        self.info = {PREPARED_KEY: dict.fromkeys(prepared)}
+        self.executed: list[str] = []
+
+    def connection(self):
+        return SimpleNamespace(info=self.info)
+
+    def begin_nested(self):
+        return nullcontext()
+
+    def execute(self, statement, params=None):
+        self.executed.append(str(statement))
+        return SimpleNamespace(scalar=lambda: INDEX_PLAN)
+
+
+class TestExplain:
+    """Tests for which form of a statement is explained."""
+
+    SQL = "SELECT id FROM scriptures WHERE lang = :lang LIMIT :limit"
+
+    def test_prepared_statement_explains_execute(self):
+        """Test a prepared statement is explained through EXECUTE."""
+        name, _, _ = positional_sql(self.SQL)
+        session = ExplainSession(prepared=[name])
+        plan, form = explain(session, self.SQL, {"lang": "en", "limit": 5})
+
+        assert plan == INDEX_PLAN
+        assert form == "prepared"
+        assert session.executed == [
+            f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) EXECUTE {name}(:lang, :limit)"
+        ]
+
+    def test_unprepared_statement_explains_sql(self):
+        """Test a statement not prepared on the connection is explained as is."""
+        session = ExplainSession()
+        _, form = explain(session, self.SQL, {"lang": "en", "limit": 5})
+
+        assert form == "statement"
+        assert session.executed == [f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {self.SQL}"]
+
+
+class TestCaptureQuery:
+    """Tests for the capture hook."""
+
+    def test_outside_request(self):
+        """Test statements run outside an API request are not captured."""
+        assert capture_query(None, "scriptures", "SELECT 1", {}, 10_000.0) is None
+
+
+class TestAdminEndpoint:
+    """Integration tests for /admin/slow-queries."""
+
+    def test_disabled_without_token(self, client):
+        """Test admin endpoints are hidden when ADMIN_TOKEN is unset."""
+        response = client.get("/admin/slow-queries")
+        assert response.status_code in (403, 404)
+
+    def test_rejects_wrong_token(self, client):
+        """Test a wrong admin token is rejected."""
+        response = client.get("/admin/slow-queries", headers={"X-Admin-Token": "wrong"})
+        assert response.status_code in (403, 404)
@@ -0,0 +1,139 @@
+"""Unit tests for per-request timing spans and the Server-Timing header.
+
+Tests:
+- Spans accumulate and render in a fixed order, followed by total
+- Nested spans can be excluded so spans stay exclusive
+- Recording outside a request is a no-op
+- The middleware exposes a collector to the app, adds the header, and
+  passes finished requests to observers
+"""
+
+import asyncio
+
+from src.api.timing import (
+    RequestTimings,
+    TimingMiddleware,
+    _current,
+    current_timings,
+    record,
+    set_labels,
+    timed,
+)
+
+
+class TestRequestTimings:
+    """Tests for the per-request collector."""
+
+    def test_header_order_and_total(self):
+        """Test known phases come first, in order, then extras, then total."""
+        timings = RequestTimings()
+        timings.add("embed", 40.0)
+        timings.add("db", 1.5)
+        timings.add("db", 2.0)
+        timings.add("hydrate", 0.25)
+        header = timings.header()
+        names = [part.split(";")[0] for part in header.split(", ")]
+        assert names == ["embed", "db", "hydrate", "total"]
+        assert "db;dur=3.50" in header
+        assert timings.counts["db"] == 2
+
+    def test_spans_include_every_stage(self):
+        """Test spans() reports every stage in milliseconds, zero if unused."""
+        timings = RequestTimings()
+        timings.add("embed", 12.5)
+        spans = timings.spans()
+        assert spans["embed_ms"] == 12.5
+        assert spans["pool_wait_ms"] == 0.0
+        assert set(spans) == {
+            "queue_ms", "pool_wait_ms", "embed_ms", "db_ms",
+            "hydrate_ms", "serialize_ms", "total_ms",
+        }
+
+    def test_no_request_is_noop(self):
+        """Test recording without a current request does nothing."""
+        assert current_timings() is None
+        record("db", 1.0)
+        with timed("embed"):
+            pass
+        assert current_timings() is None
+
+
+class TestExclusiveSpans:
+    """Tests for spans that exclude nested spans."""
+
+    def test_excluded_time_is_subtracted(self):
+        """Test db time recorded inside hydrate is not counted twice."""
+        timings = RequestTimings()
+        token = _current.set(timings)
+        try:
+            with timed("hydrate", exclude=("db",)):
+                record("db", 1000.0)
+        finally:
+            _current.reset(token)
+        assert timings.durations["db"] == 1000.0
+        # The block itself took well under a second, so hydrate nets to <= 0
+        assert timings.durations["hydrate"] < 0
+
+
+class TestTimingMiddleware:
+    """Tests for the ASGI middleware."""
+
+    def test_adds_server_timing_header(self):
+        """Test phases recorded by the app appear in the response header."""
+
+        async def app(scope, receive, send):
+            record("db", 2.0)
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"{}"})
+
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        async def receive():
+            return {"type": "http.request"}
+
+        asyncio.run(TimingMiddleware(app, server_timing=True)({"type": "http"}, receive, send))
+
+        headers = dict(messages[0]["headers"])
+        assert headers[b"server-timing"].startswith(b"db;dur=2.00, total;dur=")
+        assert messages[1]["body"] == b"{}"
+        assert current_timings() is None
+
+    def test_header_off_by_default(self):
+        """Test no Server-Timing header is added unless enabled."""
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        asyncio.run(TimingMiddleware(app)({"type": "http"}, None, send))
+        assert messages[0]["headers"] == []
+
+    def test_observers_receive_finished_request(self):
+        """Test observers get the labels, spans, and status of the request."""
+
+        async def app(scope, receive, send):
+            set_labels(corpus="cfm")
+            record("embed", 5.0)
+            await send({"type": "http.response.start", "status": 503, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        observed = []
+
+        async def send(message):
+            pass
+
+        middleware = TimingMiddleware(app, observers=[observed.append])
+        asyncio.run(middleware({"type": "http"}, None, send))
+
+        assert len(observed) == 1
+        assert observed[0].labels == {"corpus": "cfm"}
+        assert observed[0].durations == {"embed": 5.0}
+        assert observed[0].status == 503
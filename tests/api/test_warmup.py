@@ -0,0 +1,82 @@
+"""Tests for the startup warm-up and the readiness gate.
+
+Tests:
+- Steps run in order, failures are recorded without stopping the rest
+- Skipped and finished warm-ups count as finished
+- Warm-up query files skip blanks, comments, and duplicates
+- /health/ready returns 503 while warm-up is running
+"""
+
+from src.api.routers import health
+from src.api.warmup import Warmup, read_queries
+
+
+class TestWarmup:
+    """Tests for warm-up progress."""
+
+    def test_runs_steps_and_records_failures(self):
+        """Test a failing step is recorded and later steps still run."""
+        ran = []
+
+        def failing():
+            ran.append("prewarm")
+            raise RuntimeError('extension "pg_prewarm" is not installed')
+
+        warmup = Warmup()
+        warmup.run({
+            "connections": lambda: ran.append("connections") or {"connections": 4},
+            "prewarm": failing,
+            "search": lambda: ran.append("search"),
+        })
+
+        assert ran == ["connections", "prewarm", "search"]
+        assert warmup.finished
+        assert warmup.status == "done"
+        assert warmup.steps["connections"]["status"] == "ok"
+        assert warmup.steps["connections"]["detail"] == {"connections": 4}
+        assert warmup.steps["prewarm"]["status"] == "failed"
+        assert "pg_prewarm" in warmup.steps["prewarm"]["detail"]
+        assert warmup.as_dict()["elapsed_ms"] >= 0
+
+    def test_pending_until_run(self):
+        """Test a new warm-up is not finished."""
+        warmup = Warmup()
+        assert not warmup.finished
+        assert not warmup.wait(timeout=0)
+        assert warmup.as_dict() == {"status": "pending", "elapsed_ms": None, "steps": {}}
+
+    def test_skip(self):
+        """Test a skipped warm-up counts as finished."""
+        warmup = Warmup()
+        warmup.skip()
+        assert warmup.finished
+        assert warmup.status == "skipped"
+
+
+class TestReadQueries:
+    """Tests for the warm-up query file."""
+
+    def test_skips_blanks_comments_and_duplicates(self, tmp_path):
+        """Test queries are stripped and deduplicated in order."""
+        path = tmp_path / "queries.txt"
+        path.write_text(
+            "# popular queries\nfaith\n\n  prayer  \nfaith\nfe en Jesucristo\n",
+            encoding="utf-8",
+        )
+        assert read_queries(str(path)) == ["faith", "prayer", "fe en Jesucristo"]
+
+
+class TestReadinessGate:
+    """Integration tests for /health/ready during warm-up."""
+
+    def test_not_ready_while_warming_up(self, client, monkeypatch):
+        """Test readiness fails with the warm-up progress until it finishes."""
+        warmup = Warmup()
+        monkeypatch.setattr(health, "get_warmup", lambda: warmup)
+
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json()["detail"]["status"] == "warming up"
+
+        warmup.skip()
+        assert client.get("/health/ready").status_code == 200
@@ -0,0 +1,85 @@
+"""Unit tests for the golden query sets.
+
+Tests:
+- Every published golden set loads and every expected reference parses
+- English and Spanish sets share query IDs
+- Verse-level relevance for scriptures and chapter-level relevance for
+  corpora judged by their cited scripture references
+"""
+
+import pytest
+
+from src.benchmarks.golden import GOLDEN_DIR, is_relevant, load_golden_set
+from src.references import parse_reference
+
+GOLDEN_SETS = sorted(path.stem for path in (GOLDEN_DIR / "v1").glob("*.json"))
+
+
+class TestGoldenSets:
+    """Tests for the published v1 golden sets."""
+
+    def test_every_corpus_and_language_present(self):
+        """Test there is a golden set per corpus and language."""
+        assert GOLDEN_SETS == [
+            f"{corpus}_{lang}"
+            for corpus in ("cfm", "conference", "scriptures")
+            for lang in ("en", "es")
+        ]
+
+    @pytest.mark.parametrize("name", GOLDEN_SETS)
+    def test_loads_and_parses(self, name):
+        """Test each set loads with every expected reference parsed."""
+        corpus, lang = name.rsplit("_", 1)
+        golden = load_golden_set(corpus, lang)
+        assert (golden.version, golden.corpus, golden.lang) == ("v1", corpus, lang)
+        assert golden.queries
+        assert len({query.id for query in golden.queries}) == len(golden.queries)
+        for query in golden.queries:
+            assert query.query.strip()
+            assert len(query.expected_refs) >= len(query.expected)
+
+    @pytest.mark.parametrize("corpus", ["scriptures", "cfm", "conference"])
+    def test_languages_share_query_ids(self, corpus):
+        """Test English and Spanish sets cover the same queries."""
+        en = [query.id for query in load_golden_set(corpus, "en").queries]
+        es = [query.id for query in load_golden_set(corpus, "es").queries]
+        assert en == es
+
+    def test_unknown_version(self):
+        """Test a missing version raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_golden_set("scriptures", "en", version="v0")
+
+
+class TestRelevance:
+    """Tests for judging search hits against expected references."""
+
+    def test_verse_in_range(self):
+        """Test a verse inside an expected range is relevant."""
+        expected = parse_reference("Alma 32:21-23")
+        hit = {"book": "alma", "chapter": 32, "verse": 22}
+        assert is_relevant("scriptures", hit, expected)
+
+    def test_verse_outside_range(self):
+        """Test a neighboring verse outside the range is not relevant."""
+        expected = parse_reference("Alma 32:21-23")
+        hit = {"book": "alma", "chapter": 32, "verse": 24}
+        assert not is_relevant("scriptures", hit, expected)
+
+    def test_whole_chapter(self):
+        """Test any verse of an expected whole chapter is relevant."""
+        expected = parse_reference("Moroni 10")
+        hit = {"book": "moroni", "chapter": 10, "verse": 4}
+        assert is_relevant("scriptures", hit, expected)
+
+    def test_cited_chapter(self):
+        """Test a paragraph citing a verse of an expected chapter is relevant."""
+        expected = parse_reference("Alma 32")
+        hit = {"scripture_refs": ["Hebrews 11:1", "Alma 32:27"]}
+        assert is_relevant("conference", hit, expected)
+
+    def test_no_citations(self):
+        """Test a hit without scripture_refs is not relevant."""
+        expected = parse_reference("Alma 32")
+        assert not is_relevant("cfm", {"scripture_refs": None}, expected)
+        assert not is_relevant("cfm", {"scripture_refs": ["Mosiah 2:17"]}, expected)
@@ -0,0 +1,138 @@
+"""Unit tests for the load generator and the fake embedding server.
+
+Tests:
+- Parsing of corpus mixes, concurrency stages, and Server-Timing headers
+- Query mixes draw from the golden sets and bust caches on request
+- Stage summaries split latency by phase, and plateau detection
+- Fake Azure responses in float and base64 encodings
+"""
+
+import argparse
+import base64
+import random
+import struct
+
+import pytest
+
+from src.benchmarks.fake_embeddings import FakeEmbedder, embedding_response
+from src.benchmarks.load import (
+    QueryMix,
+    Sample,
+    find_plateau,
+    parse_mix,
+    parse_server_timing,
+    parse_stages,
+    summarize_stage,
+)
+
+
+class TestParsing:
+    """Tests for command-line and header parsing."""
+
+    def test_mix_is_normalized(self):
+        """Test weights are normalized to sum to 1."""
+        assert parse_mix("scriptures=6,cfm=2,conference=2") == {
+            "scriptures": 0.6, "cfm": 0.2, "conference": 0.2,
+        }
+
+    def test_mix_rejects_unknown_corpus(self):
+        """Test an unknown corpus is a usage error."""
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_mix("talks=1")
+
+    def test_stages(self):
+        """Test stages parse in order and must be positive."""
+        assert parse_stages("1,4,16") == [1, 4, 16]
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_stages("0,4")
+
+    def test_server_timing(self):
+        """Test durations are read per metric, ignoring other parameters."""
+        header = 'pool_wait;dur=0.50, db;dur=3.25;desc="SQL", embed;dur=41.00, total;dur=47.10'
+        assert parse_server_timing(header) == {
+            "pool_wait": 0.5, "db": 3.25, "embed": 41.0, "total": 47.1,
+        }
+
+    def test_missing_server_timing(self):
+        """Test a response without the header gives no timings."""
+        assert parse_server_timing(None) == {}
+
+
+class TestQueryMix:
+    """Tests for request generation."""
+
+    def test_requests_follow_mix(self):
+        """Test only weighted corpora are requested, with golden queries."""
+        mix = QueryMix({"cfm": 1.0}, ["es"], limit=5)
+        corpus, path, payload = mix.next(random.Random(1))
+        assert (corpus, path) == ("cfm", "/api/v1/cfm/search")
+        assert payload["lang"] == "es"
+        assert payload["limit"] == 5
+        assert payload["query"] in mix.queries[("cfm", "es")]
+
+    def test_miss_rate_makes_queries_unique(self):
+        """Test a miss rate of 1 never repeats a golden query verbatim."""
+        mix = QueryMix({"scriptures": 1.0}, ["en"], miss_rate=1.0)
+        rng = random.Random(2)
+        for _ in range(10):
+            _, _, payload = mix.next(rng)
+            assert payload["query"] not in mix.queries[("scriptures", "en")]
+
+
+class TestSummaries:
+    """Tests for stage summaries and saturation detection."""
+
+    def test_phase_breakdown(self):
+        """Test phases average over timed requests and 'other' is the remainder."""
+        timings = {"queue": 1.0, "pool_wait": 2.0, "db": 3.0, "embed": 10.0, "total": 20.0}
+        samples = [
+            Sample("scriptures", 200, 21.0, timings, cached=False),
+            Sample("scriptures", 200, 21.0, timings, cached=True),
+            Sample("cfm", 500, 5.0),
+        ]
+        summary = summarize_stage(samples, elapsed=1.0)
+        assert summary["requests"] == 3
+        assert summary["rps"] == 2.0
+        assert summary["error_rate"] == pytest.approx(1 / 3, abs=1e-4)
+        assert summary["statuses"] == {"200": 2, "500": 1}
+        assert summary["cache_hit_rate"] == 0.5
+        assert summary["phases_ms"] == {
+            "queue": 1.0, "pool_wait": 2.0, "embed": 10.0, "db": 3.0,
+            "hydrate": 0.0, "serialize": 0.0, "other": 4.0,
+        }
+
+    def test_plateau(self):
+        """Test the plateau is the best stage before throughput stops growing."""
+        stages = [
+            {"concurrency": 1, "rps": 20.0},
+            {"concurrency": 2, "rps": 39.0},
+            {"concurrency": 4, "rps": 40.0},
+            {"concurrency": 8, "rps": 38.0},
+        ]
+        assert find_plateau(stages)["concurrency"] == 2
+
+    def test_still_scaling(self):
+        """Test no plateau while every stage adds throughput."""
+        stages = [{"concurrency": 1, "rps": 10.0}, {"concurrency": 2, "rps": 19.0}]
+        assert find_plateau(stages) is None
+
+
+class TestFakeEmbeddings:
+    """Tests for the fake Azure embeddings response."""
+
+    def test_float_response(self):
+        """Test vectors have the requested dimensions and are deterministic."""
+        embedder = FakeEmbedder(1536)
+        body = embedding_response(embedder, ["faith", "hope"], "text-embedding-3-small")
+        assert [item["index"] for item in body["data"]] == [0, 1]
+        assert len(body["data"][0]["embedding"]) == 1536
+        again = embedding_response(embedder, ["faith"], "text-embedding-3-small")
+        assert again["data"][0]["embedding"] == body["data"][0]["embedding"]
+
+    def test_base64_response(self):
+        """Test base64 encoding is packed little-endian float32."""
+        embedder = FakeEmbedder(8)
+        vector = embedding_response(embedder, ["charity"], "d")["data"][0]["embedding"]
+        encoded = embedding_response(embedder, ["charity"], "d", "base64")["data"][0]["embedding"]
+        decoded = struct.unpack("<8f", base64.b64decode(encoded))
+        assert decoded == pytest.approx(vector, abs=1e-6)
@@ -0,0 +1,90 @@
+"""Unit tests for retrieval benchmark metrics.
+
+Tests:
+- recall@k against exact neighbors, including cutoffs and empty ground truth
+- Reciprocal rank of the first relevant result
+- Percentiles and latency summaries
+"""
+
+import pytest
+
+from src.benchmarks.metrics import (
+    latency_summary,
+    mean,
+    percentile,
+    recall_at_k,
+    reciprocal_rank,
+)
+
+
+class TestRecallAtK:
+    """Tests for recall@k."""
+
+    def test_perfect_recall(self):
+        """Test identical result lists have recall 1.0."""
+        assert recall_at_k([1, 2, 3], [1, 2, 3], 3) == 1.0
+
+    def test_order_does_not_matter(self):
+        """Test recall only counts overlap within the cutoff."""
+        assert recall_at_k([3, 1, 2], [1, 2, 3], 3) == 1.0
+
+    def test_partial_recall(self):
+        """Test one missed neighbor out of four."""
+        assert recall_at_k([1, 2, 3, 9], [1, 2, 3, 4], 4) == 0.75
+
+    def test_cutoff_applies_to_both_lists(self):
+        """Test results beyond k are ignored on both sides."""
+        assert recall_at_k([1, 5, 2], [1, 2, 3], 2) == 0.5
+
+    def test_no_ground_truth(self):
+        """Test empty ground truth gives None rather than a score."""
+        assert recall_at_k([1, 2], [], 10) is None
+
+
+class TestReciprocalRank:
+    """Tests for reciprocal rank."""
+
+    def test_first_result_relevant(self):
+        """Test a relevant first result scores 1.0."""
+        assert reciprocal_rank([True, False]) == 1.0
+
+    def test_third_result_relevant(self):
+        """Test a first relevant result at rank 3 scores 1/3."""
+        assert reciprocal_rank([False, False, True, True]) == pytest.approx(1 / 3)
+
+    def test_nothing_relevant(self):
+        """Test no relevant result scores 0.0."""
+        assert reciprocal_rank([False, False]) == 0.0
+
+
+class TestLatency:
+    """Tests for percentiles and latency summaries."""
+
+    def test_mean_skips_none(self):
+        """Test None values are excluded from the mean."""
+        assert mean([1.0, None, 3.0]) == 2.0
+        assert mean([None]) is None
+
+    def test_percentile_interpolates(self):
+        """Test percentiles interpolate between closest ranks."""
+        values = [10.0, 20.0, 30.0, 40.0]
+        assert percentile(values, 0) == 10.0
+        assert percentile(values, 50) == 25.0
+        assert percentile(values, 100) == 40.0
+
+    def test_percentile_unsorted_input(self):
+        """Test input order does not affect the percentile."""
+        assert percentile([40.0, 10.0, 30.0, 20.0], 50) == 25.0
+
+    def test_summary(self):
+        """Test the summary reports mean, p50, p95, p99, and max."""
+        summary = latency_summary([float(ms) for ms in range(1, 101)])
+        assert summary["mean"] == 50.5
+        assert summary["p50"] == 50.5
+        assert summary["p95"] == pytest.approx(95.05)
+        assert summary["p99"] == pytest.approx(99.01)
+        assert summary["max"] == 100.0
+
+    def test_empty_summary(self):
+        """Test no samples gives zeros."""
+        assert latency_summary([])["p95"] == 0.0
@@ -0,0 +1,58 @@
+"""Unit tests for query vector literals and the transport microbenchmark.
+
+Tests:
+- vector_literal round-trips float4 values and is shorter than str(list)
+- Benchmark vectors are unit length and float4-exact
+- Client costs report both methods
+"""
+
+import argparse
+import random
+import struct
+
+import pytest
+
+from src.api.services.search import vector_literal
+from src.benchmarks.vector_transport import client_costs, parse_dimensions, random_vector
+
+
+class TestVectorLiteral:
+    """Tests for the pgvector text literal."""
+
+    def test_round_trips_float4(self):
+        """Test every component parses back to the same float4 value."""
+        vector = random_vector(384, random.Random(1))
+        parsed = [float(part) for part in vector_literal(vector)[1:-1].split(",")]
+        assert struct.pack("<384f", *parsed) == struct.pack("<384f", *vector)
+
+    def test_shorter_than_str(self):
+        """Test float4 precision shortens the literal."""
+        vector = random_vector(1536, random.Random(2))
+        assert len(vector_literal(vector)) < len(str(vector))
+
+    def test_format(self):
+        """Test the literal is a bracketed, comma-separated list."""
+        assert vector_literal([0.5, -0.25, 0.0]) == "[0.5,-0.25,0]"
+
+
+class TestBenchmark:
+    """Tests for the microbenchmark helpers."""
+
+    def test_random_vector_is_unit_float4(self):
+        """Test vectors are normalized and survive a float4 round trip."""
+        vector = random_vector(64, random.Random(3))
+        assert sum(value * value for value in vector) == pytest.approx(1.0, rel=1e-5)
+        assert list(struct.unpack("<64f", struct.pack("<64f", *vector))) == vector
+
+    def test_client_costs(self):
+        """Test both methods are timed and str(list) is sent twice."""
+        costs = client_costs(32, 5, random.Random(4))
+        assert costs["str_us"] > 0 and costs["literal_us"] > 0
+        assert costs["statement_bytes"]["str_twice"] == 2 * costs["str_bytes"]
+        assert costs["statement_bytes"]["literal_once"] == costs["literal_bytes"]
+
+    def test_parse_dimensions(self):
+        """Test dimension lists are parsed and validated."""
+        assert parse_dimensions("384,1536") == [384, 1536]
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_dimensions("0")
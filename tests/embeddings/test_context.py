@@ -0,0 +1,63 @@
+"""Unit tests for the CFM lesson context budget.
+
+Token budgets are measured with a word-level stand-in for tiktoken, so the
+tests need no downloaded encoding.
+
+Tests:
+- Header, references, and commentary together fit MAX_CONTEXT_TOKENS
+- An oversized reference list is cut to the limit instead of overflowing it
+"""
+
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from src.embeddings import tokens
+from src.embeddings.context import build_cfm_context
+from src.embeddings.tokens import MAX_CONTEXT_TOKENS, count_tokens
+
+
+class WordEncoding:
+    """tiktoken stand-in with one token per word (keeping its whitespace)."""
+
+    def encode(self, text, disallowed_special=()):
+        return re.findall(r"\s*\S+\s*", text)
+
+    def decode(self, tokens):
+        return "".join(tokens)
+
+
+@pytest.fixture(autouse=True)
+def word_encoding(monkeypatch):
+    """Measure contexts with WordEncoding instead of cl100k_base."""
+    monkeypatch.setattr(tokens, "get_encoding", lambda name=tokens.ENCODING_NAME: WordEncoding())
+
+
+def lesson(refs, content):
+    """CFM lesson stand-in (whole-chapter refs need no verse lookups)."""
+    return SimpleNamespace(
+        title="Alma 30-31",
+        date_range="July 15-21",
+        scripture_refs=refs,
+        content=content,
+        lang="en",
+    )
+
+
+class TestCFMContextBudget:
+    """Tests for the token budget of build_cfm_context."""
+
+    def test_commentary_cut_to_budget(self):
+        """Test long commentary is cut so the whole context fits."""
+        context = build_cfm_context(None, lesson(["Alma 30"], "Faith is hope. " * 5000))
+        assert count_tokens(context) <= MAX_CONTEXT_TOKENS
+        assert context.startswith("Alma 30-31 (July 15-21)")
+        assert "Lesson Content:" in context
+
+    def test_oversized_reference_list(self):
+        """Test a reference list longer than the limit is cut, not exceeded."""
+        refs = [f"Alma {chapter}" for chapter in range(1, 64)] * 200
+        context = build_cfm_context(None, lesson(refs, "Commentary. " * 100))
+        assert count_tokens(context) <= MAX_CONTEXT_TOKENS
+        assert context.startswith("Alma 30-31 (July 15-21)\nScripture References: Alma 1")
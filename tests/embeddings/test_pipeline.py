@@ -0,0 +1,89 @@
+"""Unit tests for the unified embedding pipeline.
+
+Tests:
+- Every corpus is registered with its own table and defaults
+- Stored context_text is reused unless the run is stale, and rebuilt
+  context is written back
+- Corpora without stored context always rebuild it
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.embeddings.pipeline import SOURCES, build_parser, get_source
+from src.embeddings.runner import EmbeddingSource
+
+
+def numbered_context(session, row):
+    return f"context {row.id}"
+
+
+def row(row_id, context_text=None):
+    return SimpleNamespace(id=row_id, context_text=context_text)
+
+
+class TestRegistry:
+    """Tests for the corpus registry."""
+
+    def test_corpora(self):
+        """Test every corpus is registered with its own table."""
+        assert set(SOURCES) == {"scriptures", "cfm", "cfm_sections", "conference"}
+        assert len({source.table for source in SOURCES.values()}) == len(SOURCES)
+
+    def test_sections_bump_cfm_generation(self):
+        """Test section embeddings invalidate cached CFM search results."""
+        assert get_source("cfm_sections").generation == "cfm"
+
+    def test_defaults(self):
+        """Test per-corpus batch sizes match the original generators."""
+        assert get_source("scriptures").batch_size == 100
+        assert get_source("conference").batch_size == 10
+
+    def test_unknown_corpus(self):
+        """Test unknown corpora are rejected."""
+        with pytest.raises(ValueError, match="Unknown corpus"):
+            get_source("hymns")
+
+    def test_fixed_corpus_parser(self):
+        """Test per-corpus scripts do not take --corpus and default to source settings."""
+        args = build_parser("cfm").parse_args(["--lang", "es"])
+        assert not hasattr(args, "corpus")
+        assert args.batch_size is None and args.delay is None
+
+
+class TestBuildContexts:
+    """Tests for the shared context policy."""
+
+    def test_stored_context_reused(self):
+        """Test stored context_text is reused and missing context is built."""
+        source = EmbeddingSource("scriptures", "scriptures", object, numbered_context,
+                                 stores_context=True)
+        rows = [row(1, "kept"), row(2)]
+
+        contexts, stored = source.build_contexts(None, rows)
+
+        assert contexts == ["kept", "context 2"]
+        assert stored == ["kept", None]
+        assert rows[1].context_text == "context 2"
+
+    def test_stale_rebuilds_stored_context(self):
+        """Test stale runs rebuild context and report what was stored."""
+        source = EmbeddingSource("conference", "conference_paragraphs", object,
+                                 numbered_context, stores_context=True)
+        rows = [row(1, "old header")]
+
+        contexts, stored = source.build_contexts(None, rows, stale=True)
+
+        assert contexts == ["context 1"]
+        assert stored == ["old header"]
+        assert rows[0].context_text == "context 1"
+
+    def test_unstored_context_always_built(self):
+        """Test corpora without context_text always rebuild context."""
+        source = EmbeddingSource("cfm", "cfm_lessons", object, numbered_context)
+
+        contexts, stored = source.build_contexts(None, [row(5)])
+
+        assert contexts == ["context 5"]
+        assert stored is None
@@ -0,0 +1,142 @@
+"""Unit tests for embedding provenance.
+
+Tests:
+- Row classification by vector presence, model, and context hash
+- Untracked rows whose stored context still matches are adopted
+- embed_rows only calls the provider for stale rows and records provenance
+"""
+
+from types import SimpleNamespace
+
+from src.embeddings.provenance import (
+    Provenance,
+    classify,
+    context_hash,
+    embed_rows,
+)
+from src.embeddings.providers import HashingProvider
+
+MODEL = "hashing:384"
+
+
+class FakeSession:
+    """Session stand-in serving provenance lookups and capturing upserts.
+
+    The embedding store is always empty.
+    """
+
+    def __init__(self, records: dict[int, Provenance]):
+        self.records = records
+        self.upserts: list[dict] = []
+
+    def execute(self, statement, params=None):
+        if isinstance(params, list):
+            self.upserts.extend(p for p in params if "row_id" in p)
+            return []
+        if "hashes" in params:
+            return []
+        return [
+            SimpleNamespace(row_id=row_id, **record._asdict())
+            for row_id, record in self.records.items()
+            if row_id in params["row_ids"]
+        ]
+
+
+class CountingProvider(HashingProvider):
+    """Hashing provider that remembers what it embedded."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls: list[list[str]] = []
+
+    def embed(self, texts):
+        self.calls.append(list(texts))
+        return super().embed(texts)
+
+
+def make_row(row_id: int, embedded: bool = True):
+    return SimpleNamespace(id=row_id, embedding_hashing=[0.0] * 384 if embedded else None)
+
+
+class TestClassify:
+    """Tests for single-row classification."""
+
+    def test_missing(self):
+        """Test rows without a vector are missing regardless of provenance."""
+        record = Provenance(MODEL, 384, context_hash("a"))
+        assert classify(False, record, MODEL, context_hash("a")) == "missing"
+
+    def test_current(self):
+        """Test matching model and context hash is current."""
+        record = Provenance(MODEL, 384, context_hash("a"))
+        assert classify(True, record, MODEL, context_hash("a")) == "current"
+
+    def test_context_changed(self):
+        """Test a different context hash is stale."""
+        record = Provenance(MODEL, 384, context_hash("old header"))
+        assert classify(True, record, MODEL, context_hash("new header")) == "context_changed"
+
+    def test_model_changed(self):
+        """Test a vector from another model is stale even with the same context."""
+        record = Provenance("azure:text-embedding-3-small", 1536, context_hash("a"))
+        assert classify(True, record, MODEL, context_hash("a")) == "model_changed"
+
+    def test_untracked(self):
+        """Test vectors without provenance or stored context are untracked."""
+        assert classify(True, None, MODEL, context_hash("a")) == "untracked"
+        assert classify(True, None, MODEL, context_hash("a"), "b") == "untracked"
+
+    def test_adoptable(self):
+        """Test untracked vectors whose stored context matches are adoptable."""
+        assert classify(True, None, MODEL, context_hash("a"), "a") == "adoptable"
+
+
+class TestEmbedRows:
+    """Tests for incremental embedding."""
+
+    def test_embeds_all_rows_by_default(self):
+        """Test every row is embedded and recorded without only_stale."""
+        session, provider = FakeSession({}), CountingProvider()
+        rows = [make_row(1, embedded=False), make_row(2, embedded=False)]
+
+        assert embed_rows(session, "scriptures", provider, rows, ["a", "b"]) == 2
+        assert provider.calls == [["a", "b"]]
+        assert rows[0].embedding_hashing == provider.embed_one("a")
+        assert [u["row_id"] for u in session.upserts] == [1, 2]
+        assert session.upserts[0]["context_hash"] == context_hash("a")
+        assert session.upserts[0]["column"] == "embedding_hashing"
+
+    def test_only_stale_rows_are_embedded(self):
+        """Test only_stale re-embeds changed rows and adopts matching ones."""
+        session = FakeSession({
+            1: Provenance(MODEL, 384, context_hash("same")),
+            2: Provenance(MODEL, 384, context_hash("old")),
+        })
+        provider = CountingProvider()
+        rows = [make_row(1), make_row(2), make_row(3), make_row(4, embedded=False)]
+
+        embedded = embed_rows(
+            session,
+            "conference_paragraphs",
+            provider,
+            rows,
+            ["same", "new", "kept", "fresh"],
+            stored_contexts=["same", "old", "kept", None],
+            only_stale=True,
+        )
+
+        assert embedded == 2
+        assert provider.calls == [["new", "fresh"]]
+        # Row 1 is current (not rewritten); row 3 is adopted without embedding
+        assert sorted(u["row_id"] for u in session.upserts) == [2, 3, 4]
+
+    def test_nothing_stale(self):
+        """Test no provider call when every row is current."""
+        session = FakeSession({1: Provenance(MODEL, 384, context_hash("a"))})
+        provider = CountingProvider()
+
+        assert embed_rows(
+            session, "cfm_lessons", provider, [make_row(1)], ["a"], only_stale=True
+        ) == 0
+        assert provider.calls == []
+        assert session.upserts == []
@@ -0,0 +1,91 @@
+"""Unit tests for embedding providers.
+
+Tests:
+- The hashing provider is deterministic, normalized, and sized to its column
+- Texts sharing words are more similar than unrelated texts
+- create_provider maps names to columns and validates dimensions
+"""
+
+import math
+
+import pytest
+
+from src.embeddings.providers import (
+    PROVIDER_COLUMNS,
+    HashingProvider,
+    create_provider,
+)
+
+
+def cosine(a: list[float], b: list[float]) -> float:
+    return sum(x * y for x, y in zip(a, b))
+
+
+class TestHashingProvider:
+    """Tests for the deterministic hashing provider."""
+
+    def test_dimensions_match_column(self):
+        """Test vectors have the dimensions of the embedding_hashing column."""
+        provider = HashingProvider()
+        vector = provider.embed_one("faith in Jesus Christ")
+        assert provider.column == "embedding_hashing"
+        assert len(vector) == provider.dimensions == 384
+
+    def test_deterministic(self):
+        """Test the same text always embeds to the same vector."""
+        first = HashingProvider().embed(["And it came to pass"])
+        second = HashingProvider().embed(["And it came to pass"])
+        assert first == second
+
+    def test_unit_norm(self):
+        """Test vectors are L2-normalized, including for empty text."""
+        provider = HashingProvider()
+        for text in ["faith hope charity", "", "!!!"]:
+            vector = provider.embed_one(text)
+            assert math.isclose(math.sqrt(cosine(vector, vector)), 1.0, rel_tol=1e-9)
+
+    def test_shared_words_are_more_similar(self):
+        """Test overlapping texts score higher than unrelated texts."""
+        provider = HashingProvider()
+        query, related, unrelated = provider.embed([
+            "faith in the Lord Jesus Christ",
+            "have faith in Jesus Christ",
+            "the tabernacle measurements in cubits",
+        ])
+        assert cosine(query, related) > cosine(query, unrelated)
+
+    def test_batch_preserves_order(self):
+        """Test batch embedding returns one vector per text in input order."""
+        provider = HashingProvider()
+        texts = ["alpha", "beta", "gamma"]
+        assert provider.embed(texts) == [provider.embed_one(t) for t in texts]
+
+
+class TestCreateProvider:
+    """Tests for provider construction."""
+
+    @pytest.mark.parametrize("name", sorted(PROVIDER_COLUMNS))
+    def test_provider_columns(self, name):
+        """Test each provider stores vectors in its own column."""
+        provider = create_provider(name)
+        assert (provider.column, provider.dimensions) == PROVIDER_COLUMNS[name]
+
+    def test_columns_are_distinct(self):
+        """Test no two providers share a vector column."""
+        columns = [column for column, _ in PROVIDER_COLUMNS.values()]
+        assert len(set(columns)) == len(columns)
+
+    def test_unknown_provider(self):
+        """Test an unknown provider name is rejected."""
+        with pytest.raises(ValueError, match="Unknown embedding provider"):
+            create_provider("word2vec")
+
+    def test_dimension_mismatch(self):
+        """Test dimensions that do not match the provider's column are rejected."""
+        with pytest.raises(ValueError, match="384"):
+            create_provider("hashing", dimensions=1536)
+
+    def test_model_id_in_cache_namespace(self):
+        """Test providers have distinct model IDs so cached vectors never mix."""
+        ids = {create_provider(name).model_id for name in PROVIDER_COLUMNS}
+        assert len(ids) == len(PROVIDER_COLUMNS)
@@ -0,0 +1,236 @@
+"""Unit tests for the resumable embedding runner.
+
+Tests:
+- Duration formatting, token estimates, throughput and ETA
+- A failing batch is retried row by row and poison rows are quarantined
+- A batch where every row fails is treated as an outage and re-raised
+- Transport errors (connection, timeout, 429, 5xx) are re-raised even for
+  a one-row batch
+- The corpus generation is bumped at most once per interval and at the end
+"""
+
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+import pytest
+
+from src.embeddings.providers import HashingProvider
+from src.embeddings.runner import (
+    EmbeddingRunner,
+    EmbeddingSource,
+    ProgressTracker,
+    estimate_tokens,
+    format_duration,
+    is_transient_error,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeSession:
+    """Session stand-in with savepoints, captured quarantine inserts and bumps."""
+
+    def __init__(self):
+        self.quarantined: list[dict] = []
+        self.bumped: list[str] = []
+
+    def begin_nested(self):
+        return nullcontext()
+
+    def execute(self, statement, params=None):
+        if "corpus" in params:
+            self.bumped.append(params["corpus"])
+        else:
+            self.quarantined.append(params)
+
+
+def rejecting_sink(session, table, provider, rows, contexts, **kwargs):
+    """Sink that rejects any context containing 'poison' and fails on 'down'."""
+    if any("down" in context for context in contexts):
+        raise ConnectionError("provider unreachable")
+    if any("poison" in context for context in contexts):
+        raise ValueError("content rejected")
+    return len(rows)
+
+
+class StatusError(Exception):
+    """Provider error carrying an HTTP status, like the OpenAI SDK's."""
+
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+@pytest.fixture
+def runner():
+    source = EmbeddingSource(
+        "conference", "conference_paragraphs", object, str, sink=rejecting_sink
+    )
+    return EmbeddingRunner(FakeSession(), source, HashingProvider(), "en")
+
+
+def rows(*ids):
+    return [SimpleNamespace(id=i) for i in ids]
+
+
+class TestFormatting:
+    """Tests for progress formatting helpers."""
+
+    def test_format_duration(self):
+        """Test seconds, minutes, and hours formats."""
+        assert format_duration(45) == "45s"
+        assert format_duration(192) == "3m12s"
+        assert format_duration(3720) == "1h02m"
+
+    def test_estimate_tokens(self):
+        """Test tokens are estimated at four characters each, rounded up."""
+        assert estimate_tokens(0) == 0
+        assert estimate_tokens(9) == 3
+
+
+class TestProgressTracker:
+    """Tests for throughput and ETA."""
+
+    def test_eta_from_observed_rate(self):
+        """Test ETA extrapolates the observed rows per second."""
+        clock = FakeClock()
+        progress = ProgressTracker(1000, clock=clock)
+        clock.now += 10
+        progress.update(100)
+
+        assert progress.rate == 10.0
+        assert progress.eta_seconds == 90.0
+        assert "ETA 1m30s" in progress.summary()
+
+    def test_eta_unknown_before_progress(self):
+        """Test ETA is unknown until rows are processed."""
+        progress = ProgressTracker(1000, clock=FakeClock())
+        assert progress.eta_seconds is None
+        assert "ETA unknown" in progress.summary()
+
+
+class TestEmbedBatch:
+    """Tests for poison-pill isolation."""
+
+    def test_clean_batch(self, runner):
+        """Test a healthy batch is embedded in one call."""
+        job = SimpleNamespace(id=1)
+        assert runner.embed_batch(job, rows(1, 2), ["a", "b"], None) == (2, 0)
+        assert runner.session.quarantined == []
+
+    def test_poison_row_quarantined(self, runner):
+        """Test one bad row is quarantined and the rest are embedded."""
+        job = SimpleNamespace(id=7)
+        result = runner.embed_batch(job, rows(1, 2, 3), ["a", "poison", "c"], None)
+
+        assert result == (2, 1)
+        [entry] = runner.session.quarantined
+        assert entry["row_id"] == 2
+        assert entry["job_id"] == 7
+        assert entry["table"] == "conference_paragraphs"
+        assert entry["column"] == "embedding_hashing"
+        assert "content rejected" in entry["error"]
+
+    def test_outage_reraised(self, runner):
+        """Test a batch where every row fails raises instead of quarantining."""
+        job = SimpleNamespace(id=1)
+        with pytest.raises(ValueError):
+            runner.embed_batch(job, rows(1, 2), ["poison 1", "poison 2"], None)
+        assert runner.session.quarantined == []
+
+    def test_single_row_outage_reraised(self, runner):
+        """Test a one-row batch hitting a transport error raises instead of quarantining."""
+        job = SimpleNamespace(id=1)
+        with pytest.raises(ConnectionError):
+            runner.embed_batch(job, rows(1), ["down"], None)
+        assert runner.session.quarantined == []
+
+    def test_single_poison_row_quarantined(self, runner):
+        """Test a one-row batch with bad input is still quarantined."""
+        job = SimpleNamespace(id=1)
+        assert runner.embed_batch(job, rows(1), ["poison"], None) == (0, 1)
+        assert len(runner.session.quarantined) == 1
+
+
+class TestTransientErrors:
+    """Tests for telling outages from bad rows."""
+
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            ConnectionError("refused"),
+            TimeoutError("timed out"),
+            StatusError(429),
+            StatusError(503),
+            type("APITimeoutError", (Exception,), {})("timed out"),
+        ],
+    )
+    def test_transient(self, exc):
+        """Test transport failures, rate limits, and server errors are transient."""
+        assert is_transient_error(exc)
+
+    @pytest.mark.parametrize("exc", [ValueError("content rejected"), StatusError(400)])
+    def test_not_transient(self, exc):
+        """Test rejected input is not transient."""
+        assert not is_transient_error(exc)
+
+    def test_retry_error_judged_by_last_attempt(self):
+        """Test a retry wrapper is judged by the error of its last attempt."""
+        attempt = SimpleNamespace(exception=lambda: StatusError(500))
+        wrapper = Exception("RetryError")
+        wrapper.last_attempt = attempt
+        assert is_transient_error(wrapper)
+
+
+class TestGenerationBumps:
+    """Tests for publishing embedded rows through the corpus generation."""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def throttled(self, clock):
+        source = EmbeddingSource(
+            "conference", "conference_paragraphs", object, str, sink=rejecting_sink
+        )
+        return EmbeddingRunner(
+            FakeSession(), source, HashingProvider(), "en",
+            generation_interval=60, clock=clock,
+        )
+
+    def test_batches_within_interval_share_a_bump(self, throttled, clock):
+        """Test batches committed within the interval do not bump."""
+        for _ in range(10):
+            clock.now += 1
+            assert not throttled.publish_generation(100)
+        assert throttled.session.bumped == []
+
+    def test_bump_after_interval(self, throttled, clock):
+        """Test the first batch after the interval bumps once."""
+        throttled.publish_generation(100)
+        clock.now += 60
+        assert throttled.publish_generation(100)
+        assert not throttled.publish_generation(100)
+        assert throttled.session.bumped == ["conference"]
+
+    def test_nothing_embedded_never_bumps(self, throttled, clock):
+        """Test batches with no embedded rows do not bump, even at the end."""
+        clock.now += 600
+        assert not throttled.publish_generation(0)
+        assert not throttled.publish_generation(final=True)
+        assert throttled.session.bumped == []
+
+    def test_final_bump(self, throttled):
+        """Test the end of a run that embedded rows always bumps."""
+        throttled.publish_generation(5)
+        assert throttled.publish_generation(final=True)
+        assert throttled.session.bumped == ["conference"]
@@ -0,0 +1,91 @@
+"""Unit tests for the content-addressed embedding store.
+
+Tests:
+- Identical texts within a batch are embedded once
+- Texts already in the store are not sent to the provider
+- New vectors are saved and dedup counters accumulate
+"""
+
+from types import SimpleNamespace
+
+from src.embeddings.providers import HashingProvider
+from src.embeddings.store import DedupStats, context_hash, embed_with_store
+
+
+class FakeStoreSession:
+    """Session stand-in backed by a dict of (model, hash) -> vector."""
+
+    def __init__(self, store: dict[tuple[str, str], list[float]] | None = None):
+        self.store = store or {}
+
+    def execute(self, statement, params=None):
+        if isinstance(params, list):
+            for item in params:
+                key = (item["model"], item["context_hash"])
+                vector = [float(v) for v in item["embedding"].strip("[]").split(",")]
+                self.store.setdefault(key, vector)
+            return []
+        model = params["model"]
+        return [
+            SimpleNamespace(context_hash=digest, embedding=str(self.store[(model, digest)]))
+            for digest in params["hashes"]
+            if (model, digest) in self.store
+        ]
+
+
+class CountingProvider(HashingProvider):
+    """Hashing provider that remembers what it embedded."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls: list[list[str]] = []
+
+    def embed(self, texts):
+        self.calls.append(list(texts))
+        return super().embed(texts)
+
+
+class TestEmbedWithStore:
+    """Tests for embed_with_store."""
+
+    def test_duplicates_in_batch_embedded_once(self):
+        """Test identical contexts in one batch share one provider call."""
+        session, provider = FakeStoreSession(), CountingProvider()
+        stats = DedupStats()
+
+        vectors = embed_with_store(session, provider, ["a", "b", "a", "a"], stats)
+
+        assert provider.calls == [["a", "b"]]
+        assert vectors[0] == vectors[2] == vectors[3] == provider.embed_one("a")
+        assert (stats.rows, stats.unique, stats.embedded) == (4, 2, 2)
+        assert stats.dedup_ratio == 0.5
+
+    def test_store_hits_skip_provider(self):
+        """Test contexts embedded by an earlier run come from the store."""
+        session, provider = FakeStoreSession(), CountingProvider()
+        embed_with_store(session, provider, ["sustaining of officers"])
+        provider.calls.clear()
+        stats = DedupStats()
+
+        vectors = embed_with_store(
+            session, provider, ["sustaining of officers", "new paragraph"], stats
+        )
+
+        assert provider.calls == [["new paragraph"]]
+        assert stats.store_hits == 1
+        assert stats.saved == 1
+        assert vectors[0] == [float(v) for v in provider.embed_one("sustaining of officers")]
+
+    def test_store_is_per_model(self):
+        """Test vectors stored for another model are not reused."""
+        provider = CountingProvider()
+        session = FakeStoreSession({("other-model", context_hash("a")): [1.0, 0.0]})
+
+        embed_with_store(session, provider, ["a"])
+
+        assert provider.calls == [["a"]]
+
+    def test_empty_stats_ratio(self):
+        """Test the dedup ratio of an empty run is zero."""
+        assert DedupStats().dedup_ratio == 0.0
+        assert "dedup ratio 0.0%" in DedupStats().summary()
@@ -0,0 +1,94 @@
+"""Unit tests for token budgets and section chunking.
+
+Tests:
+- Truncation keeps text within the token budget and reports cuts
+- Paragraphs are packed whole, and oversized paragraphs are split
+- Lessons are chunked per section, with intro text first
+"""
+
+from src.embeddings.tokens import (
+    chunk_plain_text,
+    chunk_sections,
+    count_tokens,
+    pack_paragraphs,
+    truncate_tokens,
+)
+
+
+class WordEncoding:
+    """tiktoken stand-in with one token per whitespace-separated word."""
+
+    def encode(self, text, disallowed_special=()):
+        return text.split()
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+ENCODING = WordEncoding()
+
+
+def words(count, word="word"):
+    return " ".join([word] * count)
+
+
+class TestTruncation:
+    """Tests for count_tokens and truncate_tokens."""
+
+    def test_count(self):
+        """Test tokens are counted with the given encoding."""
+        assert count_tokens("faith hope charity", ENCODING) == 3
+
+    def test_within_budget(self):
+        """Test text within the budget is returned unchanged."""
+        assert truncate_tokens("faith hope", 2, ENCODING) == ("faith hope", False)
+
+    def test_over_budget(self):
+        """Test text over the budget is cut to exactly max_tokens."""
+        text, truncated = truncate_tokens(words(10), 4, ENCODING)
+        assert truncated
+        assert count_tokens(text, ENCODING) == 4
+
+
+class TestPackParagraphs:
+    """Tests for paragraph packing."""
+
+    def test_packs_whole_paragraphs(self):
+        """Test consecutive paragraphs share a group while they fit."""
+        groups = pack_paragraphs([words(3), words(3), words(3)], 7, ENCODING)
+        assert groups == [f"{words(3)}\n{words(3)}", words(3)]
+
+    def test_splits_oversized_paragraph(self):
+        """Test a paragraph longer than the budget is cut into pieces."""
+        groups = pack_paragraphs(["short", words(10, "long")], 4, ENCODING)
+        assert groups == ["short", words(4, "long"), words(4, "long"), words(2, "long")]
+
+
+class TestChunkSections:
+    """Tests for lesson chunking."""
+
+    def test_sections_with_intro(self):
+        """Test intro text becomes an untitled first chunk."""
+        chunks = chunk_sections(
+            [{"title": "Ideas for Personal Study", "paragraphs": ["Pray", ""]}],
+            intro=["Welcome"],
+            encoding=ENCODING,
+        )
+        assert [(c.section_title, c.text) for c in chunks] == [
+            ("", "Welcome"),
+            ("Ideas for Personal Study", "Pray"),
+        ]
+
+    def test_long_section_split(self):
+        """Test long sections become several chunks with the same title."""
+        chunks = chunk_sections(
+            [{"title": "Study", "paragraphs": [words(3), words(3)]}],
+            max_tokens=4,
+            encoding=ENCODING,
+        )
+        assert [c.section_title for c in chunks] == ["Study", "Study"]
+
+    def test_plain_text_fallback(self):
+        """Test unstructured text is chunked by lines."""
+        chunks = chunk_plain_text("one\n\ntwo", max_tokens=100, encoding=ENCODING)
+        assert [c.text for c in chunks] == ["one\ntwo"]
@@ -0,0 +1,60 @@
+"""Unit tests for the embedding worker pool.
+
+Tests:
+- 'all' corpus and language arguments expand to every target
+- Worker command lines carry the run label and split the cost cap
+"""
+
+import pytest
+
+from src.embeddings import workers
+from src.embeddings.pipeline import SOURCES
+from src.embeddings.workers import resolve_targets, worker_command
+
+
+@pytest.fixture
+def parse_run(monkeypatch):
+    """Parse 'run' arguments without starting any workers."""
+    captured = []
+    monkeypatch.setattr(workers, "supervise", lambda args: captured.append(args) or 0)
+
+    def parse(*argv):
+        workers.main(["run", *argv])
+        return captured.pop()
+
+    return parse
+
+
+class TestResolveTargets:
+    """Tests for target expansion."""
+
+    def test_all(self):
+        """Test 'all' expands to every corpus in both languages."""
+        targets = resolve_targets("all", "all")
+        assert len(targets) == 2 * len(SOURCES)
+        assert ("conference", "es") in targets
+
+    def test_single(self):
+        """Test a single corpus and language stays a single target."""
+        assert resolve_targets("cfm", "en") == [("cfm", "en")]
+
+
+class TestWorkerCommand:
+    """Tests for the supervisor's worker command line."""
+
+    def test_run_label_and_target(self, parse_run):
+        """Test workers receive the shared run label and target."""
+        args = parse_run("--corpus", "conference", "--lang", "en", "--workers", "3")
+        command = worker_command(args, "run-abc")
+
+        assert command[command.index("--run-label") + 1] == "run-abc"
+        assert command[command.index("--corpus") + 1] == "conference"
+        assert "worker" in command
+        assert "--max-cost" not in command
+
+    def test_cost_cap_split_across_workers(self, parse_run):
+        """Test the total cost cap is divided evenly among workers."""
+        args = parse_run("--workers", "4", "--max-cost", "2")
+        command = worker_command(args, "run-abc")
+
+        assert float(command[command.index("--max-cost") + 1]) == 0.5
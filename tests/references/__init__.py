@@ -0,0 +1 @@
+"""Unit tests for scripture reference parsing."""
@@ -0,0 +1,142 @@
+"""Unit tests for the shared scripture reference parser.
+
+Tests:
+- English and Spanish book names and abbreviations resolve to canonical IDs
+- Verse lists, verse ranges, chapter ranges, and whole chapters
+- Book-less fragments resolve against the previous reference in a batch
+- Trailing prose after a reference is ignored
+- 'and' / 'y' between references separate them, like ';'
+- 'ff' / 'ss' open the verse range through the end of the chapter
+- Non-references parse to an empty list
+- Formatting and per-language book IDs
+"""
+
+import pytest
+
+from src.references import (
+    ScriptureRef,
+    book_id_for_lang,
+    format_reference,
+    parse_reference,
+    parse_references,
+)
+
+
+class TestParseReference:
+    """Tests for parsing single references."""
+
+    def test_single_verse(self):
+        """Test 'Alma 32:21' parses to a single-verse reference."""
+        assert parse_reference("Alma 32:21") == [
+            ScriptureRef("bookofmormon", "alma", 32, 21, 21)
+        ]
+
+    def test_whole_chapter(self):
+        """Test 'D&C 121' parses to a whole-chapter reference."""
+        assert parse_reference("D&C 121") == [
+            ScriptureRef("doctrineandcovenants", "doctrineandcovenants", 121)
+        ]
+
+    def test_verse_list_with_spanish_conjunction(self):
+        """Test verse lists with en dashes, non-breaking spaces, and 'y'."""
+        refs = parse_reference("1\xa0Nefi 8:21–23,\xa024–28,\xa030\xa0y 31–33")
+        assert [(r.verse_start, r.verse_end) for r in refs] == [
+            (21, 23), (24, 28), (30, 30), (31, 33),
+        ]
+        assert {r.book for r in refs} == {"1nephi"}
+
+    def test_chapter_range(self):
+        """Test 'Genesis 1–6' expands to six whole-chapter references."""
+        refs = parse_reference("Genesis 1–6")
+        assert [r.chapter for r in refs] == [1, 2, 3, 4, 5, 6]
+        assert all(r.verse_start is None for r in refs)
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("Alma 32:21 (emphasis added)", ScriptureRef("bookofmormon", "alma", 32, 21, 21)),
+            ("Ether 12:27 (emphasis added)", ScriptureRef("bookofmormon", "ether", 12, 27, 27)),
+        ],
+    )
+    def test_trailing_prose_ends_reference(self, text, expected):
+        """Test prose after the chapter:verse is dropped, not the reference."""
+        assert parse_reference(text) == [expected]
+
+    @pytest.mark.parametrize(
+        "text",
+        ["Alma 32:21-23 and Moroni 10:4", "Alma 32:21–23 y Moroni 10:4"],
+    )
+    def test_conjunction_separates_references(self, text):
+        """Test a conjunction before another book starts a new reference."""
+        assert parse_reference(text) == [
+            ScriptureRef("bookofmormon", "alma", 32, 21, 23),
+            ScriptureRef("bookofmormon", "moroni", 10, 4, 4),
+        ]
+
+    @pytest.mark.parametrize("text", ["Mosiah 2:17 ff", "Mosíah 2:17ss."])
+    def test_following_verses_open_the_range(self, text):
+        """Test 'ff' reads through the end of the chapter instead of one verse."""
+        assert parse_reference(text) == [ScriptureRef("bookofmormon", "mosiah", 2, 17, None)]
+
+    def test_following_chapters_rejected(self):
+        """Test 'ff' after a chapter alone is not guessed at."""
+        assert parse_reference("Alma 32ff") == []
+
+    @pytest.mark.parametrize(
+        "text,book",
+        [
+            ("Doctrina y Convenios 110:14", "doctrineandcovenants"),
+            ("D. y C. 4:2", "doctrineandcovenants"),
+            ("Joseph Smith—History 1:17", "josephsmithhistory"),
+            ("José Smith—Historia 1:17", "josephsmithhistory"),
+            ("1 Juan 4:8", "1john"),
+            ("Juan 3:16", "john"),
+            ("Psalm 23:1", "psalms"),
+            ("Mosíah 3:19", "mosiah"),
+            ("Éter 12:27", "ether"),
+        ],
+    )
+    def test_book_names_and_abbreviations(self, text, book):
+        """Test English and Spanish names map to canonical book IDs."""
+        refs = parse_reference(text)
+        assert refs and refs[0].book == book
+
+    def test_non_reference_returns_empty(self):
+        """Test topic links and unsupported works parse to an empty list."""
+        assert parse_reference("Topical Guide") == []
+        assert parse_reference("Joseph Smith Translation, Matthew 26:22") == []
+
+
+class TestParseReferences:
+    """Tests for batch parsing."""
+
+    def test_fragments_use_previous_reference(self):
+        """Test 'verses 24–26' and '3:5' resolve against the previous book."""
+        results = parse_references(["Moses 1:12", "verses 24–26", "3:5", "Topical Guide"])
+        assert results[1] == [ScriptureRef("pearlofgreatprice", "moses", 1, 24, 26)]
+        assert results[2] == [ScriptureRef("pearlofgreatprice", "moses", 3, 5, 5)]
+        assert results[3] == []
+
+    def test_preserves_input_order_and_length(self):
+        """Test one result list is returned per input string."""
+        refs = ["Alma 32:21", "Faith", "Mateo 5:5"] * 100
+        results = parse_references(refs)
+        assert len(results) == len(refs)
+        assert results[2][0].book == "matthew"
+
+
+class TestFormatting:
+    """Tests for reference formatting and per-language book IDs."""
+
+    def test_format_reference(self):
+        """Test references format with English and Spanish titles."""
+        ref = ScriptureRef("bookofmormon", "1nephi", 3, 7, 7)
+        assert format_reference(ref) == "1 Nephi 3:7"
+        assert format_reference(ref, "es") == "1 Nefi 3:7"
+        assert format_reference(ScriptureRef("bookofmormon", "alma", 32, 21, 23)) == "Alma 32:21-23"
+
+    def test_book_id_for_lang(self):
+        """Test canonical IDs translate to the IDs stored per language."""
+        assert book_id_for_lang("1nephi", "es") == "1-ne"
+        assert book_id_for_lang("doctrineandcovenants", "es") == "dc"
+        assert book_id_for_lang("dc", "en") == "doctrineandcovenants"
@@ -0,0 +1,87 @@
+"""Unit tests for the import-time budget.
+
+Tests:
+- -X importtime output is parsed into self and cumulative times
+- Forbidden packages are matched on their top-level name
+- Lightweight entry points do not load SQLAlchemy at import time
+- The API tests are collected without a database URL
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.tools.import_budget import (
+    BUDGETS,
+    ImportBudget,
+    loaded_forbidden,
+    measure,
+    parse_importtime,
+)
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      1500 |       2400 |     sqlalchemy.engine
+import time:       900 |       3300 |   sqlalchemy
+import time:        40 |       3340 | src.db
+Traceback line that is not a timing
+"""
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+class TestParseImporttime:
+    """Tests for parsing -X importtime output."""
+
+    def test_parses_timings(self):
+        """Test self and cumulative microseconds per module."""
+        timings = parse_importtime(SAMPLE)
+        assert timings["sqlalchemy.engine"] == (1500, 2400)
+        assert timings["src.db"] == (40, 3340)
+
+    def test_skips_other_lines(self):
+        """Test the header and unrelated lines are ignored."""
+        timings = parse_importtime(SAMPLE)
+        assert set(timings) == {"_io", "sqlalchemy.engine", "sqlalchemy", "src.db"}
+
+    def test_forbidden_by_top_level_name(self):
+        """Test a submodule counts as loading its package."""
+        timings = {"sqlalchemy.engine": (1, 1), "src.db": (1, 1)}
+        assert loaded_forbidden(timings, ("sqlalchemy", "openai")) == ["sqlalchemy"]
+
+
+class TestBudgets:
+    """Tests for the entry points' import-time dependencies."""
+
+    def test_budgets_are_unique(self):
+        """Test each entry point has one budget."""
+        modules = [budget.module for budget in BUDGETS]
+        assert len(modules) == len(set(modules))
+
+    @pytest.mark.parametrize(
+        "budget",
+        [b for b in BUDGETS if b.module in ("src.references", "src.db", "src.embeddings")],
+        ids=lambda b: b.module,
+    )
+    def test_no_forbidden_imports(self, budget: ImportBudget):
+        """Test the package imports load none of their forbidden modules."""
+        assert loaded_forbidden(measure(budget.module), budget.forbidden) == []
+
+
+class TestWithoutDatabase:
+    """Tests for importing the API with no database configured."""
+
+    def test_api_tests_collect_without_database_url(self):
+        """Test creating the app opens no engine, so the API tests collect."""
+        pytest.importorskip("fastapi")
+        # An empty variable overrides DATABASE_URL_SYNC from .env
+        env = {**os.environ, "DATABASE_URL_SYNC": "", "DATABASE_REPLICA_URLS": ""}
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", "tests/api", "--collect-only", "-q"],
+            cwd=REPO_ROOT, env=env, capture_output=True, text=True,
+        )
+        assert result.returncode == 0, result.stdout + result.stderr